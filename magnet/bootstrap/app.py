@@ -308,10 +308,13 @@ class MAGNETApp:
             def create_pipeline_executor():
                 from magnet.core.state_manager import StateManager
                 state_manager = self._context.container.resolve(StateManager)
+                cache_path = self._context.config.storage.validation_cache_path
                 return PipelineExecutor(
                     topology=topology,
                     state_manager=state_manager,
                     validator_registry=ValidatorRegistry.get_all_instances(),
+                    # No fixed design_id: the cache follows loads and resets
+                    cache_path=Path(cache_path) if cache_path else None,
                 )
 
             self._services.add_factory(PipelineExecutor, create_pipeline_executor)
@@ -526,6 +529,7 @@ class MAGNETApp:
         try:
             from magnet.deployment.api import create_fastapi_app
 
+            self._configure_job_queue()
             app = create_fastapi_app(self._context)
 
             uvicorn.run(
@@ -548,12 +552,24 @@ class MAGNETApp:
             worker = Worker(
                 container=self._context.container,
                 concurrency=concurrency,
+                queue=self._configure_job_queue(),
             )
 
             asyncio.run(self._run_worker_async(worker))
         except ImportError as e:
             logger.error(f"Worker module not available: {e}")
 
+    def _configure_job_queue(self):
+        """Install a durable job queue if a job store path is configured."""
+        from magnet.deployment.worker import (
+            JobQueue, SQLiteJobStore, configure_job_queue, get_job_queue,
+        )
+
+        store_path = self.config.storage.job_store_path
+        if not store_path:
+            return get_job_queue()
+        return configure_job_queue(JobQueue(store=SQLiteJobStore(Path(store_path))))
+
     async def _run_worker_async(self, worker) -> None:
         """Run worker with proper lifecycle."""
         await self.start()
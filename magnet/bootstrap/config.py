@@ -75,6 +75,8 @@ class APIConfig:
     docs_url: str = "/docs"
     cors_origins: List[str] = field(default_factory=lambda: ["*"])
     rate_limit_rpm: int = 60
+    kernel_workers: int = 2  # Threads for CPU-bound kernel work off the event loop
+    kernel_queue_limit: int = 64  # Queued + running kernel calls before 503
 
     @classmethod
     def from_env(cls) -> "APIConfig":
@@ -87,6 +89,8 @@ class APIConfig:
             docs_url=os.getenv("MAGNET_API_DOCS_URL", "/docs"),
             cors_origins=cors.split(",") if cors else ["*"],
             rate_limit_rpm=int(os.getenv("MAGNET_API_RATE_LIMIT", "60")),
+            kernel_workers=int(os.getenv("MAGNET_API_KERNEL_WORKERS", "2")),
+            kernel_queue_limit=int(os.getenv("MAGNET_API_KERNEL_QUEUE", "64")),
         )
 
 
@@ -100,6 +104,8 @@ class StorageConfig:
     snapshots_dir: str = "./storage/snapshots"
     exports_dir: str = "./storage/exports"
     temp_dir: str = "./storage/temp"
+    validation_cache_path: str = ""  # SQLite validation cache tier (empty = disabled)
+    job_store_path: str = ""  # SQLite durable job queue (empty = in-memory only)
 
     @classmethod
     def from_env(cls) -> "StorageConfig":
@@ -111,6 +117,8 @@ class StorageConfig:
             snapshots_dir=os.getenv("MAGNET_SNAPSHOTS_DIR", f"{base}/snapshots"),
             exports_dir=os.getenv("MAGNET_EXPORTS_DIR", f"{base}/exports"),
             temp_dir=os.getenv("MAGNET_TEMP_DIR", f"{base}/temp"),
+            validation_cache_path=os.getenv("MAGNET_VALIDATION_CACHE", ""),
+            job_store_path=os.getenv("MAGNET_JOB_STORE", ""),
         )
 
 
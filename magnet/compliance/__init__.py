@@ -15,6 +15,13 @@ from .enums import (
     ComplianceStatus,
 )
 
+from .expressions import (
+    CompiledExpression,
+    ExpressionError,
+    FORMULA_SYMBOLS,
+    compile_expression,
+)
+
 from .rule_schema import (
     RuleReference,
     RuleRequirement,
@@ -26,13 +33,21 @@ from .rule_library import (
     RULE_LIBRARY,
 )
 
+from .rule_pack import (
+    RulePack,
+    RulePackError,
+    write_rule_pack,
+)
+
 from .checkers import (
     RuleChecker,
     StabilityRuleChecker,
     StructuralRuleChecker,
     FreeboardRuleChecker,
+    FormulaRuleChecker,
     get_checker,
     RULE_CHECKERS,
+    FORMULA_CHECKER,
 )
 
 from .engine import (
@@ -56,6 +71,12 @@ __all__ = [
     "FindingSeverity",
     "ComplianceStatus",
 
+    # Rule Expressions
+    "CompiledExpression",
+    "ExpressionError",
+    "FORMULA_SYMBOLS",
+    "compile_expression",
+
     # Rule Schema
     "RuleReference",
     "RuleRequirement",
@@ -65,13 +86,20 @@ __all__ = [
     "RuleLibrary",
     "RULE_LIBRARY",
 
+    # Rule Packs
+    "RulePack",
+    "RulePackError",
+    "write_rule_pack",
+
     # Checkers
     "RuleChecker",
     "StabilityRuleChecker",
     "StructuralRuleChecker",
     "FreeboardRuleChecker",
+    "FormulaRuleChecker",
     "get_checker",
     "RULE_CHECKERS",
+    "FORMULA_CHECKER",
 
     # Engine
     "ComplianceEngine",
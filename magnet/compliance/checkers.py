@@ -7,17 +7,23 @@ v1.1: Verified field names match Module 01 v1.8 StabilityState:
   - stability.angle_of_max_gz_deg (NOT angle_of_maximum_gz_deg)
   - stability.area_0_30_m_rad, area_0_40_m_rad, area_30_40_m_rad
   - stability.gz_max_m, stability.gm_m
+
+v1.2: Rule formulas are compiled (see expressions.py) and shared by all
+      checkers; check_many() evaluates limits over batches of designs.
 """
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 import logging
 import uuid
 
+import numpy as np
+
 from .enums import RuleCategory, FindingSeverity
 from .rule_schema import RuleRequirement, Finding, RuleReference
+from .expressions import ExpressionError, compile_expression, compare_limit
 
 if TYPE_CHECKING:
     from ..core.state_manager import StateManager
@@ -52,6 +58,212 @@ class RuleChecker(ABC):
         """
         pass
 
+    def input_paths(self, rule: RuleRequirement) -> List[str]:
+        """
+        State paths check() reads for this rule.
+
+        The engine re-checks a rule only when one of these changes, so a
+        checker that reads state beyond the rule's input_paths() must
+        override this.
+        """
+        return rule.input_paths()
+
+    def input_values(self, state: "StateManager", paths: List[str]) -> Tuple[Any, ...]:
+        """Current values of paths, read the way check() reads them."""
+        return tuple(self._get_value(state, path) for path in paths)
+
+    def check_many(self, rule: RuleRequirement, columns: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Pass/fail of a limit rule over a batch of designs.
+
+        Args:
+            rule: Rule requirement to check
+            columns: State path -> array of values, one per design
+
+        Returns:
+            Boolean array (True = pass; NaN inputs fail), or None if the
+            rule has no formula or limit_value, its formula is malformed,
+            or an input is not in columns
+        """
+        paths = self.input_paths(rule)
+        if any(path not in columns for path in paths):
+            return None
+
+        if rule.limit_type == "criterion":
+            if not rule.formula:
+                return None
+            try:
+                passes = compile_expression(rule.formula).evaluate_many(columns).astype(bool)
+            except ExpressionError as e:
+                logger.warning(f"Rule {rule.rule_id} not screened: {e}")
+                return None
+        else:
+            if not rule.required_inputs:
+                return None
+            if rule.formula:
+                try:
+                    required = compile_expression(rule.formula).evaluate_many(columns)
+                except ExpressionError as e:
+                    logger.warning(f"Rule {rule.rule_id} not screened: {e}")
+                    return None
+            elif rule.limit_value is not None:
+                required = rule.limit_value
+            else:
+                return None
+
+            actual = np.asarray(columns[rule.required_inputs[0]], dtype=float)
+            with np.errstate(invalid="ignore"):
+                passes = compare_limit(actual, required, rule.limit_type)
+
+        # A missing (NaN) input fails the design; NaN cast to bool would pass a criterion
+        for path in paths:
+            passes = np.logical_and(passes, ~np.isnan(np.asarray(columns[path], dtype=float)))
+        return passes
+
+    def _required_value(
+        self,
+        rule: RuleRequirement,
+        values: Dict[str, Any],
+        state: "StateManager",
+    ) -> Any:
+        """
+        The rule's formula evaluated (or its limit_value).
+
+        Inputs already read (values) are reused; others are read from state.
+        Returns None if an input is unset.
+        """
+        if not rule.formula:
+            return rule.limit_value
+        expression = compile_expression(rule.formula)
+        args = [
+            values[path] if path in values else self._get_value(state, path)
+            for path in expression.paths
+        ]
+        if any(arg is None for arg in args):
+            return None
+        return expression(args)
+
+    def _check_limit(
+        self,
+        rule: RuleRequirement,
+        values: Dict[str, Any],
+        state: "StateManager",
+        remediation: Optional[Callable[[RuleRequirement, Any, Any], str]] = None,
+    ) -> Finding:
+        """
+        Evaluate a limit rule from its inputs.
+
+        The first required input is compared against the formula (or
+        limit_value) per limit_type; for limit_type "criterion" the formula
+        itself is the pass test. Evaluation errors become "error" findings.
+        """
+        try:
+            return self._evaluate_limit(rule, values, state, remediation)
+        except Exception as e:
+            logger.error(f"Error evaluating rule {rule.rule_id}: {e}")
+            return self._create_finding(
+                rule=rule,
+                status="error",
+                severity=FindingSeverity.WARNING,
+                message=f"Evaluation error: {str(e)}",
+            )
+
+    def _evaluate_limit(
+        self,
+        rule: RuleRequirement,
+        values: Dict[str, Any],
+        state: "StateManager",
+        remediation: Optional[Callable[[RuleRequirement, Any, Any], str]],
+    ) -> Finding:
+        if len(rule.required_inputs) == 0:
+            return self._create_finding(
+                rule=rule,
+                status="error",
+                severity=FindingSeverity.WARNING,
+                message="No required inputs defined for rule",
+            )
+
+        actual_value = values.get(rule.required_inputs[0])
+        required_value = self._required_value(rule, values, state)
+
+        if required_value is None:
+            return self._create_finding(
+                rule=rule,
+                status="error",
+                severity=FindingSeverity.WARNING,
+                message="Could not determine required value",
+            )
+
+        failed_severity = FindingSeverity.NON_CONFORMANCE if rule.mandatory else FindingSeverity.WARNING
+
+        if rule.limit_type == "criterion":
+            criterion = rule.acceptance_criteria or rule.formula
+            if required_value:
+                return self._create_finding(
+                    rule=rule,
+                    status="pass",
+                    severity=FindingSeverity.PASS,
+                    message=f"{rule.name}: {criterion} met",
+                    actual_value=actual_value,
+                )
+            return self._create_finding(
+                rule=rule,
+                status="fail",
+                severity=failed_severity,
+                message=f"{rule.name}: {criterion} not met",
+                actual_value=actual_value,
+                remediation=f"Adjust design to meet: {criterion}",
+            )
+
+        # Compare values based on limit type
+        passes = compare_limit(actual_value, required_value, rule.limit_type)
+
+        # Calculate margin
+        if isinstance(actual_value, (int, float)) and isinstance(required_value, (int, float)):
+            margin = actual_value - required_value
+            if required_value != 0:
+                margin_percent = (margin / abs(required_value)) * 100
+            else:
+                margin_percent = 0.0 if actual_value == 0 else float('inf')
+        else:
+            margin = None
+            margin_percent = None
+
+        if passes:
+            return self._create_finding(
+                rule=rule,
+                status="pass",
+                severity=FindingSeverity.PASS,
+                message=f"{rule.name}: {actual_value:.3f} meets requirement of {required_value:.3f}",
+                actual_value=actual_value,
+                required_value=required_value,
+                margin=margin,
+                margin_percent=margin_percent,
+            )
+        return self._create_finding(
+            rule=rule,
+            status="fail",
+            severity=failed_severity,
+            message=f"{rule.name}: {actual_value:.3f} does not meet requirement of {required_value:.3f}",
+            actual_value=actual_value,
+            required_value=required_value,
+            margin=margin,
+            margin_percent=margin_percent,
+            remediation=remediation(rule, actual_value, required_value) if remediation else None,
+        )
+
+    def _read_inputs(self, rule: RuleRequirement, state: "StateManager") -> Tuple[List[str], Dict[str, Any]]:
+        """Read required_inputs: (missing paths, path -> value)."""
+        missing_inputs = []
+        input_values = {}
+        for input_path in rule.required_inputs:
+            value = self._get_value(state, input_path)
+            if value is None:
+                missing_inputs.append(input_path)
+            else:
+                input_values[input_path] = value
+        return missing_inputs, input_values
+
     def _get_value(
         self,
         state: "StateManager",
@@ -63,7 +275,10 @@ class RuleChecker(ABC):
             parts = path.split(".")
             if len(parts) == 2:
                 namespace, key = parts
-                return state.read(namespace, key, default)
+                if hasattr(state, "read"):
+                    return state.read(namespace, key, default)
+                # StateManager has no read(); use path access
+                return state.get(path, default)
             return default
         except Exception:
             return default
@@ -127,15 +342,7 @@ class StabilityRuleChecker(RuleChecker):
         """Evaluate stability rule."""
 
         # Check for required inputs
-        missing_inputs = []
-        input_values = {}
-
-        for input_path in rule.required_inputs:
-            value = self._get_value(state, input_path)
-            if value is None:
-                missing_inputs.append(input_path)
-            else:
-                input_values[input_path] = value
+        missing_inputs, input_values = self._read_inputs(rule, state)
 
         if missing_inputs:
             return self._create_finding(
@@ -165,110 +372,7 @@ class StabilityRuleChecker(RuleChecker):
         state: "StateManager",
     ) -> Finding:
         """Evaluate specific stability rule."""
-
-        # Get the primary value to check
-        if len(rule.required_inputs) == 0:
-            return self._create_finding(
-                rule=rule,
-                status="error",
-                severity=FindingSeverity.WARNING,
-                message="No required inputs defined for rule",
-            )
-
-        primary_input = rule.required_inputs[0]
-        actual_value = values.get(primary_input)
-
-        # Handle formula-based rules (like GM minimum)
-        if rule.formula:
-            required_value = self._evaluate_formula(rule.formula, values, state)
-        else:
-            required_value = rule.limit_value
-
-        if required_value is None:
-            return self._create_finding(
-                rule=rule,
-                status="error",
-                severity=FindingSeverity.WARNING,
-                message="Could not determine required value",
-            )
-
-        # Compare values based on limit type
-        passes = self._compare_values(actual_value, required_value, rule.limit_type)
-
-        # Calculate margin
-        if isinstance(actual_value, (int, float)) and isinstance(required_value, (int, float)):
-            margin = actual_value - required_value
-            if required_value != 0:
-                margin_percent = (margin / abs(required_value)) * 100
-            else:
-                margin_percent = 0.0 if actual_value == 0 else float('inf')
-        else:
-            margin = None
-            margin_percent = None
-
-        if passes:
-            severity = FindingSeverity.PASS
-            status = "pass"
-            message = f"{rule.name}: {actual_value:.3f} meets requirement of {required_value:.3f}"
-            remediation = None
-        else:
-            if rule.mandatory:
-                severity = FindingSeverity.NON_CONFORMANCE
-            else:
-                severity = FindingSeverity.WARNING
-            status = "fail"
-            message = f"{rule.name}: {actual_value:.3f} does not meet requirement of {required_value:.3f}"
-            remediation = self._generate_stability_remediation(rule, actual_value, required_value)
-
-        return self._create_finding(
-            rule=rule,
-            status=status,
-            severity=severity,
-            message=message,
-            actual_value=actual_value,
-            required_value=required_value,
-            margin=margin,
-            margin_percent=margin_percent,
-            remediation=remediation,
-        )
-
-    def _evaluate_formula(
-        self,
-        formula: str,
-        values: Dict[str, Any],
-        state: "StateManager",
-    ) -> Optional[float]:
-        """Evaluate formula string to get required value."""
-
-        # Handle common formulas
-        if "max(" in formula:
-            # Parse max(a, b*c) format
-            # Example: max(0.15, 0.04 * beam)
-            beam = self._get_value(state, "hull.beam", 0)
-            if "0.04 * beam" in formula or "0.04*beam" in formula:
-                return max(0.15, 0.04 * beam)
-
-        # Simple numeric limit
-        try:
-            return float(formula)
-        except ValueError:
-            return None
-
-    def _compare_values(
-        self,
-        actual: Any,
-        required: Any,
-        limit_type: str,
-    ) -> bool:
-        """Compare actual value against required based on limit type."""
-        if limit_type == "minimum":
-            return actual >= required
-        elif limit_type == "maximum":
-            return actual <= required
-        elif limit_type == "exact":
-            return abs(actual - required) < 0.001
-        else:
-            return actual >= required  # Default to minimum
+        return self._check_limit(rule, values, state, self._generate_stability_remediation)
 
     def _generate_stability_remediation(
         self,
@@ -326,15 +430,7 @@ class StructuralRuleChecker(RuleChecker):
         """Evaluate structural rule."""
 
         # Check for required inputs
-        missing_inputs = []
-        input_values = {}
-
-        for input_path in rule.required_inputs:
-            value = self._get_value(state, input_path)
-            if value is None:
-                missing_inputs.append(input_path)
-            else:
-                input_values[input_path] = value
+        missing_inputs, input_values = self._read_inputs(rule, state)
 
         if missing_inputs:
             return self._create_finding(
@@ -345,6 +441,10 @@ class StructuralRuleChecker(RuleChecker):
                 remediation="Structural analysis required to determine scantlings",
             )
 
+        # Rules with a formula or limit are checked directly
+        if rule.formula or rule.limit_value is not None:
+            return self._check_limit(rule, input_values, state)
+
         # Structural rules often require complex calculations
         # For now, flag as review_required unless we have specific formulas
         return self._create_finding(
@@ -375,15 +475,7 @@ class FreeboardRuleChecker(RuleChecker):
         """Evaluate freeboard rule."""
 
         # Check for required inputs
-        missing_inputs = []
-        input_values = {}
-
-        for input_path in rule.required_inputs:
-            value = self._get_value(state, input_path)
-            if value is None:
-                missing_inputs.append(input_path)
-            else:
-                input_values[input_path] = value
+        missing_inputs, input_values = self._read_inputs(rule, state)
 
         if missing_inputs:
             return self._create_finding(
@@ -394,6 +486,13 @@ class FreeboardRuleChecker(RuleChecker):
                 remediation="Calculate freeboard from hull geometry and loading conditions",
             )
 
+        # A formula on the rule replaces the default minimum
+        if rule.formula:
+            return self._check_limit(
+                rule, input_values, state,
+                lambda *_: "Increase hull depth or reduce loaded draft",
+            )
+
         freeboard = input_values.get("hull.freeboard", 0)
         lwl = input_values.get("hull.lwl", 0)
 
@@ -427,6 +526,50 @@ class FreeboardRuleChecker(RuleChecker):
                 remediation="Increase hull depth or reduce loaded draft",
             )
 
+    def check_many(self, rule: RuleRequirement, columns: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Vector form of check(); the default minimum when the rule has no formula."""
+        if rule.formula or "hull.freeboard" not in columns:
+            return super().check_many(rule, columns)
+        lwl = columns.get("hull.lwl", 0.0) if "hull.lwl" in rule.required_inputs else 0.0
+        freeboard = np.asarray(columns["hull.freeboard"], dtype=float)
+        with np.errstate(invalid="ignore"):
+            passes = freeboard >= np.maximum(0.3, np.asarray(lwl, dtype=float) * 0.01)
+        return np.broadcast_to(passes, np.broadcast_shapes(freeboard.shape, np.shape(lwl)))
+
+
+class FormulaRuleChecker(RuleChecker):
+    """
+    Generic checker for rules that carry their own limit.
+
+    Used for rules with a formula or limit_value in categories without a
+    dedicated checker, so such rules need no checker code of their own.
+    """
+
+    def __init__(self, category: Optional[RuleCategory] = None):
+        self._category = category
+
+    @property
+    def category(self) -> Optional[RuleCategory]:
+        return self._category
+
+    def check(
+        self,
+        rule: RuleRequirement,
+        state: "StateManager",
+    ) -> Finding:
+        """Evaluate the rule's formula or limit_value."""
+        missing_inputs, input_values = self._read_inputs(rule, state)
+
+        if missing_inputs:
+            return self._create_finding(
+                rule=rule,
+                status="incomplete",
+                severity=FindingSeverity.WARNING,
+                message=f"Missing required inputs: {', '.join(missing_inputs)}",
+            )
+
+        return self._check_limit(rule, input_values, state)
+
 
 # Checker registry
 RULE_CHECKERS: Dict[RuleCategory, RuleChecker] = {
@@ -436,6 +579,10 @@ RULE_CHECKERS: Dict[RuleCategory, RuleChecker] = {
 }
 
 
+# Fallback for formula/limit rules in categories without a checker
+FORMULA_CHECKER = FormulaRuleChecker()
+
+
 def get_checker(category: RuleCategory) -> Optional[RuleChecker]:
     """Get appropriate checker for a rule category."""
     return RULE_CHECKERS.get(category)
@@ -1,24 +1,34 @@
 """
-MAGNET Compliance Engine (v1.1)
+MAGNET Compliance Engine (v1.2)
 
 Central compliance evaluation engine.
 
 v1.1: Writes determinized compliance.report to state.
+v1.2: Incremental re-evaluation keyed on each rule's input paths, with
+      invalidation/cascade hooks; batch screening of limit rules.
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 import logging
+import threading
+import uuid
+
+import numpy as np
 
 from .enums import RegulatoryFramework, RuleCategory, FindingSeverity, ComplianceStatus
 from .rule_schema import RuleRequirement, Finding
 from .rule_library import RuleLibrary, RULE_LIBRARY
-from .checkers import get_checker, RuleChecker
+from .checkers import get_checker, RuleChecker, FORMULA_CHECKER
+from ..core.field_aliases import normalize_path
+from ..dependencies.invalidation import InvalidationReason
 
 if TYPE_CHECKING:
     from ..core.state_manager import StateManager
+    from ..dependencies.cascade import CascadeExecutor, RecalculationResult
+    from ..dependencies.invalidation import InvalidationEngine, InvalidationEvent
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +60,10 @@ class ComplianceReport:
     critical_findings: List[Finding] = field(default_factory=list)
     non_conformances: List[Finding] = field(default_factory=list)
 
+    # Rules actually run through a checker for this report (the rest were
+    # carried over from the previous report)
+    rules_checked: int = 0
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -79,6 +93,36 @@ class ComplianceReport:
         return (self.pass_count / evaluated) * 100
 
 
+@dataclass
+class _RuleSlot:
+    """A rule's finding in the last report and the inputs it was checked with."""
+    rule: RuleRequirement
+    checker: Optional[RuleChecker]
+    paths: List[str]
+    inputs: Tuple[Any, ...]
+    finding: Finding
+    index: int              # Position in report.findings
+    category_index: int     # Position in report.findings_by_category[...]
+    framework_index: int    # Position in report.findings_by_framework[...]
+    tracked: bool = True    # False: checker's inputs unknown, re-check every time
+
+
+def _new_report_id() -> str:
+    return f"CR-{uuid.uuid4().hex[:8].upper()}"
+
+
+def _tally(report: ComplianceReport, finding: Finding, sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) a finding from the report's status counts."""
+    if finding.status == "pass":
+        report.pass_count += sign
+    elif finding.status == "fail":
+        report.fail_count += sign
+    elif finding.status == "incomplete":
+        report.incomplete_count += sign
+    else:  # review_required, error
+        report.review_count += sign
+
+
 class ComplianceEngine:
     """
     Central compliance evaluation engine.
@@ -89,6 +133,7 @@ class ComplianceEngine:
     - Multi-framework support (ABS HSNC, HSC Code, USCG)
     - Category-specific checkers
     - Determinized report output for state caching
+    - Incremental re-evaluation: only rules whose inputs changed are re-checked
     """
 
     def __init__(self, rule_library: Optional[RuleLibrary] = None):
@@ -101,14 +146,63 @@ class ComplianceEngine:
         self.rule_library = rule_library or RULE_LIBRARY
         self._custom_checkers: Dict[RuleCategory, RuleChecker] = {}
 
+        # Last evaluation, reused by incremental evaluate() and refresh()
+        self._lock = threading.RLock()
+        self._report: Optional[ComplianceReport] = None
+        self._state: Optional["StateManager"] = None
+        self._context: Optional[Tuple[Any, ...]] = None
+        self._slots: List[_RuleSlot] = []
+        self._readers: Dict[str, List[int]] = {}  # Input path -> slot indices
+        self._untracked: List[int] = []  # Slots re-checked on every refresh
+        self._stale: Set[str] = set()
+        self._update_callbacks: List[Callable[[ComplianceReport, List[Finding]], None]] = []
+
+    @property
+    def last_report(self) -> Optional[ComplianceReport]:
+        """Report from the most recent evaluation or refresh."""
+        return self._report
+
     def register_checker(self, category: RuleCategory, checker: RuleChecker) -> None:
-        """Register a custom checker for a category."""
+        """
+        Register a custom checker for a category.
+
+        Incremental evaluation reuses a finding while the values at the
+        checker's input_paths() are unchanged. A custom checker that reads
+        state beyond the rule's own inputs must override input_paths();
+        one that does not override it has its rules re-checked on every
+        evaluate() and refresh().
+        """
         self._custom_checkers[category] = checker
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the last evaluation; the next evaluate() checks every rule."""
+        with self._lock:
+            self._report = None
+            self._state = None
+            self._context = None
+            self._slots = []
+            self._readers = {}
+            self._untracked = []
+            self._stale.clear()
 
     def get_checker(self, category: RuleCategory) -> Optional[RuleChecker]:
         """Get checker for category, preferring custom over default."""
         return self._custom_checkers.get(category) or get_checker(category)
 
+    def _tracks_inputs(self, checker: RuleChecker) -> bool:
+        """Whether checker's input_paths() can be trusted to cover what check() reads."""
+        if type(checker).input_paths is not RuleChecker.input_paths:
+            return True
+        return all(checker is not custom for custom in self._custom_checkers.values())
+
+    def _checker_for(self, rule: RuleRequirement) -> Optional[RuleChecker]:
+        """Category checker, else the generic one for rules carrying a formula or limit."""
+        checker = self.get_checker(rule.category)
+        if checker is None and (rule.formula or rule.limit_value is not None):
+            return FORMULA_CHECKER
+        return checker
+
     def evaluate(
         self,
         state: "StateManager",
@@ -116,95 +210,311 @@ class ComplianceEngine:
         vessel_type: str,
         length_m: float,
         vessel_name: str = "Unnamed Vessel",
+        incremental: bool = True,
     ) -> ComplianceReport:
         """
         Evaluate design against specified frameworks.
 
+        When the previous call used the same state, frameworks, vessel and
+        rule library, only rules whose input values changed since then are
+        re-checked; the rest keep their previous findings.
+
         Args:
             state: StateManager with current design state
             frameworks: List of regulatory frameworks to check
             vessel_type: Type of vessel (e.g., "ferry", "patrol")
             length_m: Vessel length for rule applicability
             vessel_name: Name of vessel for report
+            incremental: Reuse the previous evaluation where possible
 
         Returns:
             ComplianceReport with all findings
         """
-        import uuid
+        context = (tuple(frameworks), vessel_type, length_m, vessel_name, self.rule_library.revision)
+
+        with self._lock:
+            if incremental and self._report is not None and state is self._state and context == self._context:
+                self._stale.clear()
+                return self._recheck(range(len(self._slots)))
+
+            report = ComplianceReport(
+                report_id=_new_report_id(),
+                vessel_name=vessel_name,
+                vessel_type=vessel_type,
+                frameworks_checked=frameworks,
+            )
+
+            all_rules = self._applicable_rules(frameworks, vessel_type, length_m)
+
+            report.total_rules = len(all_rules)
+            report.rules_checked = len(all_rules)
+
+            # Evaluate each rule
+            slots: List[_RuleSlot] = []
+            for rule in all_rules:
+                checker = self._checker_for(rule)
+
+                if checker is None:
+                    # No checker available - mark as review required
+                    paths: List[str] = []
+                    inputs: Tuple[Any, ...] = ()
+                    finding = Finding(
+                        finding_id=f"F-{uuid.uuid4().hex[:8].upper()}",
+                        rule_id=rule.rule_id,
+                        rule_name=rule.name,
+                        severity=FindingSeverity.ADVISORY,
+                        status="review_required",
+                        message=f"No automated checker for {rule.category.value} rules",
+                        references=rule.references.copy(),
+                    )
+                else:
+                    paths = checker.input_paths(rule)
+                    inputs = checker.input_values(state, paths)
+                    finding = checker.check(rule, state)
+
+                slot = self._add_finding(report, rule, checker, paths, inputs, finding)
+                slot.tracked = checker is None or self._tracks_inputs(checker)
+                slots.append(slot)
+
+            # Determine overall status
+            report.overall_status = self._determine_status(report)
+
+            self._report = report
+            self._state = state
+            self._context = context
+            self._slots = slots
+            self._stale.clear()
+            self._readers = {}
+            self._untracked = [i for i, slot in enumerate(slots) if not slot.tracked]
+            for i, slot in enumerate(slots):
+                for path in slot.paths:
+                    self._readers.setdefault(normalize_path(path), []).append(i)
+
+            logger.info(
+                f"Compliance evaluation complete: {report.pass_count}/{report.total_rules} passed, "
+                f"status={report.overall_status.value}"
+            )
+
+            self._notify(report, report.findings)
+            return report
+
+    def screen(
+        self,
+        columns: Dict[str, Any],
+        frameworks: List[RegulatoryFramework],
+        vessel_type: str,
+        length_m: float,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Pass/fail of the applicable limit rules over a batch of designs.
 
-        report = ComplianceReport(
-            report_id=f"CR-{uuid.uuid4().hex[:8].upper()}",
-            vessel_name=vessel_name,
-            vessel_type=vessel_type,
-            frameworks_checked=frameworks,
-        )
+        For optimizer and sweep use: no findings or report are built.
+
+        Args:
+            columns: State path -> array of values, one per candidate design
+            frameworks: Regulatory frameworks to check
+            vessel_type: Type of vessel
+            length_m: Vessel length for rule applicability
 
-        # Gather applicable rules from all frameworks
+        Returns:
+            rule_id -> boolean array (True = pass). Rules without a formula
+            or limit_value, or with inputs missing from columns, are left out.
+        """
+        masks: Dict[str, np.ndarray] = {}
+        for rule in self._applicable_rules(frameworks, vessel_type, length_m):
+            checker = self._checker_for(rule)
+            if checker is None:
+                continue
+            passes = checker.check_many(rule, columns)
+            if passes is not None:
+                masks[rule.rule_id] = passes
+        return masks
+
+    def _applicable_rules(
+        self,
+        frameworks: List[RegulatoryFramework],
+        vessel_type: str,
+        length_m: float,
+    ) -> List[RuleRequirement]:
+        """Applicable rules from all frameworks, in framework order."""
         all_rules = []
         for framework in frameworks:
             rules = self.rule_library.get_applicable_rules(framework, vessel_type, length_m)
             all_rules.extend(rules)
             logger.debug(f"Found {len(rules)} applicable rules for {framework.value}")
+        return all_rules
 
-        report.total_rules = len(all_rules)
+    def refresh(self, paths: Iterable[str]) -> Optional[ComplianceReport]:
+        """
+        Re-check the rules that read any of paths, against the last state.
 
-        # Evaluate each rule
-        for rule in all_rules:
-            checker = self.get_checker(rule.category)
+        Meant for change notifications (see attach()): only the rules
+        reading the changed parameters are looked at.
 
-            if checker is None:
-                # No checker available - mark as review required
-                finding = Finding(
-                    finding_id=f"F-{uuid.uuid4().hex[:8].upper()}",
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    severity=FindingSeverity.ADVISORY,
-                    status="review_required",
-                    message=f"No automated checker for {rule.category.value} rules",
-                    references=rule.references.copy(),
-                )
-            else:
-                finding = checker.check(rule, state)
-
-            # Add finding to report
-            report.findings.append(finding)
-
-            # Categorize by status
-            if finding.status == "pass":
-                report.pass_count += 1
-            elif finding.status == "fail":
-                report.fail_count += 1
-                if finding.severity == FindingSeverity.NON_CONFORMANCE:
-                    report.non_conformances.append(finding)
-                elif finding.severity == FindingSeverity.CRITICAL:
-                    report.critical_findings.append(finding)
-            elif finding.status == "incomplete":
-                report.incomplete_count += 1
-            else:  # review_required, error
-                report.review_count += 1
-
-            # Group by category
-            cat_key = rule.category.value
-            if cat_key not in report.findings_by_category:
-                report.findings_by_category[cat_key] = []
-            report.findings_by_category[cat_key].append(finding)
-
-            # Group by framework
-            fw_key = rule.framework.value
-            if fw_key not in report.findings_by_framework:
-                report.findings_by_framework[fw_key] = []
-            report.findings_by_framework[fw_key].append(finding)
-
-        # Determine overall status
-        report.overall_status = self._determine_status(report)
+        Returns:
+            The updated report, or None before the first evaluate()
+        """
+        with self._lock:
+            if self._report is None:
+                return None
+            indices = set()
+            for path in paths:
+                path = normalize_path(path)
+                self._stale.discard(path)
+                indices.update(self._readers.get(path, ()))
+            # Rules whose checker does not declare its inputs may read any path
+            indices.update(self._untracked)
+            if not indices:
+                return self._report
+            return self._recheck(sorted(indices))
+
+    def mark_stale(self, paths: Iterable[str]) -> None:
+        """Record that paths were invalidated and are awaiting recalculation."""
+        with self._lock:
+            for path in paths:
+                path = normalize_path(path)
+                if path in self._readers:
+                    self._stale.add(path)
+
+    def stale_rules(self) -> List[str]:
+        """IDs of rules in the last report that read an invalidated, not yet refreshed path."""
+        with self._lock:
+            indices = sorted({i for path in self._stale for i in self._readers[path]})
+            return [self._slots[i].rule.rule_id for i in indices]
+
+    def on_update(self, callback: Callable[[ComplianceReport, List[Finding]], None]) -> None:
+        """Register a callback for new reports: callback(report, changed_findings)."""
+        self._update_callbacks.append(callback)
+
+    def attach(
+        self,
+        invalidation_engine: Optional["InvalidationEngine"] = None,
+        cascade_executor: Optional["CascadeExecutor"] = None,
+    ) -> None:
+        """
+        Follow the dependency system so compliance updates with the cascade.
 
-        logger.info(
-            f"Compliance evaluation complete: {report.pass_count}/{report.total_rules} passed, "
-            f"status={report.overall_status.value}"
+        A changed parameter re-checks the rules reading it at once and
+        marks the rules reading its downstream parameters stale; each
+        parameter the cascade then recalculates re-checks its readers.
+        Every re-check publishes the updated report to on_update()
+        callbacks.
+        """
+        if invalidation_engine is not None:
+            invalidation_engine.on_invalidate(self._on_invalidated)
+        if cascade_executor is not None:
+            cascade_executor.on_progress(self._on_recalculated)
+
+    def _on_invalidated(self, event: "InvalidationEvent") -> None:
+        self.mark_stale(event.invalidated_parameters)
+        if event.reason == InvalidationReason.PARAMETER_CHANGED:
+            self.refresh([event.trigger_parameter])
+
+    def _on_recalculated(self, param: str, result: "RecalculationResult") -> None:
+        if result.success:
+            self.refresh([param])
+
+    def _recheck(self, indices: Iterable[int]) -> ComplianceReport:
+        """Re-check the given slots whose inputs changed and patch the last report."""
+        state = self._state
+        changed: List[Tuple[_RuleSlot, Finding]] = []
+        for i in indices:
+            slot = self._slots[i]
+            if slot.checker is None:
+                continue
+            inputs = slot.checker.input_values(state, slot.paths)
+            if inputs == slot.inputs and slot.tracked:
+                continue
+            slot.inputs = inputs
+            changed.append((slot, slot.checker.check(slot.rule, state)))
+
+        previous = self._report
+        report = ComplianceReport(
+            report_id=_new_report_id(),
+            vessel_name=previous.vessel_name,
+            vessel_type=previous.vessel_type,
+            frameworks_checked=previous.frameworks_checked,
+            total_rules=previous.total_rules,
+            pass_count=previous.pass_count,
+            fail_count=previous.fail_count,
+            incomplete_count=previous.incomplete_count,
+            review_count=previous.review_count,
+            findings=list(previous.findings),
+            findings_by_category={k: list(v) for k, v in previous.findings_by_category.items()},
+            findings_by_framework={k: list(v) for k, v in previous.findings_by_framework.items()},
+            critical_findings=list(previous.critical_findings),
+            non_conformances=list(previous.non_conformances),
+            rules_checked=len(changed),
         )
 
+        flagged = False
+        for slot, finding in changed:
+            old = slot.finding
+            _tally(report, old, -1)
+            _tally(report, finding, 1)
+            report.findings[slot.index] = finding
+            report.findings_by_category[slot.rule.category.value][slot.category_index] = finding
+            report.findings_by_framework[slot.rule.framework.value][slot.framework_index] = finding
+            flagged = flagged or old.status == "fail" or finding.status == "fail"
+            slot.finding = finding
+
+        if flagged:
+            failed = [f for f in report.findings if f.status == "fail"]
+            report.non_conformances = [f for f in failed if f.severity == FindingSeverity.NON_CONFORMANCE]
+            report.critical_findings = [f for f in failed if f.severity == FindingSeverity.CRITICAL]
+
+        report.overall_status = self._determine_status(report)
+        self._report = report
+
+        logger.debug(f"Compliance re-check: {len(changed)}/{report.total_rules} rules changed")
+
+        if changed:
+            self._notify(report, [finding for _, finding in changed])
         return report
 
+    @staticmethod
+    def _add_finding(
+        report: ComplianceReport,
+        rule: RuleRequirement,
+        checker: Optional[RuleChecker],
+        paths: List[str],
+        inputs: Tuple[Any, ...],
+        finding: Finding,
+    ) -> "_RuleSlot":
+        """Append a finding to the report's lists and counts."""
+        report.findings.append(finding)
+        _tally(report, finding, 1)
+
+        if finding.status == "fail":
+            if finding.severity == FindingSeverity.NON_CONFORMANCE:
+                report.non_conformances.append(finding)
+            elif finding.severity == FindingSeverity.CRITICAL:
+                report.critical_findings.append(finding)
+
+        # Group by category and framework
+        by_category = report.findings_by_category.setdefault(rule.category.value, [])
+        by_category.append(finding)
+        by_framework = report.findings_by_framework.setdefault(rule.framework.value, [])
+        by_framework.append(finding)
+
+        return _RuleSlot(
+            rule=rule,
+            checker=checker,
+            paths=paths,
+            inputs=inputs,
+            finding=finding,
+            index=len(report.findings) - 1,
+            category_index=len(by_category) - 1,
+            framework_index=len(by_framework) - 1,
+        )
+
+    def _notify(self, report: ComplianceReport, changed: List[Finding]) -> None:
+        for callback in self._update_callbacks:
+            try:
+                callback(report, changed)
+            except Exception as e:
+                logger.error(f"Compliance update callback error: {e}")
+
     def evaluate_single_framework(
         self,
         state: "StateManager",
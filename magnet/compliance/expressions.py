@@ -0,0 +1,308 @@
+"""
+MAGNET Compliance Rule Expressions (v1.0)
+
+Safe compiler for rule formulas.
+
+A formula is a Python-syntax arithmetic expression over state paths, e.g.
+"max(0.15, 0.04 * beam)" or "0.05 * lwl <= arrangement.collision_bulkhead_m
+<= 0.15 * lwl". It is parsed once, checked against a whitelist of syntax and
+functions, and lowered to two plain functions over a tuple of input values:
+one for scalars and one for numpy columns (one entry per candidate design).
+Compiled expressions are cached by source text.
+"""
+
+from __future__ import annotations
+from functools import lru_cache, reduce
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple, TYPE_CHECKING
+import ast
+import math
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..core.state_manager import StateManager
+
+
+# Bare symbols and the state paths they stand for; any other input is
+# written as its dotted state path (e.g. stability.gm_m)
+FORMULA_SYMBOLS: Dict[str, str] = {
+    "beam": "hull.beam",
+    "lwl": "hull.lwl",
+    "loa": "hull.loa",
+    "draft": "hull.draft",
+    "depth": "hull.depth",
+    "freeboard": "hull.freeboard",
+    "displacement": "hull.displacement_m3",
+    "passengers": "mission.passengers",
+}
+
+_SCALAR_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "max": max,
+    "min": min,
+    "abs": abs,
+    "sqrt": math.sqrt,
+    "log": math.log,
+    "exp": math.exp,
+    # Lowered form of **: float power, so huge results overflow instead of
+    # growing unbounded integers (9 ** 9 ** 9)
+    "pow": math.pow,
+}
+
+_VECTOR_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "max": lambda *args: reduce(np.maximum, args),
+    "min": lambda *args: reduce(np.minimum, args),
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "log": np.log,
+    "exp": np.exp,
+    "pow": lambda base, exponent: np.power(np.asarray(base, dtype=float), exponent),
+    # Lowered forms of and / or / not / if-else
+    "and": np.logical_and,
+    "or": np.logical_or,
+    "not": np.logical_not,
+    "where": np.where,
+}
+
+_BINARY_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv)
+_COMPARE_OPS = (ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq)
+
+
+class ExpressionError(ValueError):
+    """Raised for formulas that are malformed or use unsupported syntax."""
+    pass
+
+
+class CompiledExpression:
+    """
+    A parsed and validated rule formula.
+
+    paths lists the state paths the formula reads, in first-use order;
+    calling the expression with a sequence of values in that order
+    evaluates it.
+    """
+
+    __slots__ = ("source", "paths", "bindings", "_scalar", "_vector")
+
+    def __init__(
+        self,
+        source: str,
+        paths: Tuple[str, ...],
+        bindings: Dict[str, str],
+        scalar: Callable[..., Any],
+        vector: Callable[..., Any],
+    ):
+        self.source = source
+        self.paths = paths
+        self.bindings = bindings  # Name as written -> state path
+        self._scalar = scalar
+        self._vector = vector
+
+    def __call__(self, values: Sequence[Any]) -> Any:
+        """Evaluate with input values given in paths order."""
+        return self._scalar(values, _SCALAR_FUNCTIONS)
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+    def evaluate(self, state: "StateManager") -> Any:
+        """
+        Evaluate against a state (anything with get(path, default)).
+
+        Returns None if any input is unset.
+        """
+        get = state.get
+        values = []
+        for path in self.paths:
+            value = get(path, None)
+            if value is None:
+                return None
+            values.append(value)
+        return self._scalar(values, _SCALAR_FUNCTIONS)
+
+    def evaluate_many(self, columns: Mapping[str, Any]) -> np.ndarray:
+        """
+        Evaluate over a batch of designs.
+
+        Args:
+            columns: State path -> array of values, one per design
+                (scalars broadcast)
+
+        Returns:
+            Array with one result per design
+        """
+        missing = [path for path in self.paths if path not in columns]
+        if missing:
+            raise ExpressionError(f"No values for {', '.join(missing)} in {self.source!r}")
+        values = [np.asarray(columns[path], dtype=float) for path in self.paths]
+        with np.errstate(all="ignore"):
+            result = np.asarray(self._vector(values, _VECTOR_FUNCTIONS))
+        if values:
+            result = np.broadcast_to(result, np.broadcast_shapes(*(v.shape for v in values)))
+        return result
+
+
+@lru_cache(maxsize=4096)
+def compile_expression(source: str) -> CompiledExpression:
+    """
+    Compile a rule formula (cached by source text).
+
+    Raises:
+        ExpressionError: If the formula does not parse or uses syntax,
+            names or functions outside the whitelist.
+    """
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid formula {source!r}: {e.msg}") from None
+
+    scalar_lowering = _Lowering(vector=False)
+    scalar_body = scalar_lowering.lower(tree.body)
+    vector_lowering = _Lowering(vector=True)
+    vector_body = vector_lowering.lower(tree.body)
+
+    return CompiledExpression(
+        source=source,
+        paths=tuple(scalar_lowering.paths),
+        bindings=dict(scalar_lowering.bindings),
+        scalar=_as_function(scalar_body, source),
+        vector=_as_function(vector_body, source),
+    )
+
+
+def _as_function(body: ast.expr, source: str) -> Callable[..., Any]:
+    """Wrap a lowered body in `lambda _v, _f: body` and compile it."""
+    arguments = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg="_v"), ast.arg(arg="_f")],
+        vararg=None,
+        kwonlyargs=[],
+        kw_defaults=[],
+        kwarg=None,
+        defaults=[],
+    )
+    tree = ast.fix_missing_locations(ast.Expression(body=ast.Lambda(args=arguments, body=body)))
+    code = compile(tree, f"<rule formula {source!r}>", "eval")
+    return eval(code, {"__builtins__": {}})
+
+
+class _Lowering:
+    """
+    Validates a formula AST and rewrites it over the `_v` (input values)
+    and `_f` (function table) arguments.
+
+    With vector=True, and/or/not, chained comparisons and if-else become
+    element-wise function calls so the result works on numpy columns.
+    """
+
+    def __init__(self, vector: bool):
+        self.vector = vector
+        self.paths: List[str] = []
+        self.bindings: Dict[str, str] = {}
+
+    def lower(self, node: ast.AST) -> ast.expr:
+        if isinstance(node, ast.Constant):
+            if type(node.value) not in (int, float, bool):
+                raise ExpressionError(f"Unsupported constant {node.value!r}")
+            return ast.Constant(value=node.value)
+
+        if isinstance(node, (ast.Name, ast.Attribute)):
+            return self._input(node)
+
+        if isinstance(node, ast.BinOp):
+            if not isinstance(node.op, _BINARY_OPS):
+                raise ExpressionError(f"Unsupported operator {type(node.op).__name__}")
+            if isinstance(node.op, ast.Pow):
+                return self._call("pow", [self.lower(node.left), self.lower(node.right)])
+            return ast.BinOp(left=self.lower(node.left), op=node.op, right=self.lower(node.right))
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self.lower(node.operand)
+            if isinstance(node.op, ast.Not):
+                if self.vector:
+                    return self._call("not", [operand])
+                return ast.UnaryOp(op=ast.Not(), operand=operand)
+            if isinstance(node.op, (ast.USub, ast.UAdd)):
+                return ast.UnaryOp(op=node.op, operand=operand)
+            raise ExpressionError(f"Unsupported operator {type(node.op).__name__}")
+
+        if isinstance(node, ast.BoolOp):
+            values = [self.lower(v) for v in node.values]
+            if not self.vector:
+                return ast.BoolOp(op=node.op, values=values)
+            name = "and" if isinstance(node.op, ast.And) else "or"
+            return reduce(lambda a, b: self._call(name, [a, b]), values)
+
+        if isinstance(node, ast.Compare):
+            for op in node.ops:
+                if not isinstance(op, _COMPARE_OPS):
+                    raise ExpressionError(f"Unsupported comparison {type(op).__name__}")
+            operands = [self.lower(node.left)] + [self.lower(c) for c in node.comparators]
+            if not self.vector:
+                return ast.Compare(left=operands[0], ops=node.ops, comparators=operands[1:])
+            pairs = [
+                ast.Compare(left=operands[i], ops=[op], comparators=[operands[i + 1]])
+                for i, op in enumerate(node.ops)
+            ]
+            return reduce(lambda a, b: self._call("and", [a, b]), pairs)
+
+        if isinstance(node, ast.IfExp):
+            test = self.lower(node.test)
+            body, orelse = self.lower(node.body), self.lower(node.orelse)
+            if self.vector:
+                return self._call("where", [test, body, orelse])
+            return ast.IfExp(test=test, body=body, orelse=orelse)
+
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in _SCALAR_FUNCTIONS:
+                raise ExpressionError(f"Unsupported function in formula: {ast.unparse(node.func)}")
+            if node.keywords or any(isinstance(a, ast.Starred) for a in node.args) or not node.args:
+                raise ExpressionError(f"Unsupported call: {ast.unparse(node)}")
+            return self._call(node.func.id, [self.lower(a) for a in node.args])
+
+        raise ExpressionError(f"Unsupported syntax in formula: {type(node).__name__}")
+
+    def _input(self, node: ast.expr) -> ast.expr:
+        """A symbol or dotted state path, as `_v[slot]`."""
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            raise ExpressionError("Inputs must be symbols or dotted state paths")
+        parts.append(node.id)
+        name = ".".join(reversed(parts))
+
+        if "." in name:
+            path = name
+        elif name in FORMULA_SYMBOLS:
+            path = FORMULA_SYMBOLS[name]
+        else:
+            raise ExpressionError(f"Unknown symbol {name!r} (use a dotted state path)")
+
+        self.bindings[name] = path
+        if path not in self.paths:
+            self.paths.append(path)
+        slot = self.paths.index(path)
+        return ast.Subscript(
+            value=ast.Name(id="_v", ctx=ast.Load()), slice=ast.Constant(value=slot), ctx=ast.Load(),
+        )
+
+    @staticmethod
+    def _call(name: str, args: List[ast.expr]) -> ast.expr:
+        func = ast.Subscript(
+            value=ast.Name(id="_f", ctx=ast.Load()), slice=ast.Constant(value=name), ctx=ast.Load(),
+        )
+        return ast.Call(func=func, args=args, keywords=[])
+
+
+def compare_limit(actual: Any, required: Any, limit_type: str) -> Any:
+    """
+    Compare actual against required per a rule's limit_type.
+
+    Works element-wise when either side is a numpy array.
+    """
+    if limit_type == "maximum":
+        return actual <= required
+    if limit_type == "exact":
+        return abs(actual - required) < 0.001
+    return actual >= required  # minimum (default)
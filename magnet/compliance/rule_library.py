@@ -10,75 +10,230 @@ v1.1 FIX: Corrected field names to match StabilityState in Module 01 v1.8:
   - stability.area_30_40_m_rad (CORRECT)
   - stability.gz_max_m (CORRECT)
   - stability.gm_m (CORRECT)
+
+v1.2: Precomputed framework/category lists and applicability indexes
+      (vessel type + length range); lazy loading from rule packs.
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+import math
+
+from ..core.interval_tree import IntervalTree
 
 from .rule_schema import RuleRequirement, RuleReference
+from .rule_pack import RulePack
 from .enums import RuleCategory, RegulatoryFramework
 
 
-class RuleLibrary:
-    """Repository of regulatory rules."""
+class _Entry:
+    """A registered rule's applicability, and the rule (decoded on first use for packs)."""
 
-    def __init__(self):
-        self._rules: Dict[str, RuleRequirement] = {}
-        self._by_framework: Dict[RegulatoryFramework, List[str]] = {}
-        self._by_category: Dict[RuleCategory, List[str]] = {}
+    __slots__ = ("rule_id", "framework", "category", "vessel_types", "min_length_m", "max_length_m", "_rule", "_load")
 
-        self._load_abs_hsnc_rules()
-        self._load_hsc_code_rules()
-        self._load_uscg_rules()
+    def __init__(
+        self,
+        rule_id: str,
+        framework: RegulatoryFramework,
+        category: RuleCategory,
+        vessel_types: List[str],
+        min_length_m: Optional[float],
+        max_length_m: Optional[float],
+        rule: Optional[RuleRequirement] = None,
+        load: Optional[Callable[[], RuleRequirement]] = None,
+    ):
+        self.rule_id = rule_id
+        self.framework = framework
+        self.category = category
+        self.vessel_types = vessel_types
+        self.min_length_m = min_length_m
+        self.max_length_m = max_length_m
+        self._rule = rule
+        self._load = load
+
+    @classmethod
+    def of(cls, rule: RuleRequirement) -> "_Entry":
+        return cls(
+            rule.rule_id, rule.framework, rule.category, list(rule.vessel_types),
+            rule.min_length_m, rule.max_length_m, rule=rule,
+        )
+
+    @property
+    def rule(self) -> RuleRequirement:
+        if self._rule is None:
+            self._rule = self._load()
+            self._load = None
+        return self._rule
+
+
+class _ApplicabilityIndex:
+    """
+    Entries of one (framework, category): an interval tree of untyped
+    entries plus one per vessel type of the entries naming it. Unset (or
+    zero) length bounds are open, as in the original linear filter.
+    """
+
+    def __init__(self, entries: List[_Entry]):
+        untyped: List[Tuple[float, float, Tuple[int, _Entry]]] = []
+        typed: Dict[str, List[Tuple[float, float, Tuple[int, _Entry]]]] = {}
+        for order, entry in enumerate(entries):
+            r = (entry.min_length_m or -math.inf, entry.max_length_m or math.inf, (order, entry))
+            if r[0] > r[1]:
+                continue  # Empty range: applies at no length
+            if not entry.vessel_types:
+                untyped.append(r)
+            for vessel_type in set(entry.vessel_types):
+                typed.setdefault(vessel_type, []).append(r)
+        self._any = IntervalTree(untyped)
+        self._by_type = {vessel_type: IntervalTree(ranges) for vessel_type, ranges in typed.items()}
+
+    def query(self, vessel_type: str, length_m: float) -> List[_Entry]:
+        """Applicable entries, in registration order."""
+        found = self._any.stab(length_m)
+        tree = self._by_type.get(vessel_type)
+        if tree is not None:
+            found.extend(tree.stab(length_m))
+        found.sort(key=lambda f: f[0])
+        return [entry for _, entry in found]
 
-    def register(self, rule: RuleRequirement) -> None:
-        """Register a rule in the library."""
-        self._rules[rule.rule_id] = rule
 
-        if rule.framework not in self._by_framework:
-            self._by_framework[rule.framework] = []
-        self._by_framework[rule.framework].append(rule.rule_id)
+class RuleLibrary:
+    """
+    Repository of regulatory rules.
+
+    Rules are indexed by framework and category, and for applicability
+    lookups by (framework, category, vessel type) with a length-range
+    interval tree. The applicability indexes are built on first lookup and
+    dropped by register() for the frameworks it touches. A rule's
+    applicability fields are read when it is registered; re-register a
+    rule after changing them. Rule packs stay memory-mapped until close().
+    """
+
+    def __init__(self, load_builtin: bool = True):
+        """
+        Args:
+            load_builtin: Load the built-in ABS HSNC, HSC Code and USCG rules
+        """
+        self._entries: Dict[str, _Entry] = {}
+        self._by_framework: Dict[RegulatoryFramework, List[_Entry]] = {}
+        self._by_category: Dict[RuleCategory, List[_Entry]] = {}
+        # (framework, category or None for all) -> index
+        self._applicability: Dict[Tuple[RegulatoryFramework, Optional[RuleCategory]], _ApplicabilityIndex] = {}
+        self._packs: List[RulePack] = []
+        # Bumped on every register(); lets engines detect library changes
+        self.revision = 0
+
+        if load_builtin:
+            self._load_abs_hsnc_rules()
+            self._load_hsc_code_rules()
+            self._load_uscg_rules()
+
+    @classmethod
+    def from_pack(cls, path: str) -> "RuleLibrary":
+        """Library holding only the rules of a rule pack (see rule_pack.py)."""
+        library = cls(load_builtin=False)
+        library.load_pack(path)
+        return library
 
-        if rule.category not in self._by_category:
-            self._by_category[rule.category] = []
-        self._by_category[rule.category].append(rule.rule_id)
+    def register(self, rule: RuleRequirement) -> None:
+        """Register a rule in the library (replacing any rule with the same ID)."""
+        self._add(_Entry.of(rule))
+
+    def load_pack(self, path: str) -> int:
+        """
+        Register every rule of a rule pack without decoding them.
+
+        Each rule is decoded from the memory-mapped pack when first
+        returned by a lookup.
+
+        Returns:
+            Number of rules registered
+        """
+        pack = RulePack(path)
+        self._packs.append(pack)
+        frameworks = {f.value: f for f in RegulatoryFramework}
+        categories = {c.value: c for c in RuleCategory}
+        for i, (rule_id, framework, category, vessel_types, min_length_m, max_length_m, _, _) in enumerate(pack.rows):
+            self._add(_Entry(
+                rule_id, frameworks[framework], categories[category], vessel_types,
+                min_length_m, max_length_m, load=lambda i=i: pack.load(i),
+            ))
+        return len(pack)
+
+    def close(self) -> None:
+        """
+        Unmap the library's rule packs.
+
+        Rules already returned by a lookup stay usable; pack rules not yet
+        decoded can no longer be loaded.
+        """
+        for pack in self._packs:
+            pack.close()
+        self._packs = []
+
+    def __enter__(self) -> "RuleLibrary":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _add(self, entry: _Entry) -> None:
+        previous = self._entries.get(entry.rule_id)
+        # Replacing keeps the rule's original position
+        self._entries[entry.rule_id] = entry
+        self.revision += 1
+
+        if previous is None:
+            self._by_framework.setdefault(entry.framework, []).append(entry)
+            self._by_category.setdefault(entry.category, []).append(entry)
+        else:
+            self._by_framework = {}
+            self._by_category = {}
+            for e in self._entries.values():
+                self._by_framework.setdefault(e.framework, []).append(e)
+                self._by_category.setdefault(e.category, []).append(e)
+            self._drop_applicability(previous.framework)
+
+        self._drop_applicability(entry.framework)
+
+    def _drop_applicability(self, framework: RegulatoryFramework) -> None:
+        if not self._applicability:
+            return
+        for key in [k for k in self._applicability if k[0] == framework]:
+            del self._applicability[key]
 
     def get(self, rule_id: str) -> Optional[RuleRequirement]:
         """Get rule by ID."""
-        return self._rules.get(rule_id)
+        entry = self._entries.get(rule_id)
+        return entry.rule if entry is not None else None
 
     def get_by_framework(self, framework: RegulatoryFramework) -> List[RuleRequirement]:
         """Get all rules for a framework."""
-        rule_ids = self._by_framework.get(framework, [])
-        return [self._rules[rid] for rid in rule_ids]
+        return [e.rule for e in self._by_framework.get(framework, ())]
 
     def get_by_category(self, category: RuleCategory) -> List[RuleRequirement]:
         """Get all rules for a category."""
-        rule_ids = self._by_category.get(category, [])
-        return [self._rules[rid] for rid in rule_ids]
+        return [e.rule for e in self._by_category.get(category, ())]
 
     def get_applicable_rules(
         self,
         framework: RegulatoryFramework,
         vessel_type: str,
         length_m: float,
+        category: Optional[RuleCategory] = None,
     ) -> List[RuleRequirement]:
-        """Get rules applicable to a specific vessel."""
-        applicable = []
-        for rule in self.get_by_framework(framework):
-            # Check vessel type restriction
-            if rule.vessel_types and vessel_type not in rule.vessel_types:
-                continue
-            # Check length restrictions
-            if rule.min_length_m and length_m < rule.min_length_m:
-                continue
-            if rule.max_length_m and length_m > rule.max_length_m:
-                continue
-            applicable.append(rule)
-        return applicable
+        """Get rules applicable to a specific vessel (optionally of one category)."""
+        key = (framework, category)
+        index = self._applicability.get(key)
+        if index is None:
+            entries = self._by_framework.get(framework, [])
+            if category is not None:
+                entries = [e for e in entries if e.category == category]
+            index = self._applicability[key] = _ApplicabilityIndex(entries)
+        return [e.rule for e in index.query(vessel_type, length_m)]
 
     def get_all_rules(self) -> List[RuleRequirement]:
         """Get all registered rules."""
-        return list(self._rules.values())
+        return [e.rule for e in self._entries.values()]
 
     def _load_abs_hsnc_rules(self) -> None:
         """Load ABS High-Speed Naval Craft rules."""
@@ -238,6 +393,8 @@ class RuleLibrary:
             references=[RuleReference("HSC Code 2000", "2.8", "2.8.1", edition_year=2000)],
             required_inputs=["stability.damage_all_pass"],  # CORRECT FIELD NAME
             acceptance_criteria="Vessel must survive one-compartment flooding",
+            formula="stability.damage_all_pass",
+            limit_type="criterion",
             mandatory=True,
         ))
 
@@ -295,6 +452,8 @@ class RuleLibrary:
             references=[RuleReference("46 CFR", "179.210", edition_year=2024)],
             required_inputs=["arrangement.collision_bulkhead_m", "hull.lwl"],
             acceptance_criteria="Collision bulkhead 5-15% LWL from FP",
+            formula="0.05 * lwl <= arrangement.collision_bulkhead_m <= 0.15 * lwl",
+            limit_type="criterion",
             mandatory=True,
         ))
 
@@ -0,0 +1,144 @@
+"""
+MAGNET Compliance Rule Packs (v1.0)
+
+Serialized rule sets that a RuleLibrary can load lazily.
+
+Layout:
+    magic "MAGNETRP" | version (u32) | header length (u64) | header | records
+
+The header is JSON: one row per rule with its applicability (framework,
+category, vessel types, length range) and the offset/length of its record.
+Each record is the rule's full JSON. A pack is memory-mapped on open, the
+header is decoded once, and a record is only decoded when its rule is
+first used.
+"""
+
+from __future__ import annotations
+from dataclasses import asdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+from .enums import RuleCategory, RegulatoryFramework
+from .rule_schema import RuleRequirement, RuleReference
+
+PACK_MAGIC = b"MAGNETRP"
+PACK_VERSION = 1
+
+_PREAMBLE = struct.Struct("<8sIQ")
+
+# Header row: rule_id, framework, category, vessel_types, min_length_m, max_length_m, offset, length
+PackRow = Tuple[str, str, str, List[str], Optional[float], Optional[float], int, int]
+
+
+class RulePackError(ValueError):
+    """Raised for files that are not readable rule packs."""
+    pass
+
+
+def rule_to_record(rule: RuleRequirement) -> Dict[str, Any]:
+    """Full, JSON-ready form of a rule (unlike to_dict(), which is a summary)."""
+    record = asdict(rule)
+    record["category"] = rule.category.value
+    record["framework"] = rule.framework.value
+    return record
+
+
+def rule_from_record(record: Dict[str, Any]) -> RuleRequirement:
+    """Inverse of rule_to_record()."""
+    record = dict(record)
+    record["category"] = RuleCategory(record["category"])
+    record["framework"] = RegulatoryFramework(record["framework"])
+    record["references"] = [RuleReference(**ref) for ref in record.get("references", [])]
+    return RuleRequirement(**record)
+
+
+def write_rule_pack(path: str, rules: Iterable[RuleRequirement]) -> int:
+    """
+    Write rules to a pack file.
+
+    The pack is written beside path and moved over it, so a library that
+    still maps the old file keeps reading the old contents.
+
+    Returns:
+        Number of rules written
+    """
+    rows: List[PackRow] = []
+    records: List[bytes] = []
+    offset = 0
+    for rule in rules:
+        data = json.dumps(rule_to_record(rule), separators=(",", ":")).encode("utf-8")
+        rows.append((
+            rule.rule_id, rule.framework.value, rule.category.value, list(rule.vessel_types),
+            rule.min_length_m, rule.max_length_m, offset, len(data),
+        ))
+        records.append(data)
+        offset += len(data)
+
+    header = json.dumps({"rules": rows}, separators=(",", ":")).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=os.path.basename(path) + ".", suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(PACK_MAGIC, PACK_VERSION, len(header)))
+            f.write(header)
+            for data in records:
+                f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return len(rows)
+
+
+class RulePack:
+    """
+    A memory-mapped rule pack.
+
+    rows holds the header; load(i) decodes the i-th rule. The mapping
+    stays open until close().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise RulePackError(f"{path} is empty") from None
+
+        if len(self._mm) < _PREAMBLE.size:
+            self.close()
+            raise RulePackError(f"{path} is not a rule pack")
+        magic, version, header_length = _PREAMBLE.unpack_from(self._mm, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise RulePackError(f"{path} is not a rule pack")
+        if version != PACK_VERSION:
+            self.close()
+            raise RulePackError(f"{path}: unsupported rule pack version {version}")
+
+        start = _PREAMBLE.size
+        self._data_start = start + header_length
+        self.rows: List[PackRow] = [
+            tuple(row) for row in json.loads(self._mm[start:self._data_start])["rules"]
+        ]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def load(self, index: int) -> RuleRequirement:
+        """Decode one rule."""
+        offset, length = self.rows[index][6], self.rows[index][7]
+        start = self._data_start + offset
+        return rule_from_record(json.loads(self._mm[start:start + length]))
+
+    def close(self) -> None:
+        self._mm.close()
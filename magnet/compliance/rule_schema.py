@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from .enums import RuleCategory, RegulatoryFramework, FindingSeverity
+from .expressions import ExpressionError, compile_expression
 
 if TYPE_CHECKING:
     pass
@@ -64,7 +65,8 @@ class RuleRequirement:
     acceptance_criteria: str = ""
     formula: Optional[str] = None
     limit_value: Optional[float] = None
-    limit_type: str = "minimum"  # minimum, maximum, exact
+    limit_type: str = "minimum"  # minimum, maximum, exact, criterion (formula is the pass test)
+    reads: List[str] = field(default_factory=list)  # State paths read; inferred when empty
 
     # Metadata
     mandatory: bool = True
@@ -82,6 +84,24 @@ class RuleRequirement:
             "mandatory": self.mandatory,
         }
 
+    def input_paths(self) -> List[str]:
+        """
+        State paths this rule's evaluation reads.
+
+        The declared reads if any; otherwise required_inputs plus the
+        paths the formula reads (see expressions.FORMULA_SYMBOLS).
+        """
+        if self.reads:
+            return list(self.reads)
+        paths = list(self.required_inputs)
+        if self.formula:
+            try:
+                formula_paths = compile_expression(self.formula).paths
+            except ExpressionError:
+                formula_paths = ()
+            paths.extend(p for p in formula_paths if p not in paths)
+        return paths
+
 
 @dataclass
 class Finding:
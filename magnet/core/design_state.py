@@ -12,6 +12,7 @@ import uuid
 import copy
 
 from magnet.core.constants import DESIGN_STATE_VERSION
+from magnet.core.history_store import HistoryStore
 from magnet.core.dataclasses import (
     MissionConfig,
     HullState,
@@ -164,7 +165,7 @@ class DesignState:
 
     # ==================== Metadata ====================
     metadata: Dict[str, Any] = field(default_factory=dict)
-    history: List[Dict[str, Any]] = field(default_factory=list)
+    history: HistoryStore = field(default_factory=HistoryStore)  # Capped, see HistoryStore
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
     created_by: Optional[str] = None
@@ -176,6 +177,9 @@ class DesignState:
         """Initialize design_id and timestamps if not set."""
         if self.design_id is None:
             self.design_id = str(uuid.uuid4())
+        if not isinstance(self.history, HistoryStore):
+            # Unbounded here; the owning StateManager applies its history_limit
+            self.history = HistoryStore(self.history, max_entries=None)
         if self.created_at is None:
             self.created_at = datetime.utcnow().isoformat()
         self.updated_at = datetime.utcnow().isoformat()
@@ -214,8 +218,14 @@ class DesignState:
 
     # ==================== Serialization ====================
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize the entire design state to a dictionary."""
+    def to_dict(self, include_history: bool = True) -> Dict[str, Any]:
+        """
+        Serialize the entire design state to a dictionary.
+
+        Args:
+            include_history: Include the mutation history. Hot paths
+                (transaction snapshots, state fetches) leave it out.
+        """
         result = {
             # Identity
             "design_id": self.design_id,
@@ -235,10 +245,11 @@ class DesignState:
             "decisions": self.decisions,
             # Metadata
             "metadata": self.metadata,
-            "history": self.history,
-            # Parameter locks
-            "locked_parameters": list(self.locked_parameters),
         }
+        if include_history:
+            result["history"] = self.history.to_list()
+        # Parameter locks
+        result["locked_parameters"] = list(self.locked_parameters)
 
         # Serialize all 27 sections
         for section_name in self.SECTION_NAMES:
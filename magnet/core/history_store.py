@@ -0,0 +1,361 @@
+"""
+MAGNET HistoryStore
+
+Bounded, columnar storage for DesignState.history.
+
+Each mutation record is split into columns: an int64 timestamp
+(microseconds since the Unix epoch), interned ids for action, path and
+source, the old/new values, and a dict for any other keys (txn_id,
+design_version, paths_modified, ...). Only the newest ``max_entries``
+records are kept. Records are materialized back into the original dict
+shape on access, so the store still iterates like the list it replaces.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_TIME = -(2 ** 63)  # timestamp column value when the record has no parseable timestamp
+_NO_ID = -1  # string column value when the key is absent
+_PREFIX_CACHE_SIZE = 4096
+
+_CORE_KEYS = frozenset(("timestamp", "source", "action", "path", "old_value", "new_value"))
+
+
+class _Absent:
+    """Marker for a record key that is not present."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self):
+        return "<ABSENT>"
+
+
+_ABSENT = _Absent()
+
+
+class HistoryStore:
+    """
+    Capped mutation history with interned strings and packed timestamps.
+
+    Usage:
+        history = HistoryStore(max_entries=10000)
+        history.record("set", path="hull.loa", source="user", old_value=None, new_value=25.0)
+        history.append({"timestamp": "...", "action": "transaction_commit", "txn_id": "..."})
+        history.page(offset=0, limit=50)   # newest first
+    """
+
+    DEFAULT_MAX_ENTRIES = 10000
+
+    def __init__(
+        self,
+        entries: Optional[Iterable[Dict[str, Any]]] = None,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            entries: Initial records (oldest first), e.g. a deserialized history list
+            max_entries: Number of records kept; None keeps everything
+        """
+        self._max_entries = max_entries
+
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+
+        self._timestamps = array("q")
+        self._actions = array("i")
+        self._paths = array("i")
+        self._sources = array("i")
+        self._old_values: List[Any] = []
+        self._new_values: List[Any] = []
+        self._extras: List[Optional[Dict[str, Any]]] = []
+
+        # Physical index of the oldest live record; evicted rows before it
+        # are dropped from the columns in batches
+        self._head = 0
+        self._recorded = 0
+
+        # ISO prefix per whole second, for formatting timestamps on access
+        self._second_prefixes: Dict[int, str] = {}
+
+        if entries:
+            self.extend(entries)
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        """Number of records kept (None: unbounded)."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: Optional[int]) -> None:
+        self._max_entries = value
+        self._enforce_cap()
+
+    @property
+    def dropped(self) -> int:
+        """Number of records evicted by the cap."""
+        return self._recorded - len(self)
+
+    @property
+    def recorded(self) -> int:
+        """Number of records added so far, evicted ones included (a mark for truncate())."""
+        return self._recorded
+
+    # =========================================================================
+    # Recording
+    # =========================================================================
+
+    def record(
+        self,
+        action: str,
+        *,
+        path: Any = _ABSENT,
+        source: Any = _ABSENT,
+        old_value: Any = _ABSENT,
+        new_value: Any = _ABSENT,
+        timestamp: Optional[datetime] = None,
+        **extra: Any,
+    ) -> None:
+        """
+        Add a record without building an intermediate dict.
+
+        Args:
+            action: Record action (e.g. "set", "transaction_commit")
+            path: Canonical state path (omitted if not given)
+            source: Who made the change (omitted if not given)
+            old_value: Previous value (omitted from the record if not given)
+            new_value: New value (omitted from the record if not given)
+            timestamp: Naive UTC time; defaults to now
+            **extra: Additional keys stored with the record
+        """
+        when = timestamp if timestamp is not None else datetime.utcnow()
+        self._timestamps.append((when - _EPOCH) // _MICROSECOND)
+        self._actions.append(self._intern_value("action", action, extra))
+        self._paths.append(self._intern_value("path", path, extra))
+        self._sources.append(self._intern_value("source", source, extra))
+        self._old_values.append(old_value)
+        self._new_values.append(new_value)
+        self._extras.append(extra or None)
+        self._recorded += 1
+        self._enforce_cap()
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Add a record given in dict form."""
+        extras: Dict[str, Any] = {
+            key: value for key, value in entry.items() if key not in _CORE_KEYS
+        }
+
+        micros = _NO_TIME
+        if "timestamp" in entry:
+            micros = _parse_timestamp(entry["timestamp"])
+            if micros == _NO_TIME:
+                extras["timestamp"] = entry["timestamp"]
+
+        self._timestamps.append(micros)
+        self._actions.append(self._intern_value("action", entry.get("action", _ABSENT), extras))
+        self._paths.append(self._intern_value("path", entry.get("path", _ABSENT), extras))
+        self._sources.append(self._intern_value("source", entry.get("source", _ABSENT), extras))
+        self._old_values.append(entry.get("old_value", _ABSENT))
+        self._new_values.append(entry.get("new_value", _ABSENT))
+        self._extras.append(extras or None)
+        self._recorded += 1
+        self._enforce_cap()
+
+    def extend(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Add records in order."""
+        for entry in entries:
+            self.append(entry)
+
+    def truncate(self, recorded: int) -> None:
+        """
+        Drop the records added after the store reached ``recorded`` records.
+
+        Records past the mark that the cap already evicted stay counted in
+        ``dropped``.
+        """
+        removed = min(self._recorded - recorded, len(self))
+        if removed <= 0:
+            return
+        stop = len(self._actions) - removed
+        for column in self._columns():
+            del column[stop:]
+        self._recorded -= removed
+
+    def clear(self) -> None:
+        """Remove all records (interned strings are kept)."""
+        self._recorded -= len(self)
+        for column in self._columns():
+            del column[:]
+        self._head = 0
+
+    # =========================================================================
+    # Access
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._actions) - self._head
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._head, len(self._actions)):
+            yield self._materialize(i)
+
+    def __reversed__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self._actions) - 1, self._head - 1, -1):
+            yield self._materialize(i)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._materialize(self._head + i) for i in range(*index.indices(len(self)))]
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("history index out of range")
+        return self._materialize(self._head + index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HistoryStore):
+            return len(self) == len(other) and self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        newest_first: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a page of records.
+
+        Args:
+            offset: Records to skip from the newest (or oldest) end
+            limit: Maximum records returned
+            newest_first: Order of the page and the end offset counts from
+        """
+        count = len(self)
+        offset = max(0, offset)
+        stop = min(count, offset + max(0, limit))
+        if newest_first:
+            last = self._head + count - 1
+            return [self._materialize(last - i) for i in range(offset, stop)]
+        return [self._materialize(self._head + i) for i in range(offset, stop)]
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Materialize all records, oldest first."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"HistoryStore({len(self)} records, max_entries={self._max_entries})"
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _columns(self):
+        return (
+            self._timestamps, self._actions, self._paths, self._sources,
+            self._old_values, self._new_values, self._extras,
+        )
+
+    def _intern(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def _intern_value(self, key: str, value: Any, extras: Dict[str, Any]) -> int:
+        """Intern a string field; non-string values are kept in extras."""
+        if value is _ABSENT:
+            return _NO_ID
+        if isinstance(value, str):
+            return self._intern(value)
+        extras[key] = value
+        return _NO_ID
+
+    def _materialize(self, i: int) -> Dict[str, Any]:
+        extras = self._extras[i]
+        record: Dict[str, Any] = {}
+
+        micros = self._timestamps[i]
+        if micros != _NO_TIME:
+            record["timestamp"] = self._format_timestamp(micros)
+        elif extras and "timestamp" in extras:
+            record["timestamp"] = extras["timestamp"]
+
+        strings = self._strings
+        for key, string_id in (
+            ("source", self._sources[i]),
+            ("action", self._actions[i]),
+            ("path", self._paths[i]),
+        ):
+            if string_id != _NO_ID:
+                record[key] = strings[string_id]
+            elif extras and key in extras:
+                record[key] = extras[key]
+
+        old_value = self._old_values[i]
+        if old_value is not _ABSENT:
+            record["old_value"] = old_value
+        new_value = self._new_values[i]
+        if new_value is not _ABSENT:
+            record["new_value"] = new_value
+
+        if extras:
+            for key, value in extras.items():
+                if key not in record:
+                    record[key] = value
+        return record
+
+    def _format_timestamp(self, micros: int) -> str:
+        """datetime.isoformat() of an epoch-microsecond value."""
+        seconds, fraction = divmod(micros, 1_000_000)
+        prefix = self._second_prefixes.get(seconds)
+        if prefix is None:
+            if len(self._second_prefixes) >= _PREFIX_CACHE_SIZE:
+                self._second_prefixes.clear()
+            prefix = (_EPOCH + timedelta(seconds=seconds)).isoformat()
+            self._second_prefixes[seconds] = prefix
+        return f"{prefix}.{fraction:06d}" if fraction else prefix
+
+    def _enforce_cap(self) -> None:
+        if self._max_entries is None:
+            return
+        excess = len(self) - self._max_entries
+        if excess > 0:
+            self._head += excess
+        # Physically drop evicted rows once they make up a sizable block
+        if self._head and self._head >= max(1024, len(self._actions) // 2):
+            for column in self._columns():
+                del column[:self._head]
+            self._head = 0
+
+
+def _parse_timestamp(value: Any) -> int:
+    """Microseconds since the epoch for a naive ISO string, else _NO_TIME."""
+    if not isinstance(value, str):
+        return _NO_TIME
+    try:
+        when = datetime.fromisoformat(value)
+    except ValueError:
+        return _NO_TIME
+    # Only accept strings that format back identically
+    if when.tzinfo is not None or when.isoformat() != value:
+        return _NO_TIME
+    return (when - _EPOCH) // _MICROSECOND
@@ -0,0 +1,69 @@
+"""
+MAGNET IntervalTree
+
+Static centered interval tree over closed ranges, for point (stabbing)
+queries. Shared by the compliance rule library (length applicability)
+and the structural plate index (frame ranges).
+"""
+
+from bisect import bisect_right
+from typing import Generic, List, Optional, Tuple, TypeVar
+import math
+
+T = TypeVar("T")
+
+
+class IntervalTree(Generic[T]):
+    """
+    Centered interval tree over closed ranges, for point (stabbing) queries.
+
+    Each node holds the ranges containing its center (a median endpoint),
+    sorted by lower bound and by upper bound; ranges entirely below or
+    above the center go to its children. Build is O(n log n) and a lookup
+    O(log n + k). Infinite bounds are open ends.
+    """
+
+    __slots__ = ("_center", "_by_lo", "_los", "_by_hi", "_neg_his", "_left", "_right")
+
+    def __init__(self, ranges: List[Tuple[float, float, T]]):
+        """
+        Args:
+            ranges: (lower, upper, item), lower <= upper
+        """
+        endpoints = sorted(b for lo, hi, _ in ranges for b in (lo, hi) if math.isfinite(b))
+        center = endpoints[len(endpoints) // 2] if endpoints else 0.0
+        here, below, above = [], [], []
+        for r in ranges:
+            if r[1] < center:
+                below.append(r)
+            elif r[0] > center:
+                above.append(r)
+            else:
+                here.append(r)
+
+        self._center = center
+        here.sort(key=lambda r: r[0])
+        self._by_lo = [r[2] for r in here]
+        self._los = [r[0] for r in here]
+        here.sort(key=lambda r: -r[1])
+        self._by_hi = [r[2] for r in here]
+        self._neg_his = [-r[1] for r in here]
+        # The range holding the center endpoint stays here, so children shrink
+        self._left = IntervalTree(below) if below else None
+        self._right = IntervalTree(above) if above else None
+
+    def stab(self, x: float) -> List[T]:
+        """Items of every range containing x, unordered."""
+        found: List[T] = []
+        node: Optional[IntervalTree[T]] = self
+        while node is not None:
+            if x < node._center:
+                found.extend(node._by_lo[:bisect_right(node._los, x)])
+                node = node._left
+            elif x > node._center:
+                found.extend(node._by_hi[:bisect_right(node._neg_his, -x)])
+                node = node._right
+            else:
+                found.extend(node._by_lo)
+                break
+        return found
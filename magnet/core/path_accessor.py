@@ -0,0 +1,199 @@
+"""
+MAGNET Path Accessors
+
+Compiled dot-notation paths for StateManager.
+
+A path is resolved once - alias normalization, split into parts, schema
+membership and the refinable flag - into a CompiledPath, cached by the
+PathCompiler that owns the schema. Reads and writes then go through an
+operator.attrgetter over the canonical path, and fall back to the
+segment-by-segment walk (dict segments, None intermediates) only when the
+attribute chain does not resolve.
+"""
+
+from operator import attrgetter
+from typing import Any, Dict, FrozenSet, Iterable, Tuple
+
+from magnet.core.field_aliases import normalize_path
+from magnet.core.refinable_schema import is_refinable
+
+
+class _Unresolved:
+    """Marker for a parent path that cannot be navigated for a write."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self):
+        return "<UNRESOLVED>"
+
+
+UNRESOLVED = _Unresolved()
+
+
+class CompiledPath:
+    """
+    A state path resolved against the schema.
+
+    Attributes:
+        path: Path as requested (may be an alias)
+        canonical: Canonical path after alias resolution
+        parts: Canonical path segments
+        leaf: Final segment
+        refinable: True if writes require an active transaction
+        in_schema: True if canonical is a schema path or a prefix of one
+    """
+
+    __slots__ = (
+        "path", "canonical", "parts", "leaf", "refinable", "in_schema",
+        "_getter", "_parent_getter",
+    )
+
+    def __init__(self, path: str, canonical: str, refinable: bool, in_schema: bool):
+        self.path = path
+        self.canonical = canonical
+        self.parts: Tuple[str, ...] = tuple(canonical.split("."))
+        self.leaf = self.parts[-1]
+        self.refinable = refinable
+        self.in_schema = in_schema
+        self._getter = attrgetter(canonical)
+        self._parent_getter = (
+            attrgetter(".".join(self.parts[:-1])) if len(self.parts) > 1 else None
+        )
+
+    def get(self, root: Any, default: Any = None) -> Any:
+        """Read the value, or default if missing or None."""
+        try:
+            obj = self._getter(root)
+        except AttributeError:
+            return self._walk_get(root, default)
+        return obj if obj is not None else default
+
+    def lookup(self, root: Any, missing: Any) -> Any:
+        """Read the raw value (None included), or missing if never written."""
+        try:
+            return self._getter(root)
+        except AttributeError:
+            return self._walk_lookup(root, missing)
+
+    def parent(self, root: Any) -> Any:
+        """
+        Resolve the object holding the leaf, creating missing dict levels.
+
+        Returns:
+            The parent object, or UNRESOLVED if the path cannot be navigated
+        """
+        if self._parent_getter is None:
+            return root
+        try:
+            return self._parent_getter(root)
+        except AttributeError:
+            pass
+
+        obj: Any = root
+        for part in self.parts[:-1]:
+            if hasattr(obj, part):
+                obj = getattr(obj, part)
+            elif isinstance(obj, dict):
+                if part not in obj:
+                    obj[part] = {}
+                obj = obj[part]
+            else:
+                return UNRESOLVED
+        return obj
+
+    def _walk_get(self, root: Any, default: Any) -> Any:
+        obj: Any = root
+        for part in self.parts:
+            if obj is None:
+                return default
+            if hasattr(obj, part):
+                obj = getattr(obj, part)
+            elif isinstance(obj, dict):
+                obj = obj.get(part, default)
+                if obj is default:
+                    return default
+            else:
+                return default
+        return obj if obj is not None else default
+
+    def _walk_lookup(self, root: Any, missing: Any) -> Any:
+        obj: Any = root
+        for part in self.parts:
+            if obj is None:
+                return missing
+            if hasattr(obj, part):
+                obj = getattr(obj, part)
+            elif isinstance(obj, dict):
+                if part not in obj:
+                    return missing
+                obj = obj[part]
+            else:
+                return missing
+        return obj
+
+    def __repr__(self) -> str:
+        return f"CompiledPath({self.path!r} -> {self.canonical!r})"
+
+
+class PathCompiler:
+    """
+    Cache of CompiledPath objects for one path schema.
+
+    Usage:
+        compiler = PathCompiler(VALID_PATHS)
+        compiler.compile("hull.length").canonical   # 'hull.loa'
+    """
+
+    DEFAULT_MAX_PATHS = 4096
+
+    def __init__(self, valid_paths: Iterable[str], max_paths: int = DEFAULT_MAX_PATHS):
+        """
+        Initialize the compiler.
+
+        Args:
+            valid_paths: Schema paths (canonical)
+            max_paths: Cache bound; paths beyond it are compiled per call
+        """
+        self._valid_paths: FrozenSet[str] = frozenset(valid_paths)
+        self._valid_prefixes: FrozenSet[str] = frozenset(
+            path[:i]
+            for path in self._valid_paths
+            for i in range(len(path))
+            if path[i] == "."
+        )
+        self._max_paths = max_paths
+        self._cache: Dict[str, CompiledPath] = {}
+
+    def compile(self, path: str) -> CompiledPath:
+        """Get the compiled form of a path (alias or canonical)."""
+        compiled = self._cache.get(path)
+        if compiled is None:
+            canonical = normalize_path(path)
+            compiled = CompiledPath(
+                path,
+                canonical,
+                refinable=is_refinable(canonical),
+                in_schema=self.is_valid(canonical),
+            )
+            if len(self._cache) < self._max_paths:
+                self._cache[path] = compiled
+        return compiled
+
+    def is_valid(self, canonical_path: str) -> bool:
+        """Check a canonical path is a schema path or a prefix of one."""
+        return canonical_path in self._valid_paths or canonical_path in self._valid_prefixes
+
+    def clear(self) -> None:
+        """Drop all compiled paths."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._cache
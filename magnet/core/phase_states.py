@@ -628,6 +628,10 @@ class PhaseMachine:
         """Load phase states from the underlying state manager."""
         self._initialize_phases()
 
+    def reset(self) -> None:
+        """Set up DRAFT phases after the state manager was reset to a fresh design."""
+        self._initialize_phases()
+
     def summary(self) -> str:
         """Get a summary of all phase states."""
         lines = ["Phase Status Summary:", "=" * 40]
@@ -0,0 +1,260 @@
+"""
+MAGNET SnapshotStore
+
+Structural-sharing snapshot storage for StateManager transactions and
+committed design versions.
+
+State dictionaries are flattened to leaf paths (tuples of keys). Each
+captured snapshot is stored as a path-level delta against the previously
+captured one, with a full keyframe every ``keyframe_interval`` deltas to
+bound replay cost. Unchanged leaves are shared between keyframes and the
+head view instead of being deep-copied per version, and append-only lists
+(e.g. ``history``) are stored as their new tail only.
+"""
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+Path = Tuple[Any, ...]
+FlatState = Dict[Path, Any]
+
+
+class _Deleted:
+    """Delta marker for a leaf path removed since the parent snapshot."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self):
+        return "<DELETED>"
+
+
+_DELETED = _Deleted()
+
+
+class _Extend:
+    """Delta op for a list leaf that only grew at the end."""
+
+    __slots__ = ("tail",)
+
+    def __init__(self, tail: List[Any]):
+        self.tail = tail
+
+
+@dataclass
+class SnapshotNode:
+    """A captured snapshot: delta against its parent, optionally a keyframe."""
+    node_id: int
+    parent: Optional[int]
+    delta: Dict[Path, Any] = field(default_factory=dict)
+    keyframe: Optional[FlatState] = None
+    depth: int = 0  # Deltas since the last keyframe
+
+
+def flatten_state(data: Dict[str, Any]) -> FlatState:
+    """Flatten a nested dict into {path_tuple: leaf}. Empty dicts are leaves."""
+    out: FlatState = {}
+    stack: List[Tuple[Path, Dict[Any, Any]]] = [((), data)]
+    while stack:
+        prefix, d = stack.pop()
+        for key, value in d.items():
+            path = prefix + (key,)
+            if isinstance(value, dict) and value:
+                stack.append((path, value))
+            else:
+                out[path] = value
+    return out
+
+
+def unflatten_state(flat: FlatState) -> Dict[str, Any]:
+    """Rebuild a nested dict from leaf paths, copying mutable leaves."""
+    result: Dict[str, Any] = {}
+    for path, value in flat.items():
+        obj = result
+        for key in path[:-1]:
+            obj = obj.setdefault(key, {})
+        if isinstance(value, (dict, list, set)):
+            value = copy.deepcopy(value)
+        obj[path[-1]] = value
+    return result
+
+
+def _same(old: Any, new: Any) -> bool:
+    return old is new or (type(old) is type(new) and old == new)
+
+
+class SnapshotStore:
+    """
+    Delta-chain snapshot store with periodic keyframes.
+
+    Usage:
+        store = SnapshotStore()
+        node = store.capture(state.to_dict())
+        store.tag_version(1, node)
+        data = store.materialize_version(1)
+    """
+
+    DEFAULT_KEYFRAME_INTERVAL = 32
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        self._keyframe_interval = max(1, keyframe_interval)
+        self._nodes: List[SnapshotNode] = []
+        self._versions: Dict[int, int] = {}
+        self._head: Optional[int] = None
+        self._head_flat: FlatState = {}
+
+    # ==================== Capture ====================
+
+    def capture(self, data: Dict[str, Any]) -> int:
+        """
+        Capture a state dict, storing only what changed since the head.
+
+        Args:
+            data: Output of DesignState.to_dict() (not modified, not retained).
+
+        Returns:
+            Node id of the new snapshot.
+        """
+        flat = flatten_state(data)
+        node_id = len(self._nodes)
+
+        if self._head is None:
+            self._head_flat = {p: copy.deepcopy(v) for p, v in flat.items()}
+            node = SnapshotNode(node_id=node_id, parent=None, keyframe=dict(self._head_flat))
+            self._nodes.append(node)
+            self._head = node_id
+            return node_id
+
+        head = self._head_flat
+        delta: Dict[Path, Any] = {}
+        added = 0
+        for path, value in flat.items():
+            old = head.get(path, _DELETED)
+            if old is _DELETED:
+                delta[path] = copy.deepcopy(value)
+                added += 1
+            elif _same(old, value):
+                continue
+            elif (
+                type(old) is list and type(value) is list
+                and len(value) > len(old) and value[:len(old)] == old
+            ):
+                delta[path] = _Extend(copy.deepcopy(value[len(old):]))
+            else:
+                delta[path] = copy.deepcopy(value)
+        if len(head) + added > len(flat):
+            for path in head:
+                if path not in flat:
+                    delta[path] = _DELETED
+
+        _apply_delta(head, delta)
+
+        parent = self._nodes[self._head]
+        depth = parent.depth + 1
+        node = SnapshotNode(node_id=node_id, parent=self._head, delta=delta, depth=depth)
+        if depth >= self._keyframe_interval:
+            node.keyframe = dict(head)
+            node.depth = 0
+        self._nodes.append(node)
+        self._head = node_id
+        return node_id
+
+    def tag_version(self, version: int, node_id: int) -> None:
+        """Associate a design_version with a captured snapshot."""
+        self._versions[version] = node_id
+
+    def record_version(self, version: int, data: Dict[str, Any]) -> int:
+        """Capture a state dict and tag it as a design_version."""
+        node_id = self.capture(data)
+        self.tag_version(version, node_id)
+        return node_id
+
+    # ==================== Replay ====================
+
+    def has_version(self, version: int) -> bool:
+        return version in self._versions
+
+    def versions(self) -> List[int]:
+        return sorted(self._versions)
+
+    def node_for_version(self, version: int) -> Optional[int]:
+        return self._versions.get(version)
+
+    def _flat(self, node_id: int) -> FlatState:
+        """Replay deltas from the nearest keyframe. Result must not be mutated."""
+        if node_id == self._head:
+            return self._head_flat
+
+        chain: List[SnapshotNode] = []
+        node = self._nodes[node_id]
+        while node.keyframe is None:
+            chain.append(node)
+            node = self._nodes[node.parent]
+
+        flat = dict(node.keyframe)
+        for node in reversed(chain):
+            _apply_delta(flat, node.delta)
+        return flat
+
+    def materialize(self, node_id: int) -> Dict[str, Any]:
+        """Rebuild an independent nested state dict for a snapshot."""
+        return unflatten_state(self._flat(node_id))
+
+    def materialize_version(self, version: int) -> Optional[Dict[str, Any]]:
+        node_id = self._versions.get(version)
+        if node_id is None:
+            return None
+        return self.materialize(node_id)
+
+    def diff(self, from_node: int, to_node: int) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Leaf-level differences between two snapshots.
+
+        Returns:
+            Dictionary of dot-joined paths to (old, new) tuples, matching
+            DesignState.diff().
+        """
+        old_flat = self._flat(from_node)
+        new_flat = self._flat(to_node)
+        differences: Dict[str, Tuple[Any, Any]] = {}
+        for path in old_flat.keys() | new_flat.keys():
+            old = old_flat.get(path)
+            new = new_flat.get(path)
+            if old is not new and old != new:
+                differences[".".join(str(p) for p in path)] = (
+                    copy.deepcopy(old), copy.deepcopy(new)
+                )
+        return differences
+
+    def diff_versions(self, from_version: int, to_version: int) -> Optional[Dict[str, Tuple[Any, Any]]]:
+        if from_version not in self._versions or to_version not in self._versions:
+            return None
+        return self.diff(self._versions[from_version], self._versions[to_version])
+
+    # ==================== Introspection ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot counts and stored leaf counts (for monitoring/benchmarks)."""
+        return {
+            "nodes": len(self._nodes),
+            "versions": len(self._versions),
+            "keyframes": sum(1 for n in self._nodes if n.keyframe is not None),
+            "delta_entries": sum(len(n.delta) for n in self._nodes),
+            "keyframe_interval": self._keyframe_interval,
+        }
+
+
+def _apply_delta(flat: FlatState, delta: Dict[Path, Any]) -> None:
+    """Apply a delta in place. Leaves are replaced, never mutated."""
+    for path, op in delta.items():
+        if op is _DELETED:
+            flat.pop(path, None)
+        elif type(op) is _Extend:
+            flat[path] = flat[path] + op.tail
+        else:
+            flat[path] = op
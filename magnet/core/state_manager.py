@@ -13,11 +13,13 @@ import copy
 import uuid
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from pathlib import Path
 
 from magnet.core.design_state import DesignState
-from magnet.core.field_aliases import normalize_path, get_canonical
+from magnet.core.history_store import HistoryStore
+from magnet.core.path_accessor import CompiledPath, PathCompiler, UNRESOLVED
+from magnet.core.snapshot_store import SnapshotStore
 
 logger = logging.getLogger(__name__)
 
@@ -257,6 +259,13 @@ VALID_PATHS = frozenset([
     "deck_equipment.anchor_weight_kg", "deck_equipment.windlass_type", "deck_equipment.cleats_count",
 ])
 
+# Compiled accessors for VALID_PATHS and their aliases (alias resolution,
+# refinable flag and schema membership are resolved once per path string)
+_PATHS = PathCompiler(VALID_PATHS)
+
+# Values stored in history as-is, without to_dict()/deepcopy
+_SCALAR_TYPES = (type(None), bool, int, float, str)
+
 
 class StateManager:
     """
@@ -269,19 +278,33 @@ class StateManager:
     - File I/O for persistence
     """
 
-    def __init__(self, state: Optional[DesignState] = None):
+    def __init__(
+        self,
+        state: Optional[DesignState] = None,
+        history_limit: Optional[int] = HistoryStore.DEFAULT_MAX_ENTRIES,
+    ):
         """
         Initialize the state manager.
 
         Args:
             state: Optional DesignState to manage. Creates new if not provided.
+            history_limit: Mutation history records kept (None: unbounded).
         """
         self._state = state if state is not None else DesignState()
+        self._history_limit = history_limit
+        self._state.history.max_entries = history_limit
         self._transactions: Dict[str, Dict[str, Any]] = {}
         self._current_txn: Optional[str] = None
-        # Versioned snapshots for revert operations
-        self._version_snapshots: Dict[int, Dict[str, Any]] = {}
-        self._version_snapshots[self._state.design_version] = copy.deepcopy(self._state.to_dict())
+        # Versioned snapshots for revert operations (delta chain + keyframes).
+        # History is kept out of snapshots; rollback/revert truncate it back
+        # to a mark (HistoryStore.recorded) instead.
+        self._snapshots = SnapshotStore()
+        self._snapshots.record_version(
+            self._state.design_version, self._state.to_dict(include_history=False)
+        )
+        self._history_marks: Dict[int, int] = {
+            self._state.design_version: self._state.history.recorded,
+        }
 
     @property
     def state(self) -> DesignState:
@@ -303,24 +326,22 @@ class StateManager:
         Returns:
             The value at the path, or default if not found.
         """
-        # Resolve aliases
-        canonical_path = normalize_path(path)
-        parts = canonical_path.split(".")
-
-        obj: Any = self._state
-        for part in parts:
-            if obj is None:
-                return default
-            if hasattr(obj, part):
-                obj = getattr(obj, part)
-            elif isinstance(obj, dict):
-                obj = obj.get(part, default)
-                if obj is default:
-                    return default
-            else:
-                return default
-
-        return obj if obj is not None else default
+        return _PATHS.compile(path).get(self._state, default)
+
+    def get_many(self, paths: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        """
+        Get several values at once.
+
+        Args:
+            paths: Dot-notation paths (aliases allowed)
+            default: Value for paths not found.
+
+        Returns:
+            Dictionary of requested path -> value.
+        """
+        compile_path = _PATHS.compile
+        state = self._state
+        return {path: compile_path(path).get(state, default) for path in paths}
 
     # ==================== Path-Strict Access (v1.1) ====================
 
@@ -334,17 +355,9 @@ class StateManager:
         Returns:
             True if path is in VALID_PATHS or is a known alias
         """
-        # Check direct match
-        if path in VALID_PATHS:
-            return True
-
-        # Check if it's a valid prefix path (for nested access)
-        # e.g., "hull" is valid because "hull.lwl" exists
-        for valid_path in VALID_PATHS:
-            if valid_path.startswith(path + "."):
-                return True
-
-        return False
+        # Direct match, or a valid prefix path for nested access
+        # (e.g., "hull" is valid because "hull.lwl" exists)
+        return _PATHS.is_valid(path)
 
     def get_strict(self, path: str) -> Union[Any, _MISSING]:
         """
@@ -358,34 +371,19 @@ class StateManager:
             InvalidPathError: if path not in schema
         """
         # Resolve aliases first
-        canonical_path = normalize_path(path)
+        compiled = _PATHS.compile(path)
 
         # Validate path exists in schema
-        if not self._is_valid_path(canonical_path):
+        if not compiled.in_schema:
             raise InvalidPathError(
-                f"Unknown path: '{canonical_path}'. "
+                f"Unknown path: '{compiled.canonical}'. "
                 f"Check schema or add to VALID_PATHS."
             )
 
         # Get raw value without default substitution
-        parts = canonical_path.split(".")
-        obj: Any = self._state
-
-        for part in parts:
-            if obj is None:
-                return MISSING
-            if hasattr(obj, part):
-                obj = getattr(obj, part)
-            elif isinstance(obj, dict):
-                if part not in obj:
-                    return MISSING
-                obj = obj[part]
-            else:
-                return MISSING
-
-        # Note: obj could be None here (explicitly set to None)
+        # Note: could be None here (explicitly set to None)
         # We only return MISSING if the path didn't exist
-        return obj
+        return compiled.lookup(self._state, MISSING)
 
     def exists(self, path: str) -> bool:
         """
@@ -426,61 +424,92 @@ class StateManager:
             MutationEnforcementError: If refinable path written outside transaction.
         """
         # Resolve aliases
-        canonical_path = normalize_path(path)
+        compiled = _PATHS.compile(path)
+        self._check_mutation_allowed(compiled, source)
+
+        now = datetime.utcnow()
+        if not self._apply_set(compiled, value, source, now):
+            return False
 
+        # Update timestamp
+        self._state.updated_at = now.isoformat()
+        return True
+
+    def set_many(self, updates: Dict[str, Any], source: str) -> List[str]:
+        """
+        Set several values with one timestamp.
+
+        Enforcement is checked for every path before anything is written,
+        so a refinable path outside a transaction leaves the state untouched.
+
+        Args:
+            updates: Dictionary of path -> value.
+            source: Identifier of who is making the change.
+
+        Returns:
+            List of canonical paths that were modified.
+
+        Raises:
+            MutationEnforcementError: If a refinable path is written outside a transaction.
+        """
+        compiled_updates = [(_PATHS.compile(path), value) for path, value in updates.items()]
+        for compiled, _ in compiled_updates:
+            self._check_mutation_allowed(compiled, source)
+
+        now = datetime.utcnow()
+        modified = [
+            compiled.canonical
+            for compiled, value in compiled_updates
+            if self._apply_set(compiled, value, source, now)
+        ]
+        if modified:
+            self._state.updated_at = now.isoformat()
+        return modified
+
+    def _check_mutation_allowed(self, compiled: CompiledPath, source: str) -> None:
+        """Raise if a refinable path is written outside a transaction."""
         # === MUTATION ENFORCEMENT (Module 62 P0.3) ===
         # Refinable-first enforcement: only refinable paths need transactions.
         # Non-refinable paths (kernel, metadata, phase_states, etc.) are always allowed.
-        from magnet.core.refinable_schema import is_refinable
-        if is_refinable(canonical_path):
-            if self._current_txn is None:
-                raise MutationEnforcementError(
-                    f"Refinable path '{canonical_path}' requires active transaction. "
-                    f"Use ActionPlan → ActionExecutor pipeline. "
-                    f"Source '{source}' attempted direct write."
-                )
+        if compiled.refinable and self._current_txn is None:
+            raise MutationEnforcementError(
+                f"Refinable path '{compiled.canonical}' requires active transaction. "
+                f"Use ActionPlan → ActionExecutor pipeline. "
+                f"Source '{source}' attempted direct write."
+            )
         # === END ENFORCEMENT ===
 
-        parts = canonical_path.split(".")
-
-        if len(parts) == 0:
-            return False
-
+    def _apply_set(
+        self, compiled: CompiledPath, value: Any, source: str, now: datetime
+    ) -> bool:
+        """Write one value and record it; updated_at is left to the caller."""
         # Navigate to parent
-        obj: Any = self._state
-        for part in parts[:-1]:
-            if hasattr(obj, part):
-                obj = getattr(obj, part)
-            elif isinstance(obj, dict):
-                if part not in obj:
-                    obj[part] = {}
-                obj = obj[part]
-            else:
-                return False
+        obj = compiled.parent(self._state)
+        if obj is UNRESOLVED:
+            return False
 
         # Set the final attribute
-        final_attr = parts[-1]
+        final_attr = compiled.leaf
+        canonical_path = compiled.canonical
         if hasattr(obj, final_attr):
             old_value = getattr(obj, final_attr)
             setattr(obj, final_attr, value)
 
             # Record in history if in transaction
             if self._current_txn:
-                if canonical_path not in self._transactions[self._current_txn]["changes"]:
-                    self._transactions[self._current_txn]["changes"][canonical_path] = old_value
-
-            # Update timestamp
-            self._state.updated_at = datetime.utcnow().isoformat()
+                changes = self._transactions[self._current_txn]["changes"]
+                if canonical_path not in changes:
+                    changes[canonical_path] = old_value
 
             # Add to history
-            self._state.history.append({
-                "timestamp": datetime.utcnow().isoformat(),
-                "source": source,
-                "action": "set",
-                "path": canonical_path,
-                "old_value": self._serialize_value(old_value),
-                "new_value": self._serialize_value(value),
-            })
+            self._state.history.record(
+                "set",
+                source=source,
+                path=canonical_path,
+                old_value=self._serialize_value(old_value),
+                new_value=self._serialize_value(value),
+                timestamp=now,
+            )
 
             return True
         elif isinstance(obj, dict):
@@ -488,16 +517,18 @@ class StateManager:
             obj[final_attr] = value
 
             if self._current_txn:
-                if canonical_path not in self._transactions[self._current_txn]["changes"]:
-                    self._transactions[self._current_txn]["changes"][canonical_path] = old_value
+                changes = self._transactions[self._current_txn]["changes"]
+                if canonical_path not in changes:
+                    changes[canonical_path] = old_value
 
-            self._state.updated_at = datetime.utcnow().isoformat()
             return True
 
         return False
 
     def _serialize_value(self, value: Any) -> Any:
         """Serialize a value for storage in history."""
+        if type(value) in _SCALAR_TYPES:
+            return value
         if hasattr(value, "to_dict"):
             return value.to_dict()
         elif isinstance(value, (list, dict)):
@@ -507,18 +538,91 @@ class StateManager:
 
     # ==================== Serialization ====================
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_history: bool = True) -> Dict[str, Any]:
         """Export the entire state as a dictionary."""
-        return self._state.to_dict()
+        return self._state.to_dict(include_history=include_history)
 
     def from_dict(self, data: Dict[str, Any]) -> None:
         """Load state from a dictionary, replacing current state."""
         self._state = DesignState.from_dict(data)
+        self._state.history.max_entries = self._history_limit
+        # Marks counted records of the replaced history
+        self._history_marks.clear()
+
+    def clone(self) -> "StateManager":
+        """
+        Create an independent copy of the current state.
+
+        The copy starts with an empty history and no open transaction;
+        it is meant as scratch space (e.g. optimizer evaluations).
+        """
+        # Map the history to a fresh store so it is not copied
+        memo = {id(self._state.history): HistoryStore(max_entries=self._history_limit)}
+        state = copy.deepcopy(self._state, memo)
+        return type(self)(state, history_limit=self._history_limit)
+
+    def overlay(self) -> "StateOverlay":
+        """
+        Create a copy-on-write scratch view of the current state.
+
+        Much cheaper than clone() when only a few paths are written, e.g.
+        scoring candidate hulls; the base state must not change while the
+        view is in use.
+        """
+        return StateOverlay(self)
+
+    def get_history(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        newest_first: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a page of the mutation history.
+
+        Args:
+            offset: Records to skip.
+            limit: Maximum records returned.
+            newest_first: Page from the newest record backwards.
+
+        Returns:
+            List of history records.
+        """
+        return self._state.history.page(offset, limit, newest_first)
+
+    def _restore_state(self, snapshot: Dict[str, Any], history_mark: Optional[int]) -> None:
+        """
+        Replace the state from a snapshot, keeping the live history
+        truncated back to history_mark (None: untouched).
+        """
+        history = self._state.history
+        if history_mark is not None:
+            history.truncate(history_mark)
+        self._state = DesignState.from_dict(snapshot)
+        self._state.history = history
 
     def load_from_dict(self, data: Dict[str, Any]) -> None:
         """Alias for from_dict for API compatibility."""
         self.from_dict(data)
 
+    def reset(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Start over with a new design, keeping this manager's identity.
+
+        Replaces the state (fresh, or loaded from data) and drops history,
+        open transactions and recorded versions, so services holding a
+        reference to this manager can be reused for an unrelated design.
+        """
+        self._state = DesignState.from_dict(data) if data else DesignState()
+        self._state.history.max_entries = self._history_limit
+        self._transactions.clear()
+        self._current_txn = None
+        self._snapshots = SnapshotStore()
+        self._snapshots.record_version(
+            self._state.design_version, self._state.to_dict(include_history=False)
+        )
+        self._history_marks = {self._state.design_version: self._state.history.recorded}
+
     def export_snapshot(self, include_metadata: bool = True) -> Dict[str, Any]:
         """
         Export a snapshot of the current state.
@@ -529,10 +633,9 @@ class StateManager:
         Returns:
             Snapshot dictionary suitable for storage or comparison.
         """
-        snapshot = self._state.to_dict()
+        snapshot = self._state.to_dict(include_history=include_metadata)
 
         if not include_metadata:
-            snapshot.pop("history", None)
             snapshot.pop("metadata", None)
 
         snapshot["snapshot_timestamp"] = datetime.utcnow().isoformat()
@@ -586,11 +689,7 @@ class StateManager:
         Returns:
             List of paths that were modified.
         """
-        modified = []
-        for path, value in updates.items():
-            if self.set(path, value, source):
-                modified.append(normalize_path(path))
-        return modified
+        return self.set_many(updates, source)
 
     def diff(self, other: "StateManager") -> Dict[str, Tuple[Any, Any]]:
         """
@@ -604,6 +703,22 @@ class StateManager:
         """
         return self._state.diff(other._state)
 
+    def diff_versions(
+        self, from_version: int, to_version: int
+    ) -> Optional[Dict[str, Tuple[Any, Any]]]:
+        """
+        Compare two committed design versions without materializing states.
+
+        Args:
+            from_version: Baseline design_version.
+            to_version: Design version to compare against the baseline.
+
+        Returns:
+            Dictionary of changed paths to (old, new) tuples, or None if
+            either version was never committed.
+        """
+        return self._snapshots.diff_versions(from_version, to_version)
+
     # ==================== Transactions ====================
 
     def begin_transaction(self) -> str:
@@ -622,7 +737,8 @@ class StateManager:
         self._transactions[txn_id] = {
             "started_at": datetime.utcnow().isoformat(),
             "changes": {},
-            "snapshot": copy.deepcopy(self._state.to_dict()),
+            "snapshot": self._snapshots.capture(self._state.to_dict(include_history=False)),
+            "history_mark": self._state.history.recorded,
         }
         self._current_txn = txn_id
         return txn_id
@@ -650,19 +766,21 @@ class StateManager:
         self._state.design_version += 1
 
         # Save snapshot of committed state for potential revert
-        self._version_snapshots[self._state.design_version] = copy.deepcopy(self._state.to_dict())
+        self._snapshots.record_version(
+            self._state.design_version, self._state.to_dict(include_history=False)
+        )
 
         # Clear transaction data
         del self._transactions[txn_id]
         self._current_txn = None
 
         # Add commit to history
-        self._state.history.append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "action": "transaction_commit",
-            "txn_id": txn_id,
-            "design_version": self._state.design_version,
-        })
+        self._state.history.record(
+            "transaction_commit",
+            txn_id=txn_id,
+            design_version=self._state.design_version,
+        )
+        self._history_marks[self._state.design_version] = self._state.history.recorded
 
         return True
 
@@ -704,20 +822,17 @@ class StateManager:
         if self._current_txn != txn_id:
             return False
 
-        # Restore from snapshot
-        snapshot = self._transactions[txn_id]["snapshot"]
-        self._state = DesignState.from_dict(snapshot)
+        # Restore from snapshot, dropping the transaction's history records
+        txn = self._transactions[txn_id]
+        snapshot = self._snapshots.materialize(txn["snapshot"])
+        self._restore_state(snapshot, txn["history_mark"])
 
         # Clear transaction data
         del self._transactions[txn_id]
         self._current_txn = None
 
         # Add rollback to history
-        self._state.history.append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "action": "transaction_rollback",
-            "txn_id": txn_id,
-        })
+        self._state.history.record("transaction_rollback", txn_id=txn_id)
 
         return True
 
@@ -733,20 +848,17 @@ class StateManager:
         Returns:
             True if revert succeeded, False otherwise.
         """
-        if target_version not in self._version_snapshots:
+        snapshot = self._snapshots.materialize_version(target_version)
+        if snapshot is None:
             return False
 
-        snapshot = self._version_snapshots[target_version]
-        self._state = DesignState.from_dict(copy.deepcopy(snapshot))
+        # History goes back to where it stood when target_version was committed
+        self._restore_state(snapshot, self._history_marks.get(target_version))
         self._current_txn = None
         self._transactions.clear()
 
         # Record revert in history
-        self._state.history.append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "action": "revert",
-            "design_version": target_version,
-        })
+        self._state.history.record("revert", design_version=target_version)
 
         return True
 
@@ -919,3 +1031,71 @@ class StateManager:
 
     def __repr__(self) -> str:
         return f"StateManager({self._state})"
+
+
+class StateOverlay:
+    """
+    Copy-on-write view over a StateManager.
+
+    Reads fall through to the base state unless the path was written to
+    the view; writes stay in the view and are never recorded in history.
+    Writes are allowed on refinable paths too, as the view is never
+    committed. Only leaf paths are overlaid: reading a section (e.g.
+    "hull") returns the base object without the view's writes.
+    """
+
+    def __init__(self, base: StateManager):
+        self._base = base
+        self._values: Dict[str, Any] = {}
+
+    @property
+    def base(self) -> StateManager:
+        """The state this view reads through to."""
+        return self._base
+
+    @property
+    def changes(self) -> Dict[str, Any]:
+        """Canonical path -> value for every path written to the view."""
+        return dict(self._values)
+
+    def get(self, path: str, default: Any = None) -> Any:
+        compiled = _PATHS.compile(path)
+        if compiled.canonical in self._values:
+            value = self._values[compiled.canonical]
+            return value if value is not None else default
+        return compiled.get(self._base._state, default)
+
+    def get_many(self, paths: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        return {path: self.get(path, default) for path in paths}
+
+    def get_strict(self, path: str) -> Union[Any, _MISSING]:
+        compiled = _PATHS.compile(path)
+        if compiled.canonical in self._values:
+            return self._values[compiled.canonical]
+        return self._base.get_strict(path)
+
+    def exists(self, path: str) -> bool:
+        return self.get_strict(path) is not MISSING
+
+    def set(self, path: str, value: Any, source: str) -> bool:
+        """Write to the view; False where StateManager.set() would fail."""
+        compiled = _PATHS.compile(path)
+        obj = compiled.parent(self._base._state)
+        if obj is UNRESOLVED or not (hasattr(obj, compiled.leaf) or isinstance(obj, dict)):
+            return False
+        self._values[compiled.canonical] = value
+        return True
+
+    def set_many(self, updates: Dict[str, Any], source: str) -> List[str]:
+        return [
+            _PATHS.compile(path).canonical
+            for path, value in updates.items()
+            if self.set(path, value, source)
+        ]
+
+    def in_transaction(self) -> bool:
+        # Scratch writes behave as if inside a transaction that is never committed
+        return True
+
+    def __repr__(self) -> str:
+        return f"StateOverlay({len(self._values)} changes over {self._base!r})"
@@ -9,13 +9,19 @@ v1.1 Fixes Applied:
 - FIX #8: Supports partial recalculation (subset of stale params)
 - FIX #9: Tracks execution time per parameter
 - FIX #10: Integrates with StateManager for value updates
+
+Parallel cascades use a streaming scheduler: each parameter is released as
+soon as its last in-cascade dependency finishes, and ready parameters are
+dispatched longest-critical-path first.
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import heapq
 import threading
 import logging
 import time
@@ -47,6 +53,8 @@ class RecalculationResult:
 
     # Execution info
     execution_time_ms: int = 0
+    queue_wait_ms: float = 0.0   # Ready -> started (scheduler latency)
+    run_time_ms: float = 0.0     # Started -> finished (wall clock)
     was_skipped: bool = False
     skip_reason: Optional[str] = None
 
@@ -64,6 +72,8 @@ class RecalculationResult:
             "new_value": str(self.new_value) if self.new_value is not None else None,
             "value_changed": self.value_changed,
             "execution_time_ms": self.execution_time_ms,
+            "queue_wait_ms": round(self.queue_wait_ms, 3),
+            "run_time_ms": round(self.run_time_ms, 3),
             "was_skipped": self.was_skipped,
             "skip_reason": self.skip_reason,
             "error": self.error,
@@ -114,6 +124,16 @@ class CascadeResult:
     def success(self) -> bool:
         return self.failed_count == 0
 
+    def get_timing_breakdown(self) -> Dict[str, Dict[str, float]]:
+        """Per-parameter queue-wait vs. run time, in milliseconds."""
+        return {
+            param: {
+                "queue_wait_ms": round(r.queue_wait_ms, 3),
+                "run_time_ms": round(r.run_time_ms, 3),
+            }
+            for param, r in self.results.items()
+        }
+
     def get_summary(self) -> Dict[str, Any]:
         return {
             "cascade_id": self.cascade_id,
@@ -123,6 +143,12 @@ class CascadeResult:
             "failed": self.failed_count,
             "skipped": self.skipped_count,
             "total_time_ms": self.total_time_ms,
+            "total_queue_wait_ms": round(
+                sum(r.queue_wait_ms for r in self.results.values()), 3
+            ),
+            "total_run_time_ms": round(
+                sum(r.run_time_ms for r in self.results.values()), 3
+            ),
         }
 
     def to_dict(self) -> Dict[str, Any]:
@@ -136,6 +162,7 @@ class CascadeResult:
             "failed_count": self.failed_count,
             "skipped_count": self.skipped_count,
             "total_time_ms": self.total_time_ms,
+            "timings": self.get_timing_breakdown(),
             "triggered_by": self.triggered_by,
             "trigger_parameter": self.trigger_parameter,
         }
@@ -370,7 +397,7 @@ class CascadeExecutor:
     ) -> None:
         """Execute calculations sequentially."""
         for param in params:
-            calc_result = self._execute_single(param)
+            calc_result = self._execute_timed(param, time.perf_counter())
             result.results[param] = calc_result
 
             if calc_result.success:
@@ -392,36 +419,55 @@ class CascadeExecutor:
         result: CascadeResult,
         stop_on_error: bool,
     ) -> None:
-        """Execute calculations in parallel where possible."""
-        completed = set()
-        pending = set(params)
-        stop_flag = threading.Event()
+        """
+        Execute calculations in parallel where possible.
+
+        Dependency-counting scheduler: every parameter tracks how many of its
+        in-cascade dependencies are still outstanding and becomes ready the
+        moment that count reaches zero, so a slow calculator only delays its
+        own dependents. Ready parameters are dispatched in order of their
+        critical path length (estimated time of the longest downstream chain).
+        """
+        param_set = set(params)
+        dependents: Dict[str, List[str]] = {p: [] for p in params}
+        remaining: Dict[str, int] = {}
+        for p in params:
+            calc_deps = self._graph.get_direct_dependencies(p) & param_set
+            remaining[p] = len(calc_deps)
+            for dep in calc_deps:
+                dependents[dep].append(p)
+
+        priority = self._critical_path_priorities(params, dependents, remaining)
+        position = {p: i for i, p in enumerate(params)}
+
+        ready: List[tuple] = []
+        ready_at: Dict[str, float] = {}
+
+        def release(param: str) -> None:
+            ready_at[param] = time.perf_counter()
+            heapq.heappush(ready, (-priority[param], position[param], param))
+
+        for p in params:
+            if remaining[p] == 0:
+                release(p)
+
+        in_flight: Dict[Future, str] = {}
+        stopped = False
 
         with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            while pending and not stop_flag.is_set():
-                # Find ready parameters (all dependencies completed)
-                ready = []
-                for p in pending:
-                    deps = self._graph.get_direct_dependencies(p)
-                    calc_deps = deps & set(params)  # Only deps we're calculating
-                    if calc_deps.issubset(completed):
-                        ready.append(p)
-
-                if not ready:
-                    # Shouldn't happen if graph is correct
-                    logger.warning("No ready parameters but pending remain")
+            while ready or in_flight:
+                # Keep the pool saturated, highest-priority first
+                while ready and not stopped and len(in_flight) < self._max_workers:
+                    _, _, param = heapq.heappop(ready)
+                    future = executor.submit(self._execute_timed, param, ready_at[param])
+                    in_flight[future] = param
+
+                if not in_flight:
                     break
 
-                # Submit ready parameters
-                futures = {}
-                for param in ready:
-                    pending.remove(param)
-                    future = executor.submit(self._execute_single, param)
-                    futures[future] = param
-
-                # Wait for results
-                for future in as_completed(futures):
-                    param = futures[future]
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    param = in_flight.pop(future)
                     try:
                         calc_result = future.result()
                     except Exception as e:
@@ -434,7 +480,6 @@ class CascadeExecutor:
                         )
 
                     result.results[param] = calc_result
-                    completed.add(param)
 
                     if calc_result.success:
                         result.success_count += 1
@@ -443,10 +488,58 @@ class CascadeExecutor:
                     else:
                         result.failed_count += 1
                         if stop_on_error:
-                            stop_flag.set()
+                            logger.warning(f"Stopping cascade due to error in {param}")
+                            stopped = True
 
                     self._notify_progress(param, calc_result)
 
+                    for dependent in dependents[param]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            release(dependent)
+
+        if not stopped and len(result.results) < len(params):
+            # Shouldn't happen if graph is correct
+            logger.warning("No ready parameters but pending remain")
+
+    def _critical_path_priorities(
+        self,
+        params: List[str],
+        dependents: Dict[str, List[str]],
+        in_degree: Dict[str, int],
+    ) -> Dict[str, int]:
+        """
+        Compute critical path length (ms) from each parameter to a sink.
+
+        priority(p) = estimated_time(p) + max(priority(d) for d in dependents(p))
+        """
+        # Local topological order (Kahn) so the graph need not be built
+        in_degree = dict(in_degree)
+        queue = deque(p for p in params if in_degree[p] == 0)
+        order: List[str] = []
+        while queue:
+            p = queue.popleft()
+            order.append(p)
+            for d in dependents[p]:
+                in_degree[d] -= 1
+                if in_degree[d] == 0:
+                    queue.append(d)
+
+        priority: Dict[str, int] = {p: 0 for p in params}
+        for p in reversed(order):
+            downstream = max((priority[d] for d in dependents[p]), default=0)
+            priority[p] = self._registry.get_estimated_time(p) + downstream
+        return priority
+
+    def _execute_timed(self, param: str, ready_at: float) -> RecalculationResult:
+        """Execute a single calculation, recording queue-wait and run time."""
+        started = time.perf_counter()
+        calc_result = self._execute_single(param)
+        finished = time.perf_counter()
+        calc_result.queue_wait_ms = (started - ready_at) * 1000.0
+        calc_result.run_time_ms = (finished - started) * 1000.0
+        return calc_result
+
     def _execute_single(self, param: str) -> RecalculationResult:
         """Execute a single parameter calculation."""
         start_time = datetime.utcnow()
@@ -11,6 +11,10 @@ v1.1 Fixes Applied:
 - FIX #2: Normalized to Section 1 field naming conventions
 - FIX #3: Separate edge types (DATA_FLOW vs SEMANTIC)
 - FIX #4: get_all_downstream returns parameters, not phases
+
+Transitive queries (downstream/upstream sets, downstream phases and
+recalculation order) are answered from a bitset closure index once the
+graph is built; see ClosureIndex.
 """
 
 from __future__ import annotations
@@ -401,6 +405,122 @@ class DependencyEdge:
         return hash((self.source, self.target))
 
 
+# =============================================================================
+# CLOSURE INDEX
+# =============================================================================
+
+def _iter_bits(bits: int):
+    """Yield the indices of set bits in ascending order."""
+    digits = bin(bits)[:1:-1]  # little-endian, without the "0b" prefix
+    i = digits.find("1")
+    while i != -1:
+        yield i
+        i = digits.find("1", i + 1)
+
+
+class ClosureIndex:
+    """
+    Precomputed transitive closure over a stable parameter numbering.
+
+    Each parameter gets a fixed integer id on insertion. ``down[i]`` and
+    ``up[i]`` are Python ints used as bitsets of all transitive dependents
+    and dependencies of parameter ``i``, so multi-parameter queries reduce
+    to bitwise ORs. New edges are folded in incrementally.
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.params: List[str] = []
+        self.down: List[int] = []
+        self.up: List[int] = []
+        self.phase_bits: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def add_parameter(self, param: str, phase: str) -> int:
+        """Assign the next id to a parameter (idempotent)."""
+        idx = self.ids.get(param)
+        if idx is not None:
+            return idx
+        idx = len(self.params)
+        self.ids[param] = idx
+        self.params.append(param)
+        self.down.append(0)
+        self.up.append(0)
+        self.phase_bits[phase] = self.phase_bits.get(phase, 0) | (1 << idx)
+        return idx
+
+    def add_edge(self, dependency: str, dependent: str) -> None:
+        """
+        Fold a new edge dependency -> dependent into the closure.
+
+        Every ancestor of ``dependency`` gains every descendant of
+        ``dependent`` downstream, and vice versa upstream.
+        """
+        u = self.ids[dependency]
+        v = self.ids[dependent]
+        ancestors = self.up[u] | (1 << u)
+        descendants = self.down[v] | (1 << v)
+        if self.down[u] & descendants == descendants:
+            return  # Already implied by existing paths
+        for x in _iter_bits(ancestors):
+            self.down[x] |= descendants
+        for y in _iter_bits(descendants):
+            self.up[y] |= ancestors
+
+    def build(self, nodes: Dict[str, "DependencyNode"], topo_order: List[str]) -> None:
+        """Compute the full closure from nodes in topological order."""
+        self.__init__()
+        for param, node in nodes.items():
+            self.add_parameter(param, node.phase)
+
+        if len(topo_order) != len(nodes):
+            # Not a DAG (or order unknown): fall back to per-edge folding
+            for param, node in nodes.items():
+                for dependent in node.depended_by:
+                    self.add_edge(param, dependent)
+            return
+
+        ids, down, up = self.ids, self.down, self.up
+        for param in reversed(topo_order):
+            bits = 0
+            for dependent in nodes[param].depended_by:
+                j = ids[dependent]
+                bits |= (1 << j) | down[j]
+            down[ids[param]] = bits
+        for param in topo_order:
+            bits = 0
+            for dependency in nodes[param].depends_on:
+                j = ids[dependency]
+                bits |= (1 << j) | up[j]
+            up[ids[param]] = bits
+
+    def downstream_bits(self, params) -> int:
+        """OR of downstream closures for a collection of parameters."""
+        bits = 0
+        for p in params:
+            idx = self.ids.get(p)
+            if idx is not None:
+                bits |= self.down[idx]
+        return bits
+
+    def upstream_bits(self, param: str) -> int:
+        idx = self.ids.get(param)
+        return self.up[idx] if idx is not None else 0
+
+    def members(self, bits: int) -> Set[str]:
+        """Materialize a bitset as parameter paths."""
+        if not bits:
+            return set()
+        params = self.params
+        return {params[i] for i in _iter_bits(bits)}
+
+    def phases(self, bits: int) -> Set[str]:
+        """Phases owning at least one parameter in the bitset."""
+        return {phase for phase, mask in self.phase_bits.items() if mask & bits}
+
+
 # =============================================================================
 # DEPENDENCY GRAPH
 # =============================================================================
@@ -426,6 +546,9 @@ class DependencyGraph:
     - FIX #1: No circular imports
     - FIX #3: Separate edge types
     - FIX #4: get_all_downstream returns parameters
+
+    Once built, transitive queries are served from a ClosureIndex that is
+    maintained incrementally by add_parameter/add_dependency.
     """
 
     def __init__(self):
@@ -433,6 +556,8 @@ class DependencyGraph:
         self._edges: Dict[Tuple[str, str], DependencyEdge] = {}
         self._is_built: bool = False
         self._build_timestamp: Optional[datetime] = None
+        self._closure: Optional[ClosureIndex] = None
+        self._order_dirty: bool = False
 
     def add_parameter(self, param: str, phase: Optional[str] = None) -> DependencyNode:
         """Add a parameter to the graph."""
@@ -444,6 +569,11 @@ class DependencyGraph:
 
         node = DependencyNode(parameter_path=param, phase=phase)
         self._nodes[param] = node
+
+        if self._closure is not None:
+            self._closure.add_parameter(param, phase)
+            self._order_dirty = True
+
         return node
 
     def add_dependency(
@@ -480,6 +610,10 @@ class DependencyGraph:
         self._nodes[dependent].depends_on.add(dependency)
         self._nodes[dependency].depended_by.add(dependent)
 
+        if self._closure is not None:
+            self._closure.add_edge(dependency, dependent)
+            self._order_dirty = True
+
         return edge
 
     def build_from_definitions(self) -> None:
@@ -499,8 +633,8 @@ class DependencyGraph:
         if cycles:
             raise CyclicDependencyError(cycles[0])
 
-        # Compute topological order
-        self._compute_order()
+        # Compute topological order and transitive closure
+        self._build_closure(self._compute_order())
 
         self._is_built = True
         self._build_timestamp = datetime.utcnow()
@@ -538,22 +672,36 @@ class DependencyGraph:
 
         return cycles
 
-    def _compute_order(self) -> None:
+    def _compute_order(self) -> List[str]:
         """Compute topological order using Kahn's algorithm."""
         in_degree = {p: len(self._nodes[p].depends_on) for p in self._nodes}
         queue = deque([p for p, d in in_degree.items() if d == 0])
-        order = 0
+        topo_order = []
 
         while queue:
             param = queue.popleft()
-            self._nodes[param].computation_order = order
-            order += 1
+            self._nodes[param].computation_order = len(topo_order)
+            topo_order.append(param)
 
             for dependent in self._nodes[param].depended_by:
                 in_degree[dependent] -= 1
                 if in_degree[dependent] == 0:
                     queue.append(dependent)
 
+        self._order_dirty = False
+        return topo_order
+
+    def _build_closure(self, topo_order: List[str]) -> None:
+        """Build the closure index from the current nodes and edges."""
+        closure = ClosureIndex()
+        closure.build(self._nodes, topo_order)
+        self._closure = closure
+
+    def _refresh_order(self) -> None:
+        """Recompute topological order after incremental edits."""
+        if self._order_dirty:
+            self._compute_order()
+
     def get_direct_dependencies(self, param: str) -> Set[str]:
         """Get parameters that this parameter directly depends on."""
         node = self._nodes.get(param)
@@ -566,6 +714,22 @@ class DependencyGraph:
 
     def get_all_dependencies(self, param: str) -> Set[str]:
         """Get all upstream dependencies (transitive closure)."""
+        if self._closure is not None:
+            return self._closure.members(self._closure.upstream_bits(param))
+        return self._dfs_dependencies(param)
+
+    def get_all_downstream(self, param: str) -> Set[str]:
+        """
+        Get all downstream dependents (transitive closure).
+
+        FIX #4: Returns parameter paths, not phase names.
+        """
+        if self._closure is not None:
+            return self._closure.members(self._closure.downstream_bits((param,)))
+        return self._dfs_downstream(param)
+
+    def _dfs_dependencies(self, param: str) -> Set[str]:
+        """Upstream closure by graph traversal (used before the index exists)."""
         result = set()
         to_process = [param]
 
@@ -580,12 +744,8 @@ class DependencyGraph:
 
         return result
 
-    def get_all_downstream(self, param: str) -> Set[str]:
-        """
-        Get all downstream dependents (transitive closure).
-
-        FIX #4: Returns parameter paths, not phase names.
-        """
+    def _dfs_downstream(self, param: str) -> Set[str]:
+        """Downstream closure by graph traversal (used before the index exists)."""
         result = set()
         to_process = [param]
 
@@ -602,13 +762,14 @@ class DependencyGraph:
 
     def get_downstream_phases(self, param: str) -> Set[str]:
         """Get phases affected by changes to this parameter."""
-        downstream_params = self.get_all_downstream(param)
-        phases = set()
-
-        for p in downstream_params:
-            node = self._nodes.get(p)
-            if node:
-                phases.add(node.phase)
+        if self._closure is not None:
+            phases = self._closure.phases(self._closure.downstream_bits((param,)))
+        else:
+            phases = set()
+            for p in self._dfs_downstream(param):
+                node = self._nodes.get(p)
+                if node:
+                    phases.add(node.phase)
 
         # Also get phase-level downstream
         param_phase = get_phase_for_parameter(param)
@@ -619,6 +780,7 @@ class DependencyGraph:
 
     def get_computation_order(self, params: Set[str]) -> List[str]:
         """Get parameters in computation order (dependencies first)."""
+        self._refresh_order()
         return sorted(
             params,
             key=lambda p: self._nodes[p].computation_order if p in self._nodes else 0
@@ -631,9 +793,13 @@ class DependencyGraph:
         Returns all downstream parameters in topological order.
         """
         # Collect all downstream parameters
-        to_recalculate = set()
-        for param in changed_params:
-            to_recalculate.update(self.get_all_downstream(param))
+        if self._closure is not None:
+            bits = self._closure.downstream_bits(changed_params)
+            to_recalculate = self._closure.members(bits)
+        else:
+            to_recalculate = set()
+            for param in changed_params:
+                to_recalculate.update(self._dfs_downstream(param))
 
         # Return in computation order
         return self.get_computation_order(to_recalculate)
@@ -703,6 +869,7 @@ class DependencyGraph:
                 EdgeType(edge_data.get("edge_type", "data_flow"))
             )
 
+        graph._build_closure(graph._compute_order())
         graph._is_built = True
         if data.get("build_timestamp"):
             graph._build_timestamp = datetime.fromisoformat(data["build_timestamp"])
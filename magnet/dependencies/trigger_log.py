@@ -8,16 +8,23 @@ Audit trail for all state changes and invalidations.
 v1.1 Fixes Applied:
 - FIX #11: Queryable by time range, parameter, phase
 - FIX #12: Supports export to JSON for debugging
+
+Entries are held in a fixed-capacity ring (deque) with per-key index
+deques, so eviction is O(1). Evicted entries can spill to append-only
+JSON-lines segments that query() still scans, pruned by time range.
 """
 
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from itertools import islice
+from typing import Any, Deque, Dict, IO, Iterator, List, Optional, Set
 from pathlib import Path
 import json
 import logging
+import os
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -134,6 +141,33 @@ def _serialize_value(value: Any) -> Any:
 # TRIGGER LOG
 # =============================================================================
 
+@dataclass
+class SpillSegment:
+    """An append-only JSON-lines file of entries evicted from the ring."""
+    path: Path
+    count: int = 0  # Entries written by this log
+    min_timestamp: Optional[datetime] = None  # None: range unknown (empty or unreadable)
+    max_timestamp: Optional[datetime] = None
+
+    def overlaps(self, since: Optional[datetime], until: Optional[datetime]) -> bool:
+        """Check whether the segment may hold entries in [since, until]."""
+        if self.min_timestamp is None or self.max_timestamp is None:
+            return True
+        if since and self.max_timestamp < since:
+            return False
+        if until and self.min_timestamp > until:
+            return False
+        return True
+
+    def record(self, timestamp: datetime) -> None:
+        """Account for one appended entry."""
+        self.count += 1
+        if self.min_timestamp is None or timestamp < self.min_timestamp:
+            self.min_timestamp = timestamp
+        if self.max_timestamp is None or timestamp > self.max_timestamp:
+            self.max_timestamp = timestamp
+
+
 class TriggerLog:
     """
     Audit trail for all state changes and invalidations.
@@ -141,25 +175,50 @@ class TriggerLog:
     v1.1 Fixes:
     - FIX #11: Queryable by time, parameter, phase
     - FIX #12: JSON export
+
+    Holds at most max_entries in memory. With spill_dir set, entries evicted
+    for capacity are appended to segment files there (rotated every
+    segment_max_entries) and remain visible to query().
     """
 
     DEFAULT_MAX_ENTRIES = 10000
     DEFAULT_RETENTION_DAYS = 7
+    DEFAULT_SEGMENT_ENTRIES = 100000
+    CLEANUP_INTERVAL = 1000
+    SEGMENT_PATTERN = "triggers-*.jsonl"
 
     def __init__(
         self,
         max_entries: int = DEFAULT_MAX_ENTRIES,
         retention_days: int = DEFAULT_RETENTION_DAYS,
+        spill_dir: Optional[Path] = None,
+        segment_max_entries: int = DEFAULT_SEGMENT_ENTRIES,
     ):
-        self._entries: List[TriggerEntry] = []
+        self._entries: Deque[TriggerEntry] = deque()
         self._max_entries = max_entries
         self._retention_days = retention_days
 
-        # Indexes for fast lookup
-        self._by_parameter: Dict[str, List[TriggerEntry]] = {}
-        self._by_phase: Dict[str, List[TriggerEntry]] = {}
-        self._by_cascade: Dict[str, List[TriggerEntry]] = {}
-        self._by_transaction: Dict[str, List[TriggerEntry]] = {}
+        # Indexes for fast lookup; each deque is in log order, so the oldest
+        # entry of the ring is always at the left of its index deques
+        self._by_parameter: Dict[str, Deque[TriggerEntry]] = {}
+        self._by_phase: Dict[str, Deque[TriggerEntry]] = {}
+        self._by_cascade: Dict[str, Deque[TriggerEntry]] = {}
+        self._by_transaction: Dict[str, Deque[TriggerEntry]] = {}
+
+        # Retention cleanup can pop from the left while timestamps are in order
+        self._log_count = 0
+        self._in_order = True
+        self._last_timestamp: Optional[datetime] = None
+
+        # On-disk spill of evicted entries
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._segment_max_entries = segment_max_entries
+        self._segments: List[SpillSegment] = []
+        self._segment_file: Optional[IO[str]] = None
+        self._next_segment = 0
+        if self._spill_dir is not None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            self._adopt_segments()
 
     def log(self, entry: TriggerEntry) -> str:
         """
@@ -169,36 +228,21 @@ class TriggerLog:
             Entry ID
         """
         # Clean old entries periodically
-        if len(self._entries) % 1000 == 0:
+        self._log_count += 1
+        if self._log_count % self.CLEANUP_INTERVAL == 0:
             self._cleanup_old_entries()
 
+        if self._last_timestamp is not None and entry.timestamp < self._last_timestamp:
+            self._in_order = False
+        self._last_timestamp = entry.timestamp
+
         # Add entry
         self._entries.append(entry)
-
-        # Update indexes
-        if entry.parameter_path:
-            if entry.parameter_path not in self._by_parameter:
-                self._by_parameter[entry.parameter_path] = []
-            self._by_parameter[entry.parameter_path].append(entry)
-
-        if entry.phase:
-            if entry.phase not in self._by_phase:
-                self._by_phase[entry.phase] = []
-            self._by_phase[entry.phase].append(entry)
-
-        if entry.cascade_id:
-            if entry.cascade_id not in self._by_cascade:
-                self._by_cascade[entry.cascade_id] = []
-            self._by_cascade[entry.cascade_id].append(entry)
-
-        if entry.transaction_id:
-            if entry.transaction_id not in self._by_transaction:
-                self._by_transaction[entry.transaction_id] = []
-            self._by_transaction[entry.transaction_id].append(entry)
+        self._index_entry(entry)
 
         # Enforce max entries
-        if len(self._entries) > self._max_entries:
-            self._trim_entries()
+        while len(self._entries) > self._max_entries:
+            self._evict_oldest()
 
         return entry.entry_id
 
@@ -340,6 +384,7 @@ class TriggerLog:
             List of matching entries (newest first)
         """
         # Start with appropriate index if available
+        entries: Any
         if parameter and parameter in self._by_parameter:
             entries = self._by_parameter[parameter]
         elif phase and phase in self._by_phase:
@@ -351,9 +396,14 @@ class TriggerLog:
         else:
             entries = self._entries
 
+        # Newest first: the in-memory ring, then spilled segments
+        candidates: Iterator[TriggerEntry] = reversed(entries)
+        if self._segments:
+            candidates = _chain_lazy(candidates, lambda: self._iter_spilled(since, until))
+
         # Apply filters
         filtered = []
-        for entry in reversed(entries):  # Newest first
+        for entry in candidates:
             # Time filters
             if since and entry.timestamp < since:
                 continue
@@ -382,7 +432,7 @@ class TriggerLog:
 
     def get_recent(self, count: int = 100) -> List[TriggerEntry]:
         """Get most recent entries."""
-        return list(reversed(self._entries[-count:]))
+        return list(islice(reversed(self._entries), count))
 
     def get_for_parameter(
         self,
@@ -390,8 +440,8 @@ class TriggerLog:
         limit: int = 100
     ) -> List[TriggerEntry]:
         """Get entries for a specific parameter."""
-        entries = self._by_parameter.get(parameter, [])
-        return list(reversed(entries[-limit:]))
+        entries = self._by_parameter.get(parameter, ())
+        return list(islice(reversed(entries), limit))
 
     def get_for_phase(
         self,
@@ -399,16 +449,16 @@ class TriggerLog:
         limit: int = 100
     ) -> List[TriggerEntry]:
         """Get entries for a specific phase."""
-        entries = self._by_phase.get(phase, [])
-        return list(reversed(entries[-limit:]))
+        entries = self._by_phase.get(phase, ())
+        return list(islice(reversed(entries), limit))
 
     def get_cascade(self, cascade_id: str) -> List[TriggerEntry]:
-        """Get all entries for a cascade."""
-        return self._by_cascade.get(cascade_id, [])
+        """Get all in-memory entries for a cascade."""
+        return list(self._by_cascade.get(cascade_id, ()))
 
     def get_transaction(self, transaction_id: str) -> List[TriggerEntry]:
-        """Get all entries for a transaction."""
-        return self._by_transaction.get(transaction_id, [])
+        """Get all in-memory entries for a transaction."""
+        return list(self._by_transaction.get(transaction_id, ()))
 
     # FIX #12: Export methods
 
@@ -470,7 +520,10 @@ class TriggerLog:
     def to_dict(self) -> Dict[str, Any]:
         """Serialize recent entries for state persistence."""
         return {
-            "entries": [e.to_dict() for e in self._entries[-1000:]],
+            "entries": [
+                e.to_dict()
+                for e in islice(self._entries, max(0, len(self._entries) - 1000), None)
+            ],
             "max_entries": self._max_entries,
             "retention_days": self._retention_days,
         }
@@ -482,31 +535,58 @@ class TriggerLog:
             self.log(entry)
 
     def _cleanup_old_entries(self) -> None:
-        """Remove entries older than retention period."""
+        """Remove entries (and whole spilled segments) older than retention period."""
         cutoff = datetime.utcnow() - timedelta(days=self._retention_days)
 
         old_count = len(self._entries)
-        self._entries = [e for e in self._entries if e.timestamp >= cutoff]
-
-        # Rebuild indexes
-        self._rebuild_indexes()
+        if self._in_order:
+            # Oldest entries are at the left of the ring and of every index
+            while self._entries and self._entries[0].timestamp < cutoff:
+                self._unindex_oldest(self._entries.popleft())
+        else:
+            self._entries = deque(e for e in self._entries if e.timestamp >= cutoff)
+            self._rebuild_indexes()
+            self._in_order = all(
+                a.timestamp <= b.timestamp
+                for a, b in zip(self._entries, islice(self._entries, 1, None))
+            )
 
         removed = old_count - len(self._entries)
         if removed > 0:
             logger.debug(f"Cleaned up {removed} old trigger log entries")
 
-    def _trim_entries(self) -> None:
-        """Trim to max entries."""
-        if len(self._entries) <= self._max_entries:
-            return
+        for segment in list(self._segments):
+            if segment.max_timestamp is not None and segment.max_timestamp < cutoff:
+                self._drop_segment(segment)
 
-        trim_count = len(self._entries) - self._max_entries
-        self._entries = self._entries[trim_count:]
+    def _evict_oldest(self) -> None:
+        """Evict the oldest entry for capacity, spilling it if configured."""
+        entry = self._entries.popleft()
+        self._unindex_oldest(entry)
+        if self._spill_dir is not None:
+            self._spill(entry)
 
-        # Rebuild indexes
-        self._rebuild_indexes()
+    def _index_entry(self, entry: TriggerEntry) -> None:
+        """Append an entry to its index deques."""
+        if entry.parameter_path:
+            _index_append(self._by_parameter, entry.parameter_path, entry)
+        if entry.phase:
+            _index_append(self._by_phase, entry.phase, entry)
+        if entry.cascade_id:
+            _index_append(self._by_cascade, entry.cascade_id, entry)
+        if entry.transaction_id:
+            _index_append(self._by_transaction, entry.transaction_id, entry)
 
-        logger.debug(f"Trimmed {trim_count} trigger log entries")
+    def _unindex_oldest(self, entry: TriggerEntry) -> None:
+        """Remove the just-evicted oldest entry from the left of its index deques."""
+        if entry.parameter_path:
+            _index_popleft(self._by_parameter, entry.parameter_path)
+        if entry.phase:
+            _index_popleft(self._by_phase, entry.phase)
+        if entry.cascade_id:
+            _index_popleft(self._by_cascade, entry.cascade_id)
+        if entry.transaction_id:
+            _index_popleft(self._by_transaction, entry.transaction_id)
 
     def _rebuild_indexes(self) -> None:
         """Rebuild all indexes from entries."""
@@ -516,33 +596,155 @@ class TriggerLog:
         self._by_transaction.clear()
 
         for entry in self._entries:
-            if entry.parameter_path:
-                if entry.parameter_path not in self._by_parameter:
-                    self._by_parameter[entry.parameter_path] = []
-                self._by_parameter[entry.parameter_path].append(entry)
-
-            if entry.phase:
-                if entry.phase not in self._by_phase:
-                    self._by_phase[entry.phase] = []
-                self._by_phase[entry.phase].append(entry)
-
-            if entry.cascade_id:
-                if entry.cascade_id not in self._by_cascade:
-                    self._by_cascade[entry.cascade_id] = []
-                self._by_cascade[entry.cascade_id].append(entry)
-
-            if entry.transaction_id:
-                if entry.transaction_id not in self._by_transaction:
-                    self._by_transaction[entry.transaction_id] = []
-                self._by_transaction[entry.transaction_id].append(entry)
+            self._index_entry(entry)
+
+    # Spill segments
+
+    @property
+    def spilled_count(self) -> int:
+        """Number of entries in spilled segments written by this log."""
+        return sum(segment.count for segment in self._segments)
+
+    @property
+    def segments(self) -> List[SpillSegment]:
+        """Spill segments, oldest first."""
+        return list(self._segments)
+
+    def flush(self) -> None:
+        """Flush the active spill segment to disk."""
+        if self._segment_file is not None:
+            self._segment_file.flush()
+
+    def close(self) -> None:
+        """Flush and close the active spill segment."""
+        if self._segment_file is not None:
+            self._segment_file.close()
+            self._segment_file = None
+
+    def _spill(self, entry: TriggerEntry) -> None:
+        """Append an evicted entry to the active segment."""
+        segment = self._segments[-1] if self._segment_file is not None else None
+        if segment is None or segment.count >= self._segment_max_entries:
+            segment = self._open_segment()
+
+        self._segment_file.write(json.dumps(entry.to_dict()))
+        self._segment_file.write("\n")
+        segment.record(entry.timestamp)
+
+    def _open_segment(self) -> SpillSegment:
+        """Close the active segment and start the next one."""
+        self.close()
+        path = self._spill_dir / f"triggers-{self._next_segment:06d}.jsonl"
+        self._next_segment += 1
+
+        segment = SpillSegment(path=path)
+        self._segments.append(segment)
+        self._segment_file = open(path, "a", encoding="utf-8")
+        return segment
+
+    def _adopt_segments(self) -> None:
+        """Register segments left in spill_dir by an earlier log."""
+        for path in sorted(self._spill_dir.glob(self.SEGMENT_PATTERN)):
+            try:
+                number = int(path.stem.split("-")[-1])
+            except ValueError:
+                continue
+            segment = SpillSegment(path=path)
+            # Segments are written in log order: the first and last entries
+            # give the time range for query pruning and retention
+            try:
+                with open(path, "rb") as f:
+                    first = f.readline()
+                    last = next(_lines_reversed(f), None)
+                for line in (first, last):
+                    if line and line.strip():
+                        segment.record(datetime.fromisoformat(json.loads(line)["timestamp"]))
+                segment.count = 0
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Could not read time range of trigger log segment {path.name}: {e}")
+            self._segments.append(segment)
+            self._next_segment = max(self._next_segment, number + 1)
+
+    def _drop_segment(self, segment: SpillSegment) -> None:
+        """Delete a spilled segment."""
+        if self._segments and segment is self._segments[-1]:
+            self.close()
+        self._segments.remove(segment)
+        segment.path.unlink(missing_ok=True)
+        logger.debug(f"Removed expired trigger log segment {segment.path.name}")
+
+    def _iter_spilled(
+        self,
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> Iterator[TriggerEntry]:
+        """Yield spilled entries newest first, skipping segments outside [since, until]."""
+        self.flush()
+        for segment in reversed(self._segments):
+            if not segment.overlaps(since, until):
+                continue
+            try:
+                f = open(segment.path, "rb")
+            except FileNotFoundError:
+                continue
+            with f:
+                for line in _lines_reversed(f):
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    timestamp = datetime.fromisoformat(data["timestamp"])
+                    if (since and timestamp < since) or (until and timestamp > until):
+                        continue
+                    yield TriggerEntry.from_dict(data)
 
     def clear(self) -> None:
-        """Clear all entries."""
+        """Clear all in-memory entries (spilled segments stay on disk)."""
         self._entries.clear()
         self._by_parameter.clear()
         self._by_phase.clear()
         self._by_cascade.clear()
         self._by_transaction.clear()
+        self._in_order = True
+        self._last_timestamp = None
 
     def __len__(self) -> int:
         return len(self._entries)
+
+
+def _lines_reversed(f: IO[bytes], block_size: int = 1 << 16) -> Iterator[bytes]:
+    """Lines of a binary file, last first, read backwards one block at a time."""
+    f.seek(0, os.SEEK_END)
+    position = f.tell()
+    tail = b""
+    while position > 0:
+        step = min(block_size, position)
+        position -= step
+        f.seek(position)
+        lines = (f.read(step) + tail).split(b"\n")
+        # lines[0] may continue in the previous block
+        tail = lines[0]
+        for line in reversed(lines[1:]):
+            if line:
+                yield line
+    if tail:
+        yield tail
+
+
+def _index_append(index: Dict[str, Deque[TriggerEntry]], key: str, entry: TriggerEntry) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        bucket = index[key] = deque()
+    bucket.append(entry)
+
+
+def _index_popleft(index: Dict[str, Deque[TriggerEntry]], key: str) -> None:
+    bucket = index[key]
+    bucket.popleft()
+    if not bucket:
+        del index[key]
+
+
+def _chain_lazy(first: Iterator[TriggerEntry], make_rest) -> Iterator[TriggerEntry]:
+    """Yield from first, then from make_rest() only if iteration gets that far."""
+    yield from first
+    yield from make_rest()
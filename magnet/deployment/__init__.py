@@ -9,13 +9,16 @@ v1.1 Changes:
 - API with PhaseMachine integration (fixes blockers #5, #8, #11)
 - WebSocket message processor startup
 - RunPod serverless handler
+- Kernel executor service (CPU-bound API work off the event loop)
 """
 
 from .worker import (
     JobStatus,
     Job,
     JobQueue,
+    SQLiteJobStore,
     Worker,
+    configure_job_queue,
     get_job_queue,
     get_job_status,
     submit_job,
@@ -27,6 +30,12 @@ from .websocket import (
     ConnectionManager,
 )
 
+from .executor_service import (
+    KernelExecutor,
+    ExecutorSaturated,
+    LatencyHistogram,
+)
+
 from .api import (
     create_fastapi_app,
 )
@@ -41,7 +50,9 @@ __all__ = [
     "JobStatus",
     "Job",
     "JobQueue",
+    "SQLiteJobStore",
     "Worker",
+    "configure_job_queue",
     "get_job_queue",
     "get_job_status",
     "submit_job",
@@ -49,6 +60,10 @@ __all__ = [
     "WSMessage",
     "WSClient",
     "ConnectionManager",
+    # Executor service
+    "KernelExecutor",
+    "ExecutorSaturated",
+    "LatencyHistogram",
     # API
     "create_fastapi_app",
     # RunPod
@@ -641,17 +641,22 @@ def create_fastapi_app(context: "AppContext" = None):
 
     from .websocket import ConnectionManager, WSMessage, get_connection_manager
     from .worker import submit_job, get_job_status, JobPriority
+    from .executor_service import KernelExecutor, ExecutorSaturated
 
     # Configuration
     enable_docs = True
     docs_url = "/docs"
     cors_origins = ["*"]
+    kernel_workers = 2
+    kernel_queue_limit = 64
 
     if context and context.config:
         if hasattr(context.config, 'api'):
             enable_docs = getattr(context.config.api, 'enable_docs', True)
             docs_url = getattr(context.config.api, 'docs_url', '/docs')
             cors_origins = getattr(context.config.api, 'cors_origins', ['*'])
+            kernel_workers = getattr(context.config.api, 'kernel_workers', 2)
+            kernel_queue_limit = getattr(context.config.api, 'kernel_queue_limit', 64)
 
     app = FastAPI(
         title="MAGNET API",
@@ -673,6 +678,27 @@ def create_fastapi_app(context: "AppContext" = None):
     # WebSocket manager
     ws_manager = get_connection_manager()
 
+    # CPU-bound kernel work runs here, never on the event loop
+    kernel = KernelExecutor(max_workers=kernel_workers, max_queue=kernel_queue_limit)
+    app.state.kernel_executor = kernel
+
+    # Ordering key for kernel calls that touch a design. Whatever design_id
+    # the URL names, they all run on the container's one Conductor,
+    # PipelineExecutor and StateManager, so they share a single lane.
+    # Every handler that mutates design state goes through this lane;
+    # a direct write from the loop could land mid-way through a phase run.
+    # Handlers that walk the state (serialize it, page history) go through
+    # it too, so they never see a half-applied write or a trimmed history.
+    design_key = "design"
+
+    @app.exception_handler(ExecutorSaturated)
+    async def executor_saturated_handler(request, exc: ExecutorSaturated):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc)},
+            headers={"Retry-After": "1"},
+        )
+
     # =========================================================================
     # Wire Geometry Router (Intent→Action Protocol integration)
     # =========================================================================
@@ -838,6 +864,7 @@ def create_fastapi_app(context: "AppContext" = None):
     async def shutdown():
         logger.info("API server stopping")
         await ws_manager.shutdown()
+        kernel.shutdown(wait=False)
 
     # =========================================================================
     # Health Endpoints
@@ -873,6 +900,7 @@ def create_fastapi_app(context: "AppContext" = None):
         return {
             "ready": all(checks.values()),
             "checks": checks,
+            "kernel_executor": kernel.stats(),
         }
 
     # =========================================================================
@@ -889,7 +917,8 @@ def create_fastapi_app(context: "AppContext" = None):
                 "designs": "/api/v1/designs",
                 "health": "/health",
                 "ws": "/ws/{design_id}"
-            }
+            },
+            "kernel_executor": kernel.stats(),
         }
 
     # =========================================================================
@@ -906,17 +935,20 @@ def create_fastapi_app(context: "AppContext" = None):
 
         from magnet.ui.utils import get_state_value
 
-        design_id = get_state_value(state_manager, "metadata.design_id")
-        if not design_id:
-            return {"designs": []}
+        def read():
+            design_id = get_state_value(state_manager, "metadata.design_id")
+            if not design_id:
+                return {"designs": []}
 
-        return {
-            "designs": [{
-                "design_id": design_id,
-                "name": get_state_value(state_manager, "metadata.name", "Untitled"),
-                "created_at": get_state_value(state_manager, "metadata.created_at"),
-            }]
-        }
+            return {
+                "designs": [{
+                    "design_id": design_id,
+                    "name": get_state_value(state_manager, "metadata.name", "Untitled"),
+                    "created_at": get_state_value(state_manager, "metadata.created_at"),
+                }]
+            }
+
+        return await kernel.run(read, key=design_key, operation="list_designs")
 
     @app.post("/api/v1/designs")
     async def create_design(
@@ -933,52 +965,55 @@ def create_fastapi_app(context: "AppContext" = None):
 
         design_id = f"MAGNET-{datetime.now().strftime('%Y%m%d')}-{str(uuid.uuid4())[:4].upper()}"
 
-        set_state_value(state_manager, "metadata.design_id", design_id, "api")
-        set_state_value(state_manager, "metadata.name", design.name, "api")
-        set_state_value(state_manager, "metadata.created_at", datetime.now(timezone.utc).isoformat(), "api")
-
-        if design.vessel_type:
-            set_state_value(state_manager, "mission.vessel_type", design.vessel_type, "api")
-
-        if design.mission:
-            for key, value in design.mission.items():
-                set_state_value(state_manager, f"mission.{key}", value, "api")
+        def create():
+            set_state_value(state_manager, "metadata.design_id", design_id, "api")
+            set_state_value(state_manager, "metadata.name", design.name, "api")
+            set_state_value(state_manager, "metadata.created_at", datetime.now(timezone.utc).isoformat(), "api")
 
-        # Initialize hull dimensions with kernel baselines to satisfy positive validators
-        hull_baselines = {
-            "hull.loa": 30.0,
-            "hull.beam": 8.0,
-            "hull.draft": 2.0,
-            "hull.depth": 4.0,
-        }
-        txn_id = None
-        try:
-            txn_id = state_manager.begin_transaction()
-            for path, value in hull_baselines.items():
-                state_manager.set(path, value, source="api|design_init")
-            state_manager.commit()
-        except Exception as e:
-            if txn_id:
-                try:
-                    state_manager.rollback_transaction(txn_id)
-                except Exception:
-                    pass
-            logger.warning(f"Failed to initialize hull baselines: {e}")
+            if design.vessel_type:
+                set_state_value(state_manager, "mission.vessel_type", design.vessel_type, "api")
 
-        # v1.1: Initialize phases via PhaseMachine (fixes blocker #11)
-        phases = ["mission", "hull_form", "structure", "propulsion",
-                  "systems", "weight_stability", "compliance", "production"]
+            if design.mission:
+                for key, value in design.mission.items():
+                    set_state_value(state_manager, f"mission.{key}", value, "api")
 
-        if phase_machine:
+            # Initialize hull dimensions with kernel baselines to satisfy positive validators
+            hull_baselines = {
+                "hull.loa": 30.0,
+                "hull.beam": 8.0,
+                "hull.draft": 2.0,
+                "hull.depth": 4.0,
+            }
+            txn_id = None
             try:
-                phase_machine.initialize_design(design_id)
+                txn_id = state_manager.begin_transaction()
+                for path, value in hull_baselines.items():
+                    state_manager.set(path, value, source="api|design_init")
+                state_manager.commit()
             except Exception as e:
-                logger.warning(f"PhaseMachine init: {e}")
+                if txn_id:
+                    try:
+                        state_manager.rollback_transaction(txn_id)
+                    except Exception:
+                        pass
+                logger.warning(f"Failed to initialize hull baselines: {e}")
+
+            # v1.1: Initialize phases via PhaseMachine (fixes blocker #11)
+            phases = ["mission", "hull_form", "structure", "propulsion",
+                      "systems", "weight_stability", "compliance", "production"]
+
+            if phase_machine:
+                try:
+                    phase_machine.initialize_design(design_id)
+                except Exception as e:
+                    logger.warning(f"PhaseMachine init: {e}")
+                    for phase in phases:
+                        set_phase_status(state_manager, phase, "pending", "api")
+            else:
                 for phase in phases:
                     set_phase_status(state_manager, phase, "pending", "api")
-        else:
-            for phase in phases:
-                set_phase_status(state_manager, phase, "pending", "api")
+
+        await kernel.run(create, key=design_key, operation="create_design")
 
         # Notify WebSocket clients
         ws_manager.queue_message(WSMessage(
@@ -1004,7 +1039,43 @@ def create_fastapi_app(context: "AppContext" = None):
         if current_id != design_id:
             raise HTTPException(status_code=404, detail="Design not found")
 
-        return serialize_state(state_manager)
+        # History is paged via /history rather than shipped with every fetch
+        return await kernel.run(
+            serialize_state, state_manager, include_history=False,
+            key=design_key, operation="get_design",
+        )
+
+    @app.get("/api/v1/designs/{design_id}/history")
+    async def get_design_history(
+        design_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        state_manager=Depends(get_state_manager),
+    ):
+        """Get a page of the design's mutation history, newest first."""
+        from magnet.ui.utils import get_state_value
+
+        if not state_manager:
+            raise HTTPException(status_code=503, detail="StateManager not available")
+
+        current_id = get_state_value(state_manager, "metadata.design_id")
+        if current_id != design_id:
+            raise HTTPException(status_code=404, detail="Design not found")
+
+        limit = max(0, min(limit, 1000))
+
+        def read():
+            history = state_manager.state.history
+            return {
+                "design_id": design_id,
+                "total": len(history),
+                "dropped": history.dropped,
+                "offset": offset,
+                "limit": limit,
+                "entries": state_manager.get_history(offset=offset, limit=limit),
+            }
+
+        return await kernel.run(read, key=design_key, operation="get_design_history")
 
     @app.patch("/api/v1/designs/{design_id}")
     async def update_design(
@@ -1062,19 +1133,44 @@ def create_fastapi_app(context: "AppContext" = None):
             value=update.value,
         )
 
-        # Create ActionPlan
-        plan = ActionPlan(
-            plan_id=f"patch_{uuid.uuid4().hex[:8]}",
-            intent_id=f"patch_intent_{uuid.uuid4().hex[:8]}",
-            design_id=design_id,
-            design_version_before=state_manager.design_version,
-            actions=[action],
-            proposed_at=datetime.now(timezone.utc),
-        )
+        def apply():
+            # Plan, validation, execution and invalidation are one kernel
+            # call so nothing else touches the design between them
+            plan = ActionPlan(
+                plan_id=f"patch_{uuid.uuid4().hex[:8]}",
+                intent_id=f"patch_intent_{uuid.uuid4().hex[:8]}",
+                design_id=design_id,
+                design_version_before=state_manager.design_version,
+                actions=[action],
+                proposed_at=datetime.now(timezone.utc),
+            )
 
-        # Validate through ActionPlanValidator
-        try:
+            # Validate through ActionPlanValidator
             validation_result = validator.validate(plan, state_manager)
+            if validation_result.has_rejections:
+                return validation_result, None, []
+
+            # Execute through ActionExecutor (owns transaction)
+            exec_result = executor.execute(validation_result.approved, plan)
+            if not exec_result.success:
+                return validation_result, exec_result, []
+
+            # Trigger dependency invalidation
+            affected_phases = []
+            if phase_machine:
+                try:
+                    affected_phases = phase_machine.invalidate_dependents(update.path)
+                    if affected_phases:
+                        logger.info(f"Invalidated phases: {affected_phases}")
+                except Exception as e:
+                    logger.warning(f"Invalidation: {e}")
+
+            return validation_result, exec_result, affected_phases
+
+        try:
+            validation_result, exec_result, affected_phases = await kernel.run(
+                apply, key=design_key, operation="update_design",
+            )
         except StalePlanError as e:
             raise HTTPException(
                 status_code=409,
@@ -1088,24 +1184,12 @@ def create_fastapi_app(context: "AppContext" = None):
                 detail={"error": "validation_failed", "path": rejection[0].path, "reason": rejection[1]}
             )
 
-        # Execute through ActionExecutor (owns transaction)
-        exec_result = executor.execute(validation_result.approved, plan)
         if not exec_result.success:
             raise HTTPException(
                 status_code=500,
                 detail={"error": "execution_failed", "errors": exec_result.errors}
             )
 
-        # Trigger dependency invalidation
-        affected_phases = []
-        if phase_machine:
-            try:
-                affected_phases = phase_machine.invalidate_dependents(update.path)
-                if affected_phases:
-                    logger.info(f"Invalidated phases: {affected_phases}")
-            except Exception as e:
-                logger.warning(f"Invalidation: {e}")
-
         # Notify clients
         ws_manager.queue_message(WSMessage(
             type="design_updated",
@@ -1141,11 +1225,14 @@ def create_fastapi_app(context: "AppContext" = None):
         if current_id != design_id:
             raise HTTPException(status_code=404, detail="Design not found")
 
-        # Reset state (in-memory only)
-        try:
-            state_manager.reset()
-        except Exception:
-            pass
+        def reset():
+            # Reset state (in-memory only)
+            try:
+                state_manager.reset()
+            except Exception:
+                pass
+
+        await kernel.run(reset, key=design_key, operation="delete_design")
 
         ws_manager.queue_message(WSMessage(
             type="design_deleted",
@@ -1229,7 +1316,10 @@ def create_fastapi_app(context: "AppContext" = None):
 
             # Validate the plan
             try:
-                validation_result = validator.validate(plan, state_manager)
+                validation_result = await kernel.run(
+                    validator.validate, plan, state_manager,
+                    key=design_key, operation="validate_actions",
+                )
             except StalePlanError as e:
                 raise HTTPException(
                     status_code=409,
@@ -1256,7 +1346,10 @@ def create_fastapi_app(context: "AppContext" = None):
                 }
 
             # Execute approved actions
-            exec_result = executor.execute(validation_result.approved, plan)
+            exec_result = await kernel.run(
+                executor.execute, validation_result.approved, plan,
+                key=design_key, operation="execute_actions",
+            )
 
             # Notify WebSocket clients
             ws_manager.queue_message(WSMessage(
@@ -1279,7 +1372,7 @@ def create_fastapi_app(context: "AppContext" = None):
                 "errors": exec_result.errors,
             }
 
-        except HTTPException:
+        except (HTTPException, ExecutorSaturated):
             raise
         except Exception as e:
             logger.error(f"Action submission failed: {e}")
@@ -1312,7 +1405,12 @@ def create_fastapi_app(context: "AppContext" = None):
 
         success = False
         try:
-            success = state_manager.revert_to_version(target_version)
+            success = await kernel.run(
+                state_manager.revert_to_version, target_version,
+                key=design_key, operation="revert",
+            )
+        except ExecutorSaturated:
+            raise
         except Exception as e:
             logger.error(f"Undo failed: {e}")
             raise HTTPException(status_code=500, detail="Undo failed")
@@ -1355,7 +1453,12 @@ def create_fastapi_app(context: "AppContext" = None):
             raise HTTPException(status_code=400, detail="Invalid version")
 
         try:
-            success = state_manager.revert_to_version(version)
+            success = await kernel.run(
+                state_manager.revert_to_version, version,
+                key=design_key, operation="revert",
+            )
+        except ExecutorSaturated:
+            raise
         except Exception as e:
             logger.error(f"Restore failed: {e}")
             raise HTTPException(status_code=500, detail="Restore failed")
@@ -1446,11 +1549,16 @@ def create_fastapi_app(context: "AppContext" = None):
         phases = ["mission", "hull_form", "structure", "propulsion",
                   "systems", "weight_stability", "compliance", "production"]
 
-        result = []
-        for phase in phases:
-            status = get_phase_status(state_manager, phase, "pending") if state_manager else "pending"
-            result.append({"phase": phase, "status": status})
+        if not state_manager:
+            return {"phases": [{"phase": phase, "status": "pending"} for phase in phases]}
+
+        def read():
+            return [
+                {"phase": phase, "status": get_phase_status(state_manager, phase, "pending")}
+                for phase in phases
+            ]
 
+        result = await kernel.run(read, key=design_key, operation="list_phases")
         return {"phases": result}
 
     @app.get("/api/v1/designs/{design_id}/phases/{phase}")
@@ -1465,8 +1573,13 @@ def create_fastapi_app(context: "AppContext" = None):
         if not state_manager:
             raise HTTPException(status_code=503, detail="StateManager not available")
 
-        status = get_phase_status(state_manager, phase, "pending")
-        phase_state = get_state_value(state_manager, f"phase_states.{phase}", {})
+        def read():
+            status = get_phase_status(state_manager, phase, "pending")
+            phase_state = get_state_value(state_manager, f"phase_states.{phase}", {})
+            # Copy inside the lane; the live dict keeps changing after we return
+            return status, dict(phase_state) if isinstance(phase_state, dict) else phase_state
+
+        status, phase_state = await kernel.run(read, key=design_key, operation="get_phase")
 
         return {
             "phase": phase,
@@ -1525,7 +1638,10 @@ def create_fastapi_app(context: "AppContext" = None):
         # Run synchronously
         if conductor:
             try:
-                result = conductor.run_phase(kernel_phase)
+                result = await kernel.run(
+                    conductor.run_phase, kernel_phase,
+                    key=design_key, operation="run_phase",
+                )
 
                 ws_manager.queue_message(WSMessage(
                     type="phase_completed",
@@ -1538,13 +1654,18 @@ def create_fastapi_app(context: "AppContext" = None):
                     "status": "completed",
                     "result": result.to_dict() if hasattr(result, 'to_dict') else {},
                 }
+            except ExecutorSaturated:
+                raise
             except Exception as e:
                 logger.error(f"Phase {phase} failed: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
 
         # Fallback: just update status
         if state_manager:
-            set_phase_status(state_manager, phase, "completed", "api")
+            await kernel.run(
+                set_phase_status, state_manager, phase, "completed", "api",
+                key=design_key, operation="run_phase",
+            )
 
         return {"phase": phase, "status": "completed"}
 
@@ -1571,7 +1692,7 @@ def create_fastapi_app(context: "AppContext" = None):
                 "phase": phase,
             }
 
-        try:
+        def validate():
             # Run phase validation via single authority (Guardrail #2)
             execution_state = executor.execute_phase(kernel_phase)
 
@@ -1587,6 +1708,13 @@ def create_fastapi_app(context: "AppContext" = None):
                 except Exception as e:
                     logger.warning(f"Gate check failed: {e}")
 
+            return execution_state, contract_result, gate_status
+
+        try:
+            execution_state, contract_result, gate_status = await kernel.run(
+                validate, key=design_key, operation="validate_phase",
+            )
+
             # Determine overall success
             validators_passed = len([
                 v for v, r in execution_state.results.items()
@@ -1623,6 +1751,8 @@ def create_fastapi_app(context: "AppContext" = None):
                     for vid, result in execution_state.results.items()
                 },
             }
+        except ExecutorSaturated:
+            raise
         except Exception as e:
             logger.error(f"Phase validation failed: {e}")
             return {
@@ -1645,23 +1775,31 @@ def create_fastapi_app(context: "AppContext" = None):
         if not state_manager:
             raise HTTPException(status_code=503, detail="StateManager not available")
 
-        current = get_phase_status(state_manager, phase)
-        if current not in ["completed", "active"]:
+        def approve():
+            # Status check and approval are one kernel call so a concurrent
+            # run or reset cannot slip between them
+            current = get_phase_status(state_manager, phase)
+            if current not in ["completed", "active"]:
+                return current
+
+            # v1.1: Approve via PhaseMachine (fixes blocker #11)
+            if phase_machine:
+                try:
+                    phase_machine.approve_phase(phase, comment=approval.comment)
+                except Exception as e:
+                    logger.warning(f"PhaseMachine approve: {e}")
+                    set_phase_status(state_manager, phase, "approved", "api")
+            else:
+                set_phase_status(state_manager, phase, "approved", "api")
+            return None
+
+        blocked = await kernel.run(approve, key=design_key, operation="approve_phase")
+        if blocked is not None:
             raise HTTPException(
                 status_code=400,
-                detail=f"Cannot approve phase in '{current}' status"
+                detail=f"Cannot approve phase in '{blocked}' status"
             )
 
-        # v1.1: Approve via PhaseMachine (fixes blocker #11)
-        if phase_machine:
-            try:
-                phase_machine.approve_phase(phase, comment=approval.comment)
-            except Exception as e:
-                logger.warning(f"PhaseMachine approve: {e}")
-                set_phase_status(state_manager, phase, "approved", "api")
-        else:
-            set_phase_status(state_manager, phase, "approved", "api")
-
         ws_manager.queue_message(WSMessage(
             type="phase_approved",
             design_id=design_id,
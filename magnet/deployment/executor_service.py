@@ -0,0 +1,235 @@
+"""
+deployment/executor_service.py - Kernel executor service v1.0
+BRAVO OWNS THIS FILE.
+
+Section 56: Deployment Infrastructure
+Runs CPU-bound kernel work (phase runs, validation, action execution) off
+the API event loop on a bounded thread pool, with per-key ordering and
+queue/latency statistics for the readiness and meta endpoints.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import bisect
+import functools
+import logging
+import threading
+import time
+
+logger = logging.getLogger("deployment.executor_service")
+
+
+# Upper bounds in seconds; the last bucket is +Inf
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+class ExecutorSaturated(Exception):
+    """Raised when the kernel executor queue is full."""
+    pass
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (cumulative counts, Prometheus style)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one observation."""
+        self._counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, n in zip(self.buckets, self._counts):
+            cumulative += n
+            buckets[f"{bound:g}"] = cumulative
+        buckets["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum_s": round(self.sum, 6),
+            "mean_s": round(self.sum / self.count, 6) if self.count else 0.0,
+            "max_s": round(self.max, 6),
+            "buckets": buckets,
+        }
+
+
+class KernelExecutor:
+    """
+    Bounded executor for CPU-bound kernel calls made from async handlers.
+
+    Calls with the same key run one at a time in submission order; calls
+    with different keys (or no key) run concurrently up to max_workers.
+    Callers key on whatever the call mutates: calls that share state must
+    share a key. At most max_queue calls may be queued or running at
+    once; further calls raise ExecutorSaturated instead of piling up.
+
+    Threads rather than processes: the conductor, StateManager and
+    validators live in the API process and are mutated in place, so the
+    work cannot be shipped to another interpreter.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 64):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="magnet-kernel")
+
+        # Counters are touched from the loop and from pool threads
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._latency: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+        # key -> [asyncio.Lock, users]; only touched on the event loop
+        self._keys: Dict[Hashable, List[Any]] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls accepted but not yet running."""
+        return self._pending
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently running on a pool thread."""
+        return self._in_flight
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        key: Optional[Hashable] = None,
+        operation: str = "kernel",
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run fn(*args, **kwargs) on the pool and await its result.
+
+        If the awaiting handler is cancelled the call still runs to
+        completion, and the key stays locked until it does, so a later
+        call with the same key never overtakes it.
+        """
+        with self._lock:
+            if self._pending + self._in_flight >= self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturated(
+                    f"Kernel executor saturated ({self.max_queue} calls queued or running)"
+                )
+            self._pending += 1
+
+        submitted = time.perf_counter()
+        registered = acquired = False
+        try:
+            if key is not None:
+                key_lock = self._acquire_key(key)
+                registered = True
+                await key_lock.acquire()
+                acquired = True
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                self._pool,
+                functools.partial(self._call, operation, submitted, fn, *args, **kwargs),
+            )
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            if registered:
+                self._release_key(key, acquired)
+            raise
+
+        future.add_done_callback(functools.partial(self._finished, key))
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue, throughput and latency statistics."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self._pending,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "keys_active": len(self._keys),
+                "latency": {
+                    operation: {phase: hist.to_dict() for phase, hist in hists.items()}
+                    for operation, hists in self._latency.items()
+                },
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and release the pool threads."""
+        self._pool.shutdown(wait=wait)
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _call(self, operation: str, submitted: float, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        with self._lock:
+            self._pending -= 1
+            self._in_flight += 1
+        ok = False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._in_flight -= 1
+                if ok:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+                hists = self._latency.get(operation)
+                if hists is None:
+                    hists = self._latency[operation] = {
+                        "wait": LatencyHistogram(),
+                        "run": LatencyHistogram(),
+                    }
+                hists["wait"].observe(started - submitted)
+                hists["run"].observe(finished - started)
+
+    def _finished(self, key: Optional[Hashable], future: asyncio.Future) -> None:
+        if key is not None:
+            self._release_key(key, True)
+        # Consume the outcome so an abandoned (cancelled) caller does not
+        # leave an "exception was never retrieved" warning behind
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug(f"Kernel call failed: {future.exception()}")
+
+    def _acquire_key(self, key: Hashable) -> asyncio.Lock:
+        entry = self._keys.get(key)
+        if entry is None:
+            entry = self._keys[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        return entry[0]
+
+    def _release_key(self, key: Hashable, locked: bool) -> None:
+        entry = self._keys[key]
+        if locked:
+            entry[0].release()
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._keys[key]
@@ -1,18 +1,23 @@
 """
-deployment/runpod_handler.py - RunPod serverless handler v1.1
+deployment/runpod_handler.py - RunPod serverless handler v1.2
 BRAVO OWNS THIS FILE.
 
 Section 56: Deployment Infrastructure
 Provides RunPod serverless function handler.
 Fixes blocker #10: RunPod missing imports.
+
+v1.2: Warm application pool. Apps are built once per worker and reset
+between invocations instead of being rebuilt for every event.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Optional, TYPE_CHECKING
-from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 import logging
 import asyncio
 import json
+import os
+import threading
+import time
 import traceback
 
 if TYPE_CHECKING:
@@ -32,6 +37,21 @@ OPERATION_QUERY = "query"
 OPERATION_UPDATE = "update"
 
 
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read an integer env setting; malformed values fall back to default."""
+    raw = os.getenv(name)
+    try:
+        value = int(raw) if raw is not None else default
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {name}={raw!r}, using {default}")
+        value = default
+    return max(minimum, value)
+
+
+# Warm apps kept per worker; also the batch handler's concurrency
+DEFAULT_POOL_SIZE = _env_int("MAGNET_RUNPOD_CONCURRENCY", 1)
+
+
 def handler(event: Dict[str, Any]) -> Dict[str, Any]:
     """
     RunPod serverless handler function.
@@ -53,9 +73,15 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
         "result": {...},
         "error": str|null,
         "duration_ms": int,
+        "startup_ms": float,  # app checkout (build if cold) + state load
+        "work_ms": float,     # the operation itself
+        "warm": bool,         # served by an already-built app
     }
     """
-    start_time = datetime.now(timezone.utc)
+    start = time.perf_counter()
+    startup_ms = work_ms = 0.0
+    warm = False
+    app = None
 
     try:
         # Extract input
@@ -66,34 +92,252 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
 
         logger.info(f"RunPod handler: operation={operation}")
 
-        # Initialize application
-        app = _create_app(design_state)
+        # Check out a warm application loaded with this design
+        app, warm = _acquire_app(design_state)
+        work_start = time.perf_counter()
+        startup_ms = (work_start - start) * 1000.0
 
         # Route to operation handler
         result = _handle_operation(app, operation, parameters)
-
-        duration_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
+        work_ms = (time.perf_counter() - work_start) * 1000.0
 
         return {
             "success": True,
             "result": result,
             "error": None,
-            "duration_ms": duration_ms,
+            "duration_ms": int((time.perf_counter() - start) * 1000),
+            "startup_ms": round(startup_ms, 3),
+            "work_ms": round(work_ms, 3),
+            "warm": warm,
             "operation": operation,
         }
 
     except Exception as e:
         logger.exception(f"RunPod handler error: {e}")
-        duration_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
+        if app is not None:
+            work_ms = (time.perf_counter() - start) * 1000.0 - startup_ms
+        else:
+            startup_ms = (time.perf_counter() - start) * 1000.0
 
         return {
             "success": False,
             "result": None,
             "error": str(e),
             "traceback": traceback.format_exc(),
-            "duration_ms": duration_ms,
+            "duration_ms": int((time.perf_counter() - start) * 1000),
+            "startup_ms": round(startup_ms, 3),
+            "work_ms": round(work_ms, 3),
+            "warm": warm,
         }
 
+    finally:
+        if app is not None:
+            _release_app(app)
+
+
+async def async_handler(event: Dict[str, Any]) -> Dict[str, Any]:
+    """handler() on a worker thread, for RunPod's concurrent mode."""
+    return await asyncio.to_thread(handler, event)
+
+
+async def batch_handler(
+    events: List[Dict[str, Any]],
+    concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Process several events concurrently, one warm app each.
+
+    At most concurrency events (default: the pool size) run at once.
+    Responses are returned in event order.
+    """
+    limit = asyncio.Semaphore(concurrency or get_app_pool().size)
+
+    async def run(event: Dict[str, Any]) -> Dict[str, Any]:
+        async with limit:
+            return await async_handler(event)
+
+    return list(await asyncio.gather(*[run(event) for event in events]))
+
+
+class WarmAppPool:
+    """
+    Pool of built MAGNETApps reused across invocations.
+
+    Building an app (DI container, validator registry, topology, conductor)
+    costs far more than a short operation, so each worker builds up to
+    size apps once and hands them out one request at a time. Between
+    requests the app's StateManager is reset in place and the conductor
+    and pipeline executor forget the previous design, which keeps the DI
+    wiring (every service shares that StateManager) intact.
+
+    create_app() resets the class-level ValidatorRegistry that every app
+    validates against, so builds never run while an app is checked out:
+    empty slots are filled all at once, after outstanding apps come back
+    and with further checkouts held until the build finishes.
+    """
+
+    def __init__(self, size: int = 1):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self._idle: List["MAGNETApp"] = []
+        self._apps: Dict[int, "MAGNETApp"] = {}
+        self._checked_out: set = set()
+        self._building = False
+        self._cond = threading.Condition()
+        self._stats = {"builds": 0, "checkouts": 0, "build_ms": 0.0}
+
+    def warm(self) -> None:
+        """Build every app up front (call at worker boot)."""
+        with self._cond:
+            self._wait_to_build()
+            if len(self._apps) >= self.size:
+                return
+            self._building = True
+        self._fill()
+
+    def acquire(self, design_state: Optional[Dict[str, Any]] = None) -> Tuple["MAGNETApp", bool]:
+        """Check out an app loaded with design_state; returns (app, warm)."""
+        warm = True
+        with self._cond:
+            self._wait_to_build()
+            if len(self._apps) < self.size:
+                self._building = True
+                build = True
+            else:
+                while not self._idle:
+                    self._cond.wait()
+                app = self._idle.pop()
+                self._checked_out.add(id(app))
+                build = False
+        if build:
+            app = self._fill(checkout=True)
+            warm = False
+
+        try:
+            _reset_app(app, design_state)
+        except Exception:
+            self.discard(app)
+            raise
+        with self._cond:
+            self._stats["checkouts"] += 1
+        return app, warm
+
+    def release(self, app: "MAGNETApp") -> None:
+        """Return an app to the pool (apps the pool did not build are ignored)."""
+        with self._cond:
+            self._checked_out.discard(id(app))
+            if id(app) in self._apps:
+                self._idle.append(app)
+            self._cond.notify_all()
+
+    def discard(self, app: "MAGNETApp") -> None:
+        """Drop a broken app; its slot is rebuilt once the pool is idle."""
+        with self._cond:
+            self._apps.pop(id(app), None)
+            self._checked_out.discard(id(app))
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                **self._stats,
+                "size": self.size,
+                "built": len(self._apps),
+                "idle": len(self._idle),
+            }
+
+    def _wait_to_build(self) -> None:
+        # Caller holds _cond. Returns with no build running and, if a slot
+        # is empty, no app checked out, so the caller may start a build.
+        # While a slot is empty no checkouts are handed out either, so a
+        # pending refill cannot be starved by a busy pool.
+        while self._building or (len(self._apps) < self.size and self._checked_out):
+            self._cond.wait()
+
+    def _fill(self, checkout: bool = False) -> Optional["MAGNETApp"]:
+        # Caller has set _building; no app is checked out until it clears
+        try:
+            while len(self._apps) < self.size:
+                start = time.perf_counter()
+                app = _create_app()
+                with self._cond:
+                    self._apps[id(app)] = app
+                    self._idle.append(app)
+                    self._stats["builds"] += 1
+                    self._stats["build_ms"] += (time.perf_counter() - start) * 1000.0
+                logger.info(f"Built warm app {len(self._apps)}/{self.size}")
+        except BaseException:
+            with self._cond:
+                self._building = False
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            self._building = False
+            app = None
+            if checkout:
+                app = self._idle.pop()
+                self._checked_out.add(id(app))
+            self._cond.notify_all()
+        return app
+
+
+_app_pool: Optional[WarmAppPool] = None
+_app_pool_lock = threading.Lock()
+
+
+def get_app_pool() -> WarmAppPool:
+    """Get the worker's warm app pool."""
+    global _app_pool
+    if _app_pool is None:
+        with _app_pool_lock:
+            if _app_pool is None:
+                _app_pool = WarmAppPool(DEFAULT_POOL_SIZE)
+    return _app_pool
+
+
+def _acquire_app(design_state: Optional[Dict[str, Any]] = None) -> Tuple["MAGNETApp", bool]:
+    """Check out a warm app loaded with design_state."""
+    return get_app_pool().acquire(design_state)
+
+
+def _release_app(app: "MAGNETApp") -> None:
+    get_app_pool().release(app)
+
+
+def _reset_app(app: "MAGNETApp", design_state: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Load design_state into a built app, discarding the previous design.
+
+    Leaves the app as _create_app(design_state) would: a fresh design with
+    initialized phases, or the given state as-is.
+    """
+    from magnet.core.state_manager import StateManager
+
+    container = app.container
+    state_manager = container.resolve(StateManager)
+    state_manager.reset(design_state or None)
+
+    if not design_state:
+        from magnet.core.phase_states import PhaseMachine
+        if container.is_registered(PhaseMachine):
+            container.resolve(PhaseMachine).reset()
+
+    try:
+        from magnet.kernel.conductor import Conductor
+        if container.is_registered(Conductor):
+            container.resolve(Conductor).reset_sessions()
+    except ImportError:
+        pass
+
+    try:
+        from magnet.validators.executor import PipelineExecutor
+        if container.is_registered(PipelineExecutor):
+            container.resolve(PipelineExecutor).reset_session()
+    except ImportError:
+        pass
+
 
 def _create_app(design_state: Dict[str, Any] = None) -> "MAGNETApp":
     """
@@ -466,8 +710,17 @@ def _export_state(app: "MAGNETApp") -> Dict[str, Any]:
 try:
     import runpod
 
+    # Build the warm apps before taking traffic
+    get_app_pool().warm()
+
     # Register handler with RunPod SDK
-    runpod.serverless.start({"handler": handler})
+    if DEFAULT_POOL_SIZE > 1:
+        runpod.serverless.start({
+            "handler": async_handler,
+            "concurrency_modifier": lambda current: DEFAULT_POOL_SIZE,
+        })
+    else:
+        runpod.serverless.start({"handler": handler})
 
 except ImportError:
     # Running locally without RunPod SDK installed
@@ -8,12 +8,20 @@ Fixes blocker #7: Worker class was stubbed.
 """
 
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from pathlib import Path
 import asyncio
+import heapq
+import itertools
+import json
 import logging
+import sqlite3
+import threading
+import time
 import uuid
 
 if TYPE_CHECKING:
@@ -113,57 +121,192 @@ class Job:
         return job
 
 
+class SQLiteJobStore:
+    """
+    SQLite-backed durable store for JobQueue.
+
+    Every job that has not reached a terminal state has a row, so a queue
+    built on the same file after a restart picks up where the last one
+    stopped. Jobs that were running when the process died are queued
+    again (at-least-once delivery). The store provides durability only; it
+    is not a channel for handing jobs between live processes.
+    """
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    enqueued_at REAL NOT NULL,
+                    job_json TEXT NOT NULL
+                )
+                """
+            )
+
+    @staticmethod
+    def _encode(job: Job) -> str:
+        record = {}
+        for name in job.__dataclass_fields__:
+            value = getattr(job, name)
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            record[name] = value
+        return json.dumps(record, default=str)
+
+    def save(self, job: Job, enqueued_at: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?)",
+                (job.job_id, enqueued_at, self._encode(job)),
+            )
+
+    def update(self, job: Job) -> None:
+        with self._lock, self._conn:
+            if job.is_terminal:
+                self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job.job_id,))
+            else:
+                self._conn.execute(
+                    "UPDATE jobs SET job_json = ? WHERE job_id = ?",
+                    (self._encode(job), job.job_id),
+                )
+
+    def load(self) -> List[Tuple[Job, float]]:
+        """Stored jobs with their enqueue times, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_json, enqueued_at FROM jobs ORDER BY enqueued_at, rowid"
+            ).fetchall()
+        return [(Job.from_dict(json.loads(data)), enqueued_at) for data, enqueued_at in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class JobQueue:
     """
-    In-memory job queue with priority support.
+    Priority job queue with blocking dequeue.
 
-    For production, replace with Redis or similar.
+    Jobs sit in a single heap. With aging enabled, each priority level is
+    worth aging_seconds of waiting: a job's key is its enqueue time minus
+    priority * aging_seconds, so CRITICAL work goes first but a LOW job
+    that has waited long enough is not starved. With aging_seconds=None
+    the order is strict priority, then FIFO.
+
+    max_per_design caps how many jobs for one design_id may run at once;
+    consumers report completion with task_done(). Jobs held back by the
+    cap keep their place and return to the heap as slots free up.
+
+    Terminal jobs are kept for status queries, up to max_finished of them
+    (oldest evicted first), as well as until cleanup_old_jobs removes them.
     """
 
-    def __init__(self, max_size: int = 10000):
-        self._queues: Dict[JobPriority, asyncio.Queue] = {
-            priority: asyncio.Queue(maxsize=max_size)
-            for priority in JobPriority
-        }
+    def __init__(
+        self,
+        max_size: int = 10000,
+        aging_seconds: Optional[float] = 60.0,
+        max_per_design: Optional[int] = None,
+        max_finished: int = 10000,
+        store: Optional[SQLiteJobStore] = None,
+    ):
+        if max_per_design is not None and max_per_design < 1:
+            raise ValueError("max_per_design must be >= 1")
+
+        self.max_size = max_size
+        self.aging_seconds = aging_seconds
+        self.max_per_design = max_per_design
+        self.max_finished = max_finished
+        self._store = store
+
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
         self._jobs: Dict[str, Job] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+
+        # design_id -> running count / jobs held back by max_per_design
+        self._running: Dict[str, int] = {}
+        self._deferred: Dict[str, Deque[Tuple[float, int, str]]] = {}
+        self._deferred_count = 0
+
         self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+
+        if store is not None:
+            self._restore()
 
     async def enqueue(self, job: Job) -> str:
-        """Add job to queue."""
-        async with self._lock:
+        """Add job to queue, waiting while the queue is full."""
+        async with self._not_full:
+            await self._not_full.wait_for(lambda: self.get_pending_count() < self.max_size)
+            enqueued_at = time.time()
             self._jobs[job.job_id] = job
+            self._finished.pop(job.job_id, None)
+            self._push(job, enqueued_at)
+            if self._store is not None:
+                self._store.save(job, enqueued_at)
+            self._not_empty.notify()
 
-        await self._queues[job.priority].put(job.job_id)
         logger.info(f"Enqueued job {job.job_id} ({job.job_type}, priority={job.priority.name})")
         return job.job_id
 
     async def dequeue(self, timeout: float = None) -> Optional[Job]:
-        """Get next job from queue (highest priority first)."""
-        # Try queues in priority order (CRITICAL first)
-        for priority in reversed(JobPriority):
-            queue = self._queues[priority]
-            if not queue.empty():
+        """
+        Get the next job, waiting up to timeout seconds for one.
+
+        Without a timeout, returns None at once if nothing is ready.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        async with self._not_empty:
+            while True:
+                job = self._pop_ready()
+                if job is not None:
+                    self._not_full.notify()
+                    return job
+                remaining = deadline - loop.time() if deadline is not None else 0
+                if remaining <= 0:
+                    return None
+                # Held-back jobs leave the heap, so any entry is worth a look
                 try:
-                    if timeout:
-                        job_id = await asyncio.wait_for(queue.get(), timeout=0.1)
-                    else:
-                        job_id = queue.get_nowait()
-                    return self._jobs.get(job_id)
-                except (asyncio.TimeoutError, asyncio.QueueEmpty):
-                    continue
-
-        # If all empty, wait on normal queue
-        if timeout:
-            try:
-                job_id = await asyncio.wait_for(
-                    self._queues[JobPriority.NORMAL].get(),
-                    timeout=timeout
-                )
-                return self._jobs.get(job_id)
-            except asyncio.TimeoutError:
-                return None
+                    await asyncio.wait_for(
+                        self._not_empty.wait_for(lambda: bool(self._heap)),
+                        timeout=remaining,
+                    )
+                except asyncio.TimeoutError:
+                    return None
+
+    async def task_done(self, job: Job) -> None:
+        """Mark a dequeued job finished, freeing its design slot."""
+        if self.max_per_design is None or not job.design_id:
+            return
+        async with self._lock:
+            running = self._running.get(job.design_id, 0) - 1
+            if running > 0:
+                self._running[job.design_id] = running
+            else:
+                self._running.pop(job.design_id, None)
 
-        return None
+            deferred = self._deferred.get(job.design_id)
+            if deferred:
+                heapq.heappush(self._heap, deferred.popleft())
+                self._deferred_count -= 1
+                if not deferred:
+                    del self._deferred[job.design_id]
+                self._not_empty.notify()
 
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID."""
@@ -172,10 +315,32 @@ class JobQueue:
     def update_job(self, job: Job) -> None:
         """Update job state."""
         self._jobs[job.job_id] = job
+        if job.is_terminal:
+            self._finished[job.job_id] = None
+            self._finished.move_to_end(job.job_id)
+            while len(self._finished) > self.max_finished:
+                old_id, _ = self._finished.popitem(last=False)
+                self._jobs.pop(old_id, None)
+        if self._store is not None:
+            self._store.update(job)
 
     def get_pending_count(self) -> int:
         """Get count of pending jobs."""
-        return sum(q.qsize() for q in self._queues.values())
+        return len(self._heap) + self._deferred_count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and per-design state."""
+        by_priority = {priority.name: 0 for priority in JobPriority}
+        for _, _, job_id in self._heap:
+            by_priority[self._jobs[job_id].priority.name] += 1
+        return {
+            "pending": self.get_pending_count(),
+            "pending_by_priority": by_priority,
+            "deferred": self._deferred_count,
+            "running_by_design": dict(self._running),
+            "tracked_jobs": len(self._jobs),
+            "durable": self._store is not None,
+        }
 
     def get_jobs_by_status(self, status: JobStatus) -> List[Job]:
         """Get all jobs with given status."""
@@ -194,6 +359,7 @@ class JobQueue:
             if job.is_terminal and job.completed_at:
                 if job.completed_at.timestamp() < cutoff:
                     del self._jobs[job_id]
+                    self._finished.pop(job_id, None)
                     removed += 1
 
         if removed:
@@ -201,6 +367,47 @@ class JobQueue:
 
         return removed
 
+    # -------------------------------------------------------------------------
+    # Internals (callers hold self._lock, or run before the loop starts)
+    # -------------------------------------------------------------------------
+
+    def _push(self, job: Job, enqueued_at: float) -> None:
+        if self.aging_seconds is None:
+            key = -float(job.priority.value)
+        else:
+            key = enqueued_at - job.priority.value * self.aging_seconds
+        heapq.heappush(self._heap, (key, next(self._seq), job.job_id))
+
+    def _pop_ready(self) -> Optional[Job]:
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            job = self._jobs.get(entry[2])
+            if job is None:
+                continue
+            design_id = job.design_id
+            if self.max_per_design is not None and design_id:
+                if self._running.get(design_id, 0) >= self.max_per_design:
+                    self._deferred.setdefault(design_id, deque()).append(entry)
+                    self._deferred_count += 1
+                    continue
+                self._running[design_id] = self._running.get(design_id, 0) + 1
+            return job
+        return None
+
+    def _restore(self) -> None:
+        restored = 0
+        for job, enqueued_at in self._store.load():
+            if job.is_terminal:
+                continue
+            if job.status == JobStatus.RUNNING:
+                job.status = JobStatus.PENDING
+                job.started_at = None
+            self._jobs[job.job_id] = job
+            self._push(job, enqueued_at)
+            restored += 1
+        if restored:
+            logger.info(f"Restored {restored} queued jobs from {self._store._path}")
+
 
 # Global queue instance
 _job_queue: Optional[JobQueue] = None
@@ -214,6 +421,13 @@ def get_job_queue() -> JobQueue:
     return _job_queue
 
 
+def configure_job_queue(queue: JobQueue) -> JobQueue:
+    """Replace the global job queue (e.g. with a durable one at startup)."""
+    global _job_queue
+    _job_queue = queue
+    return _job_queue
+
+
 def get_job_status(job_id: str) -> Optional[Dict[str, Any]]:
     """Get job status by ID."""
     queue = get_job_queue()
@@ -260,6 +474,7 @@ class Worker:
         queue_name: str = "default",
         concurrency: int = 4,
         poll_interval: float = 1.0,
+        queue: Optional[JobQueue] = None,
     ):
         self.container = container
         self.queue_name = queue_name
@@ -267,7 +482,7 @@ class Worker:
         self.poll_interval = poll_interval
         self._running = False
         self._tasks: List[asyncio.Task] = []
-        self._queue = get_job_queue()
+        self._queue = queue or get_job_queue()
         self._stats = {
             "jobs_processed": 0,
             "jobs_failed": 0,
@@ -350,7 +565,10 @@ class Worker:
                 job = await self._queue.dequeue(timeout=self.poll_interval)
                 if job is None:
                     continue
-                await self._process_job(job, worker_id)
+                try:
+                    await self._process_job(job, worker_id)
+                finally:
+                    await self._queue.task_done(job)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -609,6 +827,7 @@ class Worker:
 def create_worker(
     container: "Container" = None,
     concurrency: int = 4,
+    queue: Optional[JobQueue] = None,
 ) -> Worker:
     """Create a worker instance."""
-    return Worker(container=container, concurrency=concurrency)
+    return Worker(container=container, concurrency=concurrency, queue=queue)
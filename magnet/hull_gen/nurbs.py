@@ -4,16 +4,142 @@ hull_gen/nurbs.py - NURBS curve and surface representation.
 ALPHA OWNS THIS FILE.
 
 Module 17 v1.0 - Hull Geometry Representation.
+
+Point-wise evaluate() follows de Boor. Sampling, derivatives, normals and
+curvature go through an array engine: dense basis (and basis-derivative)
+matrices are built once per knot vector and parameter vector, cached, and
+applied to all control points at once. Control nets too small for their
+degree (or ragged surface grids) are only evaluated point-wise, and have
+zero derivatives and curvature.
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import math
 
+import numpy as np
+
 from .geometry import Point3D
 
 
+# Parameters are clamped to [0, 1) as in evaluate(), so u = 1 uses the last span
+_PARAM_MAX = 1.0 - 1e-10
+
+
+def uniform_params(num_points: int) -> Tuple[float, ...]:
+    """Uniform parameter values in [0, 1], as used by sample()/sample_grid()."""
+    return tuple(i / (num_points - 1) if num_points > 1 else 0.0 for i in range(num_points))
+
+
+@lru_cache(maxsize=64)
+def basis_matrices(
+    knots: Tuple[float, ...],
+    degree: int,
+    num_ctrl: int,
+    params: Tuple[float, ...],
+    order: int = 0,
+) -> "np.ndarray":
+    """
+    Dense B-spline basis matrices and their parametric derivatives.
+
+    Vectorized over all parameters (Piegl & Tiller A2.2/A2.3). The result
+    is cached per (knot vector, degree, parameter vector, order) and must
+    not be modified.
+
+    Args:
+        knots: Knot vector
+        degree: Basis degree p (requires num_ctrl > p)
+        num_ctrl: Number of control points
+        params: Parameter values (clamped to [0, 1))
+        order: Highest derivative order to compute
+
+    Returns:
+        Array of shape (order + 1, len(params), num_ctrl); [k] is the k-th
+        derivative basis matrix.
+    """
+    p = degree
+    knot_arr = np.asarray(knots, dtype=float)
+    u = np.clip(np.asarray(params, dtype=float), 0.0, _PARAM_MAX)
+    m = len(u)
+    span = np.clip(np.searchsorted(knot_arr, u, side="right") - 1, p, num_ctrl - 1)
+
+    def safe_div(num, den):
+        return np.divide(num, den, out=np.zeros(m), where=den != 0)
+
+    # ndu: upper triangle holds basis functions, lower triangle knot differences
+    ndu = np.zeros((p + 1, p + 1, m))
+    ndu[0, 0] = 1.0
+    left = np.zeros((p + 1, m))
+    right = np.zeros((p + 1, m))
+    for j in range(1, p + 1):
+        left[j] = u - knot_arr[span + 1 - j]
+        right[j] = knot_arr[span + j] - u
+        saved = np.zeros(m)
+        for r in range(j):
+            ndu[j, r] = right[r + 1] + left[j - r]
+            temp = safe_div(ndu[r, j - 1], ndu[j, r])
+            ndu[r, j] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        ndu[j, j] = saved
+
+    ders = np.zeros((order + 1, p + 1, m))
+    ders[0] = ndu[:, p]
+    for r in range(p + 1):
+        a = np.zeros((2, p + 1, m))
+        a[0, 0] = 1.0
+        s1, s2 = 0, 1
+        for k in range(1, min(order, p) + 1):
+            d = np.zeros(m)
+            rk, pk = r - k, p - k
+            if r >= k:
+                a[s2, 0] = safe_div(a[s1, 0], ndu[pk + 1, rk])
+                d = a[s2, 0] * ndu[rk, pk]
+            j1 = 1 if rk >= -1 else -rk
+            j2 = k - 1 if r - 1 <= pk else p - r
+            for j in range(j1, j2 + 1):
+                a[s2, j] = safe_div(a[s1, j] - a[s1, j - 1], ndu[pk + 1, rk + j])
+                d = d + a[s2, j] * ndu[rk + j, pk]
+            if r <= pk:
+                a[s2, k] = safe_div(-a[s1, k - 1], ndu[pk + 1, r])
+                d = d + a[s2, k] * ndu[r, pk]
+            ders[k, r] = d
+            s1, s2 = s2, s1
+
+    factor = p
+    for k in range(1, order + 1):
+        ders[k] *= factor
+        factor *= p - k
+
+    result = np.zeros((order + 1, m, num_ctrl))
+    cols = span[:, None] - p + np.arange(p + 1)
+    rows = np.arange(m)[:, None]
+    for k in range(order + 1):
+        result[k, rows, cols] = ders[k].T
+    result.flags.writeable = False
+    return result
+
+
+def _rational_derivatives(homogeneous: "np.ndarray", weight: "np.ndarray") -> "np.ndarray":
+    """
+    Derivatives of C = A / W from derivatives of A and W (Piegl & Tiller A4.2).
+
+    homogeneous has shape (order + 1, ..., 3) and weight (order + 1, ...).
+    Points with zero weight evaluate to the origin, as in evaluate().
+    """
+    order = homogeneous.shape[0] - 1
+    w0 = weight[0][..., None]
+    valid = w0 > 0
+    out = np.zeros_like(homogeneous)
+    for k in range(order + 1):
+        v = homogeneous[k].copy()
+        for i in range(1, k + 1):
+            v -= math.comb(k, i) * weight[i][..., None] * out[k - i]
+        out[k] = np.divide(v, w0, out=np.zeros_like(v), where=valid)
+    return out
+
+
 @dataclass
 class NURBSCurve:
     """Non-Uniform Rational B-Spline curve."""
@@ -163,6 +289,47 @@ class NURBSCurve:
 
         return N
 
+    def _can_vectorize(self) -> bool:
+        return len(self.control_points) > self.degree
+
+    def _control_arrays(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        points = np.array([(p.x, p.y, p.z) for p in self.control_points], dtype=float)
+        weights = np.array([
+            self.weights[i] if i < len(self.weights) else 1.0
+            for i in range(len(self.control_points))
+        ], dtype=float)
+        return points, weights
+
+    def derivatives_array(self, us: Sequence[float], order: int = 0) -> "np.ndarray":
+        """
+        Evaluate the curve and its analytic derivatives at many parameters.
+
+        Args:
+            us: Parameter values [0, 1]
+            order: Highest derivative order
+
+        Returns:
+            Array of shape (order + 1, len(us), 3); [0] holds the points,
+            [k] the k-th derivatives.
+        """
+        if not self._can_vectorize():
+            raise ValueError(
+                f"Need more than {self.degree} control points, got {len(self.control_points)}"
+            )
+        if not self.knot_vector:
+            self.generate_uniform_knots()
+
+        points, weights = self._control_arrays()
+        basis = basis_matrices(
+            tuple(self.knot_vector), self.degree, len(points),
+            tuple(float(u) for u in us), order,
+        )
+        return _rational_derivatives(basis @ (points * weights[:, None]), basis @ weights)
+
+    def evaluate_array(self, us: Sequence[float]) -> "np.ndarray":
+        """Evaluate the curve at many parameters; returns a (len(us), 3) array."""
+        return self.derivatives_array(us)[0]
+
     def sample(self, num_points: int = 50) -> List[Point3D]:
         """
         Sample curve at uniform parameter intervals.
@@ -173,17 +340,15 @@ class NURBSCurve:
         Returns:
             List of points along curve
         """
-        points = []
-        for i in range(num_points):
-            u = i / (num_points - 1) if num_points > 1 else 0
-            points.append(self.evaluate(u))
-        return points
+        if not self._can_vectorize():
+            return [self.evaluate(u) for u in uniform_params(num_points)]
+        return [Point3D(*xyz) for xyz in self.evaluate_array(uniform_params(num_points)).tolist()]
 
     def derivative(self, u: float) -> Point3D:
         """
         Compute first derivative at parameter u.
 
-        Uses numerical differentiation.
+        Zero for control nets the array engine cannot evaluate.
 
         Args:
             u: Parameter value [0, 1]
@@ -191,19 +356,10 @@ class NURBSCurve:
         Returns:
             Tangent vector at parameter u
         """
-        if not self.control_points or len(self.control_points) < 2:
+        if len(self.control_points) < 2 or not self._can_vectorize():
             return Point3D()
 
-        # Numerical derivative
-        h = 0.001
-        p0 = self.evaluate(max(0, u - h))
-        p1 = self.evaluate(min(1, u + h))
-
-        return Point3D(
-            (p1.x - p0.x) / (2 * h),
-            (p1.y - p0.y) / (2 * h),
-            (p1.z - p0.z) / (2 * h),
-        )
+        return Point3D(*self.derivatives_array([u], order=1)[1, 0].tolist())
 
     def curvature(self, u: float) -> float:
         """
@@ -215,33 +371,14 @@ class NURBSCurve:
         Returns:
             Curvature value (1/radius)
         """
-        h = 0.001
-        p0 = self.evaluate(max(0, u - h))
-        p1 = self.evaluate(u)
-        p2 = self.evaluate(min(1, u + h))
-
-        # First derivative approximation
-        d1 = Point3D(
-            (p2.x - p0.x) / (2 * h),
-            (p2.y - p0.y) / (2 * h),
-            (p2.z - p0.z) / (2 * h),
-        )
-
-        # Second derivative approximation
-        d2 = Point3D(
-            (p2.x - 2 * p1.x + p0.x) / (h * h),
-            (p2.y - 2 * p1.y + p0.y) / (h * h),
-            (p2.z - 2 * p1.z + p0.z) / (h * h),
-        )
-
-        # Curvature = |d1 x d2| / |d1|^3
-        cross = d1.cross(d2)
-        d1_mag = d1.length()
+        if not self._can_vectorize():
+            return 0.0
 
+        _, d1, d2 = self.derivatives_array([u], order=2)[:, 0]
+        d1_mag = float(np.linalg.norm(d1))
         if d1_mag < 1e-10:
             return 0.0
-
-        return cross.length() / (d1_mag ** 3)
+        return float(np.linalg.norm(np.cross(d1, d2))) / (d1_mag ** 3)
 
     def arc_length(self, num_segments: int = 100) -> float:
         """
@@ -253,16 +390,12 @@ class NURBSCurve:
         Returns:
             Approximate arc length
         """
-        length = 0.0
-        prev_pt = self.evaluate(0.0)
-
-        for i in range(1, num_segments + 1):
-            u = i / num_segments
-            pt = self.evaluate(u)
-            length += prev_pt.distance_to(pt)
-            prev_pt = pt
-
-        return length
+        us = uniform_params(num_segments + 1)
+        if self._can_vectorize():
+            pts = self.evaluate_array(us)
+        else:
+            pts = np.array([self.evaluate(u).to_tuple() for u in us])
+        return float(np.linalg.norm(np.diff(pts, axis=0), axis=1).sum())
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -380,6 +513,104 @@ class NURBSSurface:
 
         return u_curve.evaluate(u)
 
+    # ==================== Array evaluation ====================
+
+    def _can_vectorize(self) -> bool:
+        return (
+            self.num_u > self.degree_u
+            and self.num_v > self.degree_v
+            and all(len(row) == self.num_v for row in self.control_points)
+        )
+
+    def _control_arrays(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        points = np.array(
+            [[(p.x, p.y, p.z) for p in row] for row in self.control_points], dtype=float
+        )
+        weights = np.ones((self.num_u, self.num_v))
+        for i, row in enumerate(self.weights[:self.num_u]):
+            for j, w in enumerate(row[:self.num_v]):
+                weights[i, j] = w
+        return points, weights
+
+    def derivatives_grid(
+        self, us: Sequence[float], vs: Sequence[float], order: int = 1
+    ) -> "np.ndarray":
+        """
+        Evaluate the surface and its analytic partial derivatives on a grid.
+
+        Matches evaluate(): each control row is a rational curve in v, and
+        the rows are blended in u with unit weights.
+
+        Args:
+            us: Longitudinal parameters [0, 1]
+            vs: Transverse parameters [0, 1]
+            order: Highest derivative order in each direction
+
+        Returns:
+            Array of shape (order + 1, order + 1, len(us), len(vs), 3);
+            [k, l] holds d^(k+l)S / du^k dv^l.
+        """
+        if not self._can_vectorize():
+            raise ValueError(
+                f"Need a rectangular control grid larger than degree "
+                f"({self.degree_u}, {self.degree_v}), got {self.num_u}x{self.num_v}"
+            )
+        if not self.knot_vector_u:
+            self.generate_uniform_knots()
+
+        points, weights = self._control_arrays()
+        basis_u = basis_matrices(
+            tuple(self.knot_vector_u), self.degree_u, self.num_u,
+            tuple(float(u) for u in us), order,
+        )
+        basis_v = basis_matrices(
+            tuple(self.knot_vector_v), self.degree_v, self.num_v,
+            tuple(float(v) for v in vs), order,
+        )
+
+        # Rational row curves C_i(v) and their v-derivatives: (order+1, num_u, nv, 3)
+        homogeneous = np.einsum("kbj,ijc->kibc", basis_v, points * weights[..., None])
+        row_weights = np.einsum("kbj,ij->kib", basis_v, weights)
+        rows = _rational_derivatives(homogeneous, row_weights)
+
+        return np.einsum("kai,libc->klabc", basis_u, rows)
+
+    def evaluate_grid(self, us: Sequence[float], vs: Sequence[float]) -> "np.ndarray":
+        """Evaluate the surface on a parameter grid; returns (len(us), len(vs), 3)."""
+        return self.derivatives_grid(us, vs, order=0)[0, 0]
+
+    def sample_grid_array(self, nu: int = 20, nv: int = 20) -> "np.ndarray":
+        """Uniform (nu, nv, 3) sample grid, as sample_grid() without Point3D objects."""
+        return self.evaluate_grid(uniform_params(nu), uniform_params(nv))
+
+    def normals_grid(self, us: Sequence[float], vs: Sequence[float]) -> "np.ndarray":
+        """Unit normals Su x Sv on a parameter grid; (len(us), len(vs), 3)."""
+        ders = self.derivatives_grid(us, vs, order=1)
+        normals = np.cross(ders[1, 0], ders[0, 1])
+        length = np.linalg.norm(normals, axis=-1, keepdims=True)
+        return np.divide(normals, length, out=np.zeros_like(normals), where=length > 0)
+
+    def gaussian_curvature_grid(self, us: Sequence[float], vs: Sequence[float]) -> "np.ndarray":
+        """Gaussian curvature K = (LN - M^2) / (EG - F^2) on a parameter grid."""
+        ders = self.derivatives_grid(us, vs, order=2)
+        ru, rv = ders[1, 0], ders[0, 1]
+
+        E = np.einsum("abc,abc->ab", ru, ru)
+        F = np.einsum("abc,abc->ab", ru, rv)
+        G = np.einsum("abc,abc->ab", rv, rv)
+
+        n = np.cross(ru, rv)
+        length = np.linalg.norm(n, axis=-1, keepdims=True)
+        n = np.divide(n, length, out=np.zeros_like(n), where=length > 0)
+
+        L = np.einsum("abc,abc->ab", ders[2, 0], n)
+        M = np.einsum("abc,abc->ab", ders[1, 1], n)
+        N = np.einsum("abc,abc->ab", ders[0, 2], n)
+
+        denom = E * G - F * F
+        flat = np.abs(denom) < 1e-10
+        return np.where(flat, 0.0, (L * N - M * M) / np.where(flat, 1.0, denom))
+
     def sample_grid(self, nu: int = 20, nv: int = 20) -> List[List[Point3D]]:
         """
         Sample surface on a grid.
@@ -391,15 +622,12 @@ class NURBSSurface:
         Returns:
             2D grid of sample points
         """
-        grid = []
-        for i in range(nu):
-            row = []
-            u = i / (nu - 1) if nu > 1 else 0
-            for j in range(nv):
-                v = j / (nv - 1) if nv > 1 else 0
-                row.append(self.evaluate(u, v))
-            grid.append(row)
-        return grid
+        if not self._can_vectorize():
+            return [[self.evaluate(u, v) for v in uniform_params(nv)] for u in uniform_params(nu)]
+        return [
+            [Point3D(*xyz) for xyz in row]
+            for row in self.sample_grid_array(nu, nv).tolist()
+        ]
 
     def normal(self, u: float, v: float) -> Point3D:
         """
@@ -412,29 +640,9 @@ class NURBSSurface:
         Returns:
             Unit normal vector
         """
-        h = 0.001
-
-        # Partial derivatives
-        pu0 = self.evaluate(max(0, u - h), v)
-        pu1 = self.evaluate(min(1, u + h), v)
-        pv0 = self.evaluate(u, max(0, v - h))
-        pv1 = self.evaluate(u, min(1, v + h))
-
-        du = Point3D(
-            (pu1.x - pu0.x) / (2 * h),
-            (pu1.y - pu0.y) / (2 * h),
-            (pu1.z - pu0.z) / (2 * h),
-        )
-
-        dv = Point3D(
-            (pv1.x - pv0.x) / (2 * h),
-            (pv1.y - pv0.y) / (2 * h),
-            (pv1.z - pv0.z) / (2 * h),
-        )
-
-        # Cross product gives normal
-        normal = du.cross(dv)
-        return normal.normalize()
+        if not self._can_vectorize():
+            return Point3D()
+        return Point3D(*self.normals_grid([u], [v])[0, 0].tolist())
 
     def gaussian_curvature(self, u: float, v: float) -> float:
         """
@@ -447,43 +655,9 @@ class NURBSSurface:
         Returns:
             Gaussian curvature value
         """
-        h = 0.01
-
-        # Sample 3x3 grid
-        pts = []
-        for i in [-1, 0, 1]:
-            row = []
-            for j in [-1, 0, 1]:
-                ui = max(0, min(1, u + i * h))
-                vj = max(0, min(1, v + j * h))
-                row.append(self.evaluate(ui, vj))
-            pts.append(row)
-
-        # First fundamental form coefficients (approximation)
-        ru = (pts[2][1] - pts[0][1]) * (1 / (2 * h))
-        rv = (pts[1][2] - pts[1][0]) * (1 / (2 * h))
-
-        E = ru.dot(ru)
-        F = ru.dot(rv)
-        G = rv.dot(rv)
-
-        # Second fundamental form
-        n = ru.cross(rv).normalize()
-
-        ruu = (pts[2][1] - pts[1][1] * 2 + pts[0][1]) * (1 / (h * h))
-        rvv = (pts[1][2] - pts[1][1] * 2 + pts[1][0]) * (1 / (h * h))
-        ruv = (pts[2][2] - pts[2][0] - pts[0][2] + pts[0][0]) * (1 / (4 * h * h))
-
-        L = ruu.dot(n)
-        M = ruv.dot(n)
-        N = rvv.dot(n)
-
-        # Gaussian curvature K = (LN - M^2) / (EG - F^2)
-        denom = E * G - F * F
-        if abs(denom) < 1e-10:
+        if not self._can_vectorize():
             return 0.0
-
-        return (L * N - M * M) / denom
+        return float(self.gaussian_curvature_grid([u], [v])[0, 0])
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -125,6 +125,11 @@ class Conductor:
             return self._sessions.get(design_id)
         return self._session
 
+    def reset_sessions(self) -> None:
+        """Drop all design sessions, e.g. before reusing the conductor for a new design."""
+        self._sessions.clear()
+        self._session = None
+
     def run_phase(self, phase_name: str, context: Dict[str, Any] = None) -> PhaseResult:
         """
         Run a single phase.
@@ -6,13 +6,18 @@ Uses validators as scoring functions in a bounded propose→validate→mutate lo
 Guaranteed termination with fallback path.
 
 v1.0: Initial implementation
+v1.5: Population mode - K seeded candidates per iteration, scored
+      concurrently on scratch state views with memoized scores
 """
 
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 import logging
+import os
+import random
 
 from .priors.hull_families import HullFamily, get_family_prior
 from .synthesis_lock import SynthesisLock, SynthesisLockError
@@ -51,11 +56,17 @@ class SynthesisRequest:
     max_iterations: int = 15
     convergence_criteria: Optional["ConvergenceCriteria"] = None
 
+    # v1.5: Population mode (1 = one proposal per iteration, as before)
+    population_size: int = 1   # Candidates scored per iteration
+    seed: int = 0              # Seeds candidate perturbations (reproducible audits)
+
     def __post_init__(self):
         if self.max_speed_kts <= 0:
             raise ValueError("max_speed_kts must be positive")
         if self.max_iterations < 1:
             raise ValueError("max_iterations must be >= 1")
+        if self.population_size < 1:
+            raise ValueError("population_size must be >= 1")
 
 
 @dataclass(frozen=True)
@@ -205,6 +216,10 @@ class SynthesisResult:
     # Warnings and notes
     warnings: List[str] = field(default_factory=list)
 
+    # v1.5: Scoring effort (validator runs vs. memoized candidates)
+    evaluations: int = 0
+    cache_hits: int = 0
+
     @property
     def is_converged(self) -> bool:
         return self.termination == TerminationReason.CONVERGED
@@ -219,6 +234,18 @@ class SynthesisResult:
         return self.proposal.is_complete
 
 
+@dataclass(frozen=True)
+class _Evaluation:
+    """Scoring outcome of one proposal."""
+    score: float
+    adjustments: List[Dict[str, Any]]
+    results: List[Dict[str, Any]]
+    gm_actual: float
+    # Population mode: everything written to the scratch view (the proposal
+    # plus the scoring validators' derived values)
+    changes: Dict[str, Any] = field(default_factory=dict)
+
+
 # =============================================================================
 # HULL SYNTHESIZER
 # =============================================================================
@@ -312,10 +339,15 @@ class HullSynthesizer:
 
     MUTATION_DELTA = 0.05  # 5% max change per iteration
 
+    # Population mode: dimensions perturbed per candidate, memo key resolution
+    PERTURBED_PATHS = ("hull.lwl", "hull.beam", "hull.draft", "hull.cb")
+    MEMO_DIGITS = 9
+
     def __init__(
         self,
         executor: "PipelineExecutor",
         state_manager: "StateManager",
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize hull synthesizer.
@@ -323,10 +355,13 @@ class HullSynthesizer:
         Args:
             executor: PipelineExecutor for running validators
             state_manager: StateManager for state access
+            max_workers: Threads scoring candidates in population mode
+                (default: CPU count; 1 scores them in the calling thread)
         """
         self.executor = executor
         self.state = state_manager
         self.lock = SynthesisLock(state_manager)
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     def synthesize(self, request: SynthesisRequest) -> SynthesisResult:
         """
@@ -360,7 +395,49 @@ class HullSynthesizer:
         Bounded synthesis loop with hard convergence criteria.
 
         v1.4: Added mutation escalation to escape local optima when stagnating.
+        v1.5: Population mode (request.population_size > 1): each iteration
+              scores the proposal plus seeded random perturbations of it on
+              scratch state views and continues from the winner (meets the
+              convergence criteria, then highest score, then earliest); only
+              the final best proposal is written to the shared state.
         """
+        population = request.population_size > 1
+        rng = random.Random(request.seed)
+        memo: Dict[Tuple[float, ...], _Evaluation] = {}
+        stats = {"evaluations": 0, "cache_hits": 0}
+        pool: Optional[Executor] = None
+        if population and self.max_workers > 1:
+            pool = ThreadPoolExecutor(
+                max_workers=min(self.max_workers, request.population_size),
+                thread_name_prefix="hull_synthesis",
+            )
+
+        try:
+            result = self._run_iterations(request, criteria, population, rng, memo, stats, pool)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+
+        if population:
+            # Candidates were scored on scratch views: commit only the winner,
+            # with its derived hydrostatics as the single-proposal loop leaves them
+            winner = memo[self._memo_key(result.proposal)]
+            self.lock.write_hull_params(winner.changes, "hull_synthesizer")
+        result.evaluations = stats["evaluations"]
+        result.cache_hits = stats["cache_hits"]
+        return result
+
+    def _run_iterations(
+        self,
+        request: SynthesisRequest,
+        criteria: ConvergenceCriteria,
+        population: bool,
+        rng: random.Random,
+        memo: Dict[Tuple[float, ...], _Evaluation],
+        stats: Dict[str, int],
+        pool: Optional[Executor],
+    ) -> SynthesisResult:
+        """Propose→validate→mutate iterations; see _synthesis_loop."""
 
         # Initialize from family prior (with bounds clamping)
         proposal, clamp_warnings = self._create_initial_proposal(request)
@@ -372,16 +449,31 @@ class HullSynthesizer:
         # v1.4: Stagnation tracking for mutation escalation
         stagnation_count = 0
         last_best_score = float('-inf')
+        mutation_scale = 1.0
 
         for iteration in range(request.max_iterations):
-            # Write proposal to state for validator evaluation
-            self._write_proposal_to_state(proposal)
-
-            # Run scoring validators
-            results = self._run_validators()
+            if population:
+                # v1.5: Score the proposal and its perturbations, keep the winner
+                candidates = [proposal] + [
+                    self._perturb(proposal, rng, iteration, request.hull_family, mutation_scale)
+                    for _ in range(request.population_size - 1)
+                ]
+                evaluations = self._evaluate_candidates(candidates, memo, stats, pool)
+                ranking = [
+                    (self._meets_criteria(e, criteria, request), e.score)
+                    for e in evaluations
+                ]
+                winner = max(range(len(candidates)), key=ranking.__getitem__)
+                proposal = candidates[winner]
+                evaluation = evaluations[winner]
+            else:
+                # Write proposal to state and run scoring validators
+                evaluation = self._evaluate_in_state(proposal)
+                stats["evaluations"] += 1
 
             # Score results (v1.3: now returns structured adjustments)
-            score, adjustments = self._score_results(results)
+            results = evaluation.results
+            score, adjustments = evaluation.score, evaluation.adjustments
             score_history.append(score)
 
             # Track best
@@ -397,33 +489,8 @@ class HullSynthesizer:
                 stagnation_count = 0
             last_best_score = best_score
 
-            # Extract convergence inputs
-            validators_passed = sum(1 for r in results if r.get("passed", False))
-            max_severity = self._get_max_severity(results)
-
-            # v1.4.2: Estimate GM from hydrostatics if stability not yet computed
-            # During hull synthesis, stability phase hasn't run, so we estimate:
-            # GM = KB + BM - KG, where KG ≈ 0.55 × depth (typical for small craft)
-            gm_actual = self.state.get("stability.gm_transverse_m")
-            if gm_actual is None:
-                kb = self.state.get("hull.kb_m", 0.0)
-                bm = self.state.get("hull.bmt", 0.0)
-                depth = self.state.get("hull.depth", 0.0)
-                kg_estimate = 0.55 * depth  # VCG ≈ 55% of depth for typical small craft
-                gm_actual = kb + bm - kg_estimate if (kb > 0 and bm > 0) else 0.5
-                logger.debug(f"Estimated GM: {gm_actual:.3f}m (KB={kb:.3f}, BM={bm:.3f}, KG_est={kg_estimate:.3f})")
-
-            gm_required = request.gm_min_m or 0.5
-
             # Check convergence
-            converged, reason = criteria.is_converged(
-                score=score,
-                validators_passed=validators_passed,
-                max_finding_severity=max_severity,
-                gm_actual=gm_actual,
-                gm_required=gm_required,
-                score_history=score_history,
-            )
+            converged, reason = self._check_convergence(evaluation, criteria, request, score_history)
 
             if converged:
                 logger.info(f"Synthesis converged at iteration {iteration + 1}: {reason}")
@@ -463,6 +530,99 @@ class HullSynthesizer:
             warnings=all_warnings,
         )
 
+    def _check_convergence(
+        self,
+        evaluation: _Evaluation,
+        criteria: ConvergenceCriteria,
+        request: SynthesisRequest,
+        score_history: List[float],
+    ) -> Tuple[bool, str]:
+        """Apply the convergence criteria to one scored proposal."""
+        return criteria.is_converged(
+            score=evaluation.score,
+            validators_passed=sum(1 for r in evaluation.results if r.get("passed", False)),
+            max_finding_severity=self._get_max_severity(evaluation.results),
+            gm_actual=evaluation.gm_actual,
+            gm_required=request.gm_min_m or 0.5,
+            score_history=score_history,
+        )
+
+    def _meets_criteria(
+        self,
+        evaluation: _Evaluation,
+        criteria: ConvergenceCriteria,
+        request: SynthesisRequest,
+    ) -> bool:
+        """True if the proposal alone satisfies the criteria (plateau aside)."""
+        return self._check_convergence(evaluation, criteria, request, [])[0]
+
+    def _evaluate_in_state(self, proposal: SynthesisProposal) -> _Evaluation:
+        """Write the proposal to the shared state and score it there."""
+        self._write_proposal_to_state(proposal)
+        results = self._run_validators()
+        score, adjustments = self._score_results(results)
+        return _Evaluation(score, adjustments, results, self._estimate_gm(self.state))
+
+    def _evaluate_on_view(self, proposal: SynthesisProposal) -> _Evaluation:
+        """Score the proposal on a scratch view of the shared state."""
+        view = self.state.overlay()
+        for path, value in proposal.to_state_dict().items():
+            view.set(path, value, "synthesis:hull_synthesizer")
+        results = self._run_validators(view)
+        score, adjustments = self._score_results(results)
+        return _Evaluation(score, adjustments, results, self._estimate_gm(view), view.changes)
+
+    def _evaluate_candidates(
+        self,
+        candidates: List[SynthesisProposal],
+        memo: Dict[Tuple[float, ...], _Evaluation],
+        stats: Dict[str, int],
+        pool: Optional[Executor],
+    ) -> List[_Evaluation]:
+        """
+        Score candidates, each distinct hull once per synthesis.
+
+        Results are returned in candidate order whatever the pool's
+        completion order, so the winner only depends on the seed.
+        """
+        keys = [self._memo_key(c) for c in candidates]
+        pending: Dict[Tuple[float, ...], SynthesisProposal] = {}
+        for key, candidate in zip(keys, candidates):
+            if key in memo or key in pending:
+                stats["cache_hits"] += 1
+            else:
+                pending[key] = candidate
+
+        if pending:
+            stats["evaluations"] += len(pending)
+            if pool is not None and len(pending) > 1:
+                scored = list(pool.map(self._evaluate_on_view, pending.values()))
+            else:
+                scored = [self._evaluate_on_view(c) for c in pending.values()]
+            memo.update(zip(pending, scored))
+
+        return [memo[key] for key in keys]
+
+    def _memo_key(self, proposal: SynthesisProposal) -> Tuple[float, ...]:
+        return tuple(round(v, self.MEMO_DIGITS) for v in proposal.to_state_dict().values())
+
+    def _estimate_gm(self, state: Any) -> float:
+        """
+        GM from stability, or estimated from hydrostatics.
+
+        v1.4.2: During hull synthesis, stability phase hasn't run, so we estimate:
+        GM = KB + BM - KG, where KG ≈ 0.55 × depth (typical for small craft)
+        """
+        gm_actual = state.get("stability.gm_transverse_m")
+        if gm_actual is None:
+            kb = state.get("hull.kb_m", 0.0)
+            bm = state.get("hull.bmt", 0.0)
+            depth = state.get("hull.depth", 0.0)
+            kg_estimate = 0.55 * depth  # VCG ≈ 55% of depth for typical small craft
+            gm_actual = kb + bm - kg_estimate if (kb > 0 and bm > 0) else 0.5
+            logger.debug(f"Estimated GM: {gm_actual:.3f}m (KB={kb:.3f}, BM={bm:.3f}, KG_est={kg_estimate:.3f})")
+        return gm_actual
+
     def _clamp_to_bounds(
         self,
         proposal: SynthesisProposal,
@@ -642,15 +802,25 @@ class HullSynthesizer:
         params = proposal.to_state_dict()
         self.lock.write_hull_params(params, "hull_synthesizer")
 
-    def _run_validators(self) -> List[Dict[str, Any]]:
-        """Run scoring validators and return results."""
+    def _run_validators(self, view: Optional[Any] = None) -> List[Dict[str, Any]]:
+        """
+        Run scoring validators and return results.
+
+        Args:
+            view: Scratch state view to validate instead of the shared state
+        """
         results = []
 
         # Try to run through executor if available
         if self.executor:
             try:
                 for validator_id in self.SCORING_VALIDATORS:
-                    result = self.executor.execute_single(validator_id, self.state)
+                    if view is None:
+                        result = self.executor.execute_single(validator_id, self.state)
+                    else:
+                        result = self.executor.execute_single(
+                            validator_id, skip_cached=False, state_manager=view,
+                        )
                     if result:
                         results.append({
                             "name": validator_id,
@@ -826,6 +996,31 @@ class HullSynthesizer:
 
         return clamped
 
+    def _perturb(
+        self,
+        proposal: SynthesisProposal,
+        rng: random.Random,
+        iteration: int,
+        family: HullFamily,
+        scale: float = 1.0,
+    ) -> SynthesisProposal:
+        """
+        Random bounded mutation for population mode.
+
+        v1.5: Each perturbed dimension moves by up to MUTATION_DELTA (times
+        the escalation scale) in a random direction; coupling and bounds
+        clamping are applied by _mutate().
+        """
+        adjustments = [
+            {
+                "path": path,
+                "direction": "increase" if rng.random() < 0.5 else "decrease",
+                "magnitude": rng.uniform(0.0, self.MUTATION_DELTA),
+            }
+            for path in self.PERTURBED_PATHS
+        ]
+        return self._mutate(proposal, adjustments, iteration, family, scale)
+
     def _create_fallback_result(
         self,
         request: SynthesisRequest,
@@ -11,6 +11,9 @@ Pareto analysis, and sensitivity analysis.
 v1.1 Patches Applied:
     - P2: hull.freeboard_m (not hull.freeboard)
     - P3: StateManager.clone() for evaluations
+    - Parallel, memoized fitness evaluation (FitnessEvaluator)
+    - Vectorized non-dominated sorting and incremental Pareto archive
+    - Optional Gaussian-process surrogate screening
 """
 
 from .enums import (
@@ -18,6 +21,7 @@ from .enums import (
     ConstraintType,
     OptimizerStatus,
     SelectionMethod,
+    EvaluationMode,
 )
 
 from .schema import (
@@ -36,9 +40,11 @@ from .problems import (
     create_capacity_cost_problem,
 )
 
+from .evaluation import FitnessEvaluator, EvaluationOutcome
 from .optimizer import DesignOptimizer
-from .pareto import ParetoAnalyzer, ParetoMetrics
+from .pareto import ParetoAnalyzer, ParetoArchive, ParetoMetrics
 from .sensitivity import SensitivityAnalyzer, SensitivityResult, VariableSensitivity
+from .surrogate import GaussianProcessSurrogate, SurrogateReport, SurrogateScreen
 
 from .validator import (
     OptimizationValidator,
@@ -53,6 +59,7 @@ __all__ = [
     "ConstraintType",
     "OptimizerStatus",
     "SelectionMethod",
+    "EvaluationMode",
     # Schema
     "DesignVariable",
     "Objective",
@@ -67,12 +74,19 @@ __all__ = [
     "create_capacity_cost_problem",
     # Optimizer
     "DesignOptimizer",
+    "FitnessEvaluator",
+    "EvaluationOutcome",
     # Analysis
     "ParetoAnalyzer",
+    "ParetoArchive",
     "ParetoMetrics",
     "SensitivityAnalyzer",
     "SensitivityResult",
     "VariableSensitivity",
+    # Surrogate screening
+    "GaussianProcessSurrogate",
+    "SurrogateScreen",
+    "SurrogateReport",
     # Validator
     "OptimizationValidator",
     "OPTIMIZATION_DEFINITION",
@@ -0,0 +1,224 @@
+"""
+optimization/dominance.py - Vectorized Pareto dominance kernels.
+
+BRAVO OWNS THIS FILE.
+
+Module 13 v1.1 - Non-dominated sorting, crowding distance and hypervolume
+on objective matrices (rows = solutions, columns = minimized objectives).
+
+Non-dominated sorting follows ENS-BS (Zhang et al., 2015): solutions are
+visited in lexicographic order, so none can dominate an earlier one, and
+each is placed by binary search over the fronts built so far. Two
+objectives use a scalar fast path; more use one vectorized dominance check
+per probed front.
+"""
+
+from __future__ import annotations
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .schema import Solution
+
+
+def objective_matrix(solutions: Sequence[Solution], n_obj: Optional[int] = None) -> np.ndarray:
+    """Stack solution objectives into an (n, n_obj) float array."""
+    if not solutions:
+        return np.empty((0, n_obj or 0))
+    return np.asarray([s.objectives for s in solutions], dtype=float)
+
+
+def dominance_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Boolean matrix D with D[i, j] True if a[i] dominates b[j]."""
+    le = np.all(a[:, None, :] <= b[None, :, :], axis=2)
+    lt = np.any(a[:, None, :] < b[None, :, :], axis=2)
+    return le & lt
+
+
+def non_dominated_ranks(
+    objectives: np.ndarray,
+    feasible: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Front index of each solution (0 = non-dominated).
+
+    Matches Solution.dominates(): infeasible solutions dominate nothing and
+    are dominated by every feasible one, so they share the front after the
+    last feasible front.
+
+    Args:
+        objectives: (n, m) objective matrix
+        feasible: Optional boolean mask; all feasible if omitted
+
+    Returns:
+        Integer array of length n
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    n = len(objectives)
+    ranks = np.zeros(n, dtype=int)
+    if n == 0:
+        return ranks
+
+    if feasible is None:
+        return _ens_ranks(objectives)
+
+    feasible = np.asarray(feasible, dtype=bool)
+    feasible_idx = np.flatnonzero(feasible)
+    if feasible_idx.size:
+        feasible_ranks = _ens_ranks(objectives[feasible_idx])
+        ranks[feasible_idx] = feasible_ranks
+        ranks[~feasible] = feasible_ranks.max() + 1
+    return ranks
+
+
+def _ens_ranks(objectives: np.ndarray) -> np.ndarray:
+    n, m = objectives.shape
+    ranks = np.zeros(n, dtype=int)
+    if n == 0 or m == 0:
+        return ranks
+
+    # Lexicographic order: first objective is the primary key
+    order = np.lexsort(objectives.T[::-1])
+    if m == 1:
+        values = objectives[order, 0]
+        ranks[order] = np.cumsum(np.r_[False, values[1:] > values[:-1]])
+        return ranks
+    if m == 2:
+        return _ens_ranks_2d(objectives, order)
+
+    # Per-front member arrays with doubling capacity
+    fronts: List[np.ndarray] = []
+    sizes: List[int] = []
+    for i in order:
+        x = objectives[i]
+        lo, hi = 0, len(fronts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            members = fronts[mid][:sizes[mid]]
+            dominated = np.any(
+                np.all(members <= x, axis=1) & np.any(members < x, axis=1)
+            )
+            if dominated:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(fronts):
+            fronts.append(np.empty((4, m)))
+            sizes.append(0)
+        if sizes[lo] == len(fronts[lo]):
+            fronts[lo] = np.resize(fronts[lo], (2 * sizes[lo], m))
+        fronts[lo][sizes[lo]] = x
+        sizes[lo] += 1
+        ranks[i] = lo
+    return ranks
+
+
+def _ens_ranks_2d(objectives: np.ndarray, order: np.ndarray) -> np.ndarray:
+    # In lexicographic order the last member of each front has its lowest
+    # second objective, so one comparison decides whether a front dominates
+    ranks = np.zeros(len(objectives), dtype=int)
+    points = objectives.tolist()
+    last_f1: List[float] = []
+    last_f2: List[float] = []
+    for i in order.tolist():
+        x1, x2 = points[i]
+        lo, hi = 0, len(last_f2)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if last_f2[mid] < x2 or (last_f2[mid] == x2 and last_f1[mid] < x1):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(last_f2):
+            last_f1.append(x1)
+            last_f2.append(x2)
+        else:
+            last_f1[lo] = x1
+            last_f2[lo] = x2
+        ranks[i] = lo
+    return ranks
+
+
+def crowding_distance(objectives: np.ndarray) -> np.ndarray:
+    """
+    NSGA-II crowding distance of each solution in one front.
+
+    Boundary solutions of every objective get infinity; objectives with no
+    spread add nothing to interior solutions.
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    n = len(objectives)
+    distance = np.zeros(n)
+    if n == 0:
+        return distance
+
+    # Each objective's sort starts from the previous order, so ties break
+    # the same way as successive in-place list sorts
+    order = np.arange(n)
+    for m in range(objectives.shape[1]):
+        values = objectives[:, m]
+        order = order[np.argsort(values[order], kind="stable")]
+        distance[order[0]] = np.inf
+        distance[order[-1]] = np.inf
+
+        obj_range = values[order[-1]] - values[order[0]]
+        if obj_range == 0 or n < 3:
+            continue
+        sorted_values = values[order]
+        distance[order[1:-1]] += (sorted_values[2:] - sorted_values[:-2]) / obj_range
+    return distance
+
+
+def default_reference_point(objectives: np.ndarray) -> np.ndarray:
+    """Nadir point plus a 10% margin (works for negative objectives)."""
+    nadir = np.max(objectives, axis=0)
+    return nadir + 0.1 * np.abs(nadir)
+
+
+def hypervolume(
+    points: Iterable[Sequence[float]],
+    ref_point: Sequence[float],
+) -> float:
+    """
+    Hypervolume dominated by points and bounded by ref_point (minimization).
+
+    Two objectives use a staircase sweep; more objectives are sliced along
+    the last objective (HSO), recursing down to the 2-D sweep.
+
+    Args:
+        points: Objective vectors
+        ref_point: Reference point, worse than the front in every objective
+
+    Returns:
+        Dominated hypervolume (0.0 if no point is better than ref_point)
+    """
+    ref = np.asarray(ref_point, dtype=float)
+    pts = np.asarray(points, dtype=float).reshape(-1, len(ref))
+    pts = pts[np.all(pts < ref, axis=1)]
+    if len(pts) == 0:
+        return 0.0
+    pts = pts[_ens_ranks(pts) == 0]
+    return _hypervolume(pts, ref)
+
+
+def _hypervolume(points: np.ndarray, ref: np.ndarray) -> float:
+    m = points.shape[1]
+    if m == 1:
+        return float(ref[0] - points[:, 0].min())
+    if m == 2:
+        points = points[np.lexsort((points[:, 1], points[:, 0]))]
+        lowest = np.minimum.accumulate(points[:, 1])
+        step = np.r_[True, lowest[1:] < lowest[:-1]]
+        x = points[step, 0]
+        y = lowest[step]
+        widths = np.diff(np.r_[x, ref[0]])
+        return float(np.sum(widths * (ref[1] - y)))
+
+    points = points[np.argsort(points[:, -1], kind="stable")]
+    levels = np.r_[points[:, -1], ref[-1]]
+    volume = 0.0
+    for i in range(len(points)):
+        depth = levels[i + 1] - levels[i]
+        if depth > 0:
+            volume += _hypervolume(points[:i + 1, :-1], ref[:-1]) * depth
+    return volume
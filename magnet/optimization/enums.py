@@ -38,3 +38,10 @@ class SelectionMethod(Enum):
     KNEE = "knee"                # Maximum curvature on Pareto front
     WEIGHTED = "weighted"        # Weighted sum of objectives
     MANUAL = "manual"            # User-selected
+
+
+class EvaluationMode(Enum):
+    """Fitness evaluation backends."""
+    SERIAL = "serial"            # In the calling thread
+    THREAD = "thread"            # Thread pool (validators that release the GIL)
+    PROCESS = "process"          # Process pool (CPU-bound Python validators)
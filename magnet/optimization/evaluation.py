@@ -0,0 +1,400 @@
+"""
+optimization/evaluation.py - Fitness evaluation backends.
+
+BRAVO OWNS THIS FILE.
+
+Module 13 v1.1 - Pluggable evaluation for DesignOptimizer and
+SensitivityAnalyzer.
+
+Candidates are evaluated serially, on a thread pool, or on a process pool
+whose workers are seeded once with a compact picklable copy of the base
+state. Outcomes are memoized on quantized variable vectors, so duplicate
+offspring and repeated perturbations are evaluated only once.
+"""
+
+from __future__ import annotations
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from .enums import EvaluationMode
+from .schema import OptimizationProblem, Solution
+
+if TYPE_CHECKING:
+    from ..core.state_manager import StateManager
+
+logger = logging.getLogger(__name__)
+
+PENALTY = 1e10
+
+VariableKey = Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class EvaluationOutcome:
+    """Result of evaluating one variable vector."""
+    objectives: Tuple[float, ...]
+    constraint_violation: float
+    is_feasible: bool
+    failed: bool = False  # A validator or objective raised
+
+    @classmethod
+    def penalty(cls, n_obj: int) -> "EvaluationOutcome":
+        """Outcome for a candidate whose evaluation failed."""
+        return cls((PENALTY,) * n_obj, PENALTY, False, failed=True)
+
+    def apply(self, solution: Solution) -> None:
+        """Copy the outcome onto a solution."""
+        solution.objectives = list(self.objectives)
+        solution.constraint_violation = self.constraint_violation
+        solution.is_feasible = self.is_feasible
+
+
+def evaluate_variables(
+    problem: OptimizationProblem,
+    base_state: "StateManager",
+    validators: Sequence[Any],
+    variables: Sequence[float],
+    source: str,
+) -> EvaluationOutcome:
+    """
+    Evaluate one candidate on a clone of the base state.
+
+    Applies the variables, runs the validators, then evaluates objectives
+    and constraints. Any failure yields the penalty outcome.
+    """
+    n_obj = problem.n_obj
+    try:
+        # Create state copy using clone() method (P3 FIX)
+        if hasattr(base_state, 'clone'):
+            state = base_state.clone()
+            # The copy is scratch space: open a transaction so refinable
+            # paths can be written (never committed)
+            begin = getattr(state, 'begin_transaction', None)
+            if callable(begin) and not state.in_transaction():
+                begin()
+        else:
+            # Fallback for testing with mock
+            state = base_state
+
+        # Apply design variables - Hole #7 Fix: Use .set() with proper source
+        for var, value in zip(problem.variables, variables):
+            state.set(var.state_path, value, source)
+
+        # Run validators
+        for validator in validators:
+            try:
+                validator.validate(state, {})
+            except Exception:
+                return EvaluationOutcome.penalty(n_obj)
+
+        # Evaluate objectives
+        objectives = tuple(obj.evaluate(state) for obj in problem.objectives)
+
+        # Evaluate constraints
+        total_violation = 0.0
+        for constr in problem.constraints:
+            total_violation += constr.evaluate(state) * constr.penalty_weight
+
+        return EvaluationOutcome(objectives, total_violation, total_violation == 0)
+
+    except Exception:
+        return EvaluationOutcome.penalty(n_obj)
+
+
+class StateSeed:
+    """
+    Picklable compact copy of a base state for worker processes.
+
+    A StateManager is shipped as its to_dict() without history and rebuilt
+    once per worker; other state objects (e.g. test doubles) are pickled
+    as-is.
+    """
+
+    def __init__(self, state: Any):
+        from ..core.state_manager import StateManager
+
+        if isinstance(state, StateManager):
+            self._factory = type(state)
+            self._payload = state.to_dict(include_history=False)
+        else:
+            self._factory = None
+            self._payload = state
+
+    def restore(self) -> Any:
+        """Rebuild the state in the current process."""
+        if self._factory is None:
+            return self._payload
+        state = self._factory()
+        state.from_dict(self._payload)
+        return state
+
+
+# Per-process worker context, set by _init_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(
+    problem: OptimizationProblem,
+    seed: StateSeed,
+    validators: Sequence[Any],
+    source: str,
+) -> None:
+    _WORKER.update(
+        problem=problem,
+        state=seed.restore(),
+        validators=validators,
+        source=source,
+    )
+
+
+def _evaluate_in_worker(variables: Sequence[float]) -> EvaluationOutcome:
+    return evaluate_variables(
+        _WORKER["problem"], _WORKER["state"], _WORKER["validators"], variables, _WORKER["source"],
+    )
+
+
+class FitnessEvaluator:
+    """
+    Memoizing evaluator with a serial, thread or process backend.
+
+    Usage:
+        with FitnessEvaluator(problem, state, validators, mode=EvaluationMode.PROCESS) as ev:
+            outcomes = ev.evaluate_many([s.variables for s in population])
+
+    Process mode requires the problem and validators to be picklable; if
+    the pool cannot be used the evaluator falls back to serial mode.
+    """
+
+    DEFAULT_MEMO_SIZE = 10000
+    DEFAULT_MEMO_QUANTUM = 1e-9  # Fraction of each variable's range
+
+    def __init__(
+        self,
+        problem: OptimizationProblem,
+        base_state: "StateManager",
+        validators: Optional[List[Any]] = None,
+        mode: EvaluationMode = EvaluationMode.SERIAL,
+        max_workers: Optional[int] = None,
+        memo_size: int = DEFAULT_MEMO_SIZE,
+        memo_quantum: float = DEFAULT_MEMO_QUANTUM,
+        source: str = "optimization/optimizer",
+    ):
+        """
+        Initialize evaluator.
+
+        Args:
+            problem: Optimization problem definition
+            base_state: Base state manager to clone for evaluations
+            validators: List of validators to run during evaluation
+            mode: Evaluation backend
+            max_workers: Pool size for thread/process modes (default: CPU count)
+            memo_size: Outcomes kept in the memo cache (0 disables it)
+            memo_quantum: Memo key resolution, as a fraction of each variable's range
+            source: Source recorded for the variable writes
+        """
+        self.problem = problem
+        self.base_state = base_state
+        self.validators = validators or []
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.memo_size = memo_size
+        self.memo_quantum = memo_quantum
+        self.source = source
+
+        self._memo: "OrderedDict[VariableKey, EvaluationOutcome]" = OrderedDict()
+        self._pool: Optional[Executor] = None
+        self._evaluations = 0
+        self._cache_hits = 0
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    @property
+    def evaluations(self) -> int:
+        """Candidates actually evaluated (memo misses)."""
+        return self._evaluations
+
+    @property
+    def cache_hits(self) -> int:
+        """Candidates answered from the memo cache."""
+        return self._cache_hits
+
+    # =========================================================================
+    # Evaluation
+    # =========================================================================
+
+    def evaluate(self, variables: Sequence[float]) -> EvaluationOutcome:
+        """Evaluate one candidate in the calling thread (memoized)."""
+        key = self._key(variables)
+        outcome = self._memo_get(key)
+        if outcome is None:
+            self._evaluations += 1
+            outcome = evaluate_variables(
+                self.problem, self.base_state, self.validators, variables, self.source,
+            )
+            self._memo_put(key, outcome)
+        return outcome
+
+    def evaluate_many(
+        self,
+        batch: Sequence[Sequence[float]],
+        on_outcome: Optional[Callable[[int, EvaluationOutcome], None]] = None,
+    ) -> List[EvaluationOutcome]:
+        """
+        Evaluate candidates on the configured backend.
+
+        Duplicates within the batch and candidates already in the memo
+        cache are evaluated once. Outcomes are returned in batch order.
+
+        Args:
+            batch: Variable vectors
+            on_outcome: Optional callback(batch_index, outcome), called as
+                each outcome becomes available (memo hits first, then as
+                the backend finishes candidates) and before this returns
+        """
+        keys = [self._key(variables) for variables in batch]
+        outcomes: Dict[VariableKey, EvaluationOutcome] = {}
+        pending: Dict[VariableKey, Sequence[float]] = {}
+        # Batch indices waiting on each pending key
+        waiting: Dict[VariableKey, List[int]] = {}
+
+        for i, (key, variables) in enumerate(zip(keys, batch)):
+            if key in outcomes or key in pending:
+                self._cache_hits += 1
+            else:
+                outcome = self._memo_get(key)
+                if outcome is not None:
+                    outcomes[key] = outcome
+                else:
+                    pending[key] = variables
+            if key in pending:
+                waiting.setdefault(key, []).append(i)
+            elif on_outcome is not None:
+                on_outcome(i, outcomes[key])
+
+        if pending:
+            self._evaluations += len(pending)
+            for key, outcome in zip(pending, self._run(list(pending.values()))):
+                outcomes[key] = outcome
+                self._memo_put(key, outcome)
+                if on_outcome is not None:
+                    for i in waiting[key]:
+                        on_outcome(i, outcome)
+
+        return [outcomes[key] for key in keys]
+
+    def evaluate_solutions(
+        self,
+        solutions: Sequence[Solution],
+        on_evaluated: Optional[Callable[[Solution], None]] = None,
+    ) -> None:
+        """
+        Evaluate solutions in place.
+
+        on_evaluated(solution) is called as each solution's outcome is
+        applied, see evaluate_many().
+        """
+        def apply(i: int, outcome: EvaluationOutcome) -> None:
+            outcome.apply(solutions[i])
+            if on_evaluated is not None:
+                on_evaluated(solutions[i])
+
+        self.evaluate_many([s.variables for s in solutions], on_outcome=apply)
+
+    def clear_cache(self) -> None:
+        """Drop memoized outcomes (e.g. after the base state changed)."""
+        self._memo.clear()
+
+    # =========================================================================
+    # Backends
+    # =========================================================================
+
+    def _run(self, batch: List[Sequence[float]]) -> Iterator[EvaluationOutcome]:
+        """Outcomes in batch order, each yielded as soon as the backend has it."""
+        if self.mode == EvaluationMode.SERIAL or len(batch) == 1:
+            for variables in batch:
+                yield self._evaluate_local(variables)
+            return
+
+        done = 0
+        try:
+            pool = self._get_pool()
+            chunksize = max(1, len(batch) // (self.max_workers * 4))
+            if self.mode == EvaluationMode.PROCESS:
+                results = pool.map(_evaluate_in_worker, batch, chunksize=chunksize)
+            else:
+                results = pool.map(self._evaluate_local, batch)
+            for outcome in results:
+                done += 1
+                yield outcome
+        except Exception as e:
+            # Evaluation errors are caught per candidate, so this is the
+            # pool itself (pickling, broken workers): degrade to serial
+            logger.warning(f"{self.mode.value} evaluation unavailable, using serial: {e}")
+            self.close()
+            self.mode = EvaluationMode.SERIAL
+            for variables in batch[done:]:
+                yield self._evaluate_local(variables)
+
+    def _evaluate_local(self, variables: Sequence[float]) -> EvaluationOutcome:
+        return evaluate_variables(
+            self.problem, self.base_state, self.validators, variables, self.source,
+        )
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.mode == EvaluationMode.PROCESS:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.problem, StateSeed(self.base_state), self.validators, self.source),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool (recreated on next use)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "FitnessEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # =========================================================================
+    # Memo Cache
+    # =========================================================================
+
+    def _key(self, variables: Sequence[float]) -> VariableKey:
+        """Quantize a variable vector to a memo key."""
+        key = []
+        for var, value in zip(self.problem.variables, variables):
+            span = var.upper_bound - var.lower_bound
+            if span > 0:
+                key.append(round((value - var.lower_bound) / (span * self.memo_quantum)))
+            else:
+                key.append(value)
+        return tuple(key)
+
+    def _memo_get(self, key: VariableKey) -> Optional[EvaluationOutcome]:
+        outcome = self._memo.get(key)
+        if outcome is not None:
+            self._memo.move_to_end(key)
+            self._cache_hits += 1
+        return outcome
+
+    def _memo_put(self, key: VariableKey, outcome: EvaluationOutcome) -> None:
+        if self.memo_size <= 0:
+            return
+        self._memo[key] = outcome
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
@@ -14,7 +14,11 @@ import time
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from .enums import OptimizerStatus, SelectionMethod
+from .enums import EvaluationMode, OptimizerStatus, SelectionMethod
+from .evaluation import FitnessEvaluator
+from .dominance import crowding_distance, non_dominated_ranks, objective_matrix
+from .pareto import ParetoArchive
+from .surrogate import SurrogateScreen
 from .schema import (
     OptimizationProblem,
     OptimizationResult,
@@ -42,6 +46,12 @@ class DesignOptimizer:
         crossover_prob: float = 0.9,
         mutation_prob: float = 0.1,
         seed: Optional[int] = None,
+        evaluation_mode: EvaluationMode = EvaluationMode.SERIAL,
+        max_workers: Optional[int] = None,
+        memo_size: int = FitnessEvaluator.DEFAULT_MEMO_SIZE,
+        evaluator: Optional[FitnessEvaluator] = None,
+        archive_size: Optional[int] = None,
+        surrogate: Optional[SurrogateScreen] = None,
     ):
         """
         Initialize optimizer.
@@ -55,6 +65,14 @@ class DesignOptimizer:
             crossover_prob: Crossover probability
             mutation_prob: Mutation probability
             seed: Random seed for reproducibility
+            evaluation_mode: Serial, thread-pool or process-pool evaluation
+            max_workers: Pool size for parallel modes (default: CPU count)
+            memo_size: Evaluated candidates cached by variable vector
+            evaluator: Shared evaluator (overrides the three options above)
+            archive_size: Pareto archive capacity (default: population_size)
+            surrogate: Optional surrogate screen; once trained, only its
+                evaluation budget of offspring is evaluated per generation
+                and the rest are discarded
         """
         self.problem = problem
         self.base_state = base_state
@@ -67,18 +85,41 @@ class DesignOptimizer:
         if seed is not None:
             random.seed(seed)
 
+        # An evaluator passed in is owned (and closed) by the caller
+        self._owns_evaluator = evaluator is None
+        self.evaluator = evaluator or FitnessEvaluator(
+            problem,
+            base_state,
+            self.validators,
+            mode=evaluation_mode,
+            max_workers=max_workers,
+            memo_size=memo_size,
+        )
+
+        # Best non-dominated feasible solutions seen across generations
+        self.archive = ParetoArchive(
+            problem.n_obj,
+            max_size=archive_size or population_size,
+        )
+
+        self.surrogate = surrogate
+
         self._evaluations = 0
         self._result = None
 
     def optimize(
         self,
         callback: Optional[Callable[[int, List[Solution]], None]] = None,
+        on_evaluated: Optional[Callable[[int, Solution], None]] = None,
     ) -> OptimizationResult:
         """
         Run optimization.
 
         Args:
             callback: Optional callback(generation, pareto_front) called each generation
+            on_evaluated: Optional callback(generation, solution) streamed as each
+                evaluation finishes, before its generation completes (generation
+                is -1 for the initial population)
 
         Returns:
             OptimizationResult with Pareto front and statistics
@@ -90,6 +131,10 @@ class DesignOptimizer:
         )
 
         self._evaluations = 0
+        self.archive.clear()
+        if self.surrogate:
+            self.surrogate.reset()
+        cache_hits_before = self.evaluator.cache_hits
         start_time = time.time()
 
         try:
@@ -97,24 +142,43 @@ class DesignOptimizer:
             population = self._initialize_population()
 
             # Evaluate initial population
-            for sol in population:
-                self._evaluate_solution(sol)
+            self._evaluate_population(population, -1, on_evaluated)
+            self.archive.update(population)
+            if self.surrogate:
+                self.surrogate.observe(population)
 
             # Main NSGA-II loop
             for gen in range(self.max_generations):
+                if self.surrogate:
+                    self.surrogate.maybe_retrain(gen)
+
                 # Create offspring
-                offspring = self._create_offspring(population)
+                if self.surrogate and self.surrogate.is_active:
+                    # Breed extra candidates and evaluate only the budget's
+                    # worth the surrogate rates as promising or uncertain
+                    candidates = []
+                    for _ in range(self.surrogate.oversample):
+                        candidates.extend(self._create_offspring(population))
+                    offspring = self.surrogate.screen(
+                        candidates, population,
+                        limit=self.surrogate.evaluation_budget(self.population_size),
+                    )
+                else:
+                    offspring = self._create_offspring(population)
 
                 # Evaluate offspring
-                for sol in offspring:
-                    self._evaluate_solution(sol)
+                self._evaluate_population(offspring, gen, on_evaluated)
+                self.archive.update(offspring)
+                if self.surrogate:
+                    self.surrogate.observe(offspring)
 
                 # Combine and select
                 combined = population + offspring
                 population = self._select_population(combined)
 
-                # Extract Pareto front
-                pareto = self._extract_pareto_front(population)
+                # Pareto front: the archive, or the population's first
+                # front while no feasible solution has been found
+                pareto = self.archive.solutions or self._extract_pareto_front(population)
                 result.pareto_front = pareto
                 result.iterations = gen + 1
 
@@ -132,8 +196,15 @@ class DesignOptimizer:
             # Log error but don't crash
             pass
 
+        finally:
+            if self._owns_evaluator:
+                self.evaluator.close()
+
         # Finalize
         result.evaluations = self._evaluations
+        result.cache_hits = self.evaluator.cache_hits - cache_hits_before
+        if self.surrogate:
+            result.surrogate_report = self.surrogate.report().to_dict()
         result.elapsed_time_s = time.time() - start_time
         result.completed_at = datetime.now(timezone.utc)
 
@@ -172,54 +243,30 @@ class DesignOptimizer:
 
         v1.1 PATCH P3: Uses StateManager.clone() for proper deep copy.
         """
-        self._evaluations += 1
+        misses_before = self.evaluator.evaluations
+        self.evaluator.evaluate(solution.variables).apply(solution)
+        self._evaluations += self.evaluator.evaluations - misses_before
 
-        try:
-            # Create state copy using clone() method (P3 FIX)
-            if hasattr(self.base_state, 'clone'):
-                state = self.base_state.clone()
-            else:
-                # Fallback for testing with mock
-                state = self.base_state
-
-            # Apply design variables - Hole #7 Fix: Use .set() with proper source
-            source = "optimization/optimizer"
-            for i, var in enumerate(self.problem.variables):
-                value = solution.variables[i]
-                state.set(var.state_path, value, source)
-
-            # Run validators
-            for validator in self.validators:
-                try:
-                    validator.validate(state, {})
-                except Exception:
-                    # Penalty for validation failure
-                    solution.objectives = [1e10] * self.problem.n_obj
-                    solution.constraint_violation = 1e10
-                    solution.is_feasible = False
-                    return
-
-            # Evaluate objectives
-            objectives = []
-            for obj in self.problem.objectives:
-                value = obj.evaluate(state)
-                objectives.append(value)
-            solution.objectives = objectives
-
-            # Evaluate constraints
-            total_violation = 0.0
-            for constr in self.problem.constraints:
-                violation = constr.evaluate(state)
-                total_violation += violation * constr.penalty_weight
-
-            solution.constraint_violation = total_violation
-            solution.is_feasible = total_violation == 0
-
-        except Exception:
-            # Penalty for evaluation failure
-            solution.objectives = [1e10] * self.problem.n_obj
-            solution.constraint_violation = 1e10
-            solution.is_feasible = False
+    def _evaluate_population(
+        self,
+        solutions: List[Solution],
+        generation: int = -1,
+        on_evaluated: Optional[Callable[[int, Solution], None]] = None,
+    ) -> None:
+        """
+        Evaluate a batch of solutions on the evaluator's backend.
+
+        Only memo misses count as evaluations; cache hits are reported
+        separately via the evaluator's cache_hits.
+        """
+        misses_before = self.evaluator.evaluations
+        if on_evaluated is None:
+            self.evaluator.evaluate_solutions(solutions)
+        else:
+            self.evaluator.evaluate_solutions(
+                solutions, lambda solution: on_evaluated(generation, solution),
+            )
+        self._evaluations += self.evaluator.evaluations - misses_before
 
     def _create_offspring(self, population: List[Solution]) -> List[Solution]:
         """Create offspring through crossover and mutation."""
@@ -344,79 +391,30 @@ class DesignOptimizer:
     def _non_dominated_sort(
         self, population: List[Solution]
     ) -> List[List[Solution]]:
-        """Non-dominated sorting."""
-        fronts: List[List[Solution]] = [[]]
-
-        # For each solution, find dominated solutions and domination count
-        for p in population:
-            p._dominated_by = []
-            p._dominates = []
-            p._dom_count = 0
-
-        for i, p in enumerate(population):
-            for j, q in enumerate(population):
-                if i == j:
-                    continue
-                if p.dominates(q):
-                    p._dominates.append(q)
-                elif q.dominates(p):
-                    p._dom_count += 1
-
-            if p._dom_count == 0:
-                p._rank = 0
-                fronts[0].append(p)
-
-        # If all solutions are non-dominated, return them in single front
-        if not fronts[0]:
-            # When no solution dominates another (all equal), put all in front 0
-            for p in population:
-                p._rank = 0
-            fronts[0] = population[:]
-            return fronts
-
-        # Build subsequent fronts
-        current_front = 0
-        while current_front < len(fronts) and fronts[current_front]:
-            next_front = []
-            for p in fronts[current_front]:
-                for q in p._dominates:
-                    q._dom_count -= 1
-                    if q._dom_count == 0:
-                        q._rank = current_front + 1
-                        next_front.append(q)
-            current_front += 1
-            if next_front:
-                fronts.append(next_front)
-
-        return [f for f in fronts if f]
+        """Non-dominated sorting (vectorized ENS, see dominance.py)."""
+        if not population:
+            return []
+
+        ranks = non_dominated_ranks(
+            objective_matrix(population),
+            [p.is_feasible for p in population],
+        )
+
+        fronts: List[List[Solution]] = [[] for _ in range(int(ranks.max()) + 1)]
+        for p, rank in zip(population, ranks.tolist()):
+            p._rank = rank
+            fronts[rank].append(p)
+
+        return fronts
 
     def _calculate_crowding_distance(self, front: List[Solution]) -> None:
         """Calculate crowding distance for solutions in a front."""
-        n = len(front)
-        if n == 0:
+        if not front:
             return
 
-        for sol in front:
-            sol.crowding_distance = 0.0
-
-        for m in range(self.problem.n_obj):
-            front.sort(key=lambda s: s.objectives[m])
-
-            # Boundary solutions have infinite distance
-            front[0].crowding_distance = float('inf')
-            front[-1].crowding_distance = float('inf')
-
-            # Calculate range
-            obj_range = front[-1].objectives[m] - front[0].objectives[m]
-            if obj_range == 0:
-                continue
-
-            # Calculate distances
-            for i in range(1, n - 1):
-                front[i].crowding_distance += (
-                    (front[i + 1].objectives[m] - front[i - 1].objectives[m])
-                    / obj_range
-                )
+        distances = crowding_distance(objective_matrix(front)[:, :self.problem.n_obj])
+        for sol, distance in zip(front, distances.tolist()):
+            sol.crowding_distance = distance
 
     def _extract_pareto_front(
         self, population: List[Solution]
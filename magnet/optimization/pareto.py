@@ -8,10 +8,23 @@ Module 13 v1.1 - Pareto front analysis and visualization data.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 from .schema import Solution, OptimizationProblem
 from .enums import SelectionMethod
+from .dominance import (
+    crowding_distance,
+    default_reference_point,
+    dominance_matrix,
+    hypervolume,
+    non_dominated_ranks,
+    objective_matrix,
+)
+
+# Rows per block when computing nearest-neighbor distances
+_SPACING_BLOCK = 1024
 
 
 @dataclass
@@ -37,6 +50,131 @@ class ParetoMetrics:
         }
 
 
+class ParetoArchive:
+    """
+    Incrementally maintained set of feasible non-dominated solutions.
+
+    Candidates are merged in batches: those dominated by (or duplicating the
+    objectives of) an archived solution are rejected, and archived
+    solutions dominated by an accepted candidate are dropped. Above
+    max_size, the most crowded solutions are truncated.
+
+    Usage:
+        archive = ParetoArchive(n_obj=2, max_size=100)
+        archive.update(population)
+        analyzer.compute_metrics(archive)
+    """
+
+    def __init__(self, n_obj: int, max_size: Optional[int] = None):
+        """
+        Initialize archive.
+
+        Args:
+            n_obj: Number of objectives
+            max_size: Maximum archived solutions (None: unbounded)
+        """
+        self.n_obj = n_obj
+        self.max_size = max_size
+        self._solutions: List[Solution] = []
+        self._objectives = np.empty((0, n_obj))
+        self._version = 0
+        self._metrics: Optional[Tuple[int, "ParetoMetrics"]] = None
+
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever the archive changes."""
+        return self._version
+
+    @property
+    def solutions(self) -> List[Solution]:
+        """Archived solutions (copy of the list)."""
+        return list(self._solutions)
+
+    @property
+    def objectives(self) -> np.ndarray:
+        """Read-only (n, n_obj) objective matrix of the archived solutions."""
+        view = self._objectives.view()
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return len(self._solutions)
+
+    def __iter__(self) -> Iterator[Solution]:
+        return iter(list(self._solutions))
+
+    def add(self, solution: Solution) -> bool:
+        """Offer one solution; True if it was archived."""
+        return self.update([solution]) > 0
+
+    def update(self, solutions: Iterable[Solution]) -> int:
+        """
+        Merge a batch of solutions.
+
+        Returns:
+            Number of candidates archived (before any truncation)
+        """
+        candidates = [
+            s for s in solutions
+            if s.is_feasible and len(s.objectives) == self.n_obj
+        ]
+        if not candidates:
+            return 0
+        cand_objs = objective_matrix(candidates)
+
+        # Non-dominated within the batch, first of any duplicates
+        keep = non_dominated_ranks(cand_objs) == 0
+        _, first = np.unique(cand_objs, axis=0, return_index=True)
+        unique = np.zeros(len(candidates), dtype=bool)
+        unique[first] = True
+        keep &= unique
+
+        archive_objs = self._objectives
+        if len(archive_objs):
+            keep &= ~dominance_matrix(archive_objs, cand_objs).any(axis=0)
+            keep &= ~np.all(archive_objs[:, None, :] == cand_objs[None, :, :], axis=2).any(axis=0)
+
+        accepted = np.flatnonzero(keep)
+        if not accepted.size:
+            return 0
+
+        cand_objs = cand_objs[accepted]
+        survivors = np.ones(len(archive_objs), dtype=bool)
+        if len(archive_objs):
+            survivors = ~dominance_matrix(cand_objs, archive_objs).any(axis=0)
+
+        self._solutions = [
+            sol for sol, alive in zip(self._solutions, survivors) if alive
+        ] + [candidates[i] for i in accepted]
+        self._objectives = np.vstack([archive_objs[survivors], cand_objs])
+        self._truncate()
+        self._version += 1
+        return int(accepted.size)
+
+    def clear(self) -> None:
+        """Remove all solutions."""
+        self._solutions = []
+        self._objectives = np.empty((0, self.n_obj))
+        self._version += 1
+
+    def hypervolume(self, ref_point: Optional[List[float]] = None) -> float:
+        """Hypervolume of the archive (default reference: nadir + 10%)."""
+        if not self._solutions:
+            return 0.0
+        if ref_point is None:
+            ref_point = default_reference_point(self._objectives)
+        return hypervolume(self._objectives, ref_point)
+
+    def _truncate(self) -> None:
+        if self.max_size is None or len(self._solutions) <= self.max_size:
+            return
+        distance = crowding_distance(self._objectives)
+        # Drop the most crowded; stable so ties keep the oldest solutions
+        keep = np.sort(np.argsort(-distance, kind="stable")[:self.max_size])
+        self._solutions = [self._solutions[i] for i in keep]
+        self._objectives = self._objectives[keep]
+
+
 class ParetoAnalyzer:
     """
     Analyzer for Pareto fronts.
@@ -53,39 +191,56 @@ class ParetoAnalyzer:
         """
         self.problem = problem
 
-    def compute_metrics(self, pareto_front: List[Solution]) -> ParetoMetrics:
+    def compute_metrics(
+        self, pareto_front: Union[List[Solution], ParetoArchive]
+    ) -> ParetoMetrics:
         """
         Compute metrics for a Pareto front.
 
         Args:
-            pareto_front: List of Pareto optimal solutions
+            pareto_front: List of Pareto optimal solutions, or a ParetoArchive
+                (metrics are cached until the archive changes)
 
         Returns:
             ParetoMetrics with various quality indicators
         """
-        metrics = ParetoMetrics()
+        if isinstance(pareto_front, ParetoArchive):
+            archive = pareto_front
+            cached = archive._metrics
+            if cached is not None and cached[0] == archive.version:
+                return cached[1]
+            metrics = self._metrics_for(archive.solutions, archive.objectives)
+            archive._metrics = (archive.version, metrics)
+            return metrics
 
         if not pareto_front:
+            return ParetoMetrics()
+        return self._metrics_for(pareto_front, objective_matrix(pareto_front))
+
+    def _metrics_for(
+        self, front: List[Solution], objectives: np.ndarray
+    ) -> ParetoMetrics:
+        metrics = ParetoMetrics()
+
+        if not front:
             return metrics
 
-        metrics.n_solutions = len(pareto_front)
+        metrics.n_solutions = len(front)
 
         # Compute objective ranges
-        n_obj = self.problem.n_obj
-        for m in range(n_obj):
-            values = [s.objectives[m] for s in pareto_front]
-            metrics.objective_mins.append(min(values))
-            metrics.objective_maxs.append(max(values))
+        objectives = objectives[:, :self.problem.n_obj]
+        metrics.objective_mins = objectives.min(axis=0).tolist()
+        metrics.objective_maxs = objectives.max(axis=0).tolist()
 
-        # Compute hypervolume (simplified 2D)
-        if n_obj == 2:
-            metrics.hypervolume = self._compute_2d_hypervolume(pareto_front)
+        # Compute hypervolume
+        if objectives.shape[1] >= 2:
+            metrics.hypervolume = hypervolume(objectives, default_reference_point(objectives))
 
         # Compute spread
-        metrics.spread = self._compute_spread(pareto_front)
+        metrics.spread = self._spread(objectives)
 
         # Compute spacing
-        metrics.spacing = self._compute_spacing(pareto_front)
+        metrics.spacing = self._spacing(objectives)
 
         return metrics
 
@@ -104,34 +259,10 @@ class ParetoAnalyzer:
         if not front or self.problem.n_obj != 2:
             return 0.0
 
-        # Sort by first objective
-        sorted_front = sorted(front, key=lambda s: s.objectives[0])
-
-        # Use nadir point as reference if not provided
+        objectives = objective_matrix(front)[:, :2]
         if ref_point is None:
-            max_obj0 = max(s.objectives[0] for s in front)
-            max_obj1 = max(s.objectives[1] for s in front)
-            ref_point = [max_obj0 * 1.1, max_obj1 * 1.1]
-
-        # Compute area under staircase
-        hypervolume = 0.0
-        prev_obj0 = 0.0
-
-        for sol in sorted_front:
-            width = sol.objectives[0] - prev_obj0
-            height = ref_point[1] - sol.objectives[1]
-            if width > 0 and height > 0:
-                hypervolume += width * height
-            prev_obj0 = sol.objectives[0]
-
-        # Final rectangle to reference point
-        width = ref_point[0] - prev_obj0
-        if width > 0 and sorted_front:
-            height = ref_point[1] - sorted_front[-1].objectives[1]
-            if height > 0:
-                hypervolume += width * height
-
-        return hypervolume
+            ref_point = default_reference_point(objectives)
+        return hypervolume(objectives, ref_point)
 
     def _compute_spread(self, front: List[Solution]) -> float:
         """
@@ -141,19 +272,15 @@ class ParetoAnalyzer:
         """
         if len(front) < 2:
             return 0.0
+        return self._spread(objective_matrix(front)[:, :self.problem.n_obj])
 
-        n_obj = self.problem.n_obj
-
-        # Compute extent in each objective
-        extents = []
-        for m in range(n_obj):
-            values = [s.objectives[m] for s in front]
-            extent = max(values) - min(values)
-            extents.append(extent)
+    def _spread(self, objectives: np.ndarray) -> float:
+        if len(objectives) < 2:
+            return 0.0
 
-        # Spread is Euclidean norm of extents
-        spread = sum(e ** 2 for e in extents) ** 0.5
-        return spread
+        # Spread is Euclidean norm of the extents in each objective
+        extents = objectives.max(axis=0) - objectives.min(axis=0)
+        return float(np.sqrt(np.sum(extents ** 2)))
 
     def _compute_spacing(self, front: List[Solution]) -> float:
         """
@@ -163,29 +290,24 @@ class ParetoAnalyzer:
         """
         if len(front) < 2:
             return 0.0
+        return self._spacing(objective_matrix(front))
 
-        # Compute distances to nearest neighbor
-        distances = []
-        for i, sol in enumerate(front):
-            min_dist = float('inf')
-            for j, other in enumerate(front):
-                if i != j:
-                    dist = self._euclidean_distance(sol.objectives, other.objectives)
-                    min_dist = min(min_dist, dist)
-            if min_dist < float('inf'):
-                distances.append(min_dist)
-
-        if not distances:
+    def _spacing(self, objectives: np.ndarray) -> float:
+        n = len(objectives)
+        if n < 2:
             return 0.0
 
-        # Mean distance
-        mean_dist = sum(distances) / len(distances)
+        # Distance to nearest neighbor, in row blocks to bound memory
+        nearest = np.empty(n)
+        for start in range(0, n, _SPACING_BLOCK):
+            block = objectives[start:start + _SPACING_BLOCK]
+            dist = np.sqrt(np.sum((block[:, None, :] - objectives[None, :, :]) ** 2, axis=2))
+            rows = np.arange(len(block))
+            dist[rows, start + rows] = np.inf
+            nearest[start:start + len(block)] = dist.min(axis=1)
 
         # Standard deviation of distances
-        variance = sum((d - mean_dist) ** 2 for d in distances) / len(distances)
-        spacing = variance ** 0.5
-
-        return spacing
+        return float(np.std(nearest))
 
     def _euclidean_distance(
         self, a: List[float], b: List[float]
@@ -243,9 +243,13 @@ class OptimizationResult:
 
     # Statistics
     iterations: int = 0
-    evaluations: int = 0
+    evaluations: int = 0  # Candidates actually evaluated (memo misses)
+    cache_hits: int = 0  # Candidates answered from the memo cache
     elapsed_time_s: float = 0.0
 
+    # Surrogate screening statistics (SurrogateReport.to_dict), if used
+    surrogate_report: Optional[Dict[str, Any]] = None
+
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
@@ -270,8 +274,10 @@ class OptimizationResult:
             "statistics": {
                 "iterations": self.iterations,
                 "evaluations": self.evaluations,
+                "cache_hits": self.cache_hits,
                 "elapsed_time_s": round(self.elapsed_time_s, 2),
             },
+            "surrogate": self.surrogate_report,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
         }
@@ -10,6 +10,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
+from .evaluation import FitnessEvaluator
+from .surrogate import GaussianProcessSurrogate
 from .schema import OptimizationProblem, Solution
 
 if TYPE_CHECKING:
@@ -64,6 +66,8 @@ class SensitivityAnalyzer:
         problem: OptimizationProblem,
         base_state: "StateManager",
         validators: Optional[List[Any]] = None,
+        evaluator: Optional[FitnessEvaluator] = None,
+        surrogate: Optional[GaussianProcessSurrogate] = None,
     ):
         """
         Initialize analyzer.
@@ -72,10 +76,18 @@ class SensitivityAnalyzer:
             problem: Optimization problem definition
             base_state: Base state manager for evaluations
             validators: List of validators to run during evaluation
+            evaluator: Shared evaluator, e.g. the optimizer's (reuses its
+                backend and memo cache)
+            surrogate: Fitted surrogate for use_surrogate sweeps, e.g.
+                the optimizer's SurrogateScreen.model
         """
         self.problem = problem
         self.base_state = base_state
         self.validators = validators or []
+        self.evaluator = evaluator or FitnessEvaluator(
+            problem, base_state, self.validators, source="optimization/sensitivity",
+        )
+        self.surrogate = surrogate
 
     def analyze(
         self,
@@ -102,27 +114,28 @@ class SensitivityAnalyzer:
         # Get base objectives
         base_objectives = solution.objectives
 
+        # Perturb each variable up and down, evaluated as one batch
+        deltas = []
+        batch = []
+        for i, var in enumerate(self.problem.variables):
+            delta = (var.upper_bound - var.lower_bound) * perturbation_size
+            deltas.append(delta)
+            for sign in (1, -1):
+                perturbed_vars = solution.variables.copy()
+                perturbed_vars[i] = var.clamp(solution.variables[i] + sign * delta)
+                batch.append(perturbed_vars)
+
+        evaluated = self._evaluate_batch(batch)
+
         # Analyze each variable
         for i, var in enumerate(self.problem.variables):
             sensitivity = VariableSensitivity(
                 variable_name=var.name,
                 state_path=var.state_path,
             )
-
-            # Compute perturbation
-            delta = (var.upper_bound - var.lower_bound) * perturbation_size
-
-            # Perturb up
-            perturbed_vars = solution.variables.copy()
-            perturbed_vars[i] = var.clamp(solution.variables[i] + delta)
-
-            obj_plus = self._evaluate_objectives(perturbed_vars)
-
-            # Perturb down
-            perturbed_vars = solution.variables.copy()
-            perturbed_vars[i] = var.clamp(solution.variables[i] - delta)
-
-            obj_minus = self._evaluate_objectives(perturbed_vars)
+            delta = deltas[i]
+            obj_plus = evaluated[2 * i]
+            obj_minus = evaluated[2 * i + 1]
 
             # Central difference for each objective
             for j, obj in enumerate(self.problem.objectives):
@@ -143,35 +156,24 @@ class SensitivityAnalyzer:
         self, variables: List[float]
     ) -> Optional[List[float]]:
         """Evaluate objectives for given variable values."""
-        try:
-            # Create state copy
-            if hasattr(self.base_state, 'clone'):
-                state = self.base_state.clone()
-            else:
-                state = self.base_state
-
-            # Apply variables - Hole #7 Fix: Use .set() with proper source
-            source = "optimization/sensitivity"
-            for i, var in enumerate(self.problem.variables):
-                state.set(var.state_path, variables[i], source)
-
-            # Run validators
-            for validator in self.validators:
-                try:
-                    validator.validate(state, {})
-                except Exception:
-                    return None
-
-            # Evaluate objectives
-            objectives = []
-            for obj in self.problem.objectives:
-                value = obj.evaluate(state)
-                objectives.append(value)
-
-            return objectives
-
-        except Exception:
-            return None
+        outcome = self.evaluator.evaluate(variables)
+        return None if outcome.failed else list(outcome.objectives)
+
+    def _evaluate_batch(
+        self, batch: List[List[float]], use_surrogate: bool = False,
+    ) -> List[Optional[List[float]]]:
+        """Evaluate objectives for several variable vectors."""
+        if use_surrogate:
+            if self.surrogate is None or not self.surrogate.is_fitted:
+                raise ValueError("use_surrogate requires a fitted surrogate")
+            if not batch:
+                return []
+            mean, _ = self.surrogate.predict(batch)
+            return mean[:, :self.problem.n_obj].tolist()
+        return [
+            None if outcome.failed else list(outcome.objectives)
+            for outcome in self.evaluator.evaluate_many(batch)
+        ]
 
     def _compute_importance(self, result: SensitivityResult) -> None:
         """Compute relative importance of each variable."""
@@ -195,6 +197,7 @@ class SensitivityAnalyzer:
         solution: Solution,
         n_samples: int = 20,
         region_size: float = 0.1,
+        use_surrogate: bool = False,
     ) -> Dict[str, Any]:
         """
         Analyze local region around a solution.
@@ -205,6 +208,8 @@ class SensitivityAnalyzer:
             solution: Center solution
             n_samples: Number of samples
             region_size: Size of region relative to bounds
+            use_surrogate: Estimate objectives with the surrogate instead
+                of running the validators (dense sampling at low cost)
 
         Returns:
             Dict with local region statistics
@@ -212,6 +217,7 @@ class SensitivityAnalyzer:
         import random
 
         samples = []
+        points = []
 
         for _ in range(n_samples):
             # Generate random point in region
@@ -221,8 +227,9 @@ class SensitivityAnalyzer:
                 value = solution.variables[i] + random.uniform(-delta, delta)
                 value = var.clamp(value)
                 vars_sample.append(value)
+            points.append(vars_sample)
 
-            objectives = self._evaluate_objectives(vars_sample)
+        for vars_sample, objectives in zip(points, self._evaluate_batch(points, use_surrogate)):
             if objectives:
                 samples.append({
                     "variables": vars_sample,
@@ -263,6 +270,7 @@ class SensitivityAnalyzer:
         solution: Solution,
         variable_index: int,
         n_points: int = 20,
+        use_surrogate: bool = False,
     ) -> Dict[str, Any]:
         """
         Get trade-off curve varying one variable.
@@ -271,13 +279,16 @@ class SensitivityAnalyzer:
             solution: Base solution
             variable_index: Index of variable to vary
             n_points: Number of points on curve
+            use_surrogate: Estimate objectives with the surrogate instead
+                of running the validators
 
         Returns:
             Dict with curve data
         """
         var = self.problem.variables[variable_index]
 
-        curve_points = []
+        values = []
+        batch = []
         for i in range(n_points):
             # Interpolate between bounds
             t = i / (n_points - 1)
@@ -286,8 +297,11 @@ class SensitivityAnalyzer:
             # Create perturbed solution
             vars_perturbed = solution.variables.copy()
             vars_perturbed[variable_index] = value
+            values.append(value)
+            batch.append(vars_perturbed)
 
-            objectives = self._evaluate_objectives(vars_perturbed)
+        curve_points = []
+        for value, objectives in zip(values, self._evaluate_batch(batch, use_surrogate)):
             if objectives:
                 curve_points.append({
                     "variable_value": round(value, 6),
@@ -0,0 +1,441 @@
+"""
+optimization/surrogate.py - Surrogate-model screening.
+
+BRAVO OWNS THIS FILE.
+
+Module 13 v1.1 - Gaussian-process surrogate for cheap objective estimates.
+
+The surrogate is trained on truly evaluated solutions and used to
+pre-screen offspring: only candidates that look promising (their
+optimistic estimate is not dominated by the current population) or that
+the model is unsure about go through the validator chain. It can also be
+queried directly for dense sweeps in SensitivityAnalyzer.
+"""
+
+from __future__ import annotations
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .dominance import dominance_matrix, non_dominated_ranks
+from .evaluation import PENALTY
+from .schema import OptimizationProblem, Solution
+
+
+class GaussianProcessSurrogate:
+    """
+    Multi-output Gaussian-process regressor (squared-exponential kernel).
+
+    Inputs are scaled to the unit box given by the variable bounds and each
+    output is standardized and modeled independently, with a length scale
+    picked from LENGTH_SCALES by log marginal likelihood at each fit.
+    """
+
+    LENGTH_SCALES = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6)  # In unit-box coordinates
+    DEFAULT_NOISE = 1e-6
+
+    def __init__(
+        self,
+        lower_bounds: Sequence[float],
+        upper_bounds: Sequence[float],
+        noise: float = DEFAULT_NOISE,
+    ):
+        """
+        Initialize surrogate.
+
+        Args:
+            lower_bounds: Lower bound of each input variable
+            upper_bounds: Upper bound of each input variable
+            noise: Kernel diagonal regularization (standardized units)
+        """
+        self._lower = np.asarray(lower_bounds, dtype=float)
+        span = np.asarray(upper_bounds, dtype=float) - self._lower
+        self._span = np.where(span > 0, span, 1.0)
+        self.noise = noise
+
+        self.length_scales: List[float] = []
+        self._x: Optional[np.ndarray] = None
+        self._alphas: List[np.ndarray] = []
+        self._k_invs: List[np.ndarray] = []
+        self._y_mean: Optional[np.ndarray] = None
+        self._y_scale: Optional[np.ndarray] = None
+
+    @classmethod
+    def for_problem(cls, problem: OptimizationProblem, **kwargs: Any) -> "GaussianProcessSurrogate":
+        """Create a surrogate over the problem's design variables."""
+        return cls(
+            [v.lower_bound for v in problem.variables],
+            [v.upper_bound for v in problem.variables],
+            **kwargs,
+        )
+
+    @property
+    def is_fitted(self) -> bool:
+        return self._x is not None
+
+    @property
+    def n_samples(self) -> int:
+        return 0 if self._x is None else len(self._x)
+
+    @property
+    def output_scale(self) -> np.ndarray:
+        """Standard deviation of each training output."""
+        return self._y_scale
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Fit to training samples.
+
+        Args:
+            x: (n, n_var) inputs
+            y: (n, n_out) outputs
+        """
+        x = self._scale(np.asarray(x, dtype=float))
+        y = np.asarray(y, dtype=float)
+        if y.ndim == 1:
+            y = y[:, None]
+
+        self._y_mean = y.mean(axis=0)
+        scale = y.std(axis=0)
+        self._y_scale = np.where(scale > 0, scale, 1.0)
+        ys = (y - self._y_mean) / self._y_scale
+
+        sq_dist = _squared_distances(x, x)
+        factors = []
+        for length_scale in self.LENGTH_SCALES:
+            chol = self._cholesky(np.exp(-sq_dist / (2.0 * length_scale ** 2)))
+            if chol is not None:
+                factors.append((length_scale, chol, _cho_solve(chol, ys)))
+        if not factors:
+            raise np.linalg.LinAlgError("surrogate kernel matrix is not positive definite")
+
+        length_scales, alphas, k_invs = [], [], []
+        for j in range(ys.shape[1]):
+            # Log marginal likelihood of output j (constant dropped)
+            length_scale, chol, alpha = max(
+                factors,
+                key=lambda f: -0.5 * ys[:, j] @ f[2][:, j] - np.sum(np.log(np.diag(f[1]))),
+            )
+            chol_inv = np.linalg.inv(chol)
+            length_scales.append(length_scale)
+            alphas.append(alpha[:, j])
+            k_invs.append(chol_inv.T @ chol_inv)
+
+        self.length_scales = length_scales
+        self._alphas = alphas
+        self._k_invs = k_invs
+        self._x = x
+
+    def predict(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict outputs.
+
+        Args:
+            x: (n, n_var) inputs
+
+        Returns:
+            Tuple of (mean, std), each (n, n_out)
+        """
+        if not self.is_fitted:
+            raise RuntimeError("surrogate has not been fitted")
+        xq = self._scale(np.atleast_2d(np.asarray(x, dtype=float)))
+        sq_dist = _squared_distances(xq, self._x)
+
+        n_out = len(self._alphas)
+        mean = np.empty((len(xq), n_out))
+        var = np.empty((len(xq), n_out))
+        kernels: Dict[float, np.ndarray] = {}
+        for j in range(n_out):
+            length_scale = self.length_scales[j]
+            k = kernels.get(length_scale)
+            if k is None:
+                k = kernels[length_scale] = np.exp(-sq_dist / (2.0 * length_scale ** 2))
+            mean[:, j] = k @ self._alphas[j]
+            var[:, j] = 1.0 - np.sum((k @ self._k_invs[j]) * k, axis=1)
+
+        mean = mean * self._y_scale + self._y_mean
+        std = np.sqrt(np.clip(var, 0.0, None)) * self._y_scale
+        return mean, std
+
+    def _scale(self, x: np.ndarray) -> np.ndarray:
+        return (x - self._lower) / self._span
+
+    def _cholesky(self, kernel: np.ndarray) -> Optional[np.ndarray]:
+        """Cholesky factor, raising the diagonal jitter until it succeeds."""
+        diag = np.arange(len(kernel))
+        jitter = self.noise
+        for _ in range(5):
+            kernel[diag, diag] = 1.0 + jitter
+            try:
+                return np.linalg.cholesky(kernel)
+            except np.linalg.LinAlgError:
+                jitter *= 100.0
+        return None
+
+
+def _squared_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    sq = np.sum(a ** 2, axis=1)[:, None] + np.sum(b ** 2, axis=1)[None, :] - 2.0 * a @ b.T
+    return np.clip(sq, 0.0, None)
+
+
+def _cho_solve(chol: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    return np.linalg.solve(chol.T, np.linalg.solve(chol, rhs))
+
+
+@dataclass
+class SurrogateReport:
+    """Screening statistics and surrogate accuracy on true evaluations."""
+    n_screened: int = 0          # Offspring that went through screening
+    n_skipped: int = 0           # Offspring discarded without evaluation
+    n_retrains: int = 0
+    n_samples: int = 0           # Training samples at last fit
+    length_scales: List[float] = field(default_factory=list)
+
+    # Per objective, over screened candidates that were then evaluated
+    objective_names: List[str] = field(default_factory=list)
+    n_compared: int = 0
+    mae: List[float] = field(default_factory=list)
+    rmse: List[float] = field(default_factory=list)
+    r2: List[float] = field(default_factory=list)
+
+    @property
+    def skip_rate(self) -> float:
+        return self.n_skipped / self.n_screened if self.n_screened else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n_screened": self.n_screened,
+            "n_skipped": self.n_skipped,
+            "skip_rate": round(self.skip_rate, 4),
+            "n_retrains": self.n_retrains,
+            "n_samples": self.n_samples,
+            "length_scales": self.length_scales,
+            "n_compared": self.n_compared,
+            "objectives": {
+                name: {
+                    "mae": round(self.mae[j], 6),
+                    "rmse": round(self.rmse[j], 6),
+                    "r2": round(self.r2[j], 4),
+                }
+                for j, name in enumerate(self.objective_names)
+                if j < len(self.mae)
+            },
+        }
+
+
+class SurrogateScreen:
+    """
+    Offspring pre-screening for DesignOptimizer.
+
+    The model predicts every objective plus the constraint violation. Once
+    it is trained, the optimizer breeds oversample offspring batches per
+    generation and the screen picks which to evaluate: a candidate is
+    evaluated if its lower confidence bound (mean - kappa*std) is feasible
+    and not dominated by the population, or if its normalized uncertainty
+    exceeds uncertainty_threshold. Selections are capped at the evaluation
+    budget (evaluations_per_generation, by default DEFAULT_BUDGET_FRACTION
+    of the population size) and topped up to min_evaluate_fraction of it,
+    best estimates first; every other candidate is discarded unevaluated.
+
+    Usage:
+        screen = SurrogateScreen(problem)
+        optimizer = DesignOptimizer(problem, state, validators, surrogate=screen)
+        result = optimizer.optimize()
+        result.surrogate_report
+    """
+
+    DEFAULT_BUDGET_FRACTION = 0.25  # Of the population size
+
+    def __init__(
+        self,
+        problem: OptimizationProblem,
+        min_samples: Optional[int] = None,
+        retrain_interval: int = 5,
+        max_samples: int = 400,
+        kappa: float = 1.0,
+        uncertainty_threshold: float = 0.25,
+        min_evaluate_fraction: float = 0.25,
+        oversample: int = 3,
+        evaluations_per_generation: Optional[int] = None,
+    ):
+        """
+        Initialize screen.
+
+        Args:
+            problem: Optimization problem definition
+            min_samples: Evaluations before screening starts (default: 5 per variable + 5)
+            retrain_interval: Generations between refits
+            max_samples: Most recent evaluations kept for training
+            kappa: Confidence-bound multiplier on the predicted std
+            uncertainty_threshold: Mean std, in output standard deviations, above
+                which a candidate is evaluated regardless of its estimate
+            min_evaluate_fraction: Share of the evaluation limit always evaluated
+            oversample: Offspring batches bred per generation for screening
+            evaluations_per_generation: True evaluations per generation once
+                screening is active (default: DEFAULT_BUDGET_FRACTION of the
+                population size)
+        """
+        self.problem = problem
+        self.min_samples = min_samples or 5 * (problem.n_var + 1)
+        self.retrain_interval = max(1, retrain_interval)
+        self.kappa = kappa
+        self.uncertainty_threshold = uncertainty_threshold
+        self.min_evaluate_fraction = min_evaluate_fraction
+        self.oversample = max(1, oversample)
+        self.evaluations_per_generation = evaluations_per_generation
+
+        self.model = GaussianProcessSurrogate.for_problem(problem)
+        self._samples: Deque[Tuple[List[float], List[float]]] = deque(maxlen=max_samples)
+        self._new_samples = 0
+        self._last_fit_generation: Optional[int] = None
+        self._pending: Dict[int, np.ndarray] = {}
+        self._predicted: List[np.ndarray] = []
+        self._actual: List[List[float]] = []
+        self._report = SurrogateReport(objective_names=[o.name for o in problem.objectives])
+
+    def reset(self) -> None:
+        """Forget training data and statistics (start of a new run)."""
+        self._samples.clear()
+        self._new_samples = 0
+        self._last_fit_generation = None
+        self._pending.clear()
+        self._predicted.clear()
+        self._actual.clear()
+        self.model = GaussianProcessSurrogate.for_problem(self.problem)
+        self._report = SurrogateReport(objective_names=[o.name for o in self.problem.objectives])
+
+    def observe(self, solutions: Sequence[Solution]) -> None:
+        """Record truly evaluated solutions (training data and accuracy)."""
+        for sol in solutions:
+            predicted = self._pending.pop(id(sol), None)
+            if sol.constraint_violation >= PENALTY:
+                continue  # Failed evaluation: no usable target
+            if predicted is not None:
+                self._predicted.append(predicted)
+                self._actual.append(list(sol.objectives))
+            self._samples.append(
+                (list(sol.variables), list(sol.objectives) + [sol.constraint_violation])
+            )
+            self._new_samples += 1
+
+    def maybe_retrain(self, generation: int) -> bool:
+        """Refit if enough samples exist and the retrain interval has passed."""
+        if len(self._samples) < self.min_samples or not self._new_samples:
+            return False
+        if (
+            self._last_fit_generation is not None
+            and generation - self._last_fit_generation < self.retrain_interval
+        ):
+            return False
+        self.retrain()
+        self._last_fit_generation = generation
+        return True
+
+    def retrain(self) -> None:
+        """Refit the model on the current training samples."""
+        x = np.asarray([s[0] for s in self._samples], dtype=float)
+        y = np.asarray([s[1] for s in self._samples], dtype=float)
+        try:
+            self.model.fit(x, y)
+        except np.linalg.LinAlgError:
+            return
+        self._new_samples = 0
+        self._report.n_retrains += 1
+        self._report.n_samples = self.model.n_samples
+        self._report.length_scales = list(self.model.length_scales)
+
+    def evaluation_budget(self, population_size: int) -> int:
+        """Most offspring truly evaluated per screened generation."""
+        if self.evaluations_per_generation is not None:
+            return max(1, self.evaluations_per_generation)
+        return max(1, math.ceil(self.DEFAULT_BUDGET_FRACTION * population_size))
+
+    @property
+    def is_active(self) -> bool:
+        """True once the model is trained and screening applies."""
+        return self.model.is_fitted
+
+    def screen(
+        self,
+        candidates: List[Solution],
+        population: Sequence[Solution],
+        limit: Optional[int] = None,
+    ) -> List[Solution]:
+        """
+        Select the candidates worth a true evaluation.
+
+        Args:
+            candidates: Unevaluated offspring
+            population: Current (evaluated) population
+            limit: Maximum candidates selected (default: no cap)
+
+        Returns:
+            Candidates to evaluate, in their original order
+        """
+        if not candidates or not self.model.is_fitted:
+            return candidates
+
+        n_obj = self.problem.n_obj
+        mean, std = self.model.predict([c.variables for c in candidates])
+        bound = mean - self.kappa * std
+
+        # Promising: optimistic estimate feasible and not dominated
+        promising = bound[:, n_obj] <= 0.0
+        reference = np.asarray(
+            [p.objectives for p in population if p.is_feasible], dtype=float,
+        ).reshape(-1, n_obj)
+        if len(reference):
+            promising &= ~dominance_matrix(reference, bound[:, :n_obj]).any(axis=0)
+
+        uncertainty = np.mean(std / self.model.output_scale, axis=1)
+        selected = promising | (uncertainty > self.uncertainty_threshold)
+
+        # Priority: front of the optimistic estimate among the population's
+        # true objectives, then the most uncertain
+        n = len(candidates)
+        limit = n if limit is None else min(limit, n)
+        minimum = min(limit, math.ceil(self.min_evaluate_fraction * limit))
+        if selected.sum() > limit or selected.sum() < minimum:
+            ranks = non_dominated_ranks(
+                np.vstack([bound[:, :n_obj], reference]),
+                np.r_[bound[:, n_obj] <= 0.0, np.ones(len(reference), dtype=bool)],
+            )[:n]
+            priority = np.lexsort((-uncertainty, ranks))
+            if selected.sum() > limit:
+                keep = priority[selected[priority]][:limit]
+                selected[:] = False
+                selected[keep] = True
+            else:
+                for i in priority:
+                    if selected.sum() >= minimum:
+                        break
+                    selected[i] = True
+
+        chosen = []
+        for i, candidate in enumerate(candidates):
+            if selected[i]:
+                self._pending[id(candidate)] = mean[i, :n_obj]
+                chosen.append(candidate)
+
+        self._report.n_screened += len(candidates)
+        self._report.n_skipped += len(candidates) - len(chosen)
+        return chosen
+
+    def report(self) -> SurrogateReport:
+        """Screening statistics and prediction error against true objectives."""
+        report = self._report
+        report.n_compared = len(self._actual)
+        if self._actual:
+            predicted = np.asarray(self._predicted)
+            actual = np.asarray(self._actual)
+            error = predicted - actual
+            report.mae = np.mean(np.abs(error), axis=0).tolist()
+            report.rmse = np.sqrt(np.mean(error ** 2, axis=0)).tolist()
+            total = np.sum((actual - actual.mean(axis=0)) ** 2, axis=0)
+            residual = np.sum(error ** 2, axis=0)
+            explained = 1.0 - residual / np.where(total > 0, total, 1.0)
+            report.r2 = np.where(total > 0, explained, 0.0).tolist()
+        return report
@@ -3,6 +3,7 @@ magnet/routing/graph/__init__.py - Graph Package Exports
 
 Graph construction for systems routing including:
 - CompartmentGraph: Adjacency graph from interior spaces
+- SpatialIndex: Broadphase over space bounding boxes
 - NodeGraph: Node-to-node routing graph
 - Graph utilities for pathfinding
 """
@@ -13,6 +14,10 @@ from .compartment_graph import (
     CompartmentEdge,
 )
 
+from .spatial_index import (
+    SpatialIndex,
+)
+
 from .node_graph import (
     NodeGraph,
 )
@@ -38,6 +43,8 @@ __all__ = [
     'CompartmentGraph',
     'CompartmentNode',
     'CompartmentEdge',
+    # spatial_index
+    'SpatialIndex',
     # node_graph
     'NodeGraph',
 ]
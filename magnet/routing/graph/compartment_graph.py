@@ -18,6 +18,8 @@ try:
 except ImportError:
     nx = None  # Handle gracefully in code
 
+from .spatial_index import SpatialIndex, Bounds
+
 __all__ = ['CompartmentGraph', 'CompartmentNode', 'CompartmentEdge', 'SpaceProvider']
 
 logger = logging.getLogger(__name__)
@@ -173,6 +175,8 @@ class CompartmentGraph:
         self._graph: Optional[nx.Graph] = None
         self._nodes: Dict[str, CompartmentNode] = {}
         self._edges: Dict[Tuple[str, str], CompartmentEdge] = {}
+        self._space_index: Optional[SpatialIndex] = None
+        self._spaces: Dict[str, Any] = {}
 
     # =========================================================================
     # Properties
@@ -195,6 +199,11 @@ class CompartmentGraph:
         """Number of edges in graph."""
         return self._graph.number_of_edges() if self._graph else 0
 
+    @property
+    def space_index(self) -> Optional[SpatialIndex]:
+        """Spatial index of space bounds from the last build (keyed by space ID)."""
+        return self._space_index
+
     def get_node(self, space_id: str) -> Optional[CompartmentNode]:
         """Get node data by space ID."""
         return self._nodes.get(space_id)
@@ -235,6 +244,8 @@ class CompartmentGraph:
         self._graph = nx.Graph()
         self._nodes.clear()
         self._edges.clear()
+        self._spaces = {self._get_space_id(space): space for space in spaces.values()}
+        self._space_index = self._build_space_index(self._spaces)
 
         zone_boundaries = zone_boundaries or {}
         watertight_boundaries = watertight_boundaries or set()
@@ -403,36 +414,58 @@ class CompartmentGraph:
             watertight_boundary=is_wt_boundary,
         )
 
+    def _build_space_index(self, spaces: Dict[str, Any]) -> SpatialIndex:
+        """Index the bounds of every space that has them, by space ID."""
+        # Padding by the full tolerance keeps every within-tolerance pair as a candidate
+        index = SpatialIndex(padding=self._tolerance)
+        boxes: Dict[str, Bounds] = {}
+        for space_id, space in spaces.items():
+            bounds = self._get_bounds(space)
+            if bounds:
+                boxes[space_id] = bounds
+        index.build(boxes)
+        return index
+
     def _detect_adjacencies(
         self,
         spaces: Dict[str, Any],
         space_to_zone: Dict[str, str],
         watertight_boundaries: Set[Tuple[str, str]],
     ) -> None:
-        """Detect adjacencies not already in explicit connections."""
-        space_list = list(spaces.values())
-
-        for i, space_a in enumerate(space_list):
-            for space_b in space_list[i + 1:]:
-                id_a = self._get_space_id(space_a)
-                id_b = self._get_space_id(space_b)
-
-                # Skip if already connected
-                if self._graph.has_edge(id_a, id_b):
-                    continue
+        """
+        Detect adjacencies not already in explicit connections.
 
-                # Check if spaces are adjacent based on geometry
-                if self._are_adjacent(space_a, space_b):
-                    self._add_edge_from_connection(
-                        space_a, space_b,
-                        space_to_zone, watertight_boundaries
-                    )
+        Only pairs reported by the spatial index broadphase are tested.
+        Adjacent spaces overlap within tolerance on all three axes, so the
+        index never drops a pair the exact test would accept.
+        """
+        if self._space_index is None:
+            self._spaces = {self._get_space_id(space): space for space in spaces.values()}
+            self._space_index = self._build_space_index(self._spaces)
+        index = self._space_index
+
+        for id_a, id_b in index.candidate_pairs():
+            # Skip if already connected
+            if self._graph.has_edge(id_a, id_b):
+                continue
+
+            # Check if spaces are adjacent based on geometry
+            if self._bounds_adjacent(index.get_bounds(id_a), index.get_bounds(id_b)):
+                self._add_edge_from_connection(
+                    self._spaces[id_a], self._spaces[id_b],
+                    space_to_zone, watertight_boundaries
+                )
 
     def _are_adjacent(self, space_a: Any, space_b: Any) -> bool:
         """Check if two spaces are geometrically adjacent."""
-        bounds_a = self._get_bounds(space_a)
-        bounds_b = self._get_bounds(space_b)
+        return self._bounds_adjacent(self._get_bounds(space_a), self._get_bounds(space_b))
 
+    def _bounds_adjacent(
+        self,
+        bounds_a: Optional[Bounds],
+        bounds_b: Optional[Bounds],
+    ) -> bool:
+        """Check if two bounding boxes are adjacent within tolerance."""
         if not bounds_a or not bounds_b:
             return False
 
@@ -600,6 +633,25 @@ class CompartmentGraph:
             return []
         return list(self._graph.neighbors(space_id))
 
+    def get_spaces_at(
+        self,
+        point: Tuple[float, float, float],
+        tolerance: float = 0.0,
+    ) -> List[str]:
+        """
+        Find spaces whose bounding box contains a point.
+
+        Args:
+            point: (x, y, z) location, e.g. an equipment position
+            tolerance: Allowed distance outside a space's bounds
+
+        Returns:
+            Space IDs containing the point, in build order
+        """
+        if self._space_index is None:
+            return []
+        return self._space_index.query_point(point, tolerance)
+
     def get_shortest_path(
         self,
         from_space: str,
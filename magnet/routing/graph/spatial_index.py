@@ -0,0 +1,223 @@
+"""
+magnet/routing/graph/spatial_index.py - Spatial Index for Space Bounds
+
+Uniform-grid broadphase over axis-aligned space bounding boxes.
+
+Used by CompartmentGraph to find candidate adjacent space pairs without
+testing every pair, and kept on the graph builder for later space lookups
+(e.g. point-in-space for equipment placement).
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+import math
+
+__all__ = ['SpatialIndex', 'Bounds']
+
+Point = Tuple[float, float, float]
+Bounds = Tuple[Point, Point]  # (min (x, y, z), max (x, y, z))
+Cell = Tuple[int, int, int]
+
+
+class SpatialIndex:
+    """
+    Uniform-grid index of axis-aligned bounding boxes.
+
+    Each box is registered in every grid cell its padded extent touches.
+    Boxes whose padded extents overlap therefore share at least one cell,
+    so candidate_pairs() only has to look inside cells.
+
+    Usage:
+        index = SpatialIndex(padding=0.5)
+        index.build({'er': ((0, 0, 0), (10, 8, 4)), 'aux': ((10, 0, 0), (15, 8, 4))})
+        index.candidate_pairs()            # [('er', 'aux')]
+        index.query_point((5.0, 4.0, 2.0))  # ['er']
+    """
+
+    def __init__(
+        self,
+        cell_size: Optional[float] = None,
+        padding: float = 0.0,
+    ):
+        """
+        Initialize spatial index.
+
+        Args:
+            cell_size: Grid cell edge length (m). Defaults to the median
+                largest box extent when the index is built.
+            padding: Distance each box is grown by when registered, so boxes
+                within this gap of each other are reported as candidates
+        """
+        self._cell_size = cell_size
+        self._padding = padding
+
+        self._keys: List[Hashable] = []
+        self._order: Dict[Hashable, int] = {}
+        self._bounds: List[Bounds] = []
+        self._cells: Dict[Cell, List[int]] = {}
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def cell_size(self) -> Optional[float]:
+        """Grid cell edge length (None until built)."""
+        return self._cell_size
+
+    @property
+    def padding(self) -> float:
+        """Padding applied to every registered box."""
+        return self._padding
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._order
+
+    def keys(self) -> List[Hashable]:
+        """Indexed keys in insertion order."""
+        return list(self._keys)
+
+    def get_bounds(self, key: Hashable) -> Optional[Bounds]:
+        """Get the (unpadded) bounds registered for a key."""
+        i = self._order.get(key)
+        return self._bounds[i] if i is not None else None
+
+    # =========================================================================
+    # Build
+    # =========================================================================
+
+    def build(self, boxes: Dict[Hashable, Bounds]) -> None:
+        """
+        Replace the index contents with the given boxes.
+
+        Args:
+            boxes: key -> (min, max) bounds; insertion order is preserved
+        """
+        self.clear()
+
+        if self._cell_size is None:
+            self._cell_size = self._auto_cell_size(boxes.values())
+
+        for key, bounds in boxes.items():
+            self.insert(key, bounds)
+
+    def insert(self, key: Hashable, bounds: Bounds) -> None:
+        """Add a box to the index."""
+        if key in self._order:
+            raise ValueError(f"Key already indexed: {key!r}")
+        if self._cell_size is None:
+            self._cell_size = self._auto_cell_size([bounds])
+
+        min_pt, max_pt = bounds
+        bounds = (tuple(min_pt), tuple(max_pt))
+
+        i = len(self._keys)
+        self._keys.append(key)
+        self._order[key] = i
+        self._bounds.append(bounds)
+
+        for cell in self._cells_for(bounds[0], bounds[1], self._padding):
+            self._cells.setdefault(cell, []).append(i)
+
+    def clear(self) -> None:
+        """Remove all boxes (the cell size is kept)."""
+        self._keys.clear()
+        self._order.clear()
+        self._bounds.clear()
+        self._cells.clear()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def candidate_pairs(self) -> List[Tuple[Hashable, Hashable]]:
+        """
+        Get pairs of boxes whose padded extents share a grid cell.
+
+        This is a superset of the pairs within 2 * padding of each other in
+        every axis. Pairs are ordered by insertion order, (earlier, later).
+        """
+        pairs: Set[Tuple[int, int]] = set()
+        for members in self._cells.values():
+            if len(members) < 2:
+                continue
+            for a in range(len(members)):
+                i = members[a]
+                for j in members[a + 1:]:
+                    pairs.add((i, j))
+
+        keys = self._keys
+        return [(keys[i], keys[j]) for i, j in sorted(pairs)]
+
+    def query_box(
+        self,
+        min_pt: Point,
+        max_pt: Point,
+        tolerance: float = 0.0,
+    ) -> List[Hashable]:
+        """
+        Get keys whose bounds overlap a box, within tolerance.
+
+        Args:
+            min_pt: Query box minimum (x, y, z)
+            max_pt: Query box maximum (x, y, z)
+            tolerance: Allowed gap between the query box and a match
+
+        Returns:
+            Matching keys in insertion order
+        """
+        if not self._keys:
+            return []
+
+        seen: Set[int] = set()
+        for cell in self._cells_for(min_pt, max_pt, tolerance):
+            seen.update(self._cells.get(cell, ()))
+
+        return [
+            self._keys[i] for i in sorted(seen)
+            if _boxes_overlap(self._bounds[i], (min_pt, max_pt), tolerance)
+        ]
+
+    def query_point(self, point: Point, tolerance: float = 0.0) -> List[Hashable]:
+        """Get keys whose bounds contain a point, within tolerance."""
+        return self.query_box(point, point, tolerance)
+
+    # =========================================================================
+    # Grid Helpers
+    # =========================================================================
+
+    def _cells_for(
+        self,
+        min_pt: Iterable[float],
+        max_pt: Iterable[float],
+        padding: float,
+    ) -> List[Cell]:
+        """Grid cells touched by a box grown by padding."""
+        size = self._cell_size
+        ranges = [
+            range(math.floor((lo - padding) / size), math.floor((hi + padding) / size) + 1)
+            for lo, hi in zip(min_pt, max_pt)
+        ]
+        return [(x, y, z) for x in ranges[0] for y in ranges[1] for z in ranges[2]]
+
+    def _auto_cell_size(self, boxes: Iterable[Bounds]) -> float:
+        """Median of each box's largest extent (padding included)."""
+        extents = sorted(
+            max(hi - lo for lo, hi in zip(min_pt, max_pt)) + 2 * self._padding
+            for min_pt, max_pt in boxes
+        )
+        if not extents:
+            return 1.0
+        median = extents[len(extents) // 2]
+        return median if median > 0 else 1.0
+
+
+def _boxes_overlap(a: Bounds, b: Bounds, tolerance: float) -> bool:
+    """Check two boxes overlap in every axis, allowing a gap of tolerance."""
+    (min_a, max_a), (min_b, max_b) = a, b
+    return all(
+        min_a[k] - tolerance <= max_b[k] and max_a[k] + tolerance >= min_b[k]
+        for k in range(3)
+    )
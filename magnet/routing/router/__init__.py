@@ -24,6 +24,8 @@ try:
         SteinerRouter,
         SteinerResult,
         SteinerNode,
+        MetricClosure,
+        mark_graph_changed,
     )
     _HAS_ALPHA = True
 except ImportError:
@@ -39,6 +41,8 @@ except ImportError:
     SteinerRouter = None
     SteinerResult = None
     SteinerNode = None
+    MetricClosure = None
+    mark_graph_changed = None
 
 # BRAVO exports
 from magnet.routing.router.redundancy import (
@@ -79,6 +83,8 @@ __all__ = [
     'SteinerRouter',
     'SteinerResult',
     'SteinerNode',
+    'MetricClosure',
+    'mark_graph_changed',
     # BRAVO - Redundancy
     'RedundancyChecker',
     'RedundancyResult',
@@ -3,13 +3,20 @@ magnet/routing/router/steiner_router.py - Steiner Tree Router
 
 Enhanced routing using Steiner tree algorithms for optimal
 multi-source routing with shared path segments.
+
+The terminal metric closure is built with one early-exit Dijkstra per
+terminal and cached per (edge-cost digest, terminal set), so repeated
+routing over the same compartment graph reuses it.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Set, Any
+from itertools import count
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Set, Any
 from datetime import datetime
 import logging
 import heapq
+import weakref
 
 try:
     import networkx as nx
@@ -21,7 +28,7 @@ from ..schema.system_node import SystemNode, NodeType
 from ..schema.trunk_segment import TrunkSegment, generate_trunk_id
 from ..schema.system_topology import SystemTopology, TopologyStatus
 
-__all__ = ['SteinerRouter', 'SteinerResult', 'SteinerNode']
+__all__ = ['SteinerRouter', 'SteinerResult', 'SteinerNode', 'MetricClosure']
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +62,151 @@ class SteinerResult:
     warnings: List[str] = field(default_factory=list)
 
 
+# =========================================================================
+# Metric Closure
+# =========================================================================
+
+def _multi_target_dijkstra(
+    graph: 'nx.Graph',
+    source: str,
+    targets: Iterable[str],
+    weight: str = 'cost',
+) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """
+    Dijkstra from source that stops once every target is settled.
+
+    Edge weights default to 1 when the attribute is missing, as in networkx.
+
+    Returns:
+        (distances, predecessors) for all settled nodes
+    """
+    remaining = set(targets)
+
+    dist: Dict[str, float] = {}
+    pred: Dict[str, str] = {}
+    seen: Dict[str, float] = {source: 0.0}
+    tie = count()
+    heap = [(0.0, next(tie), source)]
+    adj = graph.adj
+
+    while heap and remaining:
+        d, _, node = heapq.heappop(heap)
+        if node in dist:
+            continue
+        dist[node] = d
+        remaining.discard(node)
+
+        for neighbor, data in adj[node].items():
+            if neighbor in dist:
+                continue
+            nd = d + data.get(weight, 1)
+            if neighbor not in seen or nd < seen[neighbor]:
+                seen[neighbor] = nd
+                pred[neighbor] = node
+                heapq.heappush(heap, (nd, next(tie), neighbor))
+
+    return dist, pred
+
+
+@dataclass
+class MetricClosure:
+    """
+    Shortest-path metric closure over a set of terminals.
+
+    Built from one multi-target Dijkstra per terminal (targets: the
+    terminals after it), keeping predecessor maps so that only the paths
+    actually used (e.g. MST edges) are expanded.
+    """
+    terminals: List[str]
+    distances: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    predecessors: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        graph: 'nx.Graph',
+        terminals: Iterable[str],
+        weight: str = 'cost',
+    ) -> 'MetricClosure':
+        """Compute the closure for the terminals present in graph."""
+        ordered = sorted(t for t in set(terminals) if t in graph)
+        closure = cls(terminals=ordered)
+
+        for i, source in enumerate(ordered[:-1]):
+            targets = ordered[i + 1:]
+            dist, pred = _multi_target_dijkstra(graph, source, targets, weight)
+            closure.predecessors[source] = pred
+            for target in targets:
+                if target in dist:
+                    closure.distances[(source, target)] = dist[target]
+
+        return closure
+
+    def distance(self, u: str, v: str) -> Optional[float]:
+        """Shortest-path cost between two terminals (None if unreachable)."""
+        if (u, v) in self.distances:
+            return self.distances[(u, v)]
+        return self.distances.get((v, u))
+
+    def path(self, u: str, v: str) -> List[str]:
+        """Expand the shortest path between two terminals, from u to v."""
+        if (u, v) in self.distances:
+            return self._walk(u, v)
+        if (v, u) in self.distances:
+            return list(reversed(self._walk(v, u)))
+        raise KeyError(f"No path between {u} and {v}")
+
+    def _walk(self, source: str, target: str) -> List[str]:
+        pred = self.predecessors[source]
+        path = [target]
+        while path[-1] != source:
+            path.append(pred[path[-1]])
+        path.reverse()
+        return path
+
+    def to_graph(self) -> 'nx.Graph':
+        """Complete terminal graph weighted by shortest-path cost."""
+        closure_graph = nx.Graph()
+        for (u, v), length in self.distances.items():
+            closure_graph.add_edge(u, v, weight=length)
+        return closure_graph
+
+
+# graph.graph attribute counting in-place changes, see mark_graph_changed()
+GRAPH_VERSION_KEY = 'version'
+
+
+def mark_graph_changed(graph: 'nx.Graph') -> None:
+    """
+    Force cached metric closures over a routing graph to be rebuilt.
+
+    Edge and cost edits are detected on their own (see _graph_version);
+    this is only needed when closures must be dropped regardless.
+    """
+    graph.graph[GRAPH_VERSION_KEY] = graph.graph.get(GRAPH_VERSION_KEY, 0) + 1
+
+
+def _graph_version(graph: 'nx.Graph', weight: str = 'cost') -> Tuple[int, int, int]:
+    """
+    Cache key for a graph's closures: node count, edge-cost digest, change counter.
+
+    The digest covers every edge's endpoints and weight, so in-place cost
+    edits and count-preserving edge swaps change the key. It is one O(E)
+    pass, against one Dijkstra per terminal to rebuild a closure.
+    """
+    return (
+        graph.number_of_nodes(),
+        hash(tuple(
+            (u, v, data.get(weight, 1)) for u, v, data in graph.edges(data=True)
+        )),
+        graph.graph.get(GRAPH_VERSION_KEY, 0),
+    )
+
+
+# =========================================================================
+# Steiner Router
+# =========================================================================
+
 class SteinerRouter:
     """
     Steiner tree-based router for optimal multi-source routing.
@@ -69,6 +221,10 @@ class SteinerRouter:
     - Hierarchical trunk sizing based on accumulated demand
     - Zone-aware routing with configurable costs
 
+    Metric closures are cached per graph object and keyed on a digest of
+    its edges and their costs, so edits made in place are picked up on
+    the next routing call.
+
     Usage:
         router = SteinerRouter()
         result = router.route_system(
@@ -85,6 +241,7 @@ class SteinerRouter:
         allow_steiner_points: bool = True,
         max_steiner_points: int = 10,
         steiner_point_cost: float = 0.5,  # Extra cost for adding Steiner point
+        closure_cache_size: int = 32,
     ):
         """
         Initialize Steiner router.
@@ -94,6 +251,7 @@ class SteinerRouter:
             allow_steiner_points: Whether to insert Steiner points
             max_steiner_points: Maximum Steiner points to add
             steiner_point_cost: Cost multiplier for Steiner points
+            closure_cache_size: Metric closures kept per graph (LRU)
         """
         if nx is None:
             raise ImportError("networkx is required for SteinerRouter")
@@ -103,6 +261,44 @@ class SteinerRouter:
         self._max_steiner = max_steiner_points
         self._steiner_cost = steiner_point_cost
 
+        # graph -> (graph version, terminal set -> MetricClosure)
+        self._closure_cache_size = closure_cache_size
+        self._closure_cache: 'weakref.WeakKeyDictionary[nx.Graph, Tuple[tuple, OrderedDict]]' = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get_metric_closure(self, graph: 'nx.Graph', terminals: Iterable[str]) -> MetricClosure:
+        """
+        Get the terminal metric closure, reusing a cached one when possible.
+
+        Cached closures are keyed by graph object and terminal set, and are
+        dropped when the graph's edges or edge costs change or
+        mark_graph_changed() is called on it.
+        """
+        key: FrozenSet[str] = frozenset(terminals)
+        version = _graph_version(graph)
+
+        entry = self._closure_cache.get(graph)
+        if entry is None or entry[0] != version:
+            entry = (version, OrderedDict())
+            self._closure_cache[graph] = entry
+        closures = entry[1]
+
+        closure = closures.get(key)
+        if closure is not None:
+            closures.move_to_end(key)
+            return closure
+
+        closure = MetricClosure.build(graph, key)
+        closures[key] = closure
+        if len(closures) > self._closure_cache_size:
+            closures.popitem(last=False)
+        return closure
+
+    def clear_closure_cache(self) -> None:
+        """Drop all cached metric closures."""
+        self._closure_cache.clear()
+
     def route_system(
         self,
         system_type: SystemType,
@@ -216,7 +412,7 @@ class SteinerRouter:
         Compute approximate Steiner tree connecting terminals.
 
         Uses the metric closure heuristic:
-        1. Compute shortest paths between all terminal pairs
+        1. Compute shortest paths between all terminal pairs (cached closure)
         2. Build MST of metric closure
         3. Expand MST edges back to actual paths
         4. Remove redundant edges
@@ -231,21 +427,8 @@ class SteinerRouter:
             Tuple of (Steiner tree graph, list of Steiner points)
         """
         # Step 1: Compute metric closure (shortest paths between all terminals)
-        metric_closure = nx.Graph()
-        terminal_list = list(terminals)
-
-        for i, t1 in enumerate(terminal_list):
-            if t1 not in graph:
-                continue
-            for t2 in terminal_list[i + 1:]:
-                if t2 not in graph:
-                    continue
-                try:
-                    path = nx.shortest_path(graph, t1, t2, weight='cost')
-                    length = nx.shortest_path_length(graph, t1, t2, weight='cost')
-                    metric_closure.add_edge(t1, t2, weight=length, path=path)
-                except nx.NetworkXNoPath:
-                    pass
+        closure = self.get_metric_closure(graph, terminals)
+        metric_closure = closure.to_graph()
 
         if metric_closure.number_of_edges() == 0:
             raise ValueError("No paths found between terminals")
@@ -255,8 +438,8 @@ class SteinerRouter:
 
         # Step 3: Expand MST edges to actual paths
         steiner_tree = nx.Graph()
-        for u, v, data in mst_closure.edges(data=True):
-            path = data.get('path', [u, v])
+        for u, v in mst_closure.edges():
+            path = closure.path(u, v)
             for i in range(len(path) - 1):
                 if not steiner_tree.has_edge(path[i], path[i + 1]):
                     # Get original edge data
@@ -482,31 +665,32 @@ class SteinerRouter:
         consumer_assignments: Dict[str, List[SystemNode]] = {s: [] for s in sources}
         source_loads: Dict[str, float] = {s: 0.0 for s in sources}
 
+        # One search per source covers every consumer space
+        consumer_spaces = {c.space_id for c in consumer_nodes if c.space_id in compartment_graph}
+        source_distances = {
+            source_id: _multi_target_dijkstra(compartment_graph, source_id, consumer_spaces)[0]
+            for source_id in sources
+            if source_id in compartment_graph
+        }
+
         for consumer in consumer_nodes:
             # Find nearest source
             best_source = None
             best_distance = float('inf')
 
             for source_id in sources:
-                if source_id not in compartment_graph:
-                    continue
-                consumer_space = consumer.space_id
-                if consumer_space not in compartment_graph:
+                distances = source_distances.get(source_id)
+                if distances is None or consumer.space_id not in distances:
                     continue
 
-                try:
-                    distance = nx.shortest_path_length(
-                        compartment_graph, source_id, consumer_space, weight='cost'
-                    )
-                    # Adjust for load balancing
-                    if load_balance:
-                        distance *= (1 + source_loads[source_id] * 0.1)
-
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_source = source_id
-                except nx.NetworkXNoPath:
-                    pass
+                distance = distances[consumer.space_id]
+                # Adjust for load balancing
+                if load_balance:
+                    distance *= (1 + source_loads[source_id] * 0.1)
+
+                if distance < best_distance:
+                    best_distance = distance
+                    best_source = source_id
 
             if best_source:
                 consumer_assignments[best_source].append(consumer)
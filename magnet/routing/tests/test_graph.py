@@ -18,6 +18,7 @@ from magnet.routing.graph.compartment_graph import (
     CompartmentEdge,
 )
 from magnet.routing.graph.node_graph import NodeGraph
+from magnet.routing.graph.spatial_index import SpatialIndex
 from magnet.routing.graph import graph_utils
 from magnet.routing.schema.system_type import SystemType
 from magnet.routing.schema.system_node import SystemNode, NodeType, generate_node_id
@@ -135,6 +136,90 @@ class TestCompartmentGraph:
         assert edge.zone_boundary is True
         assert edge.crossing_type == 'door'
 
+    @pytest.mark.skipif(not HAS_NETWORKX, reason="NetworkX not installed")
+    def test_adjacency_matches_all_pairs(self):
+        """Test indexed adjacency detection finds the same pairs as a full scan."""
+        spaces = {}
+        for deck in range(2):
+            for n in range(12):
+                x0 = (n % 4) * 4.2
+                y0 = (n // 4) * 3.1
+                space_id = f"d{deck}_s{n}"
+                spaces[space_id] = {
+                    'instance_id': space_id,
+                    'space_type': 'store',
+                    'deck_id': f"deck_{deck}",
+                    'bounds': {
+                        'min': (x0, y0, deck * 3.0),
+                        'max': (x0 + 4.0, y0 + 3.0, deck * 3.0 + 3.0),
+                    },
+                }
+
+        cg = CompartmentGraph()
+        graph = cg.build(spaces)
+
+        space_list = list(spaces.values())
+        expected = {
+            frozenset((a['instance_id'], b['instance_id']))
+            for i, a in enumerate(space_list)
+            for b in space_list[i + 1:]
+            if cg._are_adjacent(a, b)
+        }
+        assert expected
+        assert {frozenset(e) for e in graph.edges} == expected
+
+    @pytest.mark.skipif(not HAS_NETWORKX, reason="NetworkX not installed")
+    def test_get_spaces_at_point(self):
+        """Test point-in-space lookup reuses the build's spatial index."""
+        spaces = {
+            'er': {'instance_id': 'er', 'bounds': {'min': (0, 0, 0), 'max': (10, 10, 3)}},
+            'aux': {'instance_id': 'aux', 'bounds': {'min': (10, 0, 0), 'max': (20, 10, 3)}},
+        }
+        cg = CompartmentGraph()
+        cg.build(spaces)
+
+        assert cg.space_index is not None
+        assert cg.get_spaces_at((5.0, 5.0, 1.0)) == ['er']
+        assert cg.get_spaces_at((10.0, 5.0, 1.0)) == ['er', 'aux']
+        assert cg.get_spaces_at((50.0, 5.0, 1.0)) == []
+
+
+# =============================================================================
+# SpatialIndex Tests
+# =============================================================================
+
+class TestSpatialIndex:
+    """Tests for SpatialIndex broadphase."""
+
+    def test_candidate_pairs_within_padding(self):
+        """Test only boxes within padding of each other are paired."""
+        index = SpatialIndex(cell_size=1.0, padding=0.25)
+        index.build({
+            'a': ((0, 0, 0), (4, 4, 3)),
+            'b': ((4.4, 0, 0), (8, 4, 3)),
+            'c': ((20, 0, 0), (24, 4, 3)),
+        })
+
+        assert index.candidate_pairs() == [('a', 'b')]
+
+    def test_query_box_tolerance(self):
+        """Test box queries respect tolerance."""
+        index = SpatialIndex()
+        index.build({'a': ((0, 0, 0), (4, 4, 3)), 'b': ((10, 0, 0), (14, 4, 3))})
+
+        assert index.query_box((5, 1, 1), (6, 2, 2)) == []
+        assert index.query_box((5, 1, 1), (6, 2, 2), tolerance=1.0) == ['a']
+        assert index.get_bounds('b') == ((10, 0, 0), (14, 4, 3))
+        assert len(index) == 2
+
+    def test_duplicate_key_rejected(self):
+        """Test inserting the same key twice raises."""
+        index = SpatialIndex()
+        index.insert('a', ((0, 0, 0), (1, 1, 1)))
+
+        with pytest.raises(ValueError):
+            index.insert('a', ((0, 0, 0), (1, 1, 1)))
+
 
 # =============================================================================
 # NodeGraph Tests
@@ -533,3 +533,89 @@ class TestRoutingLayoutWithLineage:
 
         restored = RoutingLayout.from_dict(data)
         assert restored.lineage is None
+
+
+# =============================================================================
+# Steiner Metric Closure Tests
+# =============================================================================
+
+class TestSteinerMetricClosure:
+    """Tests for SteinerRouter metric closure construction and caching."""
+
+    @pytest.fixture
+    def ring_graph(self):
+        nx = pytest.importorskip("networkx")
+        graph = nx.cycle_graph([f"s{i}" for i in range(8)])
+        for i, (u, v) in enumerate(graph.edges):
+            graph[u][v]['cost'] = 1.0 + i
+        graph.add_edge('s0', 's4', cost=2.5)
+        return graph
+
+    def test_closure_matches_networkx(self, ring_graph):
+        """Test closure distances and paths equal networkx shortest paths."""
+        import networkx as nx
+        from magnet.routing.router.steiner_router import MetricClosure
+
+        terminals = ['s1', 's3', 's5', 's6', 'missing']
+        closure = MetricClosure.build(ring_graph, terminals)
+
+        assert closure.terminals == ['s1', 's3', 's5', 's6']
+        for u in closure.terminals:
+            for v in closure.terminals:
+                if u == v:
+                    continue
+                expected = nx.shortest_path_length(ring_graph, u, v, weight='cost')
+                assert closure.distance(u, v) == pytest.approx(expected)
+                path = closure.path(u, v)
+                assert path[0] == u and path[-1] == v
+                assert nx.path_weight(ring_graph, path, 'cost') == pytest.approx(expected)
+
+    def test_closure_cached_per_terminal_set(self, ring_graph):
+        """Test the closure is reused until the graph changes."""
+        from magnet.routing.router.steiner_router import SteinerRouter, mark_graph_changed
+
+        router = SteinerRouter()
+        first = router.get_metric_closure(ring_graph, {'s1', 's5'})
+
+        assert router.get_metric_closure(ring_graph, ['s5', 's1']) is first
+        assert router.get_metric_closure(ring_graph, {'s1', 's6'}) is not first
+
+        ring_graph.add_edge('s2', 's6', cost=1.0)
+        second = router.get_metric_closure(ring_graph, {'s1', 's5'})
+        assert second is not first
+
+        assert router.get_metric_closure(ring_graph, {'s1', 's5'}) is second
+        mark_graph_changed(ring_graph)
+        assert router.get_metric_closure(ring_graph, {'s1', 's5'}) is not second
+
+    def test_closure_sees_in_place_edits(self, ring_graph):
+        """Test cost edits and count-preserving edge swaps rebuild the closure."""
+        import networkx as nx
+        from magnet.routing.router.steiner_router import SteinerRouter
+
+        router = SteinerRouter()
+        before = router.get_metric_closure(ring_graph, {'s0', 's4'})
+        assert before.path('s0', 's4') == ['s0', 's4']
+
+        ring_graph['s0']['s4']['cost'] = 100.0
+        after = router.get_metric_closure(ring_graph, {'s0', 's4'})
+        expected = nx.shortest_path_length(ring_graph, 's0', 's4', weight='cost')
+        assert after.distance('s0', 's4') == pytest.approx(expected)
+        assert after.path('s0', 's4') != ['s0', 's4']
+
+        ring_graph.remove_edge('s0', 's4')
+        ring_graph.add_edge('s1', 's4', cost=0.5)
+        swapped = router.get_metric_closure(ring_graph, {'s0', 's4'})
+        expected = nx.shortest_path_length(ring_graph, 's0', 's4', weight='cost')
+        assert swapped.distance('s0', 's4') == pytest.approx(expected)
+
+    def test_steiner_tree_spans_terminals(self, ring_graph):
+        """Test the expanded Steiner tree connects every terminal."""
+        import networkx as nx
+        from magnet.routing.router.steiner_router import SteinerRouter
+
+        terminals = {'s1', 's3', 's6'}
+        tree, _ = SteinerRouter()._compute_steiner_tree(ring_graph, terminals, ['s1'], {})
+
+        assert terminals <= set(tree.nodes)
+        assert nx.is_tree(tree)
@@ -14,11 +14,15 @@ Implements:
 """
 
 from __future__ import annotations
-from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 import math
 import time
 import logging
 
+import numpy as np
+
 from .constants import (
     IMO_INTACT,
     IMO_WEATHER,
@@ -31,11 +35,13 @@ from .constants import (
 from .results import (
     GMResults,
     GZCurveResults,
+    GZCurveBatchResults,
     GZCurvePoint,
     DamageResults,
     DamageCase,
     WeatherCriterionResults,
     TankFreeSurface,
+    gz_criteria_warnings,
 )
 
 logger = logging.getLogger(__name__)
@@ -137,6 +143,92 @@ class IntactGMCalculator:
 # GZ CURVE CALCULATOR
 # =============================================================================
 
+@dataclass(frozen=True)
+class _GZGrid:
+    """Per-heel-grid constants and integration weights, shared by every curve."""
+    angles_deg: Tuple[float, ...]
+    angles: np.ndarray  # Degrees, float array
+    heel_rad: np.ndarray
+    sin: np.ndarray
+    tan: np.ndarray
+    upright: np.ndarray  # |φ| < 0.001 rad -> GZ = 0
+    w_gz_30: np.ndarray  # gz_30 = gz @ w_gz_30
+    w_gz_40: np.ndarray
+    w_area_0_30: np.ndarray  # area = max(gz @ w_area, 0)
+    w_area_0_40: np.ndarray
+    w_area_30_40: np.ndarray
+    w_area_to: np.ndarray  # Row k: area weights from 0° to angles[k]
+
+
+def _interpolation_weights(angles: Tuple[float, ...], target_deg: float) -> np.ndarray:
+    """Weights w such that gz @ w is the interpolated GZ at target_deg."""
+    weights = np.zeros(len(angles))
+    below = None
+    above = None
+    for j, angle in enumerate(angles):
+        if angle == target_deg:
+            weights[j] = 1.0
+            return weights
+        if angle < target_deg:
+            below = j
+        elif angle > target_deg and above is None:
+            above = j
+
+    if below is None or above is None:
+        # Extrapolate using nearest point
+        nearest = min(range(len(angles)), key=lambda j: abs(angles[j] - target_deg))
+        weights[nearest] = 1.0
+        return weights
+
+    t = (target_deg - angles[below]) / (angles[above] - angles[below])
+    weights[below] += 1.0 - t
+    weights[above] += t
+    return weights
+
+
+def _area_weights(angles: Tuple[float, ...], start_deg: float, end_deg: float) -> np.ndarray:
+    """Trapezoid weights w such that the area is max(gz @ w, 0) in m-rad."""
+    n = len(angles)
+    points = []
+    for j, angle in enumerate(angles):
+        if start_deg <= angle <= end_deg:
+            unit = np.zeros(n)
+            unit[j] = 1.0
+            points.append((angle, unit))
+
+    # Add interpolated endpoints if needed
+    if points and points[0][0] > start_deg:
+        points.insert(0, (start_deg, _interpolation_weights(angles, start_deg)))
+    if points and points[-1][0] < end_deg:
+        points.append((end_deg, _interpolation_weights(angles, end_deg)))
+
+    weights = np.zeros(n)
+    for (a1, w1), (a2, w2) in zip(points, points[1:]):
+        d_rad = math.radians(a2) - math.radians(a1)
+        weights += 0.5 * d_rad * (w1 + w2)
+    return weights
+
+
+@lru_cache(maxsize=32)
+def _gz_grid(angles_deg: Tuple[float, ...]) -> _GZGrid:
+    angles = np.array(angles_deg, dtype=float)
+    heel_rad = np.array([math.radians(a) for a in angles_deg])
+    return _GZGrid(
+        angles_deg=angles_deg,
+        angles=angles,
+        heel_rad=heel_rad,
+        sin=np.sin(heel_rad),
+        tan=np.tan(heel_rad),
+        upright=np.abs(heel_rad) < 0.001,
+        w_gz_30=_interpolation_weights(angles_deg, 30.0),
+        w_gz_40=_interpolation_weights(angles_deg, 40.0),
+        w_area_0_30=_area_weights(angles_deg, 0.0, 30.0),
+        w_area_0_40=_area_weights(angles_deg, 0.0, 40.0),
+        w_area_30_40=_area_weights(angles_deg, 30.0, 40.0),
+        w_area_to=np.array([_area_weights(angles_deg, 0.0, a) for a in angles_deg]),
+    )
+
+
 class GZCurveCalculator:
     """
     Generates GZ (righting arm) curve using wall-sided formula.
@@ -145,6 +237,9 @@ class GZCurveCalculator:
 
     This formula is accurate to approximately 40-45° heel.
     Beyond that, actual hull shape significantly affects the curve.
+
+    calculate_batch() evaluates many loading conditions (e.g. a KG sweep)
+    on a shared heel grid in one vectorized pass.
     """
 
     def calculate(
@@ -225,16 +320,9 @@ class GZCurveCalculator:
         ])
 
         # Add warnings for failed criteria
-        if not passes_gz_30:
-            warnings.append(f"GZ at 30° ({gz_30_m:.3f}m) below minimum ({IMO_INTACT.gz_30_min_m}m)")
-        if not passes_angle_gz_max:
-            warnings.append(f"Angle of max GZ ({angle_gz_max_deg:.1f}°) below minimum ({IMO_INTACT.angle_gz_max_min_deg}°)")
-        if not passes_area_0_30:
-            warnings.append(f"Area 0-30° ({area_0_30:.4f} m-rad) below minimum ({IMO_INTACT.area_0_30_min_m_rad})")
-        if not passes_area_0_40:
-            warnings.append(f"Area 0-40° ({area_0_40:.4f} m-rad) below minimum ({IMO_INTACT.area_0_40_min_m_rad})")
-        if not passes_area_30_40:
-            warnings.append(f"Area 30-40° ({area_30_40:.4f} m-rad) below minimum ({IMO_INTACT.area_30_40_min_m_rad})")
+        warnings.extend(gz_criteria_warnings(
+            gz_30_m, angle_gz_max_deg, area_0_30, area_0_40, area_30_40
+        ))
 
         elapsed_ms = int((time.perf_counter() - start_time) * 1000)
 
@@ -380,6 +468,148 @@ class GZCurveCalculator:
 
         return max(area, 0.0)
 
+    def calculate_batch(
+        self,
+        gm_m: Sequence[float],
+        bm_m: Sequence[float],
+        angles_deg: Optional[Sequence[float]] = None,
+        freeboard_m: Optional[Sequence[float]] = None,
+        beam_m: Optional[Sequence[float]] = None,
+    ) -> GZCurveBatchResults:
+        """
+        Calculate GZ curves for many loading conditions at once.
+
+        Args:
+            gm_m: Metacentric heights (meters), one per curve
+            bm_m: Metacentric radii (meters), broadcast against gm_m
+            angles_deg: Heel angles shared by every curve (degrees)
+            freeboard_m: Optional freeboards for downflooding angles (meters)
+            beam_m: Optional beams for downflooding angles (meters)
+
+        Returns:
+            GZCurveBatchResults with (n_curves,) arrays of characteristic
+            values, areas and criteria flags
+
+        Raises:
+            ValueError: If the heel grid is empty or inputs do not broadcast
+        """
+        start_time = time.perf_counter()
+
+        if angles_deg is None:
+            angles_deg = GZ_CURVE_ANGLES_DEG
+        if len(angles_deg) == 0:
+            raise ValueError("angles_deg must not be empty")
+        grid = _gz_grid(tuple(float(a) for a in angles_deg))
+
+        gm, bm = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(gm_m, dtype=float)),
+            np.atleast_1d(np.asarray(bm_m, dtype=float)),
+        )
+        rows = np.arange(len(gm))
+
+        # Wall-sided GZ for every (curve, angle)
+        gz = grid.sin * (gm[:, None] + 0.5 * bm[:, None] * grid.tan * grid.tan)
+        gz[:, grid.upright] = 0.0
+
+        grid_warnings: List[str] = []
+        if grid.angles.max() > WALL_SIDED_VALID_DEG:
+            grid_warnings.append(
+                f"GZ values beyond {WALL_SIDED_VALID_DEG}° use wall-sided approximation, "
+                "actual values depend on hull shape"
+            )
+
+        # Characteristic values (first maximum, as max() on the point list)
+        max_idx = np.argmax(gz, axis=1)
+        gz_max = gz[rows, max_idx]
+        angle_gz_max = grid.angles[max_idx]
+        gz_30 = gz @ grid.w_gz_30
+        gz_40 = gz @ grid.w_gz_40
+        vanishing = self._vanishing_angles(gz, grid.angles)
+
+        # Areas under curve (m-rad)
+        area_0_30 = np.maximum(gz @ grid.w_area_0_30, 0.0)
+        area_0_40 = np.maximum(gz @ grid.w_area_0_40, 0.0)
+        area_30_40 = np.maximum(gz @ grid.w_area_30_40, 0.0)
+        dynamic = np.maximum(np.einsum("ij,ij->i", gz, grid.w_area_to[max_idx]), 0.0)
+
+        # IMO criteria
+        passes_gz_30 = gz_30 >= IMO_INTACT.gz_30_min_m
+        passes_angle_gz_max = angle_gz_max >= IMO_INTACT.angle_gz_max_min_deg
+        passes_area_0_30 = area_0_30 >= IMO_INTACT.area_0_30_min_m_rad
+        passes_area_0_40 = area_0_40 >= IMO_INTACT.area_0_40_min_m_rad
+        passes_area_30_40 = area_30_40 >= IMO_INTACT.area_30_40_min_m_rad
+
+        downflooding = None
+        if freeboard_m is not None and beam_m is not None:
+            downflooding = self._downflooding_angles(freeboard_m, beam_m, len(gm))
+
+        return GZCurveBatchResults(
+            angles_deg=grid.angles_deg,
+            heel_rad=grid.heel_rad.copy(),
+            gm_m=gm,
+            bm_m=bm,
+            gz_m=gz,
+            gz_max_m=gz_max,
+            angle_gz_max_deg=angle_gz_max,
+            gz_30_m=gz_30,
+            gz_40_m=gz_40,
+            angle_of_vanishing_stability_deg=vanishing,
+            range_of_stability_deg=vanishing.copy(),  # Range is 0 to vanishing angle
+            area_0_30_m_rad=area_0_30,
+            area_0_40_m_rad=area_0_40,
+            area_30_40_m_rad=area_30_40,
+            dynamic_stability_m_rad=dynamic,
+            passes_gz_30_criterion=passes_gz_30,
+            passes_angle_gz_max_criterion=passes_angle_gz_max,
+            passes_area_0_30_criterion=passes_area_0_30,
+            passes_area_0_40_criterion=passes_area_0_40,
+            passes_area_30_40_criterion=passes_area_30_40,
+            passes_all_gz_criteria=(
+                passes_gz_30 & passes_angle_gz_max & passes_area_0_30
+                & passes_area_0_40 & passes_area_30_40
+            ),
+            downflooding_angle_deg=downflooding,
+            grid_warnings=grid_warnings,
+            calculation_time_ms=int((time.perf_counter() - start_time) * 1000),
+        )
+
+    def _vanishing_angles(self, gz: np.ndarray, angles: np.ndarray) -> np.ndarray:
+        """Angle where GZ first becomes zero or negative after being positive."""
+        positive = gz > 0
+        seen_positive = np.zeros_like(positive)
+        seen_positive[:, 1:] = np.logical_or.accumulate(positive, axis=1)[:, :-1]
+        crossing = seen_positive & (gz <= 0)
+
+        has_crossing = crossing.any(axis=1)
+        i = np.argmax(crossing, axis=1)
+        rows = np.arange(len(gz))
+        prev = gz[rows, i - 1]
+        cur = gz[rows, i]
+        denom = prev - cur
+
+        # Interpolate to find exact crossing
+        t = np.divide(prev, denom, out=np.zeros_like(prev), where=denom != 0)
+        interpolated = angles[i - 1] + t * (angles[i] - angles[i - 1])
+        at_crossing = np.where(denom != 0, interpolated, angles[i])
+
+        # If GZ never goes negative, return last angle
+        return np.where(has_crossing, at_crossing, angles[-1])
+
+    def _downflooding_angles(
+        self, freeboard_m: Sequence[float], beam_m: Sequence[float], count: int
+    ) -> np.ndarray:
+        """
+        Deck-edge immersion angle θ_df ≈ arctan(2F / B), clamped to 15-90°.
+
+        Returns 90° (no limit) where freeboard or beam is non-positive.
+        """
+        freeboard = np.broadcast_to(np.asarray(freeboard_m, dtype=float), (count,))
+        beam = np.broadcast_to(np.asarray(beam_m, dtype=float), (count,))
+        valid = (freeboard > 0) & (beam > 0)
+        ratio = np.divide(2.0 * freeboard, beam, out=np.zeros(count), where=valid)
+        theta = np.clip(np.degrees(np.arctan(ratio)), 15.0, 90.0)
+        return np.where(valid, theta, 90.0)
+
 
 # =============================================================================
 # FREE SURFACE CALCULATOR
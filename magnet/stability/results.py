@@ -8,9 +8,14 @@ Result dataclasses for stability calculations.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, TYPE_CHECKING
 import time
 
+from .constants import IMO_INTACT
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # =============================================================================
 # GM RESULTS
@@ -201,6 +206,144 @@ class GZCurveResults:
         return result
 
 
+def gz_criteria_warnings(
+    gz_30_m: float,
+    angle_gz_max_deg: float,
+    area_0_30_m_rad: float,
+    area_0_40_m_rad: float,
+    area_30_40_m_rad: float,
+) -> List[str]:
+    """Warning messages for each failed IMO GZ criterion."""
+    warnings: List[str] = []
+    if not gz_30_m >= IMO_INTACT.gz_30_min_m:
+        warnings.append(f"GZ at 30° ({gz_30_m:.3f}m) below minimum ({IMO_INTACT.gz_30_min_m}m)")
+    if not angle_gz_max_deg >= IMO_INTACT.angle_gz_max_min_deg:
+        warnings.append(f"Angle of max GZ ({angle_gz_max_deg:.1f}°) below minimum ({IMO_INTACT.angle_gz_max_min_deg}°)")
+    if not area_0_30_m_rad >= IMO_INTACT.area_0_30_min_m_rad:
+        warnings.append(f"Area 0-30° ({area_0_30_m_rad:.4f} m-rad) below minimum ({IMO_INTACT.area_0_30_min_m_rad})")
+    if not area_0_40_m_rad >= IMO_INTACT.area_0_40_min_m_rad:
+        warnings.append(f"Area 0-40° ({area_0_40_m_rad:.4f} m-rad) below minimum ({IMO_INTACT.area_0_40_min_m_rad})")
+    if not area_30_40_m_rad >= IMO_INTACT.area_30_40_min_m_rad:
+        warnings.append(f"Area 30-40° ({area_30_40_m_rad:.4f} m-rad) below minimum ({IMO_INTACT.area_30_40_min_m_rad})")
+    return warnings
+
+
+@dataclass
+class GZCurveBatchResults:
+    """
+    GZ curves for many loading conditions on a shared heel grid.
+
+    Every per-curve quantity is an array of shape (n_curves,); gz_m has
+    shape (n_curves, n_angles). GZCurvePoint lists and GZCurveResults are
+    only built on demand via curve(i) / result(i).
+    """
+    angles_deg: Tuple[float, ...]
+    heel_rad: np.ndarray
+    gm_m: np.ndarray
+    bm_m: np.ndarray
+    gz_m: np.ndarray
+
+    # Characteristic values
+    gz_max_m: np.ndarray
+    angle_gz_max_deg: np.ndarray
+    gz_30_m: np.ndarray
+    gz_40_m: np.ndarray
+    angle_of_vanishing_stability_deg: np.ndarray
+    range_of_stability_deg: np.ndarray
+
+    # Areas (meter-radians)
+    area_0_30_m_rad: np.ndarray
+    area_0_40_m_rad: np.ndarray
+    area_30_40_m_rad: np.ndarray
+    dynamic_stability_m_rad: np.ndarray
+
+    # IMO criteria flags
+    passes_gz_30_criterion: np.ndarray
+    passes_angle_gz_max_criterion: np.ndarray
+    passes_area_0_30_criterion: np.ndarray
+    passes_area_0_40_criterion: np.ndarray
+    passes_area_30_40_criterion: np.ndarray
+    passes_all_gz_criteria: np.ndarray
+
+    # Only when freeboard and beam were given
+    downflooding_angle_deg: Optional[np.ndarray] = None
+
+    # Warnings that apply to every curve (e.g. grid beyond wall-sided range)
+    grid_warnings: List[str] = field(default_factory=list)
+    calculation_time_ms: int = 0
+
+    def __len__(self) -> int:
+        return len(self.gm_m)
+
+    def curve(self, index: int) -> List[GZCurvePoint]:
+        """Materialize the curve points of one loading condition."""
+        return [
+            GZCurvePoint(heel_deg=angle, heel_rad=float(rad), gz_m=float(gz))
+            for angle, rad, gz in zip(self.angles_deg, self.heel_rad, self.gz_m[index])
+        ]
+
+    def result(self, index: int) -> GZCurveResults:
+        """Materialize a full GZCurveResults for one loading condition."""
+        gz_30 = float(self.gz_30_m[index])
+        angle_gz_max = float(self.angle_gz_max_deg[index])
+        area_0_30 = float(self.area_0_30_m_rad[index])
+        area_0_40 = float(self.area_0_40_m_rad[index])
+        area_30_40 = float(self.area_30_40_m_rad[index])
+
+        return GZCurveResults(
+            curve=self.curve(index),
+            gz_max_m=float(self.gz_max_m[index]),
+            angle_gz_max_deg=angle_gz_max,
+            gz_30_m=gz_30,
+            gz_40_m=float(self.gz_40_m[index]),
+            angle_of_vanishing_stability_deg=float(self.angle_of_vanishing_stability_deg[index]),
+            range_of_stability_deg=float(self.range_of_stability_deg[index]),
+            area_0_30_m_rad=area_0_30,
+            area_0_40_m_rad=area_0_40,
+            area_30_40_m_rad=area_30_40,
+            dynamic_stability_m_rad=float(self.dynamic_stability_m_rad[index]),
+            passes_gz_30_criterion=bool(self.passes_gz_30_criterion[index]),
+            passes_angle_gz_max_criterion=bool(self.passes_angle_gz_max_criterion[index]),
+            passes_area_0_30_criterion=bool(self.passes_area_0_30_criterion[index]),
+            passes_area_0_40_criterion=bool(self.passes_area_0_40_criterion[index]),
+            passes_area_30_40_criterion=bool(self.passes_area_30_40_criterion[index]),
+            passes_all_gz_criteria=bool(self.passes_all_gz_criteria[index]),
+            gm_m=float(self.gm_m[index]),
+            bm_m=float(self.bm_m[index]),
+            calculation_time_ms=self.calculation_time_ms,
+            warnings=self.grid_warnings + gz_criteria_warnings(
+                gz_30, angle_gz_max, area_0_30, area_0_40, area_30_40
+            ),
+        )
+
+    def to_results(self) -> List[GZCurveResults]:
+        return [self.result(i) for i in range(len(self))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Columnar serialization (one list per quantity)."""
+        data: Dict[str, Any] = {
+            "angles_deg": list(self.angles_deg),
+            "gm_m": self.gm_m.tolist(),
+            "bm_m": self.bm_m.tolist(),
+            "gz_m": self.gz_m.tolist(),
+            "gz_max_m": self.gz_max_m.tolist(),
+            "angle_gz_max_deg": self.angle_gz_max_deg.tolist(),
+            "gz_30_m": self.gz_30_m.tolist(),
+            "gz_40_m": self.gz_40_m.tolist(),
+            "angle_of_vanishing_stability_deg": self.angle_of_vanishing_stability_deg.tolist(),
+            "area_0_30_m_rad": self.area_0_30_m_rad.tolist(),
+            "area_0_40_m_rad": self.area_0_40_m_rad.tolist(),
+            "area_30_40_m_rad": self.area_30_40_m_rad.tolist(),
+            "dynamic_stability_m_rad": self.dynamic_stability_m_rad.tolist(),
+            "passes_all_gz_criteria": self.passes_all_gz_criteria.tolist(),
+            "calculation_time_ms": self.calculation_time_ms,
+            "grid_warnings": self.grid_warnings,
+        }
+        if self.downflooding_angle_deg is not None:
+            data["downflooding_angle_deg"] = self.downflooding_angle_deg.tolist()
+        return data
+
+
 # =============================================================================
 # DAMAGE STABILITY RESULTS
 # =============================================================================
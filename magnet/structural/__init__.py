@@ -30,6 +30,7 @@ from .grid_generator import StructuralGridGenerator
 from .plates import Plate, PlateExtent
 from .plate_generator import PlateGenerator
 from .nesting import NestSheet, NestingResult, NestingEngine
+from .plate_index import PlateIndex
 
 
 __all__ = [
@@ -55,4 +56,5 @@ __all__ = [
     "NestSheet",
     "NestingResult",
     "NestingEngine",
+    "PlateIndex",
 ]
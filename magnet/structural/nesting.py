@@ -7,11 +7,18 @@ Section 22: Plate Nesting.
 """
 
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple, Optional
+import logging
+import os
+import random
+import time
 
 from .plates import Plate
 
+logger = logging.getLogger("structural.nesting")
+
 
 @dataclass
 class NestSheet:
@@ -72,6 +79,9 @@ class NestingResult:
     average_utilization_percent: float = 0.0
     """Average utilization across all sheets."""
 
+    unplaced_plates: List[str] = field(default_factory=list)
+    """Plates too large for every stock sheet size."""
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "sheets": [s.to_dict() for s in self.sheets],
@@ -79,14 +89,294 @@ class NestingResult:
             "total_plate_area_mm2": round(self.total_plate_area_mm2, 0),
             "total_sheet_area_mm2": round(self.total_sheet_area_mm2, 0),
             "average_utilization_percent": round(self.average_utilization_percent, 1),
+            "unplaced_plates": self.unplaced_plates,
         }
 
 
-class NestingEngine:
+# =============================================================================
+# MaxRects Packing
+# =============================================================================
+
+# (plate_id, length_mm, width_mm), kerf included
+Part = Tuple[str, float, float]
+
+# (x, y, length, width) in mm
+Rect = Tuple[float, float, float, float]
+
+# (stock length, stock width) in mm
+Stock = Tuple[float, float]
+
+
+class _MaxRectsSheet:
     """
-    Simple first-fit decreasing nesting engine.
+    One stock sheet packed with the MaxRects method.
 
-    Phase 2 will add advanced algorithms (GA/SA).
+    Free space is kept as the list of maximal free rectangles (they may
+    overlap); a placement splits every rectangle it intersects into up to
+    four remainders and drops any rectangle contained in another.
+    Remainders too small for any part still to come are discarded.
+    """
+
+    __slots__ = ("stock", "free", "placements", "max_length", "max_width", "max_area")
+
+    def __init__(self, stock: Stock, margin: float):
+        self.stock = stock
+        self.free: List[Rect] = [(margin, margin, stock[0] - 2 * margin, stock[1] - 2 * margin)]
+        self.placements: List[Tuple[str, float, float, float, float]] = []
+        self._refresh()
+
+    def best_fit(self, length: float, width: float) -> Optional[Tuple[float, float, float, float, float, float]]:
+        """
+        Best-short-side-fit position, trying both orientations.
+
+        Returns (short leftover, long leftover, x, y, placed length, placed
+        width), or None if the part fits nowhere.
+        """
+        best = None
+        for fx, fy, fl, fw in self.free:
+            if length <= fl and width <= fw:
+                dl, dw = fl - length, fw - width
+                short, long = (dl, dw) if dl < dw else (dw, dl)
+                if best is None or short < best[0] or (short == best[0] and long < best[1]):
+                    best = (short, long, fx, fy, length, width)
+            if width <= fl and length <= fw:
+                dl, dw = fl - width, fw - length
+                short, long = (dl, dw) if dl < dw else (dw, dl)
+                if best is None or short < best[0] or (short == best[0] and long < best[1]):
+                    best = (short, long, fx, fy, width, length)
+        return best
+
+    def place(
+        self,
+        plate_id: str,
+        x: float, y: float,
+        length: float, width: float,
+        floor: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+    ) -> None:
+        """
+        Place a part and split the free rectangles it overlaps.
+
+        floor is the (short side, long side, area) below which no remaining
+        part can use a free rectangle.
+        """
+        self.placements.append((plate_id, x, y, length, width))
+        right = x + length
+        top = y + width
+
+        split: List[Rect] = []
+        for rect in self.free:
+            fx, fy, fl, fw = rect
+            if x >= fx + fl or right <= fx or y >= fy + fw or top <= fy:
+                split.append(rect)
+                continue
+            if x > fx:
+                split.append((fx, fy, x - fx, fw))
+            if right < fx + fl:
+                split.append((right, fy, fx + fl - right, fw))
+            if y > fy:
+                split.append((fx, fy, fl, y - fy))
+            if top < fy + fw:
+                split.append((fx, top, fl, fy + fw - top))
+
+        min_short, min_long, min_area = floor
+        self.free = _prune_contained([
+            r for r in split
+            if min(r[2], r[3]) >= min_short and max(r[2], r[3]) >= min_long and r[2] * r[3] >= min_area
+        ])
+        self._refresh()
+
+    def could_fit(self, length: float, width: float) -> bool:
+        """Cheap necessary condition for best_fit() to succeed."""
+        return (
+            (length <= self.max_length and width <= self.max_width)
+            or (width <= self.max_length and length <= self.max_width)
+        )
+
+    def _refresh(self) -> None:
+        self.max_length = max((r[2] for r in self.free), default=0.0)
+        self.max_width = max((r[3] for r in self.free), default=0.0)
+        self.max_area = max((r[2] * r[3] for r in self.free), default=0.0)
+
+
+def _prune_contained(rects: List[Rect]) -> List[Rect]:
+    """Drop free rectangles that lie inside another one."""
+    # A rectangle can only be contained in one at least as large
+    rects.sort(key=lambda r: r[2] * r[3], reverse=True)
+    kept: List[Rect] = []
+    for rect in rects:
+        x, y, length, width = rect
+        for kx, ky, kl, kw in kept:
+            if x >= kx and y >= ky and x + length <= kx + kl and y + width <= ky + kw:
+                break
+        else:
+            kept.append(rect)
+    return kept
+
+
+def _fits_stock(stock: Stock, margin: float, length: float, width: float) -> bool:
+    usable_length = stock[0] - 2 * margin
+    usable_width = stock[1] - 2 * margin
+    return (
+        (length <= usable_length and width <= usable_width)
+        or (width <= usable_length and length <= usable_width)
+    )
+
+
+def _pack(
+    parts: List[Part],
+    stocks: List[Stock],
+    primary: Stock,
+    margin: float,
+) -> List[_MaxRectsSheet]:
+    """
+    Pack parts, in order, onto sheets.
+
+    Each part goes to the best-short-side-fit position over all open
+    sheets. A new sheet uses the primary stock if the part fits on it,
+    otherwise the smallest stock that does. Sheets whose largest free
+    rectangle is smaller than every part still to come are closed. Parts
+    that fit no stock must be filtered out beforehand.
+    """
+    # Smallest short side, long side and area over parts i onward
+    floors = [(float("inf"), float("inf"), float("inf"))] * (len(parts) + 1)
+    for i in range(len(parts) - 1, -1, -1):
+        _, length, width = parts[i]
+        short, long, area = floors[i + 1]
+        floors[i] = (min(short, length, width), min(long, max(length, width)), min(area, length * width))
+
+    by_area = sorted(stocks, key=lambda s: s[0] * s[1])
+    sheets: List[_MaxRectsSheet] = []
+    open_sheets: List[_MaxRectsSheet] = []
+
+    for i, (plate_id, length, width) in enumerate(parts):
+        best = None
+        target = None
+        still_open = []
+        for sheet in open_sheets:
+            if sheet.max_area < floors[i][2]:
+                continue
+            still_open.append(sheet)
+            if not sheet.could_fit(length, width):
+                continue
+            fit = sheet.best_fit(length, width)
+            if fit is not None and (best is None or fit[:2] < best[:2]):
+                best, target = fit, sheet
+        open_sheets = still_open
+
+        if target is None:
+            if _fits_stock(primary, margin, length, width):
+                stock = primary
+            else:
+                stock = next(s for s in by_area if _fits_stock(s, margin, length, width))
+            target = _MaxRectsSheet(stock, margin)
+            sheets.append(target)
+            open_sheets.append(target)
+            best = target.best_fit(length, width)
+
+        target.place(plate_id, *best[2:], floors[i + 1])
+
+    return sheets
+
+
+def _right_size(sheets: List[_MaxRectsSheet], stocks: List[Stock], margin: float) -> List[_MaxRectsSheet]:
+    """Move each sheet's parts onto the smallest stock that still holds them all."""
+    by_area = sorted(stocks, key=lambda s: s[0] * s[1])
+    resized = []
+    for sheet in sheets:
+        area = sheet.stock[0] * sheet.stock[1]
+        used = sum(p[3] * p[4] for p in sheet.placements)
+        parts = sorted(
+            ((p[0], p[3], p[4]) for p in sheet.placements),
+            key=lambda p: p[1] * p[2],
+            reverse=True,
+        )
+        for stock in by_area:
+            if stock[0] * stock[1] >= area:
+                break
+            if used > (stock[0] - 2 * margin) * (stock[1] - 2 * margin):
+                continue
+            trial = _MaxRectsSheet(stock, margin)
+            for plate_id, length, width in parts:
+                fit = trial.best_fit(length, width)
+                if fit is None:
+                    break
+                trial.place(plate_id, *fit[2:])
+            else:
+                sheet = trial
+                break
+        resized.append(sheet)
+    return resized
+
+
+def _layout_cost(sheets: List[_MaxRectsSheet]) -> Tuple[float, int]:
+    """Stock area bought, then sheet count (lower is better)."""
+    return sum(s.stock[0] * s.stock[1] for s in sheets), len(sheets)
+
+
+# (stock, [(plate_id, x, y, length, width)]) per sheet
+SheetLayout = Tuple[Stock, List[Tuple[str, float, float, float, float]]]
+
+
+def _nest_group(task: Tuple[Any, ...]) -> Tuple[float, List[SheetLayout], List[str]]:
+    """
+    Nest one thickness group (process pool entry point).
+
+    task is (thickness, parts, stocks, margin, time_budget_s, seed) in
+    plain picklable types. Every stock size is tried as the primary sheet
+    with parts in decreasing area and in decreasing long-side order. With
+    a time budget, randomized restarts (jittered area order, random
+    primary stock) run until it is spent. Returns (thickness,
+    [(stock, placements)], unplaced plate ids).
+    """
+    thickness, parts, stocks, margin, time_budget_s, seed = task
+
+    unplaced = [p[0] for p in parts if not any(_fits_stock(s, margin, p[1], p[2]) for s in stocks)]
+    if unplaced:
+        rejected = set(unplaced)
+        parts = [p for p in parts if p[0] not in rejected]
+
+    orders = [
+        sorted(parts, key=lambda p: p[1] * p[2], reverse=True),
+        sorted(parts, key=lambda p: (max(p[1], p[2]), min(p[1], p[2])), reverse=True),
+    ]
+    best = None
+    best_cost = None
+    for order in orders:
+        for primary in stocks:
+            sheets = _right_size(_pack(order, stocks, primary, margin), stocks, margin)
+            cost = _layout_cost(sheets)
+            if best_cost is None or cost < best_cost:
+                best, best_cost = sheets, cost
+
+    if time_budget_s > 0 and parts:
+        rng = random.Random(f"{seed}:{thickness}")
+        deadline = time.perf_counter() + time_budget_s
+        while time.perf_counter() < deadline:
+            order = sorted(parts, key=lambda p: p[1] * p[2] * rng.uniform(0.8, 1.2), reverse=True)
+            primary = rng.choice(stocks)
+            sheets = _right_size(_pack(order, stocks, primary, margin), stocks, margin)
+            cost = _layout_cost(sheets)
+            if cost < best_cost:
+                best, best_cost = sheets, cost
+
+    return thickness, [(s.stock, s.placements) for s in best or []], unplaced
+
+
+# =============================================================================
+# Nesting Engine
+# =============================================================================
+
+class NestingEngine:
+    """
+    MaxRects plate nesting engine.
+
+    Plates are grouped by thickness. Each group is packed with
+    best-short-side-fit MaxRects using every stock size listed for the
+    thickness as the primary sheet, and the layout buying the least sheet
+    area wins; each sheet is then moved to the smallest stock that still
+    holds its plates. Thickness groups are independent and are nested in a
+    process pool when there are enough plates to pay for it. A time budget
+    adds randomized restarts per group.
     """
 
     # Stock sheet sizes (mm)
@@ -98,22 +388,40 @@ class NestingEngine:
         10.0: [(6000, 1500), (3000, 1500)],
     }
 
+    # Stock for thicknesses not listed above
+    DEFAULT_STOCK: List[Tuple[int, int]] = [(6000, 2000)]
+
     # Kerf width (mm) - cutting allowance
     KERF_MM = 3.0
 
     # Edge margin (mm)
     EDGE_MARGIN_MM = 25.0
 
-    def __init__(self):
+    # Below this many plates a process pool costs more than it saves
+    PARALLEL_MIN_PLATES = 2000
+
+    def __init__(self, max_workers: Optional[int] = None, time_budget_s: float = 0.0, seed: int = 0):
+        """
+        Args:
+            max_workers: Processes for thickness groups (default: CPU count)
+            time_budget_s: Randomized-restart time per thickness group
+            seed: Seed for the restarts
+        """
         self.sheets: List[NestSheet] = []
+        self.unplaced: List[str] = []
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.time_budget_s = time_budget_s
+        self.seed = seed
 
     def nest_plates(self, plates: List[Plate]) -> List[NestSheet]:
         """
-        Nest plates onto stock sheets using first-fit decreasing.
+        Nest plates onto stock sheets.
 
-        Groups plates by thickness, then nests each group.
+        Groups plates by thickness, then nests each group. Plates too large
+        for every stock size of their thickness are listed in self.unplaced.
         """
         self.sheets = []
+        self.unplaced = []
 
         # Group by thickness
         by_thickness: Dict[float, List[Plate]] = {}
@@ -123,118 +431,64 @@ class NestingEngine:
                 by_thickness[t] = []
             by_thickness[t].append(plate)
 
-        # Nest each thickness group
-        for thickness, thickness_plates in by_thickness.items():
-            self._nest_thickness_group(thickness, thickness_plates)
+        tasks = [
+            self._group_task(thickness, thickness_plates)
+            for thickness, thickness_plates in by_thickness.items()
+        ]
+        results = {thickness: (layout, unplaced) for thickness, layout, unplaced in self._run_groups(tasks)}
 
-        return self.sheets
-
-    def _nest_thickness_group(self, thickness: float, plates: List[Plate]) -> None:
-        """Nest plates of same thickness."""
-        # Get available stock for this thickness
-        stock_options = self.STOCK_SHEETS.get(thickness, [(6000, 2000)])
-        primary_stock = stock_options[0]
-
-        # Sort plates by area (decreasing) - first-fit decreasing
-        sorted_plates = sorted(
-            plates,
-            key=lambda p: p.extent.area_m2,
-            reverse=True
-        )
-
-        # Active sheets for this thickness
-        active_sheets: List[Tuple[NestSheet, List[Tuple[float, float, float, float]]]] = []
-
-        for plate in sorted_plates:
-            # Convert plate dimensions to mm
-            plate_length = plate.extent.length_m * 1000 + self.KERF_MM
-            plate_width = plate.extent.width_m * 1000 + self.KERF_MM
-
-            # Try to fit in existing sheet
-            placed = False
-            for sheet, free_rects in active_sheets:
-                pos = self._find_position(free_rects, plate_length, plate_width)
-                if pos:
-                    x, y = pos
-                    sheet.plates.append(plate.plate_id)
-                    sheet.plate_positions.append((x, y, plate_length, plate_width))
-                    self._update_free_rects(free_rects, x, y, plate_length, plate_width)
-                    placed = True
-                    break
-
-            # If not placed, create new sheet
-            if not placed:
+        # Sheet numbering follows the order thicknesses first appear
+        for thickness in by_thickness:
+            layout, unplaced = results[thickness]
+            for stock, placements in layout:
                 sheet = NestSheet(
-                    sheet_id=f"SHEET-{len(self.sheets) + len(active_sheets) + 1:03d}",
+                    sheet_id=f"SHEET-{len(self.sheets) + 1:03d}",
                     thickness_mm=thickness,
-                    length_mm=float(primary_stock[0]),
-                    width_mm=float(primary_stock[1]),
+                    length_mm=float(stock[0]),
+                    width_mm=float(stock[1]),
+                    plates=[p[0] for p in placements],
+                    plate_positions=[p[1:] for p in placements],
                 )
+                self._calculate_utilization(sheet)
+                self.sheets.append(sheet)
+            self.unplaced.extend(unplaced)
 
-                # Initial free rectangle (whole sheet minus margins)
-                usable_length = primary_stock[0] - 2 * self.EDGE_MARGIN_MM
-                usable_width = primary_stock[1] - 2 * self.EDGE_MARGIN_MM
-                free_rects: List[Tuple[float, float, float, float]] = [
-                    (self.EDGE_MARGIN_MM, self.EDGE_MARGIN_MM, usable_length, usable_width)
-                ]
-
-                # Place plate at origin
-                pos = self._find_position(free_rects, plate_length, plate_width)
-                if pos:
-                    x, y = pos
-                    sheet.plates.append(plate.plate_id)
-                    sheet.plate_positions.append((x, y, plate_length, plate_width))
-                    self._update_free_rects(free_rects, x, y, plate_length, plate_width)
-
-                active_sheets.append((sheet, free_rects))
-
-        # Calculate utilization and add to results
-        for sheet, _ in active_sheets:
-            self._calculate_utilization(sheet)
-            self.sheets.append(sheet)
-
-    def _find_position(
-        self,
-        free_rects: List[Tuple[float, float, float, float]],
-        length: float,
-        width: float,
-    ) -> Optional[Tuple[float, float]]:
-        """Find position for plate in free rectangles."""
-        for rx, ry, rlen, rwid in free_rects:
-            # Try normal orientation
-            if length <= rlen and width <= rwid:
-                return (rx, ry)
-            # Try rotated
-            if width <= rlen and length <= rwid:
-                return (rx, ry)
-        return None
-
-    def _update_free_rects(
-        self,
-        free_rects: List[Tuple[float, float, float, float]],
-        x: float, y: float,
-        length: float, width: float,
-    ) -> None:
-        """Update free rectangles after placing plate (guillotine cut)."""
-        new_rects: List[Tuple[float, float, float, float]] = []
-
-        for rx, ry, rlen, rwid in free_rects:
-            if rx == x and ry == y:
-                # This is the rectangle we placed in
-                # Split into right and top remainders
+        if self.unplaced:
+            logger.warning(f"{len(self.unplaced)} plates exceed every stock sheet size: {self.unplaced}")
 
-                # Right remainder
-                if rlen > length:
-                    new_rects.append((rx + length, ry, rlen - length, rwid))
+        return self.sheets
 
-                # Top remainder
-                if rwid > width:
-                    new_rects.append((rx, ry + width, length, rwid - width))
-            else:
-                new_rects.append((rx, ry, rlen, rwid))
+    def _group_task(self, thickness: float, plates: List[Plate]) -> Tuple[Any, ...]:
+        """Plain-data description of one thickness group for _nest_group."""
+        stocks = [
+            (float(length), float(width))
+            for length, width in self.STOCK_SHEETS.get(thickness, self.DEFAULT_STOCK)
+        ]
+        parts = [
+            (
+                plate.plate_id,
+                plate.extent.length_m * 1000 + self.KERF_MM,
+                plate.extent.width_m * 1000 + self.KERF_MM,
+            )
+            for plate in plates
+        ]
+        return (
+            thickness, parts, stocks, self.EDGE_MARGIN_MM, self.time_budget_s, self.seed,
+        )
 
-        free_rects.clear()
-        free_rects.extend(new_rects)
+    def _run_groups(self, tasks: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+        """Nest thickness groups, in a process pool when worthwhile."""
+        workers = min(self.max_workers, len(tasks))
+        total = sum(len(task[1]) for task in tasks)
+        if workers > 1 and (total >= self.PARALLEL_MIN_PLATES or self.time_budget_s > 0):
+            # Largest groups first so they do not start last
+            ordered = sorted(tasks, key=lambda task: len(task[1]), reverse=True)
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(_nest_group, ordered))
+            except Exception as e:
+                logger.warning(f"Parallel nesting unavailable, using serial: {e}")
+        return [_nest_group(task) for task in tasks]
 
     def _calculate_utilization(self, sheet: NestSheet) -> None:
         """Calculate sheet utilization percentage."""
@@ -292,4 +546,5 @@ class NestingEngine:
             total_plate_area_mm2=total_plate_area,
             total_sheet_area_mm2=total_sheet_area,
             average_utilization_percent=avg_util,
+            unplaced_plates=list(self.unplaced),
         )
@@ -0,0 +1,218 @@
+"""
+structural/plate_index.py - Spatial plate index.
+
+ALPHA OWNS THIS FILE.
+
+Section 22: Plate Index.
+
+Per-zone interval index over plate extents (frame range, y range), shared
+by the weld generators and the structure mesh builder.
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from ..core.interval_tree import IntervalTree
+from .plates import Plate
+
+if TYPE_CHECKING:
+    from .stiffeners import Stiffener
+
+
+# Two plate edges closer than this (m) are the same edge
+SEAM_TOLERANCE_M = 0.01
+
+
+class _ZoneIndex:
+    """
+    Plates of one zone, indexed by frame range and by seam edges.
+
+    Frame lookup uses an interval tree over the plates' frame ranges:
+    O(n log n) to build, and one O(log n + k) stab per lookup.
+    """
+
+    def __init__(self, plates: List[Plate]):
+        self.plates = plates
+
+        # Items are (input position, plate) so lookups can restore input order
+        ranges = []
+        for order, plate in enumerate(plates):
+            lo, hi = sorted((plate.extent.frame_start, plate.extent.frame_end))
+            ranges.append((lo, hi, (order, plate)))
+        self._frames: IntervalTree[Tuple[int, Plate]] = IntervalTree(ranges)
+
+        # Seam candidates: plates by frame_start and by (frame_start, frame_end),
+        # each sorted by y_start for a bisect on the shared edge
+        self._by_start = self._sorted_groups(plates, lambda p: p.extent.frame_start)
+        self._by_span = self._sorted_groups(plates, lambda p: (p.extent.frame_start, p.extent.frame_end))
+
+    @staticmethod
+    def _sorted_groups(plates: List[Plate], key) -> Dict[object, Tuple[List[float], List[Plate]]]:
+        groups: Dict[object, List[Plate]] = {}
+        for plate in plates:
+            groups.setdefault(key(plate), []).append(plate)
+        result = {}
+        for group_key, group in groups.items():
+            group.sort(key=lambda p: p.extent.y_start)
+            result[group_key] = ([p.extent.y_start for p in group], group)
+        return result
+
+    def at_frame(self, frame: int) -> List[Plate]:
+        """Plates whose frame range contains frame, in input order."""
+        found = self._frames.stab(frame)
+        found.sort(key=lambda f: f[0])
+        return [plate for _, plate in found]
+
+    def adjacent(self, plate: Plate, tolerance: float) -> List[Plate]:
+        """
+        Plates sharing an edge with plate, on its forward or outboard side.
+
+        Longitudinal neighbour: same y range, starts at plate's frame_end.
+        Transverse neighbour: same frame range, y_start at plate's y_end.
+        """
+        extent = plate.extent
+        found: List[Plate] = []
+
+        group = self._by_start.get(extent.frame_end)
+        if group is not None:
+            for other in self._near(group, extent.y_start, tolerance):
+                if other is not plate and abs(other.extent.y_end - extent.y_end) < tolerance:
+                    found.append(other)
+
+        group = self._by_span.get((extent.frame_start, extent.frame_end))
+        if group is not None:
+            for other in self._near(group, extent.y_end, tolerance):
+                if other is not plate and all(other is not f for f in found):
+                    found.append(other)
+
+        return found
+
+    @staticmethod
+    def _near(group: Tuple[List[float], List[Plate]], y: float, tolerance: float) -> List[Plate]:
+        """Plates of a y_start-sorted group with |y_start - y| < tolerance."""
+        keys, plates = group
+        lo = bisect_right(keys, y - tolerance)
+        hi = bisect_left(keys, y + tolerance)
+        return plates[lo:hi]
+
+
+class PlateIndex:
+    """
+    Spatial index over a plate list.
+
+    Build once per plate list and share it: plate lookup by ID, plates
+    covering a frame within a zone, stiffener attachment lookup and exact
+    seam (edge-sharing) detection.
+    """
+
+    def __init__(self, plates: Iterable[Plate]):
+        self.plates: List[Plate] = list(plates)
+        # Position in the input list, by object identity
+        self._order: Dict[int, int] = {}
+        self._by_id: Dict[str, Plate] = {}
+        by_zone: Dict[str, List[Plate]] = {}
+        for i, plate in enumerate(self.plates):
+            self._order[id(plate)] = i
+            self._by_id.setdefault(plate.plate_id, plate)
+            by_zone.setdefault(plate.zone, []).append(plate)
+        self._zones = {zone: _ZoneIndex(zone_plates) for zone, zone_plates in by_zone.items()}
+
+    def __len__(self) -> int:
+        return len(self.plates)
+
+    @property
+    def zones(self) -> List[str]:
+        """Zones in order of first appearance."""
+        return list(self._zones)
+
+    def get(self, plate_id: str) -> Optional[Plate]:
+        """Plate by ID."""
+        return self._by_id.get(plate_id)
+
+    def zone_plates(self, zone: str) -> List[Plate]:
+        """All plates of a zone, in input order."""
+        index = self._zones.get(zone)
+        return list(index.plates) if index else []
+
+    def at(self, zone: str, frame: int, y: Optional[float] = None) -> List[Plate]:
+        """
+        Plates of a zone whose frame range contains frame (inclusive).
+
+        With y, only plates whose y range contains it.
+        """
+        index = self._zones.get(zone)
+        if index is None:
+            return []
+        plates = index.at_frame(frame)
+        if y is not None:
+            plates = [p for p in plates if _contains_y(p, y)]
+        return list(plates)
+
+    def find_for_stiffener(self, stiffener: 'Stiffener') -> Optional[Plate]:
+        """
+        Plate a stiffener is attached to.
+
+        By attached_to_plate first; otherwise a plate of the stiffener's
+        zone covering its first or last frame, preferring one whose y range
+        contains the stiffener (or its mirror, for half-breadth plating),
+        then the earliest in the plate list.
+        """
+        if stiffener.attached_to_plate:
+            plate = self._by_id.get(stiffener.attached_to_plate)
+            if plate is not None:
+                return plate
+
+        index = self._zones.get(stiffener.zone)
+        if index is None:
+            return None
+
+        candidates = index.at_frame(stiffener.frame_start)
+        if stiffener.frame_end != stiffener.frame_start:
+            seen = {id(p) for p in candidates}
+            extra = [p for p in index.at_frame(stiffener.frame_end) if id(p) not in seen]
+            if extra:
+                candidates = sorted(candidates + extra, key=lambda p: self._order[id(p)])
+
+        # Candidates are in input order, so the first match is the earliest
+        y = stiffener.y_position
+        mirrored = None
+        for plate in candidates:
+            if _contains_y(plate, y):
+                return plate
+            if mirrored is None and _contains_y(plate, -y):
+                mirrored = plate
+        if mirrored is not None:
+            return mirrored
+        return candidates[0] if candidates else None
+
+    def adjacent_pairs(self, zone: str, tolerance: float = SEAM_TOLERANCE_M) -> List[Tuple[Plate, Plate]]:
+        """
+        Every pair of plates in a zone that share an edge.
+
+        Each pair appears once, ordered as (aft or inboard plate, its
+        neighbour), and pairs are sorted by the first plate's frame_start
+        and y_start.
+        """
+        index = self._zones.get(zone)
+        if index is None:
+            return []
+
+        pairs: List[Tuple[Plate, Plate]] = []
+        seen = set()
+        ordered = sorted(index.plates, key=lambda p: (p.extent.frame_start, p.extent.y_start))
+        for plate in ordered:
+            for other in index.adjacent(plate, tolerance):
+                key = (id(plate), id(other)) if id(plate) < id(other) else (id(other), id(plate))
+                if key not in seen:
+                    seen.add(key)
+                    pairs.append((plate, other))
+        return pairs
+
+
+def _contains_y(plate: Plate, y: float) -> bool:
+    y_start = plate.extent.y_start
+    y_end = plate.extent.y_end
+    if y_start > y_end:
+        y_start, y_end = y_end, y_start
+    return y_start - SEAM_TOLERANCE_M < y < y_end + SEAM_TOLERANCE_M
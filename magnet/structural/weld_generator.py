@@ -3,13 +3,14 @@ structural/weld_generator.py - Weld generation.
 
 BRAVO OWNS THIS FILE.
 
-Module 24 v1.0 - Weld Generation.
+Module 24 v1.1 - Weld Generation.
 """
 
-from typing import Dict, List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from .grid import StructuralGrid
 from .plates import Plate
+from .plate_index import PlateIndex
 from .stiffeners import Stiffener
 from .welds import WeldJoint, WeldSeam, WeldSummary, WeldParameters, WeldProcess
 from .enums import (
@@ -51,23 +52,15 @@ class WeldGenerator:
     def generate_plate_seam_welds(
         self,
         plates: List[Plate],
+        index: Optional[PlateIndex] = None,
     ) -> List[WeldJoint]:
         """Generate welds at plate seam joints."""
         welds = []
+        index = index or PlateIndex(plates)
 
-        # Find adjacent plates and create butt welds
-        plate_dict = {p.plate_id: p for p in plates}
-
-        # Group by zone
-        by_zone: Dict[str, List[Plate]] = {}
-        for plate in plates:
-            if plate.zone not in by_zone:
-                by_zone[plate.zone] = []
-            by_zone[plate.zone].append(plate)
-
-        # Generate longitudinal seams (between plates in same zone)
-        for zone, zone_plates in by_zone.items():
-            zone_welds = self._generate_zone_seams(zone, zone_plates)
+        # Butt welds between edge-sharing plates of the same zone
+        for zone in index.zones:
+            zone_welds = self._generate_zone_seams(zone, index)
             welds.extend(zone_welds)
 
         return welds
@@ -76,13 +69,15 @@ class WeldGenerator:
         self,
         stiffeners: List[Stiffener],
         plates: List[Plate],
+        index: Optional[PlateIndex] = None,
     ) -> List[WeldJoint]:
         """Generate welds attaching stiffeners to plates."""
         welds = []
+        index = index or PlateIndex(plates)
 
         for stiffener in stiffeners:
             # Find attached plate
-            plate = self._find_plate_for_stiffener(stiffener, plates)
+            plate = self._find_plate_for_stiffener(stiffener, index)
             if plate is None:
                 continue
 
@@ -119,14 +114,20 @@ class WeldGenerator:
         self,
         grid: StructuralGrid,
         plates: List[Plate],
+        index: Optional[PlateIndex] = None,
     ) -> List[WeldJoint]:
         """Generate welds for bulkhead connections."""
         welds = []
+        index = index or PlateIndex(plates)
 
-        # Find bulkhead plates
-        bh_plates = [p for p in plates if p.zone == "bulkhead"]
+        for bh_plate in index.zone_plates("bulkhead"):
+            # Shell plating the bulkhead lands on (thickest governs)
+            shell = [
+                p for zone in ("bottom", "side")
+                for p in index.at(zone, bh_plate.extent.frame_start)
+            ]
+            shell_plate = max(shell, key=lambda p: p.thickness_mm) if shell else None
 
-        for bh_plate in bh_plates:
             # Perimeter weld to shell
             perimeter_length = 2 * (bh_plate.extent.width_m +
                                     abs(bh_plate.extent.y_end - bh_plate.extent.y_start)) * 1000
@@ -141,9 +142,9 @@ class WeldGenerator:
                 part_a=bh_plate.plate_id,
                 part_b="SHELL",
                 base_material_a=bh_plate.material,
-                base_material_b=MaterialGrade.AL_5083_H116,
+                base_material_b=shell_plate.material if shell_plate else MaterialGrade.AL_5083_H116,
                 thickness_a_mm=bh_plate.thickness_mm,
-                thickness_b_mm=6.0,
+                thickness_b_mm=shell_plate.thickness_mm if shell_plate else 6.0,
                 parameters=self._get_weld_parameters(
                     self._get_fillet_size(bh_plate.thickness_mm)
                 ),
@@ -162,15 +163,16 @@ class WeldGenerator:
         """Generate all welds for the structure."""
         self.weld_counter = 0
         welds = []
+        index = PlateIndex(plates)
 
         # Plate seams
-        welds.extend(self.generate_plate_seam_welds(plates))
+        welds.extend(self.generate_plate_seam_welds(plates, index))
 
         # Stiffener attachment
-        welds.extend(self.generate_stiffener_welds(stiffeners, plates))
+        welds.extend(self.generate_stiffener_welds(stiffeners, plates, index))
 
         # Bulkhead connections
-        welds.extend(self.generate_bulkhead_welds(grid, plates))
+        welds.extend(self.generate_bulkhead_welds(grid, plates, index))
 
         return welds
 
@@ -204,62 +206,39 @@ class WeldGenerator:
     def _generate_zone_seams(
         self,
         zone: str,
-        plates: List[Plate],
+        index: PlateIndex,
     ) -> List[WeldJoint]:
         """Generate seam welds within a zone."""
         welds = []
 
-        # Sort by position to find adjacent plates
-        sorted_plates = sorted(plates, key=lambda p: (p.extent.frame_start, p.extent.y_start))
-
-        for i in range(len(sorted_plates) - 1):
-            plate_a = sorted_plates[i]
-            plate_b = sorted_plates[i + 1]
-
-            # Check if plates are adjacent (share a boundary)
-            if self._plates_adjacent(plate_a, plate_b):
-                # Calculate seam length
-                seam_length = self._calculate_seam_length(plate_a, plate_b)
-
-                if seam_length > 0:
-                    weld = WeldJoint(
-                        weld_id=f"W-{self.weld_counter:05d}",
-                        weld_type=WeldType.BUTT,
-                        weld_class=self._get_seam_class(zone),
-                        position=self._estimate_position(zone),
-                        leg_size_mm=0,
-                        throat_mm=min(plate_a.thickness_mm, plate_b.thickness_mm),
-                        length_mm=seam_length,
-                        part_a=plate_a.plate_id,
-                        part_b=plate_b.plate_id,
-                        base_material_a=plate_a.material,
-                        base_material_b=plate_b.material,
-                        thickness_a_mm=plate_a.thickness_mm,
-                        thickness_b_mm=plate_b.thickness_mm,
-                        parameters=self._get_weld_parameters(
-                            min(plate_a.thickness_mm, plate_b.thickness_mm)
-                        ),
-                    )
-                    welds.append(weld)
-                    self.weld_counter += 1
+        # Every pair of plates sharing a boundary
+        for plate_a, plate_b in index.adjacent_pairs(zone):
+            # Calculate seam length
+            seam_length = self._calculate_seam_length(plate_a, plate_b)
 
-        return welds
-
-    def _plates_adjacent(self, plate_a: Plate, plate_b: Plate) -> bool:
-        """Check if two plates share a boundary."""
-        # Check longitudinal adjacency (same y range, adjacent frames)
-        if (abs(plate_a.extent.y_start - plate_b.extent.y_start) < 0.01 and
-            abs(plate_a.extent.y_end - plate_b.extent.y_end) < 0.01):
-            if plate_a.extent.frame_end == plate_b.extent.frame_start:
-                return True
-
-        # Check transverse adjacency (same frame range, adjacent y)
-        if (plate_a.extent.frame_start == plate_b.extent.frame_start and
-            plate_a.extent.frame_end == plate_b.extent.frame_end):
-            if abs(plate_a.extent.y_end - plate_b.extent.y_start) < 0.01:
-                return True
+            if seam_length > 0:
+                weld = WeldJoint(
+                    weld_id=f"W-{self.weld_counter:05d}",
+                    weld_type=WeldType.BUTT,
+                    weld_class=self._get_seam_class(zone),
+                    position=self._estimate_position(zone),
+                    leg_size_mm=0,
+                    throat_mm=min(plate_a.thickness_mm, plate_b.thickness_mm),
+                    length_mm=seam_length,
+                    part_a=plate_a.plate_id,
+                    part_b=plate_b.plate_id,
+                    base_material_a=plate_a.material,
+                    base_material_b=plate_b.material,
+                    thickness_a_mm=plate_a.thickness_mm,
+                    thickness_b_mm=plate_b.thickness_mm,
+                    parameters=self._get_weld_parameters(
+                        min(plate_a.thickness_mm, plate_b.thickness_mm)
+                    ),
+                )
+                welds.append(weld)
+                self.weld_counter += 1
 
-        return False
+        return welds
 
     def _calculate_seam_length(self, plate_a: Plate, plate_b: Plate) -> float:
         """Calculate length of seam between plates (mm)."""
@@ -278,23 +257,10 @@ class WeldGenerator:
     def _find_plate_for_stiffener(
         self,
         stiffener: Stiffener,
-        plates: List[Plate],
-    ) -> Plate:
+        index: PlateIndex,
+    ) -> Optional[Plate]:
         """Find the plate a stiffener is attached to."""
-        # First try by ID
-        if stiffener.attached_to_plate:
-            for plate in plates:
-                if plate.plate_id == stiffener.attached_to_plate:
-                    return plate
-
-        # Fall back to position matching
-        for plate in plates:
-            if plate.zone == stiffener.zone:
-                if (plate.extent.frame_start <= stiffener.frame_start <= plate.extent.frame_end or
-                    plate.extent.frame_start <= stiffener.frame_end <= plate.extent.frame_end):
-                    return plate
-
-        return None
+        return index.find_for_stiffener(stiffener)
 
     def _get_fillet_size(self, thickness_mm: float) -> float:
         """Get fillet weld leg size for plate thickness."""
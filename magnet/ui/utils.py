@@ -370,18 +370,30 @@ def set_phase_status(state: Any, phase: str, status: str, source: str = "ui") ->
 # STATE SERIALIZATION
 # =============================================================================
 
-def serialize_state(state: Any) -> Dict[str, Any]:
+def serialize_state(state: Any, include_history: bool = True) -> Dict[str, Any]:
     """
     Serialize state to dictionary.
 
     Used by CLI save, ReportGenerator, DataPackageExporter.
 
+    Args:
+        state: State manager or state object
+        include_history: Include the mutation history (state fetches
+            leave it out; it is paged separately)
+
     Returns:
         Dictionary representation of state
     """
     if hasattr(state, 'to_dict'):
         try:
-            return state.to_dict()
+            if include_history:
+                return state.to_dict()
+            try:
+                return state.to_dict(include_history=False)
+            except TypeError:
+                data = state.to_dict()
+                data.pop("history", None)
+                return data
         except Exception as e:
             logger.warning(f"to_dict() failed: {e}")
 
@@ -34,6 +34,7 @@ from .executor import (
     PipelineExecutor,
     ExecutionState,
     ValidationCache,
+    PersistentValidationCache,
 )
 from .aggregator import (
     ResultAggregator,
@@ -86,6 +87,7 @@ __all__ = [
     "PipelineExecutor",
     "ExecutionState",
     "ValidationCache",
+    "PersistentValidationCache",
     # Aggregator
     "ResultAggregator",
     "GateStatus",
@@ -15,14 +15,17 @@ v1.1 Changes:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Any, TYPE_CHECKING
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union, Any, TYPE_CHECKING
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, Future, wait
+import heapq
 import threading
 import json
 import logging
+import sqlite3
 import time
 import uuid
 
@@ -34,7 +37,7 @@ from .taxonomy import (
     ResourcePool,
     ResourceRequirements,
 )
-from .topology import ValidatorTopology
+from .topology import TopologyNode, ValidatorTopology
 
 if TYPE_CHECKING:
     from magnet.core.state_manager import StateManager
@@ -46,6 +49,41 @@ logger = logging.getLogger(__name__)
 # EXECUTION STATE (FIX #11: Serializable)
 # =============================================================================
 
+@dataclass
+class TimelineEntry:
+    """Scheduling timestamps for one validator, in ms since the run started."""
+    queued_ms: float
+    started_ms: Optional[float] = None
+    finished_ms: Optional[float] = None
+
+    @property
+    def queue_wait_ms(self) -> float:
+        if self.started_ms is None:
+            return 0.0
+        return self.started_ms - self.queued_ms
+
+    @property
+    def run_time_ms(self) -> float:
+        if self.started_ms is None or self.finished_ms is None:
+            return 0.0
+        return self.finished_ms - self.started_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queued_ms": round(self.queued_ms, 3),
+            "started_ms": round(self.started_ms, 3) if self.started_ms is not None else None,
+            "finished_ms": round(self.finished_ms, 3) if self.finished_ms is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TimelineEntry":
+        return cls(
+            queued_ms=data["queued_ms"],
+            started_ms=data.get("started_ms"),
+            finished_ms=data.get("finished_ms"),
+        )
+
+
 @dataclass
 class ExecutionState:
     """
@@ -74,6 +112,9 @@ class ExecutionState:
     had_fatal_error: bool = False
     fatal_error_validator: Optional[str] = None
 
+    # Per-run scheduling timeline (queued/started/finished per validator)
+    timeline: Dict[str, TimelineEntry] = field(default_factory=dict)
+
     @property
     def is_complete(self) -> bool:
         return len(self.pending) == 0 and len(self.running) == 0
@@ -97,6 +138,25 @@ class ExecutionState:
             "had_fatal_error": self.had_fatal_error,
         }
 
+    def get_timing_breakdown(self) -> List[Dict[str, Any]]:
+        """Timeline entries ordered by start time, for profiling."""
+        entries = sorted(
+            self.timeline.items(),
+            key=lambda item: (
+                item[1].started_ms if item[1].started_ms is not None else float("inf"),
+                item[0],
+            ),
+        )
+        return [
+            {
+                "validator_id": v_id,
+                **entry.to_dict(),
+                "queue_wait_ms": round(entry.queue_wait_ms, 3),
+                "run_time_ms": round(entry.run_time_ms, 3),
+            }
+            for v_id, entry in entries
+        ]
+
     # FIX #11: Serialization
     def to_dict(self) -> Dict[str, Any]:
         """Serialize entire execution state."""
@@ -113,6 +173,7 @@ class ExecutionState:
             "errors": self.errors,
             "had_fatal_error": self.had_fatal_error,
             "fatal_error_validator": self.fatal_error_validator,
+            "timeline": {k: v.to_dict() for k, v in self.timeline.items()},
         }
 
     def save(self, path: Path) -> None:
@@ -141,6 +202,10 @@ class ExecutionState:
         state.errors = data.get("errors", [])
         state.had_fatal_error = data.get("had_fatal_error", False)
         state.fatal_error_validator = data.get("fatal_error_validator")
+        state.timeline = {
+            v_id: TimelineEntry.from_dict(t_data)
+            for v_id, t_data in data.get("timeline", {}).items()
+        }
 
         # Results would need ValidationResult.from_dict() to fully restore
         for v_id, r_data in data.get("results", {}).items():
@@ -166,21 +231,162 @@ class CacheEntry:
         return age < self.ttl_seconds
 
 
+# Deterministic outcomes of validate(); ERROR/NOT_IMPLEMENTED are never cached
+CACHEABLE_STATES = (
+    ValidatorState.PASSED,
+    ValidatorState.WARNING,
+    ValidatorState.FAILED,
+)
+
+
+class PersistentValidationCache:
+    """
+    SQLite-backed validation cache tier.
+
+    Entries are keyed by (design_id, validator_id, input_hash), so every
+    executor working on the same design shares results across processes
+    and restarts. design_id may be a callable, read on every access, so
+    the tier follows a StateManager as designs are loaded and reset.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        design_id: Union[str, Callable[[], Optional[str]], None] = None,
+    ):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._design_id = design_id
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS validation_cache (
+                    design_id TEXT NOT NULL,
+                    validator_id TEXT NOT NULL,
+                    input_hash TEXT NOT NULL,
+                    result_json TEXT NOT NULL,
+                    cached_at TEXT NOT NULL,
+                    ttl_seconds INTEGER NOT NULL,
+                    PRIMARY KEY (design_id, validator_id, input_hash)
+                )
+                """
+            )
+
+    @property
+    def design_id(self) -> str:
+        """Design the tier currently reads and writes."""
+        design_id = self._design_id() if callable(self._design_id) else self._design_id
+        return design_id or ""
+
+    def get(self, validator_id: str, input_hash: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result_json, cached_at, ttl_seconds FROM validation_cache "
+                "WHERE design_id = ? AND validator_id = ? AND input_hash = ?",
+                (self.design_id, validator_id, input_hash),
+            ).fetchone()
+        if row is None:
+            return None
+        entry = CacheEntry(
+            result=ValidationResult.from_dict(json.loads(row[0])),
+            input_hash=input_hash,
+            cached_at=datetime.fromisoformat(row[1]),
+            ttl_seconds=row[2],
+        )
+        return entry if entry.is_valid() else None
+
+    def put(self, validator_id: str, entry: CacheEntry) -> None:
+        payload = json.dumps(entry.result.to_dict(), default=str)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO validation_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.design_id, validator_id, entry.input_hash, payload,
+                    entry.cached_at.isoformat(), entry.ttl_seconds,
+                ),
+            )
+
+    def invalidate(self, validator_id: Optional[str] = None) -> None:
+        with self._lock, self._conn:
+            if validator_id is None:
+                self._conn.execute(
+                    "DELETE FROM validation_cache WHERE design_id = ?",
+                    (self.design_id,),
+                )
+            else:
+                self._conn.execute(
+                    "DELETE FROM validation_cache WHERE design_id = ? AND validator_id = ?",
+                    (self.design_id, validator_id),
+                )
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM validation_cache WHERE design_id = ?",
+                (self.design_id,),
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class ValidationCache:
-    """In-memory cache for validation results."""
+    """
+    Bounded LRU cache for validation results.
+
+    Entries are content-addressed by (validator_id, input_hash), so results
+    for several design alternatives coexist and flipping back to an earlier
+    state (e.g. after undo) is a cache hit. An optional persistent tier is
+    consulted on memory misses and written through on put.
+    """
 
-    def __init__(self):
-        self._cache: Dict[str, CacheEntry] = {}
+    DEFAULT_MAX_ENTRIES = 2048
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        persistent: Optional[PersistentValidationCache] = None,
+    ):
+        self._cache: "OrderedDict[Tuple[str, str], CacheEntry]" = OrderedDict()
+        self._max_entries = max(1, max_entries)
+        self._persistent = persistent
         self._lock = threading.Lock()
 
+        # Counters
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._persistent_hits = 0
+
     def get(self, validator_id: str, input_hash: str) -> Optional[ValidationResult]:
+        key = (validator_id, input_hash)
         with self._lock:
-            entry = self._cache.get(validator_id)
-            if entry and entry.input_hash == input_hash and entry.is_valid():
-                result = entry.result
-                result.was_cached = True
-                return result
-            return None
+            entry = self._cache.get(key)
+            if entry is not None:
+                if entry.is_valid():
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return replace(entry.result, was_cached=True)
+                del self._cache[key]
+                self._expirations += 1
+
+        if self._persistent is not None:
+            entry = self._persistent.get(validator_id, input_hash)
+            if entry is not None:
+                with self._lock:
+                    self._insert(key, entry)
+                    self._hits += 1
+                    self._persistent_hits += 1
+                return replace(entry.result, was_cached=True)
+
+        with self._lock:
+            self._misses += 1
+        return None
 
     def put(
         self,
@@ -189,30 +395,57 @@ class ValidationCache:
         result: ValidationResult,
         ttl_seconds: int
     ) -> None:
+        entry = CacheEntry(
+            result=result,
+            input_hash=input_hash,
+            cached_at=datetime.utcnow(),
+            ttl_seconds=ttl_seconds,
+        )
         with self._lock:
-            self._cache[validator_id] = CacheEntry(
-                result=result,
-                input_hash=input_hash,
-                cached_at=datetime.utcnow(),
-                ttl_seconds=ttl_seconds,
-            )
+            self._insert((validator_id, input_hash), entry)
+        if self._persistent is not None:
+            self._persistent.put(validator_id, entry)
+
+    def _insert(self, key: Tuple[str, str], entry: CacheEntry) -> None:
+        """Insert under lock, evicting least recently used entries."""
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+            self._evictions += 1
 
     def invalidate(self, validator_id: str) -> None:
         with self._lock:
-            self._cache.pop(validator_id, None)
+            for key in [k for k in self._cache if k[0] == validator_id]:
+                del self._cache[key]
+        if self._persistent is not None:
+            self._persistent.invalidate(validator_id)
 
     def invalidate_all(self) -> None:
         with self._lock:
             self._cache.clear()
+        if self._persistent is not None:
+            self._persistent.invalidate()
 
     def get_stats(self) -> Dict[str, Any]:
         with self._lock:
             valid_count = sum(1 for e in self._cache.values() if e.is_valid())
-            return {
+            lookups = self._hits + self._misses
+            stats = {
                 "total_entries": len(self._cache),
                 "valid_entries": valid_count,
-                "validator_ids": list(self._cache.keys()),
+                "max_entries": self._max_entries,
+                "validator_ids": sorted({k[0] for k in self._cache}),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "persistent_hits": self._persistent_hits,
             }
+        if self._persistent is not None:
+            stats["persistent_entries"] = self._persistent.count()
+        return stats
 
 
 # =============================================================================
@@ -234,7 +467,9 @@ class PipelineExecutor:
         max_workers: int = DEFAULT_MAX_WORKERS,
         contract_layer: Optional[Any] = None,  # FIX #8
         resource_pool: Optional[ResourcePool] = None,  # FIX #9
-        design_id: Optional[str] = None,  # Hole #2 Fix: Design-scoped execution
+        design_id: Optional[str] = None,  # Hole #2 Fix: fixed scope; None follows state_manager
+        cache_max_entries: int = ValidationCache.DEFAULT_MAX_ENTRIES,
+        cache_path: Optional[Path] = None,  # Optional on-disk tier, shared per design
     ):
         self._topology = topology
         self._state_manager = state_manager
@@ -247,8 +482,12 @@ class PipelineExecutor:
         self._resource_pool = resource_pool or ResourcePool()
         self._resource_lock = threading.Lock()
 
-        # Hole #2 Fix: Each executor instance gets its own cache (no shared state)
-        self._cache = ValidationCache()
+        # Hole #2 Fix: Each executor instance gets its own in-memory cache;
+        # the optional persistent tier is scoped by the current design_id
+        persistent = (
+            PersistentValidationCache(cache_path, lambda: self.design_id) if cache_path else None
+        )
+        self._cache = ValidationCache(cache_max_entries, persistent)
         self._progress_callbacks: List[Callable[[str, ValidationResult], None]] = []
         self._current_execution: Optional[ExecutionState] = None
 
@@ -308,94 +547,9 @@ class PipelineExecutor:
                 logger.error(f"Contract precondition failed: {e}")
 
         try:
-            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-                while not state.is_complete:
-                    # FIX #4: Check for fatal error
-                    if state.had_fatal_error and stop_on_fatal_error:
-                        logger.error(
-                            f"Aborting pipeline due to fatal error in "
-                            f"{state.fatal_error_validator}"
-                        )
-                        self._skip_remaining(state)
-                        break
-
-                    ready = self._topology.get_ready_validators(
-                        state.completed | state.failed | state.skipped,
-                        state.running
-                    )
-                    ready = [v for v in ready if v in state.pending]
-
-                    if not ready and state.running:
-                        time.sleep(0.1)
-                        continue
-
-                    if not ready:
-                        break
-
-                    # FIX #9: Resource-aware scheduling
-                    ready = self._filter_by_resources(ready)
-
-                    futures: Dict[Future, str] = {}
-                    for validator_id in ready:
-                        state.pending.remove(validator_id)
-                        state.running.add(validator_id)
-
-                        # FIX #9: Allocate resources
-                        node = self._topology.get_node(validator_id)
-                        if node:
-                            self._allocate_resources(node.validator.resource_requirements)
-
-                        future = executor.submit(
-                            self._execute_validator,
-                            validator_id,
-                            skip_cached,
-                            skip_unchanged  # FIX #10
-                        )
-                        futures[future] = validator_id
-
-                    for future in as_completed(futures):
-                        validator_id = futures[future]
-                        state.running.remove(validator_id)
-
-                        # FIX #9: Release resources
-                        node = self._topology.get_node(validator_id)
-                        if node:
-                            self._release_resources(node.validator.resource_requirements)
-
-                        try:
-                            result = future.result()
-                            state.results[validator_id] = result
-
-                            # FIX #10: Update last validation time
-                            self._last_validation_times[validator_id] = datetime.utcnow()
-
-                            if result.state == ValidatorState.PASSED:
-                                state.completed.add(validator_id)
-                            elif result.state == ValidatorState.WARNING:
-                                state.completed.add(validator_id)
-                            elif result.state == ValidatorState.FAILED:
-                                state.failed.add(validator_id)
-                                if stop_on_failure:
-                                    self._skip_dependents(validator_id, state)
-                            elif result.state == ValidatorState.ERROR:
-                                # FIX #4: Fatal error handling
-                                state.failed.add(validator_id)
-                                state.had_fatal_error = True
-                                state.fatal_error_validator = validator_id
-                                logger.error(
-                                    f"Fatal error in {validator_id}: {result.error_message}"
-                                )
-                            elif result.state == ValidatorState.SKIPPED:
-                                state.skipped.add(validator_id)
-                            else:
-                                state.completed.add(validator_id)
-
-                            self._notify_progress(validator_id, result)
-
-                        except Exception as e:
-                            state.failed.add(validator_id)
-                            state.errors.append(f"{validator_id}: {e}")
-
+            self._run_scheduler(
+                state, skip_cached, stop_on_failure, stop_on_fatal_error, skip_unchanged
+            )
         finally:
             state.completed_at = datetime.utcnow()
             self._current_execution = None
@@ -439,15 +593,183 @@ class PipelineExecutor:
         self,
         validator_id: str,
         skip_cached: bool = True,
+        state_manager: Optional["StateManager"] = None,
     ) -> ValidationResult:
-        """Execute a single validator."""
+        """
+        Execute a single validator.
+
+        Args:
+            validator_id: Validator to run
+            skip_cached: Return a cached result when inputs are unchanged
+            state_manager: State to validate instead of the executor's own
+                (e.g. a scratch view); results are not cached for it
+        """
+        if state_manager is not None and state_manager is not self._state_manager:
+            return self._execute_validator(validator_id, False, False, state_manager)
         return self._execute_validator(validator_id, skip_cached, False)
 
+    def _run_scheduler(
+        self,
+        state: ExecutionState,
+        skip_cached: bool,
+        stop_on_failure: bool,
+        stop_on_fatal_error: bool,
+        skip_unchanged: bool,
+    ) -> None:
+        """
+        Completion-driven scheduling of state.pending.
+
+        Each pending validator gets a ready counter seeded from
+        TopologyNode.in_degree minus dependencies already finished. A
+        validator is started as soon as its counter reaches zero and its
+        resources fit (FIX #9), so one slow validator only delays its own
+        dependents. Validators whose dependencies are outside this run and
+        not previously completed never become ready and stay pending.
+        """
+        run_start = time.perf_counter()
+        finished = state.completed | state.failed | state.skipped
+        unmet: Dict[str, int] = {}
+        ready: List[Tuple[int, str]] = []
+
+        def enqueue(validator_id: str, node: TopologyNode) -> None:
+            state.timeline[validator_id] = TimelineEntry(
+                queued_ms=(time.perf_counter() - run_start) * 1000.0
+            )
+            heapq.heappush(ready, (node.validator.priority.value, validator_id))
+
+        for validator_id in sorted(state.pending):
+            node = self._topology.get_node(validator_id)
+            if node is None:
+                continue
+            unmet[validator_id] = node.in_degree - len(node.all_dependencies & finished)
+            if unmet[validator_id] == 0:
+                enqueue(validator_id, node)
+
+        in_flight: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while True:
+                # FIX #4: Check for fatal error; in-flight validators still drain
+                if state.had_fatal_error and stop_on_fatal_error and state.pending:
+                    logger.error(
+                        f"Aborting pipeline due to fatal error in "
+                        f"{state.fatal_error_validator}"
+                    )
+                    self._skip_remaining(state)
+
+                deferred: List[Tuple[int, str]] = []
+                while ready:
+                    entry = heapq.heappop(ready)
+                    validator_id = entry[1]
+                    if validator_id not in state.pending:
+                        continue  # Skipped after it became ready
+                    node = self._topology.get_node(validator_id)
+                    # FIX #9: Resource-aware scheduling
+                    if not self._try_allocate_resources(node.validator.resource_requirements):
+                        deferred.append(entry)
+                        continue
+                    state.pending.remove(validator_id)
+                    state.running.add(validator_id)
+                    future = executor.submit(
+                        self._execute_timed,
+                        validator_id,
+                        skip_cached,
+                        skip_unchanged,  # FIX #10
+                        state.timeline[validator_id],
+                        run_start,
+                    )
+                    in_flight[future] = validator_id
+                for entry in deferred:
+                    heapq.heappush(ready, entry)
+
+                if not in_flight:
+                    if deferred:
+                        state.errors.append(
+                            "Insufficient resources to run: "
+                            + ", ".join(sorted(v_id for _, v_id in deferred))
+                        )
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    validator_id = in_flight.pop(future)
+                    state.running.remove(validator_id)
+
+                    # FIX #9: Release resources
+                    node = self._topology.get_node(validator_id)
+                    self._release_resources(node.validator.resource_requirements)
+
+                    self._record_result(validator_id, future, state, stop_on_failure)
+
+                    for dependent_id in node.depended_by:
+                        if dependent_id not in unmet:
+                            continue
+                        unmet[dependent_id] -= 1
+                        if unmet[dependent_id] == 0 and dependent_id in state.pending:
+                            enqueue(dependent_id, self._topology.get_node(dependent_id))
+
+    def _execute_timed(
+        self,
+        validator_id: str,
+        skip_cached: bool,
+        skip_unchanged: bool,
+        timeline: TimelineEntry,
+        run_start: float,
+    ) -> ValidationResult:
+        """Run _execute_validator on a worker, stamping the timeline entry."""
+        timeline.started_ms = (time.perf_counter() - run_start) * 1000.0
+        try:
+            return self._execute_validator(validator_id, skip_cached, skip_unchanged)
+        finally:
+            timeline.finished_ms = (time.perf_counter() - run_start) * 1000.0
+
+    def _record_result(
+        self,
+        validator_id: str,
+        future: Future,
+        state: ExecutionState,
+        stop_on_failure: bool,
+    ) -> None:
+        """Fold a finished validator's result into the execution state."""
+        try:
+            result = future.result()
+            state.results[validator_id] = result
+
+            # FIX #10: Update last validation time
+            self._last_validation_times[validator_id] = datetime.utcnow()
+
+            if result.state == ValidatorState.PASSED:
+                state.completed.add(validator_id)
+            elif result.state == ValidatorState.WARNING:
+                state.completed.add(validator_id)
+            elif result.state == ValidatorState.FAILED:
+                state.failed.add(validator_id)
+                if stop_on_failure:
+                    self._skip_dependents(validator_id, state)
+            elif result.state == ValidatorState.ERROR:
+                # FIX #4: Fatal error handling
+                state.failed.add(validator_id)
+                state.had_fatal_error = True
+                state.fatal_error_validator = validator_id
+                logger.error(
+                    f"Fatal error in {validator_id}: {result.error_message}"
+                )
+            elif result.state == ValidatorState.SKIPPED:
+                state.skipped.add(validator_id)
+            else:
+                state.completed.add(validator_id)
+
+            self._notify_progress(validator_id, result)
+
+        except Exception as e:
+            state.failed.add(validator_id)
+            state.errors.append(f"{validator_id}: {e}")
+
     def _execute_validator(
         self,
         validator_id: str,
         skip_cached: bool,
-        skip_unchanged: bool  # FIX #10
+        skip_unchanged: bool,  # FIX #10
+        state_manager: Optional["StateManager"] = None,
     ) -> ValidationResult:
         """
         Execute single validator with all fixes.
@@ -495,7 +817,7 @@ class PipelineExecutor:
         last_error = None
         for attempt in range(definition.max_retries + 1):
             try:
-                result = self._run_with_timeout(impl, definition.timeout_seconds)
+                result = self._run_with_timeout(impl, definition.timeout_seconds, state_manager)
                 result.retry_count = attempt
                 result.input_hash = input_hash
 
@@ -506,8 +828,12 @@ class PipelineExecutor:
                     ValidatorState.WARNING,
                     ValidatorState.FAILED
                 ):
-                    # Cache successful results
-                    if definition.is_cacheable and input_hash and result.passed:
+                    # Cache deterministic outcomes (including failures)
+                    if (
+                        definition.is_cacheable
+                        and input_hash
+                        and result.state in CACHEABLE_STATES
+                    ):
                         self._cache.put(
                             validator_id, input_hash, result,
                             definition.cache_ttl_seconds
@@ -546,6 +872,11 @@ class PipelineExecutor:
                         result.append(v_id)
             return result
 
+    def _try_allocate_resources(self, req: ResourceRequirements) -> bool:
+        """Allocate resources if they fit; returns False (no change) otherwise."""
+        with self._resource_lock:
+            return self._resource_pool.allocate(req)
+
     def _allocate_resources(self, req: ResourceRequirements) -> None:
         """Allocate resources for a validator."""
         with self._resource_lock:
@@ -573,12 +904,15 @@ class PipelineExecutor:
     def _run_with_timeout(
         self,
         impl: ValidatorInterface,
-        timeout_seconds: int
+        timeout_seconds: int,
+        state_manager: Optional["StateManager"] = None,
     ) -> ValidationResult:
         """Run validator (timeout handling simplified)."""
         start_time = time.time()
 
-        result = impl.validate(self._state_manager, {})
+        if state_manager is None:
+            state_manager = self._state_manager
+        result = impl.validate(state_manager, {})
         result.execution_time_ms = int((time.time() - start_time) * 1000)
         result.completed_at = datetime.utcnow()
 
@@ -640,6 +974,25 @@ class PipelineExecutor:
         """
         self._all_completed_validators.clear()
 
+    @property
+    def design_id(self) -> Optional[str]:
+        """The fixed design_id, else the state manager's current one."""
+        if self._design_id is not None:
+            return self._design_id
+        get_design_id = getattr(self._state_manager, "get_design_id", None)
+        return get_design_id() if get_design_id is not None else None
+
+    def reset_session(self) -> None:
+        """
+        Forget per-design run history before reusing this executor.
+
+        Clears completed validators and last-run times. The result cache is
+        content-addressed and is kept, so earlier results still hit.
+        """
+        self._all_completed_validators.clear()
+        self._last_validation_times.clear()
+        self._current_execution = None
+
     def get_completed_validators(self) -> Set[str]:
         """Get the set of validators completed across all phase executions."""
         return self._all_completed_validators.copy()
@@ -62,6 +62,7 @@ class TopologyNode:
     # Computed during build
     depth: int = 0
     execution_group: int = 0
+    in_degree: int = 0  # len(all_dependencies), seeds per-run ready counters
 
     @property
     def all_dependencies(self) -> Set[str]:
@@ -227,6 +228,8 @@ class ValidatorTopology:
     def _compute_depths(self) -> None:
         """Compute depth using all dependencies."""
         in_degree = {n: len(self._nodes[n].all_dependencies) for n in self._nodes}
+        for node_id, degree in in_degree.items():
+            self._nodes[node_id].in_degree = degree
         queue = deque([n for n, d in in_degree.items() if d == 0])
 
         while queue:
@@ -21,6 +21,8 @@ import base64
 import logging
 import math
 
+import numpy as np
+
 from .schema import MeshData, SceneData, MaterialDef, BoundingBox, GeometryMode
 from .errors import ExportError
 from .contracts import MeshCategory, AttributePolicy
@@ -400,40 +402,7 @@ class GeometryExporter:
         triangle_count = len(mesh.indices) // 3
         output.write(struct.pack("<I", triangle_count))
 
-        # Triangles
-        for i in range(0, len(mesh.indices), 3):
-            i0, i1, i2 = mesh.indices[i], mesh.indices[i+1], mesh.indices[i+2]
-
-            # Get vertices
-            v0 = (mesh.vertices[i0*3], mesh.vertices[i0*3+1], mesh.vertices[i0*3+2])
-            v1 = (mesh.vertices[i1*3], mesh.vertices[i1*3+1], mesh.vertices[i1*3+2])
-            v2 = (mesh.vertices[i2*3], mesh.vertices[i2*3+1], mesh.vertices[i2*3+2])
-
-            # Calculate face normal
-            e1 = (v1[0]-v0[0], v1[1]-v0[1], v1[2]-v0[2])
-            e2 = (v2[0]-v0[0], v2[1]-v0[1], v2[2]-v0[2])
-            n = (
-                e1[1]*e2[2] - e1[2]*e2[1],
-                e1[2]*e2[0] - e1[0]*e2[2],
-                e1[0]*e2[1] - e1[1]*e2[0],
-            )
-            length = math.sqrt(n[0]**2 + n[1]**2 + n[2]**2)
-            if length > 0:
-                n = (n[0]/length, n[1]/length, n[2]/length)
-            else:
-                n = (0, 0, 1)
-
-            # Write normal
-            output.write(struct.pack("<3f", n[0], n[1], n[2]))
-
-            # Write vertices
-            output.write(struct.pack("<3f", v0[0], v0[1], v0[2]))
-            output.write(struct.pack("<3f", v1[0], v1[1], v1[2]))
-            output.write(struct.pack("<3f", v2[0], v2[1], v2[2]))
-
-            # Attribute byte count (unused)
-            output.write(struct.pack("<H", 0))
-
+        output.write(_stl_records(mesh))
         return output.getvalue()
 
     def _export_stl_ascii(self, mesh: MeshData) -> bytes:
@@ -488,27 +457,22 @@ class GeometryExporter:
         ]
 
         # Vertices
-        for i in range(0, len(mesh.vertices), 3):
-            x, y, z = mesh.vertices[i], mesh.vertices[i+1], mesh.vertices[i+2]
-            lines.append(f"v {x:.6f} {y:.6f} {z:.6f}")
+        lines.extend(f"v {x:.6f} {y:.6f} {z:.6f}" for x, y, z in _triples(mesh.vertices))
 
         # Normals
         if mesh.normals:
             lines.append("")
-            for i in range(0, len(mesh.normals), 3):
-                nx, ny, nz = mesh.normals[i], mesh.normals[i+1], mesh.normals[i+2]
-                lines.append(f"vn {nx:.6f} {ny:.6f} {nz:.6f}")
+            lines.extend(f"vn {nx:.6f} {ny:.6f} {nz:.6f}" for nx, ny, nz in _triples(mesh.normals))
 
         # Faces (OBJ is 1-indexed)
         lines.append("")
         if mesh.normals:
-            for i in range(0, len(mesh.indices), 3):
-                i0, i1, i2 = mesh.indices[i]+1, mesh.indices[i+1]+1, mesh.indices[i+2]+1
-                lines.append(f"f {i0}//{i0} {i1}//{i1} {i2}//{i2}")
+            lines.extend(
+                f"f {i0}//{i0} {i1}//{i1} {i2}//{i2}"
+                for i0, i1, i2 in _triples(mesh.indices, offset=1)
+            )
         else:
-            for i in range(0, len(mesh.indices), 3):
-                i0, i1, i2 = mesh.indices[i]+1, mesh.indices[i+1]+1, mesh.indices[i+2]+1
-                lines.append(f"f {i0} {i1} {i2}")
+            lines.extend(f"f {i0} {i1} {i2}" for i0, i1, i2 in _triples(mesh.indices, offset=1))
 
         return "\n".join(lines).encode('utf-8')
 
@@ -527,15 +491,13 @@ class GeometryExporter:
             lines.append(f"o {name}")
 
             # Vertices
-            for i in range(0, len(mesh.vertices), 3):
-                x, y, z = mesh.vertices[i], mesh.vertices[i+1], mesh.vertices[i+2]
-                lines.append(f"v {x:.6f} {y:.6f} {z:.6f}")
+            lines.extend(f"v {x:.6f} {y:.6f} {z:.6f}" for x, y, z in _triples(mesh.vertices))
 
             # Normals
             if mesh.normals:
-                for i in range(0, len(mesh.normals), 3):
-                    nx, ny, nz = mesh.normals[i], mesh.normals[i+1], mesh.normals[i+2]
-                    lines.append(f"vn {nx:.6f} {ny:.6f} {nz:.6f}")
+                lines.extend(
+                    f"vn {nx:.6f} {ny:.6f} {nz:.6f}" for nx, ny, nz in _triples(mesh.normals)
+                )
 
             # Faces
             lines.append(f"g {name}")
@@ -592,3 +554,38 @@ class GeometryExporter:
             indices=combined_indices,
             normals=combined_normals if combined_normals else None,
         )
+
+
+def _triples(values, offset: int = 0):
+    """Iterate a flat list or packed buffer as (a, b, c) tuples."""
+    end = len(values) - len(values) % 3
+    if offset:
+        values = [v + offset for v in values[:end]]
+    return zip(values[0:end:3], values[1:end:3], values[2:end:3])
+
+
+# Binary STL facet: normal, three vertices, attribute byte count (50 bytes)
+_STL_RECORD = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attributes", "<u2"),
+])
+
+
+def _stl_records(mesh: MeshData) -> memoryview:
+    """Pack all binary STL facets of a mesh in one pass."""
+    positions = np.asarray(mesh.vertices, dtype=np.float64).reshape(-1, 3)
+    faces = np.asarray(mesh.indices, dtype=np.int64)
+    faces = faces[:len(faces) - len(faces) % 3].reshape(-1, 3)
+    corners = positions[faces]
+
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    degenerate = lengths <= 0
+    normals[~degenerate] /= lengths[~degenerate, None]
+    normals[degenerate] = (0.0, 0.0, 1.0)
+
+    records = np.zeros(len(faces), dtype=_STL_RECORD)
+    records["normal"] = normals
+    records["vertices"] = corners
+    return memoryview(records.view(np.uint8))
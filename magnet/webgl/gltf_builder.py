@@ -26,6 +26,7 @@ from .contracts import (
     MeshContractValidator,
 )
 from .errors import ExportError
+from .schema import UINT32, buffer_bytes
 
 if TYPE_CHECKING:
     from .schema import MeshData, ExportMetadata
@@ -286,30 +287,22 @@ class GLTFBuilder:
 
     def _write_positions(self, vertices: List[float]) -> Tuple[List[float], List[float]]:
         """Write position data, return (min, max) bounds."""
-        min_pos = [float('inf')] * 3
-        max_pos = [float('-inf')] * 3
+        self._buffer.write(buffer_bytes(vertices))
 
-        for i in range(0, len(vertices), 3):
-            x, y, z = vertices[i], vertices[i+1], vertices[i+2]
-            self._buffer.write(struct.pack("<3f", x, y, z))
-            min_pos[0] = min(min_pos[0], x)
-            min_pos[1] = min(min_pos[1], y)
-            min_pos[2] = min(min_pos[2], z)
-            max_pos[0] = max(max_pos[0], x)
-            max_pos[1] = max(max_pos[1], y)
-            max_pos[2] = max(max_pos[2], z)
+        end = len(vertices) - len(vertices) % 3
+        if end == 0:
+            return [float('inf')] * 3, [float('-inf')] * 3
 
-        return min_pos, max_pos
+        axes = [vertices[axis:end:3] for axis in range(3)]
+        return [min(a) for a in axes], [max(a) for a in axes]
 
     def _write_normals(self, normals: List[float]) -> None:
         """Write normal data."""
-        for i in range(0, len(normals), 3):
-            self._buffer.write(struct.pack("<3f", normals[i], normals[i+1], normals[i+2]))
+        self._buffer.write(buffer_bytes(normals))
 
     def _write_indices(self, indices: List[int]) -> None:
         """Write index data as uint32."""
-        for idx in indices:
-            self._buffer.write(struct.pack("<I", idx))
+        self._buffer.write(buffer_bytes(indices, UINT32))
 
     def _build_glb(self, buffer_bytes: bytes) -> bytes:
         """Build binary GLB format."""
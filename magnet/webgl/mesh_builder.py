@@ -5,15 +5,23 @@ Module 58: WebGL 3D Visualization
 ALPHA OWNS THIS FILE.
 
 Provides utilities for building triangle meshes with proper normals.
+
+MeshBuilder stores vertices and indices in contiguous arrays. Normals,
+tangents, merge and transform are vectorized with NumPy.
 """
 
 from __future__ import annotations
-from typing import List, Tuple, Optional
+from array import array
+from typing import List, Sequence, Tuple, Optional
 from dataclasses import dataclass, field
-import math
 import logging
 
-from .schema import MeshData
+import numpy as np
+
+from .schema import MeshData, FLOAT32, UINT32, pack_buffer
+
+# Faces per vectorized batch in _vertex_normals
+_FACE_CHUNK = 1 << 16
 
 logger = logging.getLogger("webgl.mesh_builder")
 
@@ -29,16 +37,19 @@ class MeshBuilder:
         v2 = builder.add_vertex(0, 1, 0)
         builder.add_triangle(v0, v1, v2)
         mesh = builder.build()
+
+    Whole blocks can be appended with add_vertex_buffer() and
+    add_triangle_buffer(); build(packed=True) returns float32/uint32 buffers.
     """
 
     def __init__(self):
-        self._vertices: List[float] = []
-        self._indices: List[int] = []
+        self._vertices = array("d")
+        self._indices = array("q")
         self._vertex_count = 0
 
     def add_vertex(self, x: float, y: float, z: float) -> int:
         """Add a vertex and return its index."""
-        self._vertices.extend([x, y, z])
+        self._vertices.extend((x, y, z))
         idx = self._vertex_count
         self._vertex_count += 1
         return idx
@@ -50,9 +61,36 @@ class MeshBuilder:
             indices.append(self.add_vertex(x, y, z))
         return indices
 
+    def add_vertex_buffer(self, vertices: Sequence[float]) -> int:
+        """
+        Add a block of vertices and return the index of the first one.
+
+        Accepts a flat [x,y,z, ...] sequence, a packed buffer or an (N, 3) array.
+        """
+        block = _flat_block(vertices, "d")
+        if len(block) % 3 != 0:
+            raise ValueError(f"Vertex buffer length {len(block)} is not a multiple of 3")
+
+        first = self._vertex_count
+        self._vertices.frombytes(memoryview(block).cast("B"))
+        self._vertex_count += len(block) // 3
+        return first
+
+    def add_triangle_buffer(self, indices: Sequence[int], offset: int = 0) -> None:
+        """
+        Add a block of triangle indices, shifted by offset.
+
+        Accepts a flat index sequence, a packed buffer or an (N, 3) array.
+        """
+        block = _flat_block(indices, "q", offset)
+        if len(block) % 3 != 0:
+            raise ValueError(f"Index buffer length {len(block)} is not a multiple of 3")
+
+        self._indices.frombytes(memoryview(block).cast("B"))
+
     def add_triangle(self, v0: int, v1: int, v2: int) -> None:
         """Add a triangle face (counter-clockwise winding)."""
-        self._indices.extend([v0, v1, v2])
+        self._indices.extend((v0, v1, v2))
 
     def add_quad(self, v0: int, v1: int, v2: int, v3: int) -> None:
         """Add a quad as two triangles (v0,v1,v2,v3 in CCW order)."""
@@ -80,17 +118,23 @@ class MeshBuilder:
         for i in range(len(ring) - 1):
             self.add_triangle(center, ring[i], ring[i + 1])
 
-    def build(self, compute_normals: bool = True) -> MeshData:
-        """Build the final mesh."""
+    def build(self, compute_normals: bool = True, packed: bool = False) -> MeshData:
+        """
+        Build the final mesh.
+
+        Buffers are lists by default; packed=True returns float32/uint32
+        arrays for binary transfer.
+        """
+        positions = np.frombuffer(self._vertices, dtype=np.float64).reshape(-1, 3)
+        faces = np.frombuffer(self._indices, dtype=np.int64).reshape(-1, 3)
         if compute_normals:
-            normals = compute_vertex_normals(self._vertices, self._indices)
+            normals = _vertex_normals(positions, faces)
         else:
-            normals = [0.0, 1.0, 0.0] * self._vertex_count
-
+            normals = np.tile([0.0, 1.0, 0.0], (self._vertex_count, 1))
         return MeshData(
-            vertices=self._vertices,
-            indices=self._indices,
-            normals=normals,
+            vertices=_from_array(positions, packed, FLOAT32),
+            indices=_from_array(faces, packed, UINT32),
+            normals=_from_array(normals, packed, FLOAT32),
         )
 
     @property
@@ -111,55 +155,25 @@ def compute_vertex_normals(vertices: List[float], indices: List[int]) -> List[fl
     """
     Compute smooth per-vertex normals.
 
-    Uses angle-weighted averaging of face normals.
+    Uses area-weighted averaging of face normals. Returns a list, or a
+    float32 buffer if vertices is packed.
     """
-    vertex_count = len(vertices) // 3
-
-    # Initialize normals to zero
-    normals = [0.0] * len(vertices)
-
-    # Accumulate face normals
-    for i in range(0, len(indices), 3):
-        i0, i1, i2 = indices[i], indices[i + 1], indices[i + 2]
+    normals = _vertex_normals(_positions(vertices), _faces(indices))
+    return _from_array(normals, isinstance(vertices, array), FLOAT32)
 
-        # Get vertex positions
-        v0 = (vertices[i0 * 3], vertices[i0 * 3 + 1], vertices[i0 * 3 + 2])
-        v1 = (vertices[i1 * 3], vertices[i1 * 3 + 1], vertices[i1 * 3 + 2])
-        v2 = (vertices[i2 * 3], vertices[i2 * 3 + 1], vertices[i2 * 3 + 2])
 
-        # Calculate edges
-        e1 = (v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2])
-        e2 = (v2[0] - v0[0], v2[1] - v0[1], v2[2] - v0[2])
+def _vertex_normals(positions: "np.ndarray", faces: "np.ndarray") -> "np.ndarray":
+    """Vectorized compute_vertex_normals on (N, 3) positions and (F, 3) faces."""
+    normals = np.zeros((len(positions), 3))
 
-        # Cross product for face normal
-        nx = e1[1] * e2[2] - e1[2] * e2[1]
-        ny = e1[2] * e2[0] - e1[0] * e2[2]
-        nz = e1[0] * e2[1] - e1[1] * e2[0]
+    # Chunked so per-corner temporaries stay bounded on very large meshes
+    for start in range(0, len(faces), _FACE_CHUNK):
+        chunk = faces[start:start + _FACE_CHUNK]
+        p0 = positions[chunk[:, 0]]
+        face_normals = np.cross(positions[chunk[:, 1]] - p0, positions[chunk[:, 2]] - p0)
+        normals += _accumulate(chunk, face_normals, len(positions))
 
-        # Accumulate to each vertex
-        for idx in [i0, i1, i2]:
-            normals[idx * 3] += nx
-            normals[idx * 3 + 1] += ny
-            normals[idx * 3 + 2] += nz
-
-    # Normalize all normals
-    for i in range(vertex_count):
-        nx = normals[i * 3]
-        ny = normals[i * 3 + 1]
-        nz = normals[i * 3 + 2]
-
-        length = math.sqrt(nx * nx + ny * ny + nz * nz)
-        if length > 1e-10:
-            normals[i * 3] = nx / length
-            normals[i * 3 + 1] = ny / length
-            normals[i * 3 + 2] = nz / length
-        else:
-            # Default to up vector for degenerate normals
-            normals[i * 3] = 0.0
-            normals[i * 3 + 1] = 0.0
-            normals[i * 3 + 2] = 1.0
-
-    return normals
+    return _normalize_rows(normals, fallback=(0.0, 0.0, 1.0))
 
 
 def compute_uvs(
@@ -217,141 +231,132 @@ def compute_tangents(
     """
     Compute tangent vectors for normal mapping.
 
-    Returns tangent vectors as 4 floats per vertex (xyz + handedness).
+    Returns tangent vectors as 4 floats per vertex (xyz + handedness), as a
+    list or, if vertices is packed, a float32 buffer.
     """
-    vertex_count = len(vertices) // 3
+    tangents = _tangents(
+        _positions(vertices),
+        _positions(normals),
+        np.asarray(uvs, dtype=np.float64).reshape(-1, 2),
+        _faces(indices),
+    )
+    return _from_array(tangents, isinstance(vertices, array), FLOAT32)
 
-    # Initialize tangent accumulators
-    tangents = [0.0] * (vertex_count * 3)
-    bitangents = [0.0] * (vertex_count * 3)
 
-    # Accumulate tangents from faces
-    for i in range(0, len(indices), 3):
-        i0, i1, i2 = indices[i], indices[i + 1], indices[i + 2]
+def _tangents(
+    positions: "np.ndarray",
+    normals: "np.ndarray",
+    uvs: "np.ndarray",
+    faces: "np.ndarray",
+) -> "np.ndarray":
+    """Vectorized compute_tangents; returns an (N, 4) array."""
+    p = positions[faces]
+    t = uvs[faces]
+    dp1 = p[:, 1] - p[:, 0]
+    dp2 = p[:, 2] - p[:, 0]
+    duv1 = t[:, 1] - t[:, 0]
+    duv2 = t[:, 2] - t[:, 0]
 
-        # Positions
-        p0 = (vertices[i0 * 3], vertices[i0 * 3 + 1], vertices[i0 * 3 + 2])
-        p1 = (vertices[i1 * 3], vertices[i1 * 3 + 1], vertices[i1 * 3 + 2])
-        p2 = (vertices[i2 * 3], vertices[i2 * 3 + 1], vertices[i2 * 3 + 2])
+    # Faces with degenerate UVs contribute nothing
+    denom = duv1[:, 0] * duv2[:, 1] - duv2[:, 0] * duv1[:, 1]
+    valid = np.abs(denom) >= 1e-10
+    faces, dp1, dp2, duv1, duv2 = faces[valid], dp1[valid], dp2[valid], duv1[valid], duv2[valid]
+    r = (1.0 / denom[valid])[:, None]
 
-        # UVs
-        uv0 = (uvs[i0 * 2], uvs[i0 * 2 + 1])
-        uv1 = (uvs[i1 * 2], uvs[i1 * 2 + 1])
-        uv2 = (uvs[i2 * 2], uvs[i2 * 2 + 1])
+    face_tangents = (duv2[:, 1, None] * dp1 - duv1[:, 1, None] * dp2) * r
+    face_bitangents = (duv1[:, 0, None] * dp2 - duv2[:, 0, None] * dp1) * r
 
-        # Edges
-        dp1 = (p1[0] - p0[0], p1[1] - p0[1], p1[2] - p0[2])
-        dp2 = (p2[0] - p0[0], p2[1] - p0[1], p2[2] - p0[2])
+    tangents = _accumulate(faces, face_tangents, len(positions))
+    bitangents = _accumulate(faces, face_bitangents, len(positions))
 
-        duv1 = (uv1[0] - uv0[0], uv1[1] - uv0[1])
-        duv2 = (uv2[0] - uv0[0], uv2[1] - uv0[1])
+    # Gram-Schmidt orthogonalize, then handedness from the bitangent side
+    dot_nt = (normals * tangents).sum(axis=1)
+    t_ortho = _normalize_rows(tangents - normals * dot_nt[:, None], fallback=(1.0, 0.0, 0.0))
+    side = (np.cross(normals, t_ortho) * bitangents).sum(axis=1)
+    handedness = np.where(side >= 0, 1.0, -1.0)
 
-        # Calculate tangent and bitangent
-        denom = duv1[0] * duv2[1] - duv2[0] * duv1[1]
-        if abs(denom) < 1e-10:
-            continue
+    return np.column_stack([t_ortho, handedness])
 
-        r = 1.0 / denom
 
-        tangent = (
-            (duv2[1] * dp1[0] - duv1[1] * dp2[0]) * r,
-            (duv2[1] * dp1[1] - duv1[1] * dp2[1]) * r,
-            (duv2[1] * dp1[2] - duv1[1] * dp2[2]) * r,
-        )
+def merge_meshes(meshes: List[MeshData]) -> MeshData:
+    """
+    Merge multiple meshes into a single mesh.
 
-        bitangent = (
-            (duv1[0] * dp2[0] - duv2[0] * dp1[0]) * r,
-            (duv1[0] * dp2[1] - duv2[0] * dp1[1]) * r,
-            (duv1[0] * dp2[2] - duv2[0] * dp1[2]) * r,
-        )
+    Normals are recomputed; the result is packed if any input is.
+    """
+    builder = MeshBuilder()
 
-        # Accumulate
-        for idx in [i0, i1, i2]:
-            tangents[idx * 3] += tangent[0]
-            tangents[idx * 3 + 1] += tangent[1]
-            tangents[idx * 3 + 2] += tangent[2]
+    for mesh in meshes:
+        offset = builder.add_vertex_buffer(mesh.vertices)
+        builder.add_triangle_buffer(mesh.indices, offset=offset)
 
-            bitangents[idx * 3] += bitangent[0]
-            bitangents[idx * 3 + 1] += bitangent[1]
-            bitangents[idx * 3 + 2] += bitangent[2]
+    return builder.build(packed=any(mesh.is_packed for mesh in meshes))
 
-    # Orthonormalize and compute handedness
-    result = []
-    for i in range(vertex_count):
-        n = (normals[i * 3], normals[i * 3 + 1], normals[i * 3 + 2])
-        t = (tangents[i * 3], tangents[i * 3 + 1], tangents[i * 3 + 2])
-        b = (bitangents[i * 3], bitangents[i * 3 + 1], bitangents[i * 3 + 2])
-
-        # Gram-Schmidt orthogonalize
-        dot_nt = n[0] * t[0] + n[1] * t[1] + n[2] * t[2]
-        t_ortho = (
-            t[0] - n[0] * dot_nt,
-            t[1] - n[1] * dot_nt,
-            t[2] - n[2] * dot_nt,
-        )
 
-        # Normalize
-        length = math.sqrt(t_ortho[0] ** 2 + t_ortho[1] ** 2 + t_ortho[2] ** 2)
-        if length > 1e-10:
-            t_ortho = (t_ortho[0] / length, t_ortho[1] / length, t_ortho[2] / length)
-        else:
-            t_ortho = (1.0, 0.0, 0.0)
+def transform_mesh(
+    mesh: MeshData,
+    translate: Tuple[float, float, float] = (0, 0, 0),
+    scale: Tuple[float, float, float] = (1, 1, 1),
+) -> MeshData:
+    """Transform mesh vertices, keeping list or packed buffers as given."""
+    positions = _positions(mesh.vertices) * scale + translate
+    new_vertices = _from_array(positions, mesh.is_packed, FLOAT32)
 
-        # Calculate handedness
-        cross = (
-            n[1] * t_ortho[2] - n[2] * t_ortho[1],
-            n[2] * t_ortho[0] - n[0] * t_ortho[2],
-            n[0] * t_ortho[1] - n[1] * t_ortho[0],
-        )
-        handedness = 1.0 if (cross[0] * b[0] + cross[1] * b[1] + cross[2] * b[2]) >= 0 else -1.0
+    return MeshData(
+        vertices=new_vertices,
+        indices=_copy_buffer(mesh.indices),
+        normals=_copy_buffer(mesh.normals),
+        mesh_id=mesh.mesh_id,
+    )
 
-        result.extend([t_ortho[0], t_ortho[1], t_ortho[2], handedness])
 
-    return result
+# =============================================================================
+# BUFFER HELPERS
+# =============================================================================
 
+def _positions(values: Sequence[float]) -> "np.ndarray":
+    """(N, 3) float64 view of a flat xyz buffer (zero-copy for float64 arrays)."""
+    return np.asarray(values, dtype=np.float64).reshape(-1, 3)
 
-def merge_meshes(meshes: List[MeshData]) -> MeshData:
-    """Merge multiple meshes into a single mesh."""
-    builder = MeshBuilder()
 
-    for mesh in meshes:
-        # Add vertices and track index offset
-        offset = builder.vertex_count
+def _faces(indices: Sequence[int]) -> "np.ndarray":
+    """(F, 3) int64 array of triangle indices."""
+    return np.asarray(indices, dtype=np.int64).reshape(-1, 3)
 
-        for i in range(mesh.vertex_count):
-            x = mesh.vertices[i * 3]
-            y = mesh.vertices[i * 3 + 1]
-            z = mesh.vertices[i * 3 + 2]
-            builder.add_vertex(x, y, z)
 
-        # Add faces with offset
-        for i in range(0, len(mesh.indices), 3):
-            builder.add_triangle(
-                mesh.indices[i] + offset,
-                mesh.indices[i + 1] + offset,
-                mesh.indices[i + 2] + offset,
-            )
+def _accumulate(faces: "np.ndarray", per_face: "np.ndarray", count: int) -> "np.ndarray":
+    """Sum a per-face (F, 3) quantity onto the face corners, per vertex."""
+    corners = faces.ravel()
+    result = np.empty((count, 3))
+    for axis in range(3):
+        result[:, axis] = np.bincount(
+            corners, weights=np.repeat(per_face[:, axis], 3), minlength=count
+        )
+    return result
 
-    return builder.build()
 
+def _normalize_rows(rows: "np.ndarray", fallback: Tuple[float, float, float]) -> "np.ndarray":
+    """Normalize (N, 3) rows in place; rows shorter than 1e-10 become fallback."""
+    lengths = np.sqrt((rows * rows).sum(axis=1))
+    valid = lengths > 1e-10
+    rows[valid] /= lengths[valid, None]
+    rows[~valid] = fallback
+    return rows
 
-def transform_mesh(
-    mesh: MeshData,
-    translate: Tuple[float, float, float] = (0, 0, 0),
-    scale: Tuple[float, float, float] = (1, 1, 1),
-) -> MeshData:
-    """Transform mesh vertices."""
-    new_vertices = []
 
-    for i in range(mesh.vertex_count):
-        x = mesh.vertices[i * 3] * scale[0] + translate[0]
-        y = mesh.vertices[i * 3 + 1] * scale[1] + translate[1]
-        z = mesh.vertices[i * 3 + 2] * scale[2] + translate[2]
-        new_vertices.extend([x, y, z])
+def _from_array(values: "np.ndarray", packed: bool, typecode: str):
+    """Flat list, or packed float32/uint32 buffer, from a NumPy array."""
+    if packed:
+        return pack_buffer(np.ascontiguousarray(values, dtype=typecode).reshape(-1), typecode)
+    return values.reshape(-1).tolist()
 
-    return MeshData(
-        vertices=new_vertices,
-        indices=mesh.indices.copy() if isinstance(mesh.indices, list) else list(mesh.indices),
-        normals=mesh.normals.copy() if isinstance(mesh.normals, list) else list(mesh.normals),
-        mesh_id=mesh.mesh_id,
-    )
+
+def _flat_block(values: Sequence, typecode: str, offset: int = 0):
+    """Contiguous flat block in the builder's storage type, shifted by offset."""
+    block = np.ascontiguousarray(values, dtype=typecode).reshape(-1)
+    return block + offset if offset else block
+
+
+def _copy_buffer(values: Sequence):
+    """Copy a list or packed buffer, keeping its kind."""
+    return values[:] if isinstance(values, (list, array)) else list(values)
@@ -12,11 +12,13 @@ Addresses: FM2 (Mesh schema drift)
 """
 
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from enum import Enum
 from datetime import datetime
 import logging
+import sys
 
 logger = logging.getLogger("webgl.schema")
 
@@ -119,6 +121,64 @@ class BoundingBox:
         )
 
 
+# =============================================================================
+# PACKED BUFFERS
+# =============================================================================
+
+# array.array typecodes for packed mesh buffers (float32 attributes, uint32 indices)
+FLOAT32 = "f"
+UINT32 = "I"
+
+
+def pack_buffer(values: Sequence, typecode: str = FLOAT32) -> array:
+    """
+    Return values as a contiguous array.array of the given typecode.
+
+    Arrays that already have the typecode are returned as-is (shared, not
+    copied). Anything exposing a matching buffer (e.g. a float32 ndarray) is
+    copied with a single memcpy; other sequences are converted in C.
+    """
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    packed = array(typecode)
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is not None and view.format == typecode and view.c_contiguous:
+        packed.frombytes(view.cast("B"))
+    else:
+        packed.extend(values.tolist() if hasattr(values, "tolist") else values)
+    return packed
+
+
+def buffer_bytes(values: Sequence, typecode: str = FLOAT32) -> memoryview:
+    """
+    Little-endian byte view of a flat buffer, for writing straight to a stream.
+
+    Packed buffers are viewed without copying; lists are packed once.
+    """
+    packed = pack_buffer(values, typecode)
+    if sys.byteorder == "big":
+        packed = array(typecode, packed)
+        packed.byteswap()
+    return memoryview(packed).cast("B")
+
+
+def unpack_buffer(data: bytes, typecode: str = FLOAT32) -> array:
+    """Read a little-endian byte string into an array.array."""
+    packed = array(typecode)
+    packed.frombytes(data)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed
+
+
+def _as_list(values: Optional[Sequence]) -> Optional[List]:
+    """JSON-compatible list for a list or packed buffer."""
+    return values.tolist() if isinstance(values, array) else values
+
+
 @dataclass
 class MeshData:
     """
@@ -143,9 +203,13 @@ class MeshData:
     - UVs (if flag): vertex_count * 2 * 4 bytes (float32)
     - Colors (if flag): vertex_count * 4 * 4 bytes (float32)
     - Tangents (if flag): vertex_count * 4 * 4 bytes (float32)
+
+    Buffers are lists by default. packed() returns a copy backed by
+    contiguous array.array buffers (float32 / uint32) that the serializer,
+    glTF builder and exporters write without per-element conversion.
     """
 
-    # Required fields - stored as lists for JSON compatibility
+    # Required fields - stored as lists for JSON compatibility, or packed arrays
     vertices: List[float] = field(default_factory=list)  # [x,y,z, x,y,z, ...]
     indices: List[int] = field(default_factory=list)     # Triangle indices
     normals: List[float] = field(default_factory=list)   # Per-vertex normals
@@ -177,18 +241,14 @@ class MeshData:
         if len(self.vertices) < 3:
             return
 
-        min_x = min_y = min_z = float('inf')
-        max_x = max_y = max_z = float('-inf')
-
-        for i in range(0, len(self.vertices), 3):
-            x, y, z = self.vertices[i], self.vertices[i+1], self.vertices[i+2]
-            min_x, max_x = min(min_x, x), max(max_x, x)
-            min_y, max_y = min(min_y, y), max(max_y, y)
-            min_z, max_z = min(min_z, z), max(max_z, z)
+        end = self.vertex_count * 3
+        xs = self.vertices[0:end:3]
+        ys = self.vertices[1:end:3]
+        zs = self.vertices[2:end:3]
 
         self.bounds = BoundingBox(
-            min=(min_x, min_y, min_z),
-            max=(max_x, max_y, max_z),
+            min=(min(xs), min(ys), min(zs)),
+            max=(max(xs), max(ys), max(zs)),
         )
 
     @property
@@ -203,13 +263,31 @@ class MeshData:
     def is_empty(self) -> bool:
         return self.vertex_count == 0
 
+    @property
+    def is_packed(self) -> bool:
+        """True if buffers are contiguous array.array rather than lists."""
+        return isinstance(self.vertices, array)
+
+    def packed(self) -> "MeshData":
+        """Return a copy with float32/uint32 array buffers (shared if already packed)."""
+        return MeshData(
+            vertices=pack_buffer(self.vertices),
+            indices=pack_buffer(self.indices, UINT32),
+            normals=pack_buffer(self.normals),
+            uvs=pack_buffer(self.uvs) if self.uvs is not None else None,
+            colors=pack_buffer(self.colors) if self.colors is not None else None,
+            tangents=pack_buffer(self.tangents) if self.tangents is not None else None,
+            mesh_id=self.mesh_id,
+            bounds=self.bounds,
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to JSON-compatible dict."""
         result = {
             "mesh_id": self.mesh_id,
-            "vertices": self.vertices,
-            "indices": self.indices,
-            "normals": self.normals,
+            "vertices": _as_list(self.vertices),
+            "indices": _as_list(self.indices),
+            "normals": _as_list(self.normals),
             "metadata": {
                 "vertex_count": self.vertex_count,
                 "face_count": self.face_count,
@@ -221,11 +299,11 @@ class MeshData:
         }
 
         if self.uvs is not None:
-            result["uvs"] = self.uvs
+            result["uvs"] = _as_list(self.uvs)
         if self.colors is not None:
-            result["colors"] = self.colors
+            result["colors"] = _as_list(self.colors)
         if self.tangents is not None:
-            result["tangents"] = self.tangents
+            result["tangents"] = _as_list(self.tangents)
 
         return result
 
@@ -251,12 +329,6 @@ class MeshData:
         """Serialize to binary format for efficient transfer."""
         import struct
 
-        try:
-            import numpy as np
-            HAS_NUMPY = True
-        except ImportError:
-            HAS_NUMPY = False
-
         flags = 0
         if self.uvs is not None:
             flags |= self.FLAG_HAS_UVS
@@ -277,35 +349,16 @@ class MeshData:
 
         data = bytearray(header)
 
-        if HAS_NUMPY:
-            data.extend(np.array(self.vertices, dtype=np.float32).tobytes())
-            data.extend(np.array(self.indices, dtype=np.uint32).tobytes())
-            data.extend(np.array(self.normals, dtype=np.float32).tobytes())
-
-            if self.uvs is not None:
-                data.extend(np.array(self.uvs, dtype=np.float32).tobytes())
-            if self.colors is not None:
-                data.extend(np.array(self.colors, dtype=np.float32).tobytes())
-            if self.tangents is not None:
-                data.extend(np.array(self.tangents, dtype=np.float32).tobytes())
-        else:
-            # Fallback without numpy
-            for v in self.vertices:
-                data.extend(struct.pack('<f', v))
-            for i in self.indices:
-                data.extend(struct.pack('<I', i))
-            for n in self.normals:
-                data.extend(struct.pack('<f', n))
-
-            if self.uvs is not None:
-                for u in self.uvs:
-                    data.extend(struct.pack('<f', u))
-            if self.colors is not None:
-                for c in self.colors:
-                    data.extend(struct.pack('<f', c))
-            if self.tangents is not None:
-                for t in self.tangents:
-                    data.extend(struct.pack('<f', t))
+        data.extend(buffer_bytes(self.vertices))
+        data.extend(buffer_bytes(self.indices, UINT32))
+        data.extend(buffer_bytes(self.normals))
+
+        if self.uvs is not None:
+            data.extend(buffer_bytes(self.uvs))
+        if self.colors is not None:
+            data.extend(buffer_bytes(self.colors))
+        if self.tangents is not None:
+            data.extend(buffer_bytes(self.tangents))
 
         return bytes(data)
 
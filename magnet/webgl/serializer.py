@@ -12,6 +12,7 @@ Addresses: FM2 (Schema drift through versioned binary format)
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple, BinaryIO
 from dataclasses import dataclass
+from array import array
 import struct
 import io
 import logging
@@ -23,6 +24,10 @@ from .schema import (
     MaterialDef,
     BoundingBox,
     SCHEMA_VERSION,
+    FLOAT32,
+    UINT32,
+    buffer_bytes,
+    unpack_buffer,
 )
 
 if TYPE_CHECKING:
@@ -163,24 +168,19 @@ def serialize_mesh(mesh: MeshData, compress: bool = True) -> bytes:
     vertex_count = mesh.vertex_count
     buffer.write(struct.pack("<I", vertex_count))
 
-    # Pack vertices as flat float32 array
-    vertex_data = struct.pack(f"<{vertex_count * 3}f", *mesh.vertices)
-    buffer.write(vertex_data)
+    # Vertices as flat float32 array, written straight from the buffer
+    buffer.write(buffer_bytes(mesh.vertices))
 
-    # Index count and data
+    # Index count and data (uint32)
     index_count = len(mesh.indices)
     buffer.write(struct.pack("<I", index_count))
-
-    # Pack indices as uint32
-    index_data = struct.pack(f"<{index_count}I", *mesh.indices)
-    buffer.write(index_data)
+    buffer.write(buffer_bytes(mesh.indices, UINT32))
 
     # Normal count and data
     if mesh.normals:
         normal_count = len(mesh.normals) // 3
         buffer.write(struct.pack("<I", normal_count))
-        normal_data = struct.pack(f"<{len(mesh.normals)}f", *mesh.normals)
-        buffer.write(normal_data)
+        buffer.write(buffer_bytes(mesh.normals))
     else:
         buffer.write(struct.pack("<I", 0))
 
@@ -188,8 +188,7 @@ def serialize_mesh(mesh: MeshData, compress: bool = True) -> bytes:
     if mesh.uvs:
         uv_count = len(mesh.uvs) // 2
         buffer.write(struct.pack("<I", uv_count))
-        uv_data = struct.pack(f"<{len(mesh.uvs)}f", *mesh.uvs)
-        buffer.write(uv_data)
+        buffer.write(buffer_bytes(mesh.uvs))
     else:
         buffer.write(struct.pack("<I", 0))
 
@@ -205,32 +204,36 @@ def serialize_mesh(mesh: MeshData, compress: bool = True) -> bytes:
     # End marker
     buffer.write(struct.pack("<B", SECTION_END))
 
-    # Get raw data
-    raw_data = buffer.getvalue()
-
     # Compress if requested
     if compress:
         # Compress everything after header
         header_size = size_pos + 4  # size_pos is where total_size starts
-        compressed = zlib.compress(raw_data[header_size:], level=6)
+        with buffer.getbuffer() as raw_view:
+            compressed = zlib.compress(raw_view[header_size:], level=6)
 
         # Rebuild with compressed data
-        final_buffer = io.BytesIO()
-        final_buffer.write(raw_data[:header_size])
-        final_buffer.write(compressed)
-        raw_data = final_buffer.getvalue()
+        buffer.seek(header_size)
+        buffer.truncate()
+        buffer.write(compressed)
 
     # Update header with section count and total size
-    final_buffer = io.BytesIO(raw_data)
-    final_buffer.seek(size_pos - 2)  # Go to section_count position
-    final_buffer.write(struct.pack("<H", section_count))
-    final_buffer.write(struct.pack("<I", len(raw_data)))
+    total_size = buffer.tell()
+    buffer.seek(size_pos - 2)  # Go to section_count position
+    buffer.write(struct.pack("<H", section_count))
+    buffer.write(struct.pack("<I", total_size))
 
-    return final_buffer.getvalue()
+    return buffer.getvalue()
 
 
-def deserialize_mesh(data: bytes) -> MeshData:
-    """Deserialize binary data to MeshData."""
+def deserialize_mesh(data: bytes, packed: bool = False) -> MeshData:
+    """
+    Deserialize binary data to MeshData.
+
+    With packed=True the buffers are returned as float32/uint32 arrays
+    instead of lists. A mesh written without normals gets an empty
+    normals buffer and one written without UVs gets uvs=None, in both
+    modes, as MeshData and MeshData.packed() leave them.
+    """
     reader = io.BytesIO(data)
 
     # Read header
@@ -247,10 +250,10 @@ def deserialize_mesh(data: bytes) -> MeshData:
 
     # Initialize mesh data
     mesh_id = ""
-    vertices = []
-    indices = []
-    normals = []
-    uvs = []
+    vertices = array(FLOAT32)
+    indices = array(UINT32)
+    normals = array(FLOAT32)
+    uvs = None
     bounds = None
 
     # Read sections
@@ -270,25 +273,21 @@ def deserialize_mesh(data: bytes) -> MeshData:
 
             # Read vertices
             vertex_count = struct.unpack("<I", reader.read(4))[0]
-            vertex_data = reader.read(vertex_count * 3 * 4)
-            vertices = list(struct.unpack(f"<{vertex_count * 3}f", vertex_data))
+            vertices = unpack_buffer(reader.read(vertex_count * 3 * 4))
 
             # Read indices
             index_count = struct.unpack("<I", reader.read(4))[0]
-            index_data = reader.read(index_count * 4)
-            indices = list(struct.unpack(f"<{index_count}I", index_data))
+            indices = unpack_buffer(reader.read(index_count * 4), UINT32)
 
             # Read normals
             normal_count = struct.unpack("<I", reader.read(4))[0]
             if normal_count > 0:
-                normal_data = reader.read(normal_count * 3 * 4)
-                normals = list(struct.unpack(f"<{normal_count * 3}f", normal_data))
+                normals = unpack_buffer(reader.read(normal_count * 3 * 4))
 
             # Read UVs
             uv_count = struct.unpack("<I", reader.read(4))[0]
             if uv_count > 0:
-                uv_data = reader.read(uv_count * 2 * 4)
-                uvs = list(struct.unpack(f"<{uv_count * 2}f", uv_data))
+                uvs = unpack_buffer(reader.read(uv_count * 2 * 4))
 
         elif section_type == SECTION_BOUNDS:
             bounds_data = struct.unpack("<6f", reader.read(24))
@@ -297,6 +296,12 @@ def deserialize_mesh(data: bytes) -> MeshData:
                 max=(bounds_data[3], bounds_data[4], bounds_data[5]),
             )
 
+    if not packed:
+        vertices = list(vertices)
+        indices = list(indices)
+        normals = list(normals)
+        uvs = list(uvs) if uvs is not None else None
+
     return MeshData(
         mesh_id=mesh_id,
         vertices=vertices,
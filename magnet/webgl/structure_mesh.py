@@ -1,5 +1,5 @@
 """
-webgl/structure_mesh.py - Structural visualization meshes v1.1
+webgl/structure_mesh.py - Structural visualization meshes v1.2
 
 Module 58: WebGL 3D Visualization
 ALPHA OWNS THIS FILE.
@@ -18,6 +18,7 @@ from .config import TessellationConfig
 
 if TYPE_CHECKING:
     from magnet.core.state_manager import StateManager
+    from magnet.structural.plate_index import PlateIndex
 
 logger = logging.getLogger("webgl.structure_mesh")
 
@@ -25,8 +26,9 @@ logger = logging.getLogger("webgl.structure_mesh")
 class StructureMeshBuilder:
     """Builder for structural visualization meshes."""
 
-    def __init__(self, state_manager: "StateManager"):
+    def __init__(self, state_manager: "StateManager", plate_index: Optional["PlateIndex"] = None):
         self._sm = state_manager
+        self._plates = plate_index
 
     def build(self, lod: LODLevel = LODLevel.MEDIUM) -> StructureSceneData:
         """Build all structural meshes."""
@@ -263,6 +265,39 @@ class StructureMeshBuilder:
         return []
 
     def _build_plating(self, lod: LODLevel) -> List[MeshData]:
-        """Build plating visualization meshes."""
-        # Simplified - not implemented in basic version
-        return []
+        """Build plating meshes, one per zone, from the plate index."""
+        if self._plates is None:
+            return []
+
+        spacing = self._get_structure_params()["frame_spacing"]
+        draft = self._get_hull_params()["draft"]
+
+        plating = []
+        for zone in self._plates.zones:
+            builder = MeshBuilder()
+            for plate in self._plates.zone_plates(zone):
+                extent = plate.extent
+                x0 = extent.frame_start * spacing
+                x1 = extent.frame_end * spacing
+                y0, y1 = extent.y_start, extent.y_end
+                z0 = extent.z_start - draft
+                z1 = extent.z_end - draft
+
+                if x0 == x1:
+                    # Transverse (bulkhead, transom)
+                    corners = [(x0, y0, z0), (x0, y1, z0), (x0, y1, z1), (x0, y0, z1)]
+                elif z0 == z1:
+                    # Deck
+                    corners = [(x0, y0, z0), (x1, y0, z0), (x1, y1, z0), (x0, y1, z0)]
+                else:
+                    # Shell strake, flat across its extent
+                    corners = [(x0, y0, z0), (x1, y0, z0), (x1, y1, z1), (x0, y1, z1)]
+
+                builder.add_quad(*builder.add_vertices(corners))
+
+            if builder.vertex_count:
+                mesh = builder.build()
+                mesh.mesh_id = f"plating_{zone}"
+                plating.append(mesh)
+
+        return plating
@@ -0,0 +1,91 @@
+"""
+Benchmark: health-check latency while a phase run is in progress
+
+Simulates the API event loop with one long CPU-bound "phase run" request
+and a stream of lightweight health-check coroutines probing every
+--interval-ms. The phase run is made once inline in the coroutine (the old
+handler behaviour) and once through KernelExecutor. Reports probe latency
+percentiles and the executor's stats. No FastAPI needed.
+
+Run:
+    python scripts/benchmarks/bench_api_kernel_executor.py --phase-seconds 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.deployment.executor_service import KernelExecutor
+
+
+def phase_run(seconds: float) -> int:
+    """Pure-Python busy loop standing in for conductor.run_phase."""
+    end = time.perf_counter() + seconds
+    n = 0
+    while time.perf_counter() < end:
+        n += 1
+    return n
+
+
+async def health_probes(stop: asyncio.Event, interval: float, latencies: list) -> None:
+    while not stop.is_set():
+        scheduled = time.perf_counter()
+        await asyncio.sleep(interval)
+        # Time past the requested interval is time the loop was not serving
+        latencies.append(time.perf_counter() - scheduled - interval)
+
+
+async def scenario(offload: bool, phase_seconds: float, interval: float, executor: KernelExecutor):
+    latencies = []
+    stop = asyncio.Event()
+    probes = asyncio.ensure_future(health_probes(stop, interval, latencies))
+    await asyncio.sleep(interval * 2)
+
+    start = time.perf_counter()
+    if offload:
+        await executor.run(phase_run, phase_seconds, design_id="BENCH-1", operation="run_phase")
+    else:
+        phase_run(phase_seconds)
+    elapsed = time.perf_counter() - start
+
+    await asyncio.sleep(interval * 2)
+    stop.set()
+    await probes
+    return elapsed, sorted(latencies)
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API kernel executor benchmark")
+    parser.add_argument("--phase-seconds", type=float, default=5.0)
+    parser.add_argument("--interval-ms", type=float, default=50.0, help="health probe period")
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    executor = KernelExecutor(max_workers=args.workers)
+    interval = args.interval_ms / 1000.0
+    try:
+        for label, offload in (("inline", False), ("executor", True)):
+            elapsed, latencies = asyncio.run(scenario(offload, args.phase_seconds, interval, executor))
+            print(
+                f"{label:9s} phase {elapsed:6.2f} s  {len(latencies):4d} probes  "
+                f"p50 {percentile(latencies, 0.5) * 1000:8.1f} ms  "
+                f"p99 {percentile(latencies, 0.99) * 1000:8.1f} ms  "
+                f"max {latencies[-1] * 1000 if latencies else 0.0:8.1f} ms"
+            )
+        print(json.dumps(executor.stats()["latency"], indent=2))
+    finally:
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: CascadeExecutor streaming scheduler
+
+Builds a synthetic refinement cascade (one root fanning out to many
+independent branches, one of which is slow) and reports wall time plus
+aggregate queue-wait vs. run time from CascadeResult.
+
+Run:
+    python scripts/benchmarks/bench_cascade_scheduler.py --branches 200 --depth 3
+"""
+import argparse
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.dependencies.cascade import CalculatorRegistry, CascadeExecutor
+from magnet.dependencies.graph import DependencyGraph
+
+
+class _State:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, path, default=None):
+        return self.values.get(path, default)
+
+    def set(self, path, value, source=None):
+        self.values[path] = value
+
+
+def build_cascade(branches: int, depth: int, fast_ms: float, slow_ms: float):
+    graph = DependencyGraph()
+    registry = CalculatorRegistry()
+    graph.add_parameter("root")
+
+    def make_calc(duration_ms):
+        def calc(sm, param):
+            time.sleep(duration_ms / 1000.0)
+            return 1.0
+        return calc
+
+    registry.register("root", make_calc(fast_ms), estimated_time_ms=int(fast_ms))
+    for b in range(branches):
+        parent = "root"
+        duration = slow_ms if b == 0 else fast_ms
+        for d in range(depth):
+            param = f"b{b}.p{d}"
+            graph.add_dependency(param, parent)
+            registry.register(param, make_calc(duration), estimated_time_ms=int(duration))
+            parent = param
+
+    return graph, registry
+
+
+def run(branches: int, depth: int, workers: int, fast_ms: float, slow_ms: float) -> None:
+    graph, registry = build_cascade(branches, depth, fast_ms, slow_ms)
+    graph._compute_order()
+    params = set(registry.list_calculators())
+
+    executor = CascadeExecutor(
+        dependency_graph=graph,
+        invalidation_engine=MagicMock(),
+        state_manager=_State(),
+        calculator_registry=registry,
+        max_workers=workers,
+    )
+
+    total_work_ms = fast_ms * (1 + (branches - 1) * depth) + slow_ms * depth
+    ideal_ms = max(total_work_ms / workers, fast_ms + slow_ms * depth)
+
+    start = time.perf_counter()
+    result = executor.execute(params)
+    wall_ms = (time.perf_counter() - start) * 1000.0
+
+    summary = result.get_summary()
+    print(f"params={len(params)} workers={workers} branches={branches} depth={depth}")
+    print(f"  wall time:        {wall_ms:9.1f} ms")
+    print(f"  lower bound:      {ideal_ms:9.1f} ms")
+    print(f"  total run time:   {summary['total_run_time_ms']:9.1f} ms")
+    print(f"  total queue wait: {summary['total_queue_wait_ms']:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CascadeExecutor scheduler benchmark")
+    parser.add_argument("--branches", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--fast-ms", type=float, default=2.0)
+    parser.add_argument("--slow-ms", type=float, default=100.0)
+    args = parser.parse_args()
+    run(args.branches, args.depth, args.workers, args.fast_ms, args.slow_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark: rule library throughput across design variants
+
+Generates --variants random designs and checks the full rule library
+(ABS HSNC, HSC Code 2000, USCG Subchapter T) against each:
+
+  per-design   ComplianceEngine.evaluate() once per variant (full reports)
+  screen       ComplianceEngine.screen() once over all variants (pass masks)
+
+Also times a single formula the old way (string matching plus re-reading
+hull.beam from state, as StabilityRuleChecker._evaluate_formula did)
+against the compiled expression. Screen results are checked against the
+per-design reports.
+
+Run:
+    python scripts/benchmarks/bench_compliance_expressions.py --variants 10000
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.compliance import ComplianceEngine, RegulatoryFramework, compile_expression
+
+FRAMEWORKS = [RegulatoryFramework.ABS_HSNC, RegulatoryFramework.HSC_CODE_2000, RegulatoryFramework.USCG_SUBCHAPTER_T]
+
+
+class DictState:
+    """Flat path -> value state, read like StateManager.get()."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, path, default=None):
+        return self.values.get(path, default)
+
+
+def make_variants(n, seed):
+    rng = np.random.default_rng(seed)
+    return {
+        "hull.lwl": rng.uniform(20.0, 45.0, n),
+        "hull.beam": rng.uniform(5.0, 10.0, n),
+        "hull.freeboard": rng.uniform(0.2, 1.5, n),
+        "stability.gm_m": rng.uniform(0.0, 1.2, n),
+        "stability.gz_max_m": rng.uniform(0.1, 0.6, n),
+        "stability.angle_of_max_gz_deg": rng.uniform(10.0, 40.0, n),
+        "stability.area_0_30_m_rad": rng.uniform(0.02, 0.1, n),
+        "stability.area_0_40_m_rad": rng.uniform(0.04, 0.15, n),
+        "stability.area_30_40_m_rad": rng.uniform(0.01, 0.06, n),
+        "stability.range_deg": rng.uniform(10.0, 60.0, n),
+        "stability.damage_all_pass": rng.integers(0, 2, n).astype(bool),
+        "arrangement.collision_bulkhead_m": rng.uniform(1.0, 6.0, n),
+    }
+
+
+def legacy_formula(formula, state):
+    """StabilityRuleChecker._evaluate_formula before compiled expressions."""
+    if "max(" in formula:
+        beam = state.get("hull.beam", 0)
+        if "0.04 * beam" in formula or "0.04*beam" in formula:
+            return max(0.15, 0.04 * beam)
+    try:
+        return float(formula)
+    except ValueError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rule library throughput benchmark")
+    parser.add_argument("--variants", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verify", type=int, default=500, help="variants cross-checked against screen")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    columns = make_variants(args.variants, args.seed)
+    states = [
+        DictState({path: values[i].item() for path, values in columns.items()})
+        for i in range(args.variants)
+    ]
+    engine = ComplianceEngine()
+
+    formula = "max(0.15, 0.04 * beam)"
+    expression = compile_expression(formula)
+    start = time.perf_counter()
+    legacy = [legacy_formula(formula, s) for s in states]
+    legacy_s = time.perf_counter() - start
+    start = time.perf_counter()
+    compiled = [expression.evaluate(s) for s in states]
+    compiled_s = time.perf_counter() - start
+    assert legacy == compiled
+    print(
+        f"formula {formula!r}: string match {legacy_s / args.variants * 1e6:.2f} us, "
+        f"compiled {compiled_s / args.variants * 1e6:.2f} us per design"
+    )
+
+    start = time.perf_counter()
+    reports = [engine.evaluate(s, FRAMEWORKS, "patrol", 35.0, incremental=False) for s in states]
+    per_design_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    masks = engine.screen(columns, FRAMEWORKS, "patrol", 35.0)
+    screen_s = time.perf_counter() - start
+
+    for i in range(min(args.verify, args.variants)):
+        for finding in reports[i].findings:
+            if finding.rule_id in masks:
+                assert masks[finding.rule_id][i] == (finding.status == "pass"), (i, finding.rule_id)
+
+    rules = reports[0].total_rules
+    print(f"{args.variants} variants x {rules} rules ({len(masks)} screenable)")
+    print(f"per-design   {per_design_s:8.3f} s  {args.variants / per_design_s:10.0f} designs/s")
+    print(f"screen       {screen_s:8.3f} s  {args.variants / screen_s:10.0f} designs/s")
+    feasible = np.logical_and.reduce(list(masks.values()))
+    print(f"{int(feasible.sum())} variants pass every screened rule")
+
+
+if __name__ == "__main__":
+    main()
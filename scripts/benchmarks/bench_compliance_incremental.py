@@ -0,0 +1,145 @@
+"""
+Benchmark: compliance re-evaluation latency after a single-parameter change
+
+Builds a RuleLibrary of the built-in ABS HSNC / HSC Code / USCG rules plus
+--rules synthetic stability rules, each reading one of --paths numeric
+state paths, and evaluates a real StateManager against it. Then changes one
+parameter at a time and times three ways of getting the updated report:
+
+  full         evaluate(..., incremental=False): every rule re-checked
+  incremental  evaluate(...): inputs re-read, changed rules re-checked
+  refresh      refresh([path]): only the changed path's readers looked at
+
+Every updated report is checked against a full evaluation.
+
+Run:
+    python scripts/benchmarks/bench_compliance_incremental.py --rules 2000 --changes 200
+"""
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.compliance import (
+    ComplianceEngine,
+    RegulatoryFramework,
+    RuleCategory,
+    RuleLibrary,
+    RuleRequirement,
+)
+from magnet.core.state_manager import StateManager
+
+FRAMEWORKS = [RegulatoryFramework.ABS_HSNC, RegulatoryFramework.HSC_CODE_2000, RegulatoryFramework.USCG_SUBCHAPTER_T]
+
+BUILTIN_INPUTS = {
+    "hull.lwl": 35.0, "hull.beam": 8.0, "hull.freeboard": 1.5,
+    "stability.gm_m": 1.0, "stability.gz_max_m": 0.5, "stability.angle_of_max_gz_deg": 30.0,
+    "stability.area_0_30_m_rad": 0.08, "stability.area_0_40_m_rad": 0.12,
+    "stability.area_30_40_m_rad": 0.05, "stability.range_deg": 60.0,
+}
+
+
+def write(state, path, value):
+    """One committed design version per change (refinable paths need a transaction)."""
+    state.begin_transaction()
+    ok = state.set(path, value, "bench")
+    state.commit()
+    return ok
+
+
+def numeric_paths(state, count):
+    """Float-valued paths that StateManager accepts."""
+    from magnet.core.state_manager import VALID_PATHS
+    paths = []
+    for path in sorted(VALID_PATHS):
+        if path.count(".") == 1 and path not in BUILTIN_INPUTS and write(state, path, 1.0):
+            paths.append(path)
+            if len(paths) == count:
+                break
+    return paths
+
+
+def build_library(paths, rules, rng):
+    library = RuleLibrary()
+    for i in range(rules):
+        library.register(RuleRequirement(
+            rule_id=f"SYN-{i:05d}",
+            name=f"Synthetic limit {i}",
+            description="",
+            category=RuleCategory.STABILITY,
+            framework=FRAMEWORKS[i % len(FRAMEWORKS)],
+            required_inputs=[rng.choice(paths)],
+            limit_value=rng.uniform(0.0, 2.0),
+        ))
+    return library
+
+
+def signature(report):
+    return (
+        report.pass_count, report.fail_count, report.incomplete_count, report.review_count,
+        report.overall_status, [f.status for f in report.findings],
+        [f.rule_id for f in report.non_conformances],
+    )
+
+
+def ms(samples):
+    return f"mean {statistics.fmean(samples):8.3f} ms  p50 {statistics.median(samples):8.3f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental compliance benchmark")
+    parser.add_argument("--rules", type=int, default=2000, help="synthetic rules added to the library")
+    parser.add_argument("--paths", type=int, default=200, help="distinct state paths they read")
+    parser.add_argument("--changes", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+
+    state = StateManager()
+    for path, value in BUILTIN_INPUTS.items():
+        write(state, path, value)
+    paths = numeric_paths(state, args.paths)
+    library = build_library(paths, args.rules, rng)
+
+    engine = ComplianceEngine(library)
+    report = engine.evaluate(state, FRAMEWORKS, "patrol", 35.0)
+    print(f"{report.total_rules} rules over {len(paths) + len(BUILTIN_INPUTS)} paths, {args.changes} changes")
+
+    full_ms, incremental_ms, refresh_ms, checked = [], [], [], []
+    reference = ComplianceEngine(library)
+    changeable = paths + list(BUILTIN_INPUTS)
+    for i in range(args.changes):
+        path = rng.choice(changeable)
+        value = rng.uniform(0.0, 2.0) if path in paths else BUILTIN_INPUTS[path] * rng.uniform(0.5, 1.5)
+
+        write(state, path, value)
+        start = time.perf_counter()
+        incremental = engine.evaluate(state, FRAMEWORKS, "patrol", 35.0)
+        incremental_ms.append((time.perf_counter() - start) * 1000.0)
+        checked.append(incremental.rules_checked)
+
+        start = time.perf_counter()
+        full = reference.evaluate(state, FRAMEWORKS, "patrol", 35.0, incremental=False)
+        full_ms.append((time.perf_counter() - start) * 1000.0)
+        assert signature(incremental) == signature(full), f"mismatch after change {i} ({path})"
+
+        write(state, path, value * 0.9)
+        start = time.perf_counter()
+        refreshed = engine.refresh([path])
+        refresh_ms.append((time.perf_counter() - start) * 1000.0)
+        assert signature(refreshed) == signature(reference.evaluate(state, FRAMEWORKS, "patrol", 35.0, incremental=False))
+
+    print(f"full         {ms(full_ms)}")
+    print(f"incremental  {ms(incremental_ms)}  ({statistics.fmean(checked):.1f} rules re-checked on average)")
+    print(f"refresh      {ms(refresh_ms)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: DependencyGraph closure index vs. DFS traversal
+
+Compares downstream-set and recalculation-order queries served by the
+bitset ClosureIndex against the per-call DFS path, on the default graph
+and on synthetic layered DAGs.
+
+Run:
+    python scripts/benchmarks/bench_dependency_closure.py --nodes 10000 --fanout 3
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.dependencies.graph import DependencyGraph
+
+
+def synthetic_graph(nodes: int, fanout: int, seed: int = 42) -> DependencyGraph:
+    """Random DAG: each node depends on `fanout` earlier nodes."""
+    rng = random.Random(seed)
+    graph = DependencyGraph()
+    for i in range(nodes):
+        graph.add_parameter(f"p{i}", phase=f"phase{i % 9}")
+    for i in range(1, nodes):
+        for j in rng.sample(range(max(0, i - 200), i), min(fanout, i)):
+            graph.add_dependency(f"p{i}", f"p{j}")
+    return graph
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / repeat
+
+
+def dfs_recalc_order(graph: DependencyGraph, changed):
+    result = set()
+    for p in changed:
+        result |= graph._dfs_downstream(p)
+    return graph.get_computation_order(result)
+
+
+def report(label: str, graph: DependencyGraph, queries, repeat: int) -> None:
+    build_ms = timed(lambda: graph._build_closure(graph._compute_order()), 1)
+
+    dfs_ms = timed(lambda: [graph._dfs_downstream(q) for q in queries], repeat)
+    idx_ms = timed(lambda: [graph.get_all_downstream(q) for q in queries], repeat)
+    idx_bits_ms = timed(
+        lambda: [graph._closure.downstream_bits((q,)) for q in queries], repeat
+    )
+
+    changed = set(queries[:5])
+    dfs_order_ms = timed(lambda: dfs_recalc_order(graph, changed), repeat)
+    idx_order_ms = timed(lambda: graph.get_recalculation_order(changed), repeat)
+
+    n = len(queries)
+    print(f"{label}: {len(graph._nodes)} nodes, {len(graph._edges)} edges")
+    print(f"  closure build:              {build_ms:10.2f} ms")
+    print(f"  downstream set  (DFS):      {dfs_ms / n * 1000:10.2f} us/query")
+    print(f"  downstream set  (index):    {idx_ms / n * 1000:10.2f} us/query")
+    print(f"  downstream bits (index):    {idx_bits_ms / n * 1000:10.2f} us/query")
+    print(f"  recalc order, 5 changed (DFS):   {dfs_order_ms:8.3f} ms")
+    print(f"  recalc order, 5 changed (index): {idx_order_ms:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dependency closure benchmark")
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--fanout", type=int, default=3)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    default = DependencyGraph()
+    default.build_from_definitions()
+    report("default graph", default, list(default._nodes), args.repeat * 10)
+
+    graph = synthetic_graph(args.nodes, args.fanout)
+    rng = random.Random(0)
+    queries = rng.sample(list(graph._nodes), min(args.queries, args.nodes))
+    report("synthetic graph", graph, queries, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: batched GZ curves vs. per-curve calculation
+
+Evaluates a KG sweep (GM varying, BM fixed per hull) on the default heel
+grid with GZCurveCalculator.calculate() in a loop and with one
+calculate_batch() call, and reports per-curve cost at several batch sizes.
+
+Run:
+    python scripts/benchmarks/bench_gz_batch.py --sizes 1 100 10000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.stability.calculators import GZCurveCalculator
+
+
+def per_curve_us(fn, count: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GZ curve batch benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    calc = GZCurveCalculator()
+    rng = random.Random(3)
+
+    print(f"{'batch':>8} {'loop us/curve':>15} {'batch us/curve':>15} {'speedup':>9}")
+    for size in args.sizes:
+        gms = [rng.uniform(-0.2, 1.5) for _ in range(size)]
+        bms = [rng.uniform(1.0, 4.0) for _ in range(size)]
+        freeboards = [rng.uniform(0.5, 2.0) for _ in range(size)]
+        beams = [rng.uniform(5.0, 9.0) for _ in range(size)]
+
+        loop_repeat = args.repeat if size <= 1000 else 1
+        loop_us = per_curve_us(
+            lambda: [calc.calculate(gm, bm) for gm, bm in zip(gms, bms)], size, loop_repeat
+        )
+        batch_us = per_curve_us(
+            lambda: calc.calculate_batch(gms, bms, freeboard_m=freeboards, beam_m=beams),
+            size, args.repeat,
+        )
+        print(f"{size:>8} {loop_us:>15.2f} {batch_us:>15.2f} {loop_us / batch_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: HullSynthesizer, one proposal per iteration vs. population mode
+
+Synthesizes a hull for each family with the builtin hydrostatics and
+resistance validators, once in the original one-proposal loop and once per
+population size. Reports iterations, validator runs, memo hits, best score,
+termination and wall time, and checks that a population run is repeated
+exactly for the same seed. --delay-ms adds a GIL-releasing sleep to every
+scoring validator run, standing in for costlier physics.
+
+Run:
+    python scripts/benchmarks/bench_hull_synthesis.py --population 1 4 8 --delay-ms 5
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.core.state_manager import StateManager
+from magnet.kernel.priors.hull_families import HullFamily
+from magnet.kernel.synthesis import HullSynthesizer, SynthesisRequest
+from magnet.validators.builtin import get_all_validators
+from magnet.validators.executor import PipelineExecutor
+from magnet.validators.registry import ValidatorRegistry
+from magnet.validators.topology import ValidatorTopology
+
+SPEEDS = {
+    HullFamily.PATROL: 30.0,
+    HullFamily.WORKBOAT: 12.0,
+    HullFamily.FERRY: 20.0,
+    HullFamily.PLANING: 35.0,
+    HullFamily.CATAMARAN: 25.0,
+}
+
+
+class DelayedValidator:
+    """Wraps a validator with a fixed sleep per run."""
+
+    def __init__(self, inner, delay_s: float):
+        self._inner = inner
+        self._delay_s = delay_s
+
+    def validate(self, state_manager, context):
+        time.sleep(self._delay_s)
+        return self._inner.validate(state_manager, context)
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+def build_registry(delay_ms: float):
+    ValidatorRegistry.reset()
+    ValidatorRegistry.initialize_defaults()
+    ValidatorRegistry.instantiate_all()
+    registry = dict(ValidatorRegistry.get_all_instances())
+    if delay_ms > 0:
+        for validator_id in HullSynthesizer.SCORING_VALIDATORS:
+            registry[validator_id] = DelayedValidator(registry[validator_id], delay_ms / 1000.0)
+    topology = ValidatorTopology()
+    for definition in get_all_validators():
+        topology.add_validator(definition)
+    topology.build()
+    return topology, registry
+
+
+def synthesize(topology, registry, family, population, seed, workers):
+    state = StateManager()
+    state.begin_transaction()
+    state.set("mission.max_speed_kts", SPEEDS[family], "bench")
+    state.commit()
+    executor = PipelineExecutor(topology=topology, state_manager=state, validator_registry=registry)
+    synthesizer = HullSynthesizer(executor, state, max_workers=workers)
+    request = SynthesisRequest(
+        hull_family=family,
+        max_speed_kts=SPEEDS[family],
+        population_size=population,
+        seed=seed,
+    )
+    start = time.perf_counter()
+    result = synthesizer.synthesize(request)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hull synthesis population benchmark")
+    parser.add_argument("--population", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="extra cost per validator run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    topology, registry = build_registry(args.delay_ms)
+    print(f"{args.workers} workers, {args.delay_ms} ms extra per validator run")
+    for family in HullFamily:
+        for population in args.population:
+            result, elapsed = synthesize(
+                topology, registry, family, population, args.seed, args.workers,
+            )
+            again, _ = synthesize(topology, registry, family, population, args.seed, args.workers)
+            assert again.proposal == result.proposal, f"{family.value} K={population}: not reproducible"
+            print(
+                f"{family.value:10s} K={population:<2d} {result.iterations_used:3d} iterations  "
+                f"{result.evaluations:4d} scored  {result.cache_hits:4d} memo hits  "
+                f"best {max(result.score_history, default=0.0):5.1f}  "
+                f"{result.termination.value:15s} {elapsed * 1000.0:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark: JobQueue dequeue latency and throughput
+
+Fills a JobQueue with --jobs mixed-priority jobs and drains it with
+--workers consumer coroutines (no-op handlers), reporting enqueue and
+drain throughput. Then measures wakeup latency: with all workers idle in
+dequeue(), enqueues one CRITICAL job at a time and times how long it
+takes a worker to receive it. --store repeats the fill/drain with the
+SQLite durable store, including completion updates.
+
+Run:
+    python scripts/benchmarks/bench_job_queue.py --jobs 100000 --workers 16 --store
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.deployment.worker import Job, JobPriority, JobQueue, JobStatus, SQLiteJobStore
+
+PRIORITIES = list(JobPriority)
+
+
+async def fill_and_drain(queue, jobs, workers, designs, seed):
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for i in range(jobs):
+        design = f"D-{rng.randrange(designs)}" if designs else None
+        await queue.enqueue(Job(job_id=f"j{i}", job_type="bench", priority=rng.choice(PRIORITIES), design_id=design))
+    enqueue_s = time.perf_counter() - start
+
+    done = 0
+
+    async def consume():
+        nonlocal done
+        while True:
+            job = await queue.dequeue(timeout=0.05)
+            if job is None:
+                if queue.get_pending_count() == 0:
+                    return
+                continue
+            job.status = JobStatus.COMPLETED
+            queue.update_job(job)
+            await queue.task_done(job)
+            done += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[consume() for _ in range(workers)])
+    drain_s = time.perf_counter() - start
+    assert done == jobs, f"drained {done} of {jobs}"
+    return enqueue_s, drain_s
+
+
+async def wakeup_latency(workers, samples):
+    queue = JobQueue()
+    received = asyncio.Queue()
+
+    async def consume():
+        while True:
+            job = await queue.dequeue(timeout=10.0)
+            if job is not None:
+                received.put_nowait(time.perf_counter() - job.metadata["sent"])
+
+    tasks = [asyncio.ensure_future(consume()) for _ in range(workers)]
+    await asyncio.sleep(0.05)
+    latencies = []
+    for _ in range(samples):
+        await queue.enqueue(Job(job_type="ping", priority=JobPriority.CRITICAL, metadata={"sent": time.perf_counter()}))
+        latencies.append(await received.get())
+        await asyncio.sleep(0.002)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return sorted(latencies)
+
+
+def report(label, jobs, enqueue_s, drain_s):
+    print(
+        f"{label:28s} enqueue {jobs / enqueue_s:9.0f} jobs/s  "
+        f"drain {jobs / drain_s:9.0f} jobs/s  ({enqueue_s + drain_s:6.2f} s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JobQueue benchmark")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--designs", type=int, default=64, help="distinct design_ids (0 = none)")
+    parser.add_argument("--samples", type=int, default=500, help="wakeup latency samples")
+    parser.add_argument("--store", action="store_true", help="also run with the SQLite store")
+    args = parser.parse_args()
+
+    print(f"{args.jobs} jobs, {args.workers} workers, {args.designs} designs")
+    runs = [
+        ("memory", lambda: JobQueue(max_size=args.jobs)),
+        ("memory, max_per_design=1", lambda: JobQueue(max_size=args.jobs, max_per_design=1)),
+    ]
+    tmp = tempfile.TemporaryDirectory()
+    if args.store:
+        runs.append(("sqlite store", lambda: JobQueue(
+            max_size=args.jobs, store=SQLiteJobStore(os.path.join(tmp.name, "jobs.db")),
+        )))
+
+    for label, make in runs:
+        enqueue_s, drain_s = asyncio.run(fill_and_drain(make(), args.jobs, args.workers, args.designs, 1))
+        report(label, args.jobs, enqueue_s, drain_s)
+
+    latencies = asyncio.run(wakeup_latency(args.workers, args.samples))
+    print(
+        f"wakeup latency, {args.workers} idle workers: "
+        f"p50 {statistics.median(latencies) * 1e6:7.1f} us  "
+        f"p99 {latencies[int(0.99 * (len(latencies) - 1))] * 1e6:7.1f} us  "
+        f"max {latencies[-1] * 1e6:7.1f} us"
+    )
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: NURBS array engine vs. point-wise evaluation
+
+Samples a bicubic hull-like surface on an LOD grid, computes normals and
+Gaussian curvature, and compares the cached basis-matrix engine against
+per-point evaluate()/normal() calls (measured on a smaller grid and scaled).
+
+Run:
+    python scripts/benchmarks/bench_nurbs_sampling.py --lod 100
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.hull_gen.geometry import Point3D
+from magnet.hull_gen.nurbs import NURBSSurface, basis_matrices, uniform_params
+
+
+def hull_surface(stations: int = 12, waterlines: int = 8) -> NURBSSurface:
+    control_points = []
+    for i in range(stations):
+        x = 30.0 * i / (stations - 1)
+        half_beam = 3.5 * math.sin(math.pi * (0.15 + 0.8 * i / (stations - 1)))
+        row = []
+        for j in range(waterlines):
+            z = 3.0 * j / (waterlines - 1)
+            row.append(Point3D(x, half_beam * (z / 3.0) ** 0.5, z))
+        control_points.append(row)
+    surface = NURBSSurface(control_points=control_points)
+    surface.generate_uniform_knots()
+    return surface
+
+
+def timed_ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def pointwise_grid(surface, us, vs, fn):
+    return [[fn(u, v) for v in vs] for u in us]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NURBS sampling benchmark")
+    parser.add_argument("--lod", type=int, default=100, help="Samples per direction")
+    parser.add_argument("--pointwise-lod", type=int, default=40,
+                        help="Samples per direction for the (slow) point-wise reference")
+    args = parser.parse_args()
+
+    surface = hull_surface()
+    us, vs = uniform_params(args.lod), uniform_params(args.lod)
+    ref_us, ref_vs = uniform_params(args.pointwise_lod), uniform_params(args.pointwise_lod)
+    ref_scale = (args.lod / args.pointwise_lod) ** 2
+
+    basis_matrices.cache_clear()
+    cold = timed_ms(lambda: surface.sample_grid_array(args.lod, args.lod))
+    warm = timed_ms(lambda: surface.sample_grid_array(args.lod, args.lod))
+    normals = timed_ms(lambda: surface.normals_grid(us, vs))
+    curvature = timed_ms(lambda: surface.gaussian_curvature_grid(us, vs))
+
+    pw_points = timed_ms(lambda: pointwise_grid(surface, ref_us, ref_vs, surface.evaluate))
+    pw_normals = timed_ms(lambda: pointwise_grid(surface, ref_us, ref_vs, surface.normal))
+
+    print(f"{args.lod}x{args.lod} grid on a {surface.num_u}x{surface.num_v} bicubic surface")
+    print(f"  array points (cold cache): {cold:9.2f} ms")
+    print(f"  array points (warm cache): {warm:9.2f} ms")
+    print(f"  array normals:             {normals:9.2f} ms")
+    print(f"  array gaussian curvature:  {curvature:9.2f} ms")
+    print(f"  point-wise points (scaled from {args.pointwise_lod}^2): {pw_points * ref_scale:9.1f} ms")
+    print(f"  normal(u, v) per point (scaled):                {pw_normals * ref_scale:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
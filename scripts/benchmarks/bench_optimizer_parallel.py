@@ -0,0 +1,143 @@
+"""
+Benchmark: DesignOptimizer fitness evaluation, serial vs. thread vs. process pool
+
+Runs NSGA-II on a patrol boat problem against a real StateManager, with a
+synthetic CPU-bound validator standing in for the physics chain (a fixed
+amount of pure-Python work per candidate). The problem trades lightship
+weight against GM, on state paths the current DesignState schema can
+store. Each evaluation mode is timed with the memo cache on, plus serial
+with the memo cache off, and all runs are checked to produce the same
+Pareto front.
+
+Process-pool speedup depends on the cores available; with one core it can
+only show the pool overhead.
+
+Run:
+    python scripts/benchmarks/bench_optimizer_parallel.py --population 100 --generations 50
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.core.state_manager import StateManager
+from magnet.optimization import (
+    Constraint,
+    ConstraintType,
+    DesignOptimizer,
+    DesignVariable,
+    EvaluationMode,
+    Objective,
+    ObjectiveType,
+    OptimizationProblem,
+)
+
+SOURCE = "bench/validator"
+
+
+def patrol_boat_problem() -> OptimizationProblem:
+    """Hull/power variables; minimize weight, maximize GM; cost and freeboard limits."""
+    problem = OptimizationProblem(name="bench_patrol_boat", description="Benchmark problem")
+    for name, path, low, high in (
+        ("Hull Length", "hull.lwl", 15.0, 35.0),
+        ("Hull Beam", "hull.beam", 4.0, 8.0),
+        ("Hull Depth", "hull.depth", 2.0, 4.0),
+        ("Installed Power", "propulsion.total_installed_power_kw", 500.0, 3000.0),
+    ):
+        problem.add_variable(DesignVariable(name=name, state_path=path, lower_bound=low, upper_bound=high))
+    problem.add_objective(Objective(
+        name="Weight", state_path="weight.lightship_weight_mt", objective_type=ObjectiveType.MINIMIZE,
+    ))
+    problem.add_objective(Objective(
+        name="GM", state_path="stability.gm_transverse_m", objective_type=ObjectiveType.MAXIMIZE,
+    ))
+    problem.add_constraint(Constraint(
+        name="Budget", constraint_type=ConstraintType.INEQUALITY_LE,
+        state_path="cost.total_cost", limit_value=6.0e6, penalty_weight=1e-3,
+    ))
+    problem.add_constraint(Constraint(
+        name="Minimum Freeboard", constraint_type=ConstraintType.INEQUALITY_GE,
+        state_path="hull.freeboard", limit_value=1.2, penalty_weight=10000,
+    ))
+    return problem
+
+
+class SyntheticPhysicsValidator:
+    """Derives weight, cost, stability and freeboard after some CPU work."""
+
+    def __init__(self, work: int):
+        self.work = work
+
+    def validate(self, state, config):
+        lwl = state.get("hull.lwl", 25.0)
+        beam = state.get("hull.beam", 6.0)
+        depth = state.get("hull.depth", 3.0)
+        power = state.get("propulsion.total_installed_power_kw", 1500.0)
+
+        # Stand-in for a hydrostatics integration
+        acc = 0.0
+        for i in range(self.work):
+            acc += math.sin(i * lwl * 1e-4) * math.cos(i * beam * 1e-4)
+
+        lightship = 0.12 * lwl * beam * depth + 0.002 * power + abs(acc) * 1e-6
+        state.set("weight.lightship_weight_mt", lightship, SOURCE)
+        state.set("cost.total_cost", 45000.0 * lightship + 900.0 * power, SOURCE)
+        state.set("stability.gm_transverse_m", beam ** 2 / (12.0 * depth) - 0.4 * depth + power * 1e-4, SOURCE)
+        state.set("hull.freeboard", depth * 0.45, SOURCE)
+
+
+def run(mode, population, generations, work, workers, memo_size):
+    optimizer = DesignOptimizer(
+        patrol_boat_problem(),
+        StateManager(),
+        validators=[SyntheticPhysicsValidator(work)],
+        population_size=population,
+        max_generations=generations,
+        seed=42,
+        evaluation_mode=mode,
+        max_workers=workers,
+        memo_size=memo_size,
+    )
+    start = time.perf_counter()
+    result = optimizer.optimize()
+    elapsed = time.perf_counter() - start
+    front = sorted(tuple(round(v, 6) for v in s.objectives) for s in result.pareto_front)
+    return elapsed, result, front
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DesignOptimizer evaluation benchmark")
+    parser.add_argument("--population", type=int, default=100)
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--work", type=int, default=2000, help="validator loop iterations")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    print(f"{args.population} x {args.generations} generations, {args.workers} workers")
+
+    runs = [
+        ("serial, no memo", EvaluationMode.SERIAL, 0),
+        ("serial", EvaluationMode.SERIAL, 10000),
+        ("thread", EvaluationMode.THREAD, 10000),
+        ("process", EvaluationMode.PROCESS, 10000),
+    ]
+    reference = None
+    for label, mode, memo_size in runs:
+        elapsed, result, front = run(
+            mode, args.population, args.generations, args.work, args.workers, memo_size,
+        )
+        if reference is None:
+            reference = front
+        assert front == reference, f"{label}: Pareto front differs"
+        print(
+            f"{label:16s} {elapsed:8.2f} s  "
+            f"{result.evaluations / elapsed:8.0f} candidates/s  "
+            f"cache hits {result.cache_hits}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark: plate nesting, legacy first-fit guillotine vs. MaxRects
+
+Generates random plate sets (mixed thicknesses, mostly small plates with a
+tail of large ones, all fitting the stock for their thickness) and nests
+each with the previous first-fit-decreasing guillotine nester (reproduced
+below, primary stock only; as shipped and with its rotated-fit bookkeeping
+fixed) and with NestingEngine. Reports sheets, stock
+area bought, yield, average utilization, sheets whose layout is invalid
+(plates overlapping or off the sheet) and wall time; --budget adds the
+randomized-restart pass per thickness group.
+
+Run:
+    python scripts/benchmarks/bench_plate_nesting.py --plates 500 2000 5000 20000 --workers 4
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.structural.nesting import NestingEngine
+from magnet.structural.plates import Plate, PlateExtent
+
+THICKNESSES = [4.0, 5.0, 6.0, 8.0, 10.0]
+
+
+def generate_plates(n, seed):
+    rng = random.Random(seed)
+    plates = []
+    for i in range(n):
+        thickness = rng.choice(THICKNESSES)
+        max_width = 1.4 if thickness == 10.0 else 1.9
+        if rng.random() < 0.15:
+            length, width = rng.uniform(1.5, 5.5), rng.uniform(0.8, max_width)
+        else:
+            length, width = rng.uniform(0.15, 1.5), rng.uniform(0.1, 0.8)
+        plates.append(Plate(
+            plate_id=f"PL-{i:05d}",
+            thickness_mm=thickness,
+            extent=PlateExtent(y_start=0.0, y_end=round(length, 3), z_start=0.0, z_end=round(width, 3)),
+        ))
+    return plates
+
+
+def legacy_nest(plates, fix_rotation=False):
+    """The pre-MaxRects nester: returns [(stock, [(x, y, length, width)])]."""
+    kerf, margin = NestingEngine.KERF_MM, NestingEngine.EDGE_MARGIN_MM
+    groups = {}
+    for plate in plates:
+        groups.setdefault(plate.thickness_mm, []).append(plate)
+
+    sheets = []
+    for thickness, group in groups.items():
+        stock = NestingEngine.STOCK_SHEETS.get(thickness, [(6000, 2000)])[0]
+        active = []
+        for plate in sorted(group, key=lambda p: p.extent.area_m2, reverse=True):
+            length = plate.extent.length_m * 1000 + kerf
+            width = plate.extent.width_m * 1000 + kerf
+            for entry in active + [None]:
+                if entry is None:
+                    entry = [[], [(margin, margin, stock[0] - 2 * margin, stock[1] - 2 * margin)]]
+                    active.append(entry)
+                free = entry[1]
+                pos = next(
+                    (r for r in free if (length <= r[2] and width <= r[3]) or (width <= r[2] and length <= r[3])),
+                    None,
+                )
+                if pos is None:
+                    continue
+                rx, ry, rlen, rwid = pos
+                free.remove(pos)
+                # The old code recorded and split a rotated fit unrotated
+                if fix_rotation and not (length <= rlen and width <= rwid):
+                    length, width = width, length
+                entry[0].append((rx, ry, length, width))
+                if rlen > length:
+                    free.append((rx + length, ry, rlen - length, rwid))
+                if rwid > width:
+                    free.append((rx, ry + width, length, rwid - width))
+                break
+        sheets.extend((stock, positions) for positions, _ in active)
+    return sheets
+
+
+def invalid_sheets(sheets):
+    """Sheets with a plate off the usable area or overlapping another plate."""
+    margin = NestingEngine.EDGE_MARGIN_MM
+    bad = 0
+    for (stock_length, stock_width), positions in sheets:
+        ok = all(
+            x >= margin and y >= margin
+            and x + length <= stock_length - margin + 1e-6
+            and y + width <= stock_width - margin + 1e-6
+            for x, y, length, width in positions
+        )
+        ordered = sorted(positions)
+        for i, (x, y, length, width) in enumerate(ordered):
+            if not ok:
+                break
+            for ox, oy, olength, owidth in ordered[i + 1:]:
+                if ox >= x + length - 1e-6:
+                    break
+                if oy < y + width - 1e-6 and y < oy + owidth - 1e-6:
+                    ok = False
+                    break
+        bad += not ok
+    return bad
+
+
+def report(label, sheets, elapsed):
+    area = sum(stock[0] * stock[1] for stock, _ in sheets)
+    used = [sum(p[2] * p[3] for p in positions) for _, positions in sheets]
+    avg = sum(u / (stock[0] * stock[1]) for (stock, _), u in zip(sheets, used)) / len(sheets) * 100
+    print(
+        f"  {label:26s} {len(sheets):6d} sheets  {area / 1e6:9.1f} m2 stock  "
+        f"yield {sum(used) / area * 100:5.1f}%  avg util {avg:5.1f}%  "
+        f"{invalid_sheets(sheets):4d} invalid  {elapsed:8.2f} s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plate nesting benchmark")
+    parser.add_argument("--plates", type=int, nargs="+", default=[500, 2000, 5000, 20000])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--budget", type=float, default=0.0, help="restart seconds per thickness group")
+    parser.add_argument("--legacy-max", type=int, default=5000, help="skip the legacy nester above this size")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    for n in args.plates:
+        plates = generate_plates(n, args.seed)
+        print(f"{n} plates, {args.workers} workers")
+
+        if n <= args.legacy_max:
+            for label, fix_rotation in (("legacy guillotine", False), ("legacy, rotation fixed", True)):
+                start = time.perf_counter()
+                sheets = legacy_nest(plates, fix_rotation)
+                report(label, sheets, time.perf_counter() - start)
+
+        runs = [("maxrects", 0.0)]
+        if args.budget > 0:
+            runs.append((f"maxrects +{args.budget:g}s restarts", args.budget))
+        for label, budget in runs:
+            engine = NestingEngine(max_workers=args.workers, time_budget_s=budget, seed=args.seed)
+            start = time.perf_counter()
+            nested = engine.nest_plates(plates)
+            elapsed = time.perf_counter() - start
+            assert not engine.unplaced
+            assert sum(len(s.plates) for s in nested) == n
+            report(label, [((s.length_mm, s.width_mm), s.plate_positions) for s in nested], elapsed)
+
+
+if __name__ == "__main__":
+    main()
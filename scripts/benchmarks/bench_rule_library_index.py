@@ -0,0 +1,168 @@
+"""
+Benchmark: RuleLibrary applicability lookups and rule pack loading
+
+Builds a library of the built-in rules plus --rules synthetic rules spread
+over every framework and category, with random vessel types and distinct
+random length ranges, and times:
+
+  lookup    get_applicable_rules() for --queries random (framework,
+            vessel type, length, category) queries: the linear filter the
+            library used before indexes vs the indexed lookup
+  build     the first lookup (index build included) on --dense rules that
+            all share one framework and category
+  load      building the library from RuleRequirement constructors vs
+            RuleLibrary.from_pack() on a pack of the same rules, and
+            from_pack() plus decoding every rule
+
+Every indexed lookup is checked against the linear filter, and the pack
+library's rules against the originals.
+
+Run:
+    python scripts/benchmarks/bench_rule_library_index.py --rules 20000 --queries 2000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.compliance import (
+    RegulatoryFramework,
+    RuleCategory,
+    RuleLibrary,
+    RuleReference,
+    RuleRequirement,
+    write_rule_pack,
+)
+from magnet.compliance.rule_pack import rule_to_record
+
+VESSEL_TYPES = ["patrol", "ferry", "workboat", "yacht", "crew_boat", "pilot", "fireboat", "research"]
+
+
+def synthetic_rules(count, rng):
+    """Rules over every framework and category with distinct random length ranges."""
+    frameworks = list(RegulatoryFramework)
+    categories = list(RuleCategory)
+    rules = []
+    for i in range(count):
+        lo = rng.uniform(5.0, 100.0)
+        hi = lo + rng.uniform(0.0, 60.0)
+        rules.append(RuleRequirement(
+            rule_id=f"SYN-{i:06d}",
+            name=f"Synthetic requirement {i}",
+            description="Generated for the rule library benchmark",
+            category=rng.choice(categories),
+            framework=rng.choice(frameworks),
+            references=[RuleReference("SYN", f"{i // 100}/{i % 100}", edition_year=2024)],
+            required_inputs=["hull.lwl"],
+            vessel_types=rng.sample(VESSEL_TYPES, rng.choice([0, 0, 1, 2, 3])),
+            min_length_m=lo if rng.random() < 0.6 else None,
+            max_length_m=hi if rng.random() < 0.6 else None,
+            limit_value=rng.uniform(0.0, 2.0),
+        ))
+    return rules
+
+
+def build_library(count, seed):
+    library = RuleLibrary()
+    for rule in synthetic_rules(count, random.Random(seed)):
+        library.register(rule)
+    return library
+
+
+def dense_library(count, rng):
+    """count stability rules in one framework, each with its own length range."""
+    library = RuleLibrary(load_builtin=False)
+    for rule in synthetic_rules(count, rng):
+        rule.framework = RegulatoryFramework.ABS_HSNC
+        rule.category = RuleCategory.STABILITY
+        library.register(rule)
+    return library
+
+
+def linear_applicable(library, framework, vessel_type, length_m, category=None):
+    """RuleLibrary.get_applicable_rules() before applicability indexes."""
+    applicable = []
+    for rule in library.get_by_framework(framework):
+        if category is not None and rule.category != category:
+            continue
+        if rule.vessel_types and vessel_type not in rule.vessel_types:
+            continue
+        if rule.min_length_m and length_m < rule.min_length_m:
+            continue
+        if rule.max_length_m and length_m > rule.max_length_m:
+            continue
+        applicable.append(rule)
+    return applicable
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RuleLibrary index and rule pack benchmark")
+    parser.add_argument("--rules", type=int, default=20000, help="synthetic rules added to the built-in ones")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--dense", type=int, default=5000, help="rules in the single-framework build test")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed + 1)
+    queries = [
+        (
+            rng.choice(list(RegulatoryFramework)),
+            rng.choice(VESSEL_TYPES),
+            rng.uniform(0.0, 160.0),
+            rng.choice([None, None] + list(RuleCategory)),
+        )
+        for _ in range(args.queries)
+    ]
+
+    library, build_s = timed(lambda: build_library(args.rules, args.seed))
+    total = len(library.get_all_rules())
+
+    linear, linear_s = timed(lambda: [linear_applicable(library, *q) for q in queries])
+    # First pass includes building each (framework, category) index on demand
+    _, first_s = timed(lambda: [library.get_applicable_rules(*q) for q in queries])
+    indexed, indexed_s = timed(lambda: [library.get_applicable_rules(*q) for q in queries])
+    assert indexed == linear
+
+    found = sum(len(r) for r in indexed) / len(queries)
+    print(f"{total} rules, {args.queries} queries ({found:.0f} applicable rules on average)")
+    print(f"lookup  linear   {linear_s / len(queries) * 1e6:10.1f} us/query")
+    print(f"lookup  indexed  {indexed_s / len(queries) * 1e6:10.1f} us/query  "
+          f"(first pass incl. index builds {first_s / len(queries) * 1e6:.1f} us/query)")
+
+    dense = dense_library(args.dense, random.Random(args.seed))
+    query = (RegulatoryFramework.ABS_HSNC, "patrol", 40.0, RuleCategory.STABILITY)
+    found, build_first_s = timed(lambda: dense.get_applicable_rules(*query))
+    assert found == linear_applicable(dense, *query)
+    _, dense_linear_s = timed(lambda: linear_applicable(dense, *query))
+    print(f"build   {args.dense} rules, one framework/category: first lookup {build_first_s * 1000:.1f} ms "
+          f"(linear filter {dense_linear_s * 1000:.1f} ms)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rules.rulepack")
+        _, write_s = timed(lambda: write_rule_pack(path, library.get_all_rules()))
+        size_mb = os.path.getsize(path) / 1e6
+
+        packed, open_s = timed(lambda: RuleLibrary.from_pack(path))
+        assert packed.get_applicable_rules(*queries[0]) is not None
+        decoded, decode_s = timed(lambda: RuleLibrary.from_pack(path).get_all_rules())
+        assert [rule_to_record(r) for r in decoded] == [rule_to_record(r) for r in library.get_all_rules()]
+        for q in queries[:200]:
+            assert [r.rule_id for r in packed.get_applicable_rules(*q)] == [r.rule_id for r in library.get_applicable_rules(*q)]
+
+    print(f"load    constructors      {build_s * 1000:8.1f} ms")
+    print(f"load    from_pack         {open_s * 1000:8.1f} ms  ({size_mb:.1f} MB pack, written in {write_s * 1000:.0f} ms)")
+    print(f"load    from_pack + all   {decode_s * 1000:8.1f} ms  (every rule decoded)")
+
+
+if __name__ == "__main__":
+    main()
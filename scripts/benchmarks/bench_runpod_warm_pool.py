@@ -0,0 +1,98 @@
+"""
+Benchmark: RunPod handler per-invocation overhead, rebuild vs. warm pool
+
+Times a short `query` operation the old way (build a fresh MAGNETApp with
+_create_app for every event, as handler() used to) and through handler()
+with the warm app pool, with and without a design_state payload. Reports
+per-invocation mean/p50/p99 and the startup vs. work split the handler
+now returns. Finally runs a batch of events through batch_handler.
+
+The very first app build in a process also pays module imports; both
+paths are measured after one warm-up build so only the steady-state
+per-invocation cost is compared.
+
+Run:
+    python scripts/benchmarks/bench_runpod_warm_pool.py --invocations 200
+"""
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+runpod_handler = importlib.import_module("magnet.deployment.runpod_handler")
+
+DESIGN_STATE = {
+    "mission": {"vessel_type": "patrol", "max_speed_kts": 30.0, "range_nm": 300.0},
+    "hull": {"loa": 25.0, "lwl": 23.0, "beam": 6.0, "draft": 1.5, "depth": 3.0},
+}
+
+
+def event(design_state):
+    return {"input": {
+        "operation": "query",
+        "design_state": design_state,
+        "parameters": {"path": "hull.loa"},
+    }}
+
+
+def rebuild_per_event(evt):
+    """The pre-pool handler body: build an app, then run the operation."""
+    data = evt["input"]
+    app = runpod_handler._create_app(data["design_state"])
+    return runpod_handler._handle_operation(app, data["operation"], data["parameters"])
+
+
+def timed(fn, evt, n):
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        fn(evt)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return sorted(samples)
+
+
+def summarize(label, samples):
+    print(
+        f"{label:34s} mean {statistics.fmean(samples):7.3f} ms  "
+        f"p50 {statistics.median(samples):7.3f} ms  "
+        f"p99 {samples[int(0.99 * (len(samples) - 1))]:7.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RunPod warm pool benchmark")
+    parser.add_argument("--invocations", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=32)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    start = time.perf_counter()
+    runpod_handler.get_app_pool().warm()
+    print(f"first build (imports + app): {(time.perf_counter() - start) * 1000.0:.1f} ms")
+
+    for name, design_state in (("empty state", {}), ("with design_state", DESIGN_STATE)):
+        evt = event(design_state)
+        assert rebuild_per_event(evt) == runpod_handler.handler(evt)["result"]
+        summarize(f"rebuild per event, {name}", timed(rebuild_per_event, evt, args.invocations))
+        summarize(f"warm pool, {name}", timed(runpod_handler.handler, evt, args.invocations))
+
+        response = runpod_handler.handler(evt)
+        print(f"{'':34s} last response: startup {response['startup_ms']:.3f} ms, work {response['work_ms']:.3f} ms")
+
+    events = [event({"hull": {"loa": float(i)}}) for i in range(args.batch)]
+    start = time.perf_counter()
+    responses = asyncio.run(runpod_handler.batch_handler(events))
+    elapsed = (time.perf_counter() - start) * 1000.0
+    assert [r["result"]["value"] for r in responses] == [float(i) for i in range(args.batch)]
+    print(f"batch of {args.batch}: {elapsed:.1f} ms  pool {runpod_handler.get_app_pool().stats()}")
+
+
+if __name__ == "__main__":
+    main()
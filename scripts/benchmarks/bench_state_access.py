@@ -0,0 +1,180 @@
+"""
+Benchmark: StateManager get/set hot path, per-call path walk vs. compiled accessors
+
+Records every StateManager.get/set made by one pass of all registered
+validators over a seeded design, then replays that trace many times
+through the previous implementation (normalize_path + split + hasattr/
+getattr walk per call, is_refinable import and two timestamps per set)
+and through the compiled accessors, including get_many/set_many.
+
+Run:
+    python scripts/benchmarks/bench_state_access.py --passes 200
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.core.field_aliases import normalize_path
+from magnet.core.state_manager import StateManager
+from magnet.validators.registry import ValidatorRegistry
+
+SEED = {
+    "mission.vessel_type": "patrol",
+    "mission.max_speed_kts": 30.0,
+    "mission.cruise_speed_kts": 20.0,
+    "mission.range_nm": 300.0,
+    "mission.crew_berthed": 6,
+    "hull.hull_type": "deep_v_planing",
+    "hull.loa": 25.0,
+    "hull.lwl": 23.0,
+    "hull.beam": 6.0,
+    "hull.draft": 1.5,
+    "hull.depth": 3.0,
+    "hull.cb": 0.45,
+    "hull.deadrise_deg": 18.0,
+}
+
+
+def legacy_get(manager: StateManager, path: str, default=None):
+    """Previous StateManager.get."""
+    parts = normalize_path(path).split(".")
+    obj = manager.state
+    for part in parts:
+        if obj is None:
+            return default
+        if hasattr(obj, part):
+            obj = getattr(obj, part)
+        elif isinstance(obj, dict):
+            obj = obj.get(part, default)
+            if obj is default:
+                return default
+        else:
+            return default
+    return obj if obj is not None else default
+
+
+def legacy_set(manager: StateManager, path: str, value, source: str) -> bool:
+    """Previous StateManager.set (transaction bookkeeping omitted)."""
+    canonical_path = normalize_path(path)
+    from magnet.core.refinable_schema import is_refinable
+    is_refinable(canonical_path)
+    parts = canonical_path.split(".")
+    obj = manager.state
+    for part in parts[:-1]:
+        if hasattr(obj, part):
+            obj = getattr(obj, part)
+        elif isinstance(obj, dict):
+            obj = obj.setdefault(part, {})
+        else:
+            return False
+    final_attr = parts[-1]
+    if hasattr(obj, final_attr):
+        old_value = getattr(obj, final_attr)
+        setattr(obj, final_attr, value)
+        manager.state.updated_at = datetime.utcnow().isoformat()
+        manager.state.history.append({
+            "timestamp": datetime.utcnow().isoformat(),
+            "source": source,
+            "action": "set",
+            "path": canonical_path,
+            "old_value": manager._serialize_value(old_value),
+            "new_value": manager._serialize_value(value),
+        })
+        return True
+    elif isinstance(obj, dict):
+        obj[final_attr] = value
+        manager.state.updated_at = datetime.utcnow().isoformat()
+        return True
+    return False
+
+
+def seeded_manager() -> StateManager:
+    manager = StateManager()
+    manager.begin_transaction()
+    manager.set_many(SEED, source="bench")
+    manager.commit()
+    manager.begin_transaction()
+    return manager
+
+
+def record_trace(validators) -> list:
+    """Run every validator once and record its get/set calls."""
+    trace = []
+    get, set_ = StateManager.get, StateManager.set
+
+    def recording_get(self, path, default=None):
+        trace.append(("get", path, None))
+        return get(self, path, default)
+
+    def recording_set(self, path, value, source):
+        trace.append(("set", path, value))
+        return set_(self, path, value, source)
+
+    StateManager.get, StateManager.set = recording_get, recording_set
+    try:
+        manager = seeded_manager()
+        for validator in validators.values():
+            try:
+                validator.validate(manager, {})
+            except Exception:
+                pass
+    finally:
+        StateManager.get, StateManager.set = get, set_
+    return trace
+
+
+def replay(manager: StateManager, trace, passes: int, get, set_) -> float:
+    start = time.perf_counter()
+    for _ in range(passes):
+        for op, path, value in trace:
+            if op == "get":
+                get(manager, path)
+            else:
+                set_(manager, path, value, "bench")
+        manager.state.history.clear()
+    return time.perf_counter() - start
+
+
+def replay_batched(manager: StateManager, trace, passes: int) -> float:
+    reads = [path for op, path, _ in trace if op == "get"]
+    writes = {path: value for op, path, value in trace if op == "set"}
+    start = time.perf_counter()
+    for _ in range(passes):
+        manager.get_many(reads)
+        manager.set_many(writes, "bench")
+        manager.state.history.clear()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StateManager access benchmark")
+    parser.add_argument("--passes", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    ValidatorRegistry.initialize_defaults()
+    ValidatorRegistry.instantiate_all()
+    validators = ValidatorRegistry.get_all_instances()
+
+    trace = record_trace(validators)
+    gets = sum(1 for op, _, _ in trace if op == "get")
+    calls = len(trace) * args.passes
+    print(f"{len(validators)} validators: {gets} get + {len(trace) - gets} set calls per pass, "
+          f"{args.passes} passes")
+
+    old_s = replay(seeded_manager(), trace, args.passes, legacy_get, legacy_set)
+    new_s = replay(seeded_manager(), trace, args.passes, StateManager.get, StateManager.set)
+    batch_s = replay_batched(seeded_manager(), trace, args.passes)
+
+    print(f"  path walk:   {old_s * 1000:8.1f} ms ({old_s / calls * 1e6:6.2f} us/call)")
+    print(f"  compiled:    {new_s * 1000:8.1f} ms ({new_s / calls * 1e6:6.2f} us/call)")
+    print(f"  get_many/set_many: {batch_s * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
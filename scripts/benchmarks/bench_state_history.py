@@ -0,0 +1,94 @@
+"""
+Benchmark: DesignState.to_dict with an unbounded history list vs. HistoryStore
+
+Applies N set() mutations through StateManager and reports the cost of
+to_dict() + JSON encoding (as on save and state fetches) the old way
+(every history dict carried in to_dict), with the capped HistoryStore,
+and with the history left out as on transaction snapshots and state
+fetches. Also reports the memory held by the history itself.
+
+Run:
+    python scripts/benchmarks/bench_state_history.py --mutations 10000 100000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.core.state_manager import StateManager
+
+PATHS = ["kernel.status", "hull.lwl", "hull.loa", "hull.beam", "hull.draft"]
+
+
+def mutate(manager: StateManager, count: int) -> None:
+    manager.begin_transaction()
+    for i in range(count):
+        manager.set(PATHS[i % len(PATHS)], float(i), source=f"agent{i % 7}")
+    manager.commit()
+
+
+def timed(fn, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best * 1000.0
+
+
+def held_bytes(build) -> int:
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DesignState history benchmark")
+    parser.add_argument("--mutations", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    for count in args.mutations:
+        manager = StateManager(history_limit=None)
+        mutate(manager, count)
+        records = manager.state.history.to_list()
+
+        def legacy_to_dict():
+            data = manager.to_dict(include_history=False)
+            data["history"] = records
+            return data
+
+        capped = StateManager()
+        mutate(capped, count)
+
+        old, old_ms = timed(lambda: json.dumps(legacy_to_dict(), default=str))
+        new, new_ms = timed(lambda: json.dumps(capped.to_dict(), default=str))
+        hot, hot_ms = timed(lambda: json.dumps(capped.to_dict(include_history=False), default=str))
+
+        old_kb, new_kb, hot_kb = (len(text) / 1024.0 for text in (old, new, hot))
+
+        list_mb = held_bytes(lambda: [dict(r) for r in records]) / 1e6
+        store_mb = held_bytes(lambda: _store(records)) / 1e6
+
+        print(f"{count:7d} mutations")
+        print(f"  unbounded list:  to_dict+json {old_ms:8.1f} ms, {old_kb:9.0f} KiB JSON, "
+              f"history {list_mb:7.1f} MB")
+        print(f"  HistoryStore:    to_dict+json {new_ms:8.1f} ms, {new_kb:9.0f} KiB JSON, "
+              f"history {store_mb:7.1f} MB (unbounded), {len(capped.state.history)} kept")
+        print(f"  without history: to_dict+json {hot_ms:8.1f} ms, {hot_kb:9.0f} KiB JSON")
+
+
+def _store(records):
+    from magnet.core.history_store import HistoryStore
+    return HistoryStore(records, max_entries=None)
+
+
+if __name__ == "__main__":
+    main()
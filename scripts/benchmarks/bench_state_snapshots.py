@@ -0,0 +1,139 @@
+"""
+Benchmark: StateManager snapshot memory and commit latency
+
+Runs N refinement commits (a handful of hull/mission writes each) and
+reports per-commit latency plus retained snapshot memory, comparing the
+SnapshotStore against the previous full-deepcopy-per-version approach.
+Latency is timed without tracing; retained memory is measured in a second
+pass under tracemalloc (slow for the deepcopy reference).
+
+Run:
+    python scripts/benchmarks/bench_state_snapshots.py --commits 1000
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.core.state_manager import StateManager
+
+
+def seed(manager: StateManager) -> None:
+    manager.begin_transaction()
+    for path, value in {
+        "mission.vessel_type": "patrol",
+        "mission.max_speed_kts": 30.0,
+        "hull.loa": 30.0,
+        "hull.beam": 7.0,
+        "hull.draft": 1.8,
+        "hull.depth": 3.5,
+    }.items():
+        manager.set(path, value, source="bench")
+    manager.commit()
+    # Populate a realistically sized non-parameter payload
+    manager.state.arrangement.compartments = [
+        {"id": f"C{i}", "volume_m3": float(i), "tags": ["dry", "void"]} for i in range(500)
+    ]
+
+
+def refine(manager: StateManager, i: int) -> None:
+    manager.begin_transaction()
+    manager.set("hull.loa", 30.0 + (i % 50) * 0.1, source="bench")
+    manager.set("hull.beam", 7.0 + (i % 13) * 0.05, source="bench")
+    manager.set("mission.max_speed_kts", 28.0 + (i % 5), source="bench")
+    manager.commit()
+
+
+def measure(step, commits: int) -> float:
+    """Mean milliseconds per commit for a commit step function."""
+    start = time.perf_counter()
+    for i in range(commits):
+        step(i)
+    return (time.perf_counter() - start) * 1000 / commits
+
+
+def retained_mb(make_step, commits: int) -> float:
+    """MB still allocated after N commits (snapshot growth)."""
+    _, step = make_step()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(commits):
+        step(i)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / 1e6
+
+
+def store_step():
+    manager = StateManager()
+    seed(manager)
+
+    def step(i):
+        refine(manager, i)
+
+    return manager, step
+
+
+def deepcopy_step():
+    """Reference: what every commit paid before (full deepcopy per version + txn)."""
+    manager = StateManager()
+    seed(manager)
+    versions = {}
+
+    def step(i):
+        txn_snapshot = copy.deepcopy(manager.state.to_dict())
+        refine(manager, i)
+        versions[manager.design_version] = copy.deepcopy(manager.state.to_dict())
+        del txn_snapshot
+
+    return manager, step
+
+
+def run_store(commits: int) -> dict:
+    manager, step = store_step()
+    latency_ms = measure(step, commits)
+
+    targets = range(2, commits, max(1, commits // 50))
+    revert_start = time.perf_counter()
+    for v in targets:
+        manager.revert_to_version(v)
+    revert_ms = (time.perf_counter() - revert_start) * 1000 / max(1, len(targets))
+
+    return {
+        "commit_ms": latency_ms,
+        "retained_mb": retained_mb(store_step, commits),
+        "revert_ms": revert_ms,
+        "stats": manager._snapshots.get_stats(),
+    }
+
+
+def run_deepcopy(commits: int) -> dict:
+    return {
+        "commit_ms": measure(deepcopy_step()[1], commits),
+        "retained_mb": retained_mb(deepcopy_step, commits),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StateManager snapshot benchmark")
+    parser.add_argument("--commits", type=int, default=1000)
+    args = parser.parse_args()
+
+    store = run_store(args.commits)
+    full = run_deepcopy(args.commits)
+
+    print(f"{args.commits} commits")
+    print(f"  snapshot store: {store['commit_ms']:7.3f} ms/commit, "
+          f"{store['retained_mb']:8.2f} MB retained, "
+          f"{store['revert_ms']:6.3f} ms/revert")
+    print(f"  deepcopy (old): {full['commit_ms']:7.3f} ms/commit, "
+          f"{full['retained_mb']:8.2f} MB retained (+ store overhead)")
+    print(f"  store stats:    {store['stats']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: SteinerRouter metric closure, per-pair searches vs. per-terminal Dijkstra
+
+Builds a multi-deck grid compartment graph and compares the previous
+closure construction (nx.shortest_path + nx.shortest_path_length for every
+terminal pair) with MetricClosure.build (one early-exit Dijkstra per
+terminal) and with a cache hit through SteinerRouter.get_metric_closure.
+
+Run:
+    python scripts/benchmarks/bench_steiner_closure.py --terminals 10 40 80
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import networkx as nx
+
+from magnet.routing.router.steiner_router import MetricClosure, SteinerRouter
+
+
+def deck_grid(rows: int, cols: int, decks: int, seed: int = 42) -> nx.Graph:
+    """Grid of spaces per deck with stair links between decks."""
+    rng = random.Random(seed)
+    graph = nx.Graph()
+    for d in range(decks):
+        for r in range(rows):
+            for c in range(cols):
+                node = f"d{d}_{r}_{c}"
+                if c + 1 < cols:
+                    graph.add_edge(node, f"d{d}_{r}_{c + 1}", cost=rng.uniform(2.0, 6.0))
+                if r + 1 < rows:
+                    graph.add_edge(node, f"d{d}_{r + 1}_{c}", cost=rng.uniform(2.0, 6.0))
+                if d + 1 < decks and rng.random() < 0.1:
+                    graph.add_edge(node, f"d{d + 1}_{r}_{c}", cost=rng.uniform(4.0, 8.0))
+    return graph
+
+
+def pairwise_closure(graph: nx.Graph, terminals) -> nx.Graph:
+    """Previous closure construction: two searches per terminal pair."""
+    closure = nx.Graph()
+    terminal_list = list(terminals)
+    for i, t1 in enumerate(terminal_list):
+        for t2 in terminal_list[i + 1:]:
+            path = nx.shortest_path(graph, t1, t2, weight='cost')
+            length = nx.shortest_path_length(graph, t1, t2, weight='cost')
+            closure.add_edge(t1, t2, weight=length, path=path)
+    return closure
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steiner metric closure benchmark")
+    parser.add_argument("--terminals", type=int, nargs="+", default=[10, 40, 80])
+    parser.add_argument("--rows", type=int, default=12)
+    parser.add_argument("--cols", type=int, default=30)
+    parser.add_argument("--decks", type=int, default=4)
+    args = parser.parse_args()
+
+    graph = deck_grid(args.rows, args.cols, args.decks)
+    print(f"graph: {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
+
+    for count in args.terminals:
+        terminals = random.Random(count).sample(sorted(graph.nodes), count)
+
+        start = time.perf_counter()
+        old = pairwise_closure(graph, terminals)
+        old_ms = (time.perf_counter() - start) * 1000.0
+
+        start = time.perf_counter()
+        closure = MetricClosure.build(graph, terminals)
+        new_ms = (time.perf_counter() - start) * 1000.0
+
+        for u, v, data in old.edges(data=True):
+            assert abs(closure.distance(u, v) - data['weight']) < 1e-9
+
+        router = SteinerRouter()
+        router.get_metric_closure(graph, terminals)
+        start = time.perf_counter()
+        router.get_metric_closure(graph, terminals)
+        cached_ms = (time.perf_counter() - start) * 1000.0
+
+        print(
+            f"{count:4d} terminals: per-pair {old_ms:9.1f} ms, "
+            f"per-terminal {new_ms:8.1f} ms, cached {cached_ms:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: DesignOptimizer with and without surrogate screening
+
+Runs NSGA-II on the patrol boat problem and synthetic CPU-bound validator
+from bench_optimizer_parallel.py, once evaluating every offspring and once
+with a SurrogateScreen (evaluating only its per-generation budget), then
+evaluating every offspring again with the generations cut to the surrogate
+run's evaluation count. Reports true evaluations, wall time and the
+hypervolume of each final front against a common reference point, plus the
+surrogate's accuracy report. Finally times a dense get_tradeoff_curve sweep
+on the surrogate against true evaluation.
+
+Run:
+    python scripts/benchmarks/bench_surrogate_screening.py --population 60 --generations 40
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from bench_optimizer_parallel import SyntheticPhysicsValidator, patrol_boat_problem
+from magnet.core.state_manager import StateManager
+from magnet.optimization import (
+    DesignOptimizer,
+    SensitivityAnalyzer,
+    SurrogateScreen,
+)
+from magnet.optimization.dominance import default_reference_point, hypervolume
+
+
+def run(population, generations, work, surrogate, seed):
+    problem = patrol_boat_problem()
+    validators = [SyntheticPhysicsValidator(work)]
+    screen = SurrogateScreen(problem) if surrogate else None
+    optimizer = DesignOptimizer(
+        problem,
+        StateManager(),
+        validators=validators,
+        population_size=population,
+        max_generations=generations,
+        seed=seed,
+        surrogate=screen,
+    )
+    start = time.perf_counter()
+    result = optimizer.optimize()
+    return optimizer, result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Surrogate screening benchmark")
+    parser.add_argument("--population", type=int, default=60)
+    parser.add_argument("--generations", type=int, default=40)
+    parser.add_argument("--work", type=int, default=20000, help="validator loop iterations")
+    parser.add_argument("--sweep", type=int, default=500, help="trade-off curve points")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    runs = {}
+    for label, surrogate in (("full", False), ("surrogate", True)):
+        runs[label] = run(args.population, args.generations, args.work, surrogate, args.seed)
+
+    budget = runs["surrogate"][1].evaluations
+    same_budget = max(1, round((budget - args.population) / args.population))
+    runs[f"full, {same_budget} gen"] = run(args.population, same_budget, args.work, False, args.seed)
+
+    fronts = {
+        label: np.asarray([s.objectives for s in result.pareto_front])
+        for label, (_, result, _) in runs.items()
+    }
+    ref = default_reference_point(np.vstack(list(fronts.values())))
+
+    for label, (_, result, elapsed) in runs.items():
+        print(
+            f"{label:16s} {result.evaluations:6d} evaluations  {elapsed:7.2f} s  "
+            f"front {len(result.pareto_front):3d}  hypervolume {hypervolume(fronts[label], ref):.4g}"
+        )
+
+    optimizer, result, _ = runs["surrogate"]
+    print(json.dumps(result.surrogate_report, indent=2))
+
+    analyzer = SensitivityAnalyzer(
+        optimizer.problem, optimizer.base_state, optimizer.validators,
+        surrogate=optimizer.surrogate.model,
+    )
+    best = result.selected_solution
+    start = time.perf_counter()
+    analyzer.get_tradeoff_curve(best, 0, n_points=args.sweep, use_surrogate=True)
+    surrogate_ms = (time.perf_counter() - start) * 1000.0
+    start = time.perf_counter()
+    analyzer.get_tradeoff_curve(best, 0, n_points=args.sweep)
+    true_ms = (time.perf_counter() - start) * 1000.0
+    print(f"trade-off curve, {args.sweep} points: surrogate {surrogate_ms:.1f} ms, evaluated {true_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
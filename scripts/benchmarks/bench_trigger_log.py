@@ -0,0 +1,69 @@
+"""
+Benchmark: TriggerLog sustained logging at capacity
+
+Logs value-set triggers into a full TriggerLog and reports throughput,
+with and without spilling evicted entries to disk, plus the latency of a
+time-range query that has to reach into spilled segments.
+
+Run:
+    python scripts/benchmarks/bench_trigger_log.py --count 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.dependencies.trigger_log import TriggerEntry, TriggerLog, TriggerType
+
+PARAMETERS = [f"hull.p{i}" for i in range(50)]
+
+
+def fill(log: TriggerLog, count: int) -> float:
+    """Log count entries with increasing timestamps; returns seconds."""
+    base = datetime.utcnow() - timedelta(seconds=count)
+    start = time.perf_counter()
+    for i in range(count):
+        log.log(TriggerEntry(
+            trigger_type=TriggerType.VALUE_SET,
+            parameter_path=PARAMETERS[i % len(PARAMETERS)],
+            new_value=i,
+            timestamp=base + timedelta(seconds=i),
+            transaction_id=f"tx{i // 100}",
+        ))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TriggerLog benchmark")
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--max-entries", type=int, default=TriggerLog.DEFAULT_MAX_ENTRIES)
+    args = parser.parse_args()
+
+    log = TriggerLog(max_entries=args.max_entries)
+    seconds = fill(log, args.count)
+    print(f"in-memory: {args.count} entries in {seconds:6.2f} s "
+          f"({args.count / seconds:9.0f} entries/s), {len(log)} retained")
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+        log = TriggerLog(max_entries=args.max_entries, spill_dir=spill_dir)
+        seconds = fill(log, args.count)
+        log.flush()
+        print(f"spilling:  {args.count} entries in {seconds:6.2f} s "
+              f"({args.count / seconds:9.0f} entries/s), "
+              f"{log.spilled_count} spilled to {len(log.segments)} segments")
+
+        # A one-minute window near the start of the run
+        since = log.segments[0].min_timestamp + timedelta(seconds=60)
+        start = time.perf_counter()
+        hits = log.query(since=since, until=since + timedelta(seconds=60), limit=1000)
+        query_ms = (time.perf_counter() - start) * 1000.0
+        print(f"range query over spilled data: {len(hits)} hits in {query_ms:8.1f} ms")
+        log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark: content-addressed validation cache
+
+Simulates a designer flipping between two design alternatives (edit, run
+phase validation, undo, run again) with a chain of synthetic validators of
+fixed cost, and reports per-run wall time and cache counters. A second
+executor on the same design then reuses the on-disk tier.
+
+Run:
+    python scripts/benchmarks/bench_validation_cache.py --validators 40 --cost-ms 5
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.validators.executor import PipelineExecutor
+from magnet.validators.taxonomy import (
+    ValidationResult,
+    ValidatorCategory,
+    ValidatorDefinition,
+    ValidatorInterface,
+    ValidatorState,
+)
+from magnet.validators.topology import ValidatorTopology
+
+
+class _State:
+    def __init__(self):
+        self.values = {"hull.loa": 30.0}
+
+    def get(self, path, default=None):
+        return self.values.get(path, default)
+
+
+class SyntheticValidator(ValidatorInterface):
+    def __init__(self, validator_id: str, cost_ms: float):
+        self.validator_id = validator_id
+        self.cost_ms = cost_ms
+
+    def validate(self, state_manager, context) -> ValidationResult:
+        time.sleep(self.cost_ms / 1000.0)
+        loa = state_manager.get("hull.loa")
+        return ValidationResult(
+            validator_id=self.validator_id,
+            state=ValidatorState.PASSED if loa < 35 else ValidatorState.FAILED,
+            started_at=datetime.utcnow(),
+        )
+
+    def get_input_hash(self, state_manager) -> str:
+        return hashlib.sha256(repr(state_manager.get("hull.loa")).encode()).hexdigest()[:16]
+
+    def should_skip_unchanged(self, state_manager, last_run_time) -> bool:
+        return False
+
+
+def build(count: int, cost_ms: float):
+    topology = ValidatorTopology()
+    registry = {}
+    for i in range(count):
+        v_id = f"bench/v{i}"
+        topology.add_validator(ValidatorDefinition(
+            validator_id=v_id,
+            name=v_id,
+            description="synthetic",
+            category=ValidatorCategory.PHYSICS,
+            depends_on_validators=[f"bench/v{i - 1}"] if i % 4 else [],
+            depends_on_parameters=["hull.loa"],
+        ))
+        registry[v_id] = SyntheticValidator(v_id, cost_ms)
+    topology.build()
+    return topology, registry
+
+
+def timed_run(executor: PipelineExecutor) -> float:
+    start = time.perf_counter()
+    executor.execute_all(skip_unchanged=False)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validation cache benchmark")
+    parser.add_argument("--validators", type=int, default=40)
+    parser.add_argument("--cost-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    topology, registry = build(args.validators, args.cost_ms)
+    state = _State()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "validation_cache.db"
+        executor = PipelineExecutor(
+            topology, state, registry, design_id="bench", cache_path=db
+        )
+
+        print(f"{args.validators} validators x {args.cost_ms} ms")
+        print(f"  design A (cold):        {timed_run(executor):8.1f} ms")
+        state.values["hull.loa"] = 36.0
+        print(f"  design B (cold, fails): {timed_run(executor):8.1f} ms")
+        state.values["hull.loa"] = 30.0
+        print(f"  undo -> design A:       {timed_run(executor):8.1f} ms")
+        state.values["hull.loa"] = 36.0
+        print(f"  redo -> design B:       {timed_run(executor):8.1f} ms")
+
+        stats = executor.get_cache_stats()
+        print(f"  stats: hits={stats['hits']} misses={stats['misses']} "
+              f"evictions={stats['evictions']} entries={stats['total_entries']}")
+
+        fresh = PipelineExecutor(
+            topology, state, registry, design_id="bench", cache_path=db
+        )
+        print(f"  new executor, disk tier: {timed_run(fresh):8.1f} ms "
+              f"(persistent_hits={fresh.get_cache_stats()['persistent_hits']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: WebGL mesh build + serialize, list vs packed buffers
+
+Builds a wavy grid surface of N triangles and times MeshBuilder -> build()
+(smooth normals) -> serialize_mesh(), once through the per-vertex/per-quad
+list API and once through the buffer API with packed float32/uint32
+output. Peak memory is measured in a second pass under tracemalloc.
+
+Run:
+    python scripts/benchmarks/bench_webgl_mesh.py --triangles 10000 100000 1000000
+"""
+import argparse
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from magnet.webgl.mesh_builder import MeshBuilder
+from magnet.webgl.serializer import serialize_mesh
+
+
+def grid_size(triangles: int) -> int:
+    """Quads per side for a square grid with roughly `triangles` triangles."""
+    return max(1, int(math.sqrt(triangles / 2)))
+
+
+def build_lists(n: int, compress: bool) -> bytes:
+    builder = MeshBuilder()
+    for j in range(n + 1):
+        for i in range(n + 1):
+            builder.add_vertex(float(i), float(j), math.sin(i * 0.1) * math.cos(j * 0.1))
+    row = n + 1
+    for j in range(n):
+        for i in range(n):
+            v0 = j * row + i
+            builder.add_quad(v0, v0 + 1, v0 + row + 1, v0 + row)
+    return serialize_mesh(builder.build(), compress=compress)
+
+
+def build_packed(n: int, compress: bool) -> bytes:
+    i, j = np.meshgrid(np.arange(n + 1, dtype=np.float64), np.arange(n + 1, dtype=np.float64))
+    vertices = np.stack([i, j, np.sin(i * 0.1) * np.cos(j * 0.1)], axis=-1)
+
+    row = n + 1
+    v0 = (np.arange(n)[None, :] + np.arange(n)[:, None] * row).reshape(-1)
+    quads = np.stack([v0, v0 + 1, v0 + row + 1, v0, v0 + row + 1, v0 + row], axis=1)
+
+    builder = MeshBuilder()
+    builder.add_vertex_buffer(vertices)
+    builder.add_triangle_buffer(quads)
+    return serialize_mesh(builder.build(packed=True), compress=compress)
+
+
+def measure(fn, n: int, compress: bool):
+    start = time.perf_counter()
+    data = fn(n, compress)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+    tracemalloc.start()
+    fn(n, compress)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1e6, data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebGL mesh build/serialize benchmark")
+    parser.add_argument("--triangles", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--compress", action="store_true", help="zlib-compress the payload")
+    args = parser.parse_args()
+
+    for triangles in args.triangles:
+        n = grid_size(triangles)
+        list_ms, list_mb, _ = measure(build_lists, n, args.compress)
+        packed_ms, packed_mb, packed_data = measure(build_packed, n, args.compress)
+
+        print(f"{2 * n * n} triangles ({(n + 1) ** 2} vertices), payload {len(packed_data) / 1e6:.1f} MB")
+        print(f"  lists:  {list_ms:9.1f} ms  peak {list_mb:8.1f} MB")
+        print(f"  packed: {packed_ms:9.1f} ms  peak {packed_mb:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark: weld generation with the spatial plate index
+
+Builds a synthetic 60 m hull plated in 3 m x 0.5 m strakes (bottom, side
+and deck zones plus bulkheads) with longitudinals attached by plate ID and
+transverse frame stiffeners located by position, about 10k stiffeners in
+all. Times the previous list scans (stiffener lookup by ID then by zone and
+frame, seams between consecutive plates in sort order, reproduced below)
+against PlateIndex, and reports how many seams each finds.
+
+Run:
+    python scripts/benchmarks/bench_weld_plate_index.py --loa 60 --frame-stiffeners 20
+"""
+import argparse
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from magnet.structural.plate_index import PlateIndex
+from magnet.structural.plates import Plate, PlateExtent
+from magnet.structural.stiffeners import ProfileSection, Stiffener
+from magnet.structural.weld_generator import WeldGenerator
+
+FRAME_SPACING_M = 0.5
+
+
+def build_hull(loa, beam, depth, frames_per_plate, strake_m, frame_stiffeners):
+    n_frames = int(loa / FRAME_SPACING_M) + 1
+    plates = []
+    for zone, half_breadth in (("bottom", True), ("side", True), ("deck", False)):
+        y0 = 0.0 if half_breadth else -beam / 2
+        width = beam / 2 if half_breadth else beam
+        z0, z1 = {"bottom": (0.0, depth / 4), "side": (depth / 4, depth), "deck": (depth, depth)}[zone]
+        strakes = int(round(width / strake_m))
+        for f in range(0, n_frames - 1, frames_per_plate):
+            for k in range(strakes):
+                plates.append(Plate(
+                    plate_id=f"PL-{zone.upper()}-{len(plates):05d}",
+                    zone=zone,
+                    extent=PlateExtent(
+                        frame_start=f, frame_end=min(f + frames_per_plate, n_frames - 1),
+                        y_start=y0 + k * strake_m, y_end=y0 + (k + 1) * strake_m,
+                        z_start=z0, z_end=z1,
+                    ),
+                ))
+    for f in range(10, n_frames - 1, 12):
+        plates.append(Plate(
+            plate_id=f"PL-BH-{f:03d}", zone="bulkhead",
+            extent=PlateExtent(frame_start=f, frame_end=f, y_start=-beam / 2, y_end=beam / 2, z_start=0, z_end=depth),
+        ))
+
+    profile = ProfileSection.flat_bar(80, 6)
+    stiffeners = []
+    for plate in plates:
+        if plate.zone == "bulkhead":
+            continue
+        extent = plate.extent
+        for i in range(3):
+            stiffeners.append(Stiffener(
+                stiffener_id=f"L-{len(stiffeners):05d}", zone=plate.zone, profile=profile,
+                frame_start=extent.frame_start, frame_end=extent.frame_end,
+                y_position=extent.y_start + (i + 1) * strake_m / 4,
+                length_m=(extent.frame_end - extent.frame_start) * FRAME_SPACING_M,
+                attached_to_plate=plate.plate_id,
+            ))
+    for f in range(n_frames):
+        for zone in ("bottom", "side", "deck"):
+            for j in range(frame_stiffeners):
+                y = (j + 0.5) * (beam / 2) / frame_stiffeners
+                stiffeners.append(Stiffener(
+                    stiffener_id=f"FR-{len(stiffeners):05d}", zone=zone, profile=profile,
+                    frame_start=f, frame_end=f, y_position=-y if j % 2 else y, length_m=0.3,
+                ))
+    return plates, stiffeners
+
+
+def legacy_find_plate(stiffener, plates):
+    """The pre-index lookup: ID scan, then first plate in zone covering either end frame."""
+    if stiffener.attached_to_plate:
+        for plate in plates:
+            if plate.plate_id == stiffener.attached_to_plate:
+                return plate
+    for plate in plates:
+        if plate.zone == stiffener.zone:
+            if (plate.extent.frame_start <= stiffener.frame_start <= plate.extent.frame_end or
+                    plate.extent.frame_start <= stiffener.frame_end <= plate.extent.frame_end):
+                return plate
+    return None
+
+
+def legacy_seams(plates):
+    """The pre-index seam search: consecutive plates per zone after sorting."""
+    by_zone = {}
+    for plate in plates:
+        by_zone.setdefault(plate.zone, []).append(plate)
+    pairs = []
+    for zone_plates in by_zone.values():
+        ordered = sorted(zone_plates, key=lambda p: (p.extent.frame_start, p.extent.y_start))
+        for a, b in zip(ordered, ordered[1:]):
+            ea, eb = a.extent, b.extent
+            longitudinal = (abs(ea.y_start - eb.y_start) < 0.01 and abs(ea.y_end - eb.y_end) < 0.01
+                            and ea.frame_end == eb.frame_start)
+            transverse = (ea.frame_start == eb.frame_start and ea.frame_end == eb.frame_end
+                          and abs(ea.y_end - eb.y_start) < 0.01)
+            if longitudinal or transverse:
+                pairs.append((a, b))
+    return pairs
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weld generation plate index benchmark")
+    parser.add_argument("--loa", type=float, default=60.0)
+    parser.add_argument("--beam", type=float, default=12.0)
+    parser.add_argument("--depth", type=float, default=6.0)
+    parser.add_argument("--frames-per-plate", type=int, default=6)
+    parser.add_argument("--strake-m", type=float, default=0.5)
+    parser.add_argument("--frame-stiffeners", type=int, default=20, help="per frame and zone")
+    args = parser.parse_args()
+
+    plates, stiffeners = build_hull(
+        args.loa, args.beam, args.depth, args.frames_per_plate, args.strake_m, args.frame_stiffeners,
+    )
+    print(f"{args.loa:g} m hull: {len(plates)} plates, {len(stiffeners)} stiffeners")
+
+    legacy, legacy_s = timed(lambda: [legacy_find_plate(s, plates) for s in stiffeners])
+    index, build_s = timed(lambda: PlateIndex(plates))
+    indexed, lookup_s = timed(lambda: [index.find_for_stiffener(s) for s in stiffeners])
+    moved = sum(a is not b for a, b in zip(legacy, indexed))
+    print(f"stiffener lookup   scan {legacy_s * 1000:9.1f} ms   index {lookup_s * 1000:7.1f} ms "
+          f"(+{build_s * 1000:.1f} ms build)   {moved} moved to the plate under them")
+
+    old_pairs, old_s = timed(lambda: legacy_seams(plates))
+    new_pairs, new_s = timed(lambda: [pair for zone in index.zones for pair in index.adjacent_pairs(zone)])
+    print(f"seam detection     scan {old_s * 1000:9.1f} ms   index {new_s * 1000:7.1f} ms   "
+          f"seams {len(old_pairs)} -> {len(new_pairs)}")
+
+    generator = WeldGenerator(MagicMock())
+    welds, total_s = timed(lambda: generator.generate_all_welds(None, plates, stiffeners))
+    print(f"generate_all_welds {total_s * 1000:9.1f} ms   {len(welds)} welds")
+
+
+if __name__ == "__main__":
+    main()
@@ -276,6 +276,132 @@ class TestHullSynthesizer:
         assert result.proposal.lwl_m > 18.0
 
 
+class StubResult:
+    """Minimal validator result."""
+
+    def __init__(self, passed, findings):
+        self.passed = passed
+        self.findings = findings
+
+
+class StubFinding:
+    def __init__(self, severity):
+        self.severity = severity
+
+    def to_dict(self):
+        return {"severity": self.severity}
+
+
+class StubExecutor:
+    """Scores proposals on whichever state it is handed; counts runs."""
+
+    def __init__(self):
+        self.runs = 0
+        self.targets = set()
+
+    def execute_single(self, validator_id, skip_cached=True, state_manager=None):
+        self.runs += 1
+        state = state_manager
+        self.targets.add(type(state).__name__ if state is not None else "shared")
+        if state is None:
+            return StubResult(True, [])
+        # Reward beamier hulls so a better candidate than the prior exists
+        ratio = state.get("hull.lwl") / state.get("hull.beam")
+        severity = "warning" if ratio > 4.2 else "info"
+        return StubResult(True, [StubFinding(severity)])
+
+
+class DerivingExecutor:
+    """Writes derived hydrostatics to the state it validates, like the real validators."""
+
+    def __init__(self, state_manager):
+        self.state = state_manager
+
+    def execute_single(self, validator_id, skip_cached=True, state_manager=None):
+        if validator_id == "physics/hydrostatics":
+            if state_manager is None:
+                with refinable_write_context(self.state):
+                    self.derive(self.state)
+            else:
+                self.derive(state_manager)
+        return StubResult(True, [])
+
+    @staticmethod
+    def derive(state):
+        draft, beam = state.get("hull.draft"), state.get("hull.beam")
+        state.set("hull.kb_m", 0.55 * draft, "physics/hydrostatics")
+        state.set("hull.bmt", beam ** 2 / (12.0 * draft), "physics/hydrostatics")
+
+
+class TestPopulationSynthesis:
+    """Tests for population-mode synthesis (v1.5)."""
+
+    def request(self, **kwargs):
+        params = dict(hull_family=HullFamily.WORKBOAT, max_speed_kts=12.0, max_iterations=6)
+        params.update(kwargs)
+        return SynthesisRequest(**params)
+
+    def test_invalid_population_rejected(self):
+        """population_size must be positive."""
+        with pytest.raises(ValueError):
+            self.request(population_size=0)
+
+    def test_same_seed_same_hull(self):
+        """Population runs are reproducible for a given seed."""
+        results = []
+        for _ in range(2):
+            sm = StateManager()
+            synthesizer = HullSynthesizer(executor=StubExecutor(), state_manager=sm, max_workers=4)
+            results.append(synthesizer.synthesize(self.request(population_size=6, seed=3)))
+
+        assert results[0].proposal == results[1].proposal
+        assert results[0].score_history == results[1].score_history
+
+    def test_candidates_scored_on_views_and_winner_written(self):
+        """Only the winning proposal reaches the shared state."""
+        sm = StateManager()
+        executor = StubExecutor()
+        synthesizer = HullSynthesizer(executor=executor, state_manager=sm, max_workers=2)
+
+        result = synthesizer.synthesize(self.request(population_size=4))
+
+        assert executor.targets == {"StateOverlay"}
+        assert result.evaluations + result.cache_hits == 4 * result.iterations_used
+        assert executor.runs == result.evaluations * len(HullSynthesizer.SCORING_VALIDATORS)
+        assert sm.get("hull.lwl") == result.proposal.lwl_m
+        assert sm.get("hull.beam") == result.proposal.beam_m
+
+    def test_winner_derived_values_written(self):
+        """Population runs leave the same derived hydrostatics as single-proposal runs."""
+        for population_size in (1, 4):
+            sm = StateManager()
+            synthesizer = HullSynthesizer(DerivingExecutor(sm), sm, max_workers=2)
+            result = synthesizer.synthesize(self.request(population_size=population_size))
+            draft, beam = result.proposal.draft_m, result.proposal.beam_m
+            assert sm.get("hull.kb_m") == pytest.approx(0.55 * draft)
+            assert sm.get("hull.bmt") == pytest.approx(beam ** 2 / (12.0 * draft))
+
+    def test_population_finds_better_scores(self):
+        """Perturbed candidates improve on the single-proposal loop."""
+        single = HullSynthesizer(StubExecutor(), StateManager()).synthesize(self.request())
+        population = HullSynthesizer(StubExecutor(), StateManager(), max_workers=1).synthesize(
+            self.request(population_size=8)
+        )
+        assert max(population.score_history) >= max(single.score_history)
+        assert single.evaluations == single.iterations_used
+        assert single.cache_hits == 0
+
+    def test_repeated_candidates_are_memoized(self):
+        """Proposals seen before are not scored again."""
+        executor = StubExecutor()
+        synthesizer = HullSynthesizer(executor=executor, state_manager=StateManager(), max_workers=1)
+        # Without adjustments the guided proposal repeats every iteration
+        result = synthesizer.synthesize(self.request(population_size=2, max_iterations=5))
+
+        assert result.cache_hits > 0
+        assert executor.runs == result.evaluations * len(HullSynthesizer.SCORING_VALIDATORS)
+
+
 class TestConductorIntegration:
     """Tests for conductor integration with synthesis."""
 
@@ -88,6 +88,8 @@ def mock_context(mock_state_manager, mock_phase_machine, mock_conductor, mock_vi
     context.config.api.enable_docs = True
     context.config.api.docs_url = "/docs"
     context.config.api.cors_origins = ["*"]
+    context.config.api.kernel_workers = 2
+    context.config.api.kernel_queue_limit = 64
 
     container = Mock()
 
@@ -221,6 +223,11 @@ class TestDesignEndpoints:
         response = client.get("/api/v1/designs/TEST-001")
         assert response.status_code == 503
 
+    def test_get_design_history_no_state_manager(self, client):
+        """Test getting design history without state manager returns 503."""
+        response = client.get("/api/v1/designs/TEST-001/history?offset=0&limit=10")
+        assert response.status_code == 503
+
     def test_update_design_invalid_path(self, client):
         """Test updating with invalid path prefix returns 422."""
         response = client.patch("/api/v1/designs/TEST-001", json={
@@ -298,6 +305,134 @@ class TestPhaseEndpoints:
         assert data["phase"] == "mission"
         assert data["status"] == "completed"
 
+    def test_run_phase_serialized_across_design_ids(self, mock_context, mock_conductor):
+        """Phase runs share one conductor and state, whatever design_id the URL names."""
+        import threading
+        import time
+        import httpx
+        from magnet.deployment.api import create_fastapi_app
+
+        lock = threading.Lock()
+        running = []
+
+        def run_phase(phase):
+            with lock:
+                running.append(phase)
+                assert len(running) == 1, "phase runs on the shared state overlapped"
+            time.sleep(0.05)
+            with lock:
+                running.remove(phase)
+            return Mock(to_dict=Mock(return_value={}))
+
+        mock_conductor.run_phase = Mock(side_effect=run_phase)
+        app = create_fastapi_app(mock_context)
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(
+                    client.post("/api/v1/designs/TEST-001/phases/mission/run", json={}),
+                    client.post("/api/v1/designs/TEST-002/phases/mission/run", json={}),
+                )
+
+        try:
+            responses = asyncio.run(main())
+        finally:
+            app.state.kernel_executor.shutdown()
+
+        assert [r.status_code for r in responses] == [200, 200]
+        assert mock_conductor.run_phase.call_count == 2
+
+    def test_delete_ordered_with_run_phase(self, mock_context, mock_conductor, mock_state_manager):
+        """A DELETE issued while a phase runs waits for the run instead of resetting under it."""
+        import threading
+        import time
+        import httpx
+        from magnet.deployment.api import create_fastapi_app
+
+        events = []
+        started = threading.Event()
+
+        def run_phase(phase):
+            events.append("run_start")
+            started.set()
+            time.sleep(0.05)
+            events.append("run_end")
+            return Mock(to_dict=Mock(return_value={}))
+
+        mock_conductor.run_phase = Mock(side_effect=run_phase)
+        mock_state_manager.metadata.design_id = "TEST-001"
+        mock_state_manager.reset = Mock(side_effect=lambda: events.append("reset"))
+        app = create_fastapi_app(mock_context)
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                run = asyncio.create_task(
+                    client.post("/api/v1/designs/TEST-001/phases/mission/run", json={})
+                )
+                # Issue the DELETE only once the run holds the shared state
+                while not started.is_set():
+                    await asyncio.sleep(0.001)
+                delete = await client.delete("/api/v1/designs/TEST-001")
+                return await run, delete
+
+        try:
+            run, delete = asyncio.run(main())
+        finally:
+            app.state.kernel_executor.shutdown()
+
+        assert (run.status_code, delete.status_code) == (200, 200)
+        assert events == ["run_start", "run_end", "reset"]
+
+    def test_history_read_ordered_with_run_phase(
+        self, mock_context, mock_conductor, mock_state_manager
+    ):
+        """A history read issued while a phase runs waits for the run instead of paging under it."""
+        import threading
+        import time
+        import httpx
+        from magnet.deployment.api import create_fastapi_app
+
+        events = []
+        started = threading.Event()
+
+        def run_phase(phase):
+            events.append("run_start")
+            started.set()
+            time.sleep(0.05)
+            events.append("run_end")
+            return Mock(to_dict=Mock(return_value={}))
+
+        def get_history(offset=0, limit=100):
+            events.append("read")
+            return []
+
+        mock_conductor.run_phase = Mock(side_effect=run_phase)
+        mock_state_manager.metadata.design_id = "TEST-001"
+        mock_state_manager.state.history = Mock(__len__=Mock(return_value=0), dropped=0)
+        mock_state_manager.get_history = Mock(side_effect=get_history)
+        app = create_fastapi_app(mock_context)
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                run = asyncio.create_task(
+                    client.post("/api/v1/designs/TEST-001/phases/mission/run", json={})
+                )
+                while not started.is_set():
+                    await asyncio.sleep(0.001)
+                history = await client.get("/api/v1/designs/TEST-001/history")
+                return await run, history
+
+        try:
+            run, history = asyncio.run(main())
+        finally:
+            app.state.kernel_executor.shutdown()
+
+        assert (run.status_code, history.status_code) == (200, 200)
+        assert events == ["run_start", "run_end", "read"]
+
     def test_validate_phase_no_state_manager(self, client):
         """Test validating phase without state manager returns 503."""
         response = client.post("/api/v1/designs/TEST-001/phases/mission/validate", json={})
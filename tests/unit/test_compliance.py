@@ -20,6 +20,9 @@ from magnet.compliance import (
     RuleReference,
     RuleRequirement,
     Finding,
+    # Rule Expressions
+    ExpressionError,
+    compile_expression,
     # Rule Library
     RuleLibrary,
     RULE_LIBRARY,
@@ -27,6 +30,7 @@ from magnet.compliance import (
     StabilityRuleChecker,
     StructuralRuleChecker,
     FreeboardRuleChecker,
+    FormulaRuleChecker,
     get_checker,
     RULE_CHECKERS,
     # Engine
@@ -221,6 +225,71 @@ class TestFinding:
         assert d["status"] == "pass"
 
 
+class TestRuleExpressions:
+    """Test the rule formula compiler."""
+
+    def test_symbols_and_paths_bind_to_state(self):
+        """Test bare symbols and dotted paths become bindings, in first-use order."""
+        expr = compile_expression("max(0.15, 0.04 * beam) + stability.fsc_m")
+        assert expr.paths == ("hull.beam", "stability.fsc_m")
+        assert expr.bindings == {"beam": "hull.beam", "stability.fsc_m": "stability.fsc_m"}
+        assert expr([8.0, 0.1]) == pytest.approx(0.42)
+        assert compile_expression("max(0.15, 0.04 * beam) + stability.fsc_m") is expr
+
+    def test_evaluate_against_state(self):
+        """Test evaluation reads the state; unset inputs give None."""
+        expr = compile_expression("0.05 * lwl <= arrangement.collision_bulkhead_m <= 0.15 * lwl")
+        assert expr.evaluate(MockStateManager({"hull.lwl": 30.0, "arrangement.collision_bulkhead_m": 3.0})) is True
+        assert expr.evaluate(MockStateManager({"hull.lwl": 30.0, "arrangement.collision_bulkhead_m": 5.0})) is False
+        assert expr.evaluate(MockStateManager({"hull.lwl": 30.0})) is None
+
+    def test_evaluate_many_matches_scalar(self):
+        """Test the vector form agrees with the scalar form per design."""
+        import numpy as np
+
+        source = "(beam * 0.04 if not stability.damage_all_pass or lwl > 30 else 0.2) + min(depth, 2)"
+        expr = compile_expression(source)
+        rng = np.random.default_rng(3)
+        columns = {
+            "hull.beam": rng.uniform(4, 12, 50),
+            "stability.damage_all_pass": rng.integers(0, 2, 50),
+            "hull.lwl": rng.uniform(20, 40, 50),
+            "hull.depth": 2.5,  # Scalars broadcast
+        }
+        result = expr.evaluate_many(columns)
+
+        assert result.shape == (50,)
+        for i in range(50):
+            values = [columns[p] if np.isscalar(columns[p]) else columns[p][i] for p in expr.paths]
+            assert result[i] == pytest.approx(expr(values))
+
+    @pytest.mark.parametrize("source", [
+        "__import__('os')",
+        "hull.beam.__class__()",
+        "open('x')",
+        "[beam]",
+        "beam if",
+        "unknown_symbol * 2",
+        "'text'",
+        "lambda: 1",
+    ])
+    def test_rejects_unsafe_or_invalid_formulas(self, source):
+        """Test anything outside the whitelist raises ExpressionError."""
+        with pytest.raises(ExpressionError):
+            compile_expression(source)
+
+    def test_power_overflows_instead_of_hanging(self):
+        """Test ** is a float power, so huge exponents overflow rather than build big integers."""
+        import numpy as np
+
+        assert compile_expression("2 ** 3 * beam")([2.0]) == 16.0
+        with pytest.raises(OverflowError):
+            compile_expression("9 ** 9 ** 9")(())
+        with pytest.raises(OverflowError):
+            compile_expression("passengers ** passengers")([10 ** 6])
+        assert np.isinf(compile_expression("9 ** 9 ** 9 * beam").evaluate_many({"hull.beam": np.ones(2)})).all()
+
+
 # =============================================================================
 # RULE LIBRARY TESTS
 # =============================================================================
@@ -311,6 +380,134 @@ class TestRuleLibraryRegistration:
         assert retrieved.name == "Custom Test Rule"
 
 
+class TestRuleLibraryIndex:
+    """Test applicability indexes and rule packs."""
+
+    @staticmethod
+    def _linear(library, framework, vessel_type, length_m, category=None):
+        """The pre-index filter, as reference."""
+        applicable = []
+        for rule in library.get_by_framework(framework):
+            if category is not None and rule.category != category:
+                continue
+            if rule.vessel_types and vessel_type not in rule.vessel_types:
+                continue
+            if rule.min_length_m and length_m < rule.min_length_m:
+                continue
+            if rule.max_length_m and length_m > rule.max_length_m:
+                continue
+            applicable.append(rule)
+        return applicable
+
+    def test_index_matches_linear_filter(self):
+        """Test indexed lookups equal the linear filter, including at range bounds."""
+        import random
+
+        rng = random.Random(5)
+        library = RuleLibrary()
+        bounds = [None, 0.0, 12.0, 24.0, 24.0, 50.0, 90.0]
+        for i in range(300):
+            library.register(RuleRequirement(
+                rule_id=f"IDX-{i}", name="", description="",
+                category=rng.choice([RuleCategory.STABILITY, RuleCategory.FIRE_SAFETY]),
+                framework=rng.choice([RegulatoryFramework.ABS_HSNC, RegulatoryFramework.DNV_HSLC]),
+                vessel_types=rng.sample(["ferry", "patrol", "workboat"], rng.randint(0, 2)),
+                min_length_m=rng.choice(bounds),
+                max_length_m=rng.choice(bounds),
+            ))
+
+        for length_m in [0.0, 5.0, 12.0, 18.0, 24.0, 37.5, 50.0, 90.0, 120.0]:
+            for vessel_type in ["ferry", "patrol", "yacht"]:
+                for framework in [RegulatoryFramework.ABS_HSNC, RegulatoryFramework.DNV_HSLC]:
+                    for category in [None, RuleCategory.FIRE_SAFETY]:
+                        indexed = library.get_applicable_rules(framework, vessel_type, length_m, category)
+                        assert indexed == self._linear(library, framework, vessel_type, length_m, category)
+
+    def test_index_matches_linear_filter_continuous_bounds(self):
+        """Test indexed lookups with distinct random (sometimes inverted) length ranges."""
+        import random
+
+        rng = random.Random(11)
+        library = RuleLibrary(load_builtin=False)
+        for i in range(2000):
+            library.register(RuleRequirement(
+                rule_id=f"IDX-{i}", name="", description="",
+                category=RuleCategory.STABILITY, framework=RegulatoryFramework.ABS_HSNC,
+                vessel_types=rng.sample(["ferry", "patrol", "workboat"], rng.randint(0, 2)),
+                min_length_m=rng.choice([None, rng.uniform(5.0, 100.0)]),
+                max_length_m=rng.choice([None, rng.uniform(5.0, 100.0)]),
+            ))
+
+        for length_m in [rng.uniform(0.0, 110.0) for _ in range(50)]:
+            for vessel_type in ["ferry", "yacht"]:
+                indexed = library.get_applicable_rules(RegulatoryFramework.ABS_HSNC, vessel_type, length_m)
+                assert indexed == self._linear(library, RegulatoryFramework.ABS_HSNC, vessel_type, length_m)
+
+    def test_register_updates_index_and_replaces(self):
+        """Test register() after a lookup is visible, and re-registering replaces in place."""
+        library = RuleLibrary()
+        before = library.get_applicable_rules(RegulatoryFramework.USCG_SUBCHAPTER_T, "ferry", 15.0)
+
+        rule = RuleRequirement(
+            rule_id="USCG-46CFR-178-310", name="Replaced", description="",
+            category=RuleCategory.FREEBOARD, framework=RegulatoryFramework.USCG_SUBCHAPTER_T,
+            max_length_m=10.0,
+        )
+        library.register(rule)
+
+        after = library.get_applicable_rules(RegulatoryFramework.USCG_SUBCHAPTER_T, "ferry", 15.0)
+        assert "USCG-46CFR-178-310" in [r.rule_id for r in before]
+        assert "USCG-46CFR-178-310" not in [r.rule_id for r in after]
+        ids = [r.rule_id for r in library.get_by_framework(RegulatoryFramework.USCG_SUBCHAPTER_T)]
+        assert ids.count("USCG-46CFR-178-310") == 1
+        assert library.get("USCG-46CFR-178-310") is rule
+
+    def test_rule_pack_round_trip_is_lazy(self, tmp_path):
+        """Test a pack library matches the built-in one and decodes rules on use."""
+        from magnet.compliance import write_rule_pack
+        from magnet.compliance.rule_pack import rule_to_record
+
+        path = str(tmp_path / "builtin.rulepack")
+        assert write_rule_pack(path, RULE_LIBRARY.get_all_rules()) == len(RULE_LIBRARY.get_all_rules())
+
+        library = RuleLibrary.from_pack(path)
+        assert all(entry._rule is None for entry in library._entries.values())
+
+        packed = library.get_applicable_rules(RegulatoryFramework.HSC_CODE_2000, "patrol", 35.0)
+        builtin = RULE_LIBRARY.get_applicable_rules(RegulatoryFramework.HSC_CODE_2000, "patrol", 35.0)
+        assert [rule_to_record(r) for r in packed] == [rule_to_record(r) for r in builtin]
+        assert library.get("ABS-HSNC-3-2-1").references[0].section == "3/2.1"
+        decoded = [rid for rid, entry in library._entries.items() if entry._rule is not None]
+        assert sorted(decoded) == sorted([r.rule_id for r in packed] + ["ABS-HSNC-3-2-1"])
+
+    def test_rewriting_mapped_pack_keeps_old_contents(self, tmp_path):
+        """Test rewriting a pack a library still maps neither truncates it nor leaks temp files."""
+        from magnet.compliance import write_rule_pack
+
+        path = str(tmp_path / "builtin.rulepack")
+        write_rule_pack(path, RULE_LIBRARY.get_all_rules())
+
+        with RuleLibrary.from_pack(path) as library:
+            write_rule_pack(path, [RULE_LIBRARY.get("ABS-HSNC-3-2-1")])
+            rules = library.get_by_framework(RegulatoryFramework.USCG_SUBCHAPTER_T)
+            assert [r.rule_id for r in rules] == [
+                r.rule_id for r in RULE_LIBRARY.get_by_framework(RegulatoryFramework.USCG_SUBCHAPTER_T)
+            ]
+        assert library._packs == []
+
+        assert [p.name for p in tmp_path.iterdir()] == ["builtin.rulepack"]
+        assert [r.rule_id for r in RuleLibrary.from_pack(path).get_all_rules()] == ["ABS-HSNC-3-2-1"]
+
+    def test_rejects_non_pack_file(self, tmp_path):
+        """Test opening a file that is not a rule pack raises RulePackError."""
+        from magnet.compliance import RulePackError
+
+        path = tmp_path / "rules.json"
+        path.write_text('{"rules": []}')
+        with pytest.raises(RulePackError):
+            RuleLibrary.from_pack(str(path))
+
+
 # =============================================================================
 # RULE CHECKER TESTS
 # =============================================================================
@@ -550,6 +747,266 @@ class TestComplianceEngine:
         assert len(findings) > 0
 
 
+class TestIncrementalCompliance:
+    """Test incremental re-evaluation and dependency hooks."""
+
+    BASE = {
+        "hull.lwl": 35.0,
+        "hull.beam": 8.0,
+        "hull.freeboard": 1.5,
+        "stability.gm_m": 1.0,
+        "stability.gz_max_m": 0.50,
+        "stability.angle_of_max_gz_deg": 30.0,
+        "stability.area_0_30_m_rad": 0.08,
+        "stability.area_0_40_m_rad": 0.12,
+        "stability.area_30_40_m_rad": 0.05,
+        "stability.range_deg": 60.0,
+    }
+    FRAMEWORKS = [RegulatoryFramework.ABS_HSNC, RegulatoryFramework.HSC_CODE_2000]
+
+    def _evaluate(self, engine, state, **kwargs):
+        return engine.evaluate(
+            state=state, frameworks=self.FRAMEWORKS, vessel_type="patrol", length_m=35.0, **kwargs
+        )
+
+    def test_input_paths_inferred_from_formula(self):
+        """Test formula symbols add their state paths; declared reads win."""
+        rule = RuleRequirement(
+            rule_id="T-1", name="GM", description="", category=RuleCategory.STABILITY,
+            framework=RegulatoryFramework.ABS_HSNC,
+            required_inputs=["stability.gm_m"], formula="max(0.15, 0.04 * beam)",
+        )
+        assert rule.input_paths() == ["stability.gm_m", "hull.beam"]
+
+        rule.reads = ["stability.gm_m"]
+        assert rule.input_paths() == ["stability.gm_m"]
+
+    def test_unchanged_inputs_recheck_nothing(self):
+        """Test a second evaluation with the same state checks no rules."""
+        engine = ComplianceEngine()
+        state = MockStateManager(dict(self.BASE))
+        first = self._evaluate(engine, state)
+        second = self._evaluate(engine, state)
+
+        assert first.rules_checked == first.total_rules
+        assert second.rules_checked == 0
+        assert second.report_id != first.report_id
+        assert [f.finding_id for f in second.findings] == [f.finding_id for f in first.findings]
+
+    def test_single_change_matches_full_evaluation(self):
+        """Test only readers of a changed path are re-checked, with correct counts and groups."""
+        engine = ComplianceEngine()
+        state = MockStateManager(dict(self.BASE))
+        first = self._evaluate(engine, state)
+
+        state.write("stability", "gm_m", 0.05)
+        report = self._evaluate(engine, state)
+        full = self._evaluate(ComplianceEngine(), state)
+
+        gm_rules = [f for f in first.findings if "stability.gm_m" in f.affected_parameters]
+        assert report.rules_checked == len(gm_rules)
+        for attr in ("pass_count", "fail_count", "incomplete_count", "review_count", "overall_status"):
+            assert getattr(report, attr) == getattr(full, attr)
+        assert [f.status for f in report.findings] == [f.status for f in full.findings]
+        assert [f.rule_id for f in report.non_conformances] == [f.rule_id for f in full.non_conformances]
+        for key, findings in full.findings_by_category.items():
+            assert [f.status for f in report.findings_by_category[key]] == [f.status for f in findings]
+        # The previous report is left as it was
+        assert first.fail_count == 0
+
+    def test_custom_checker_without_input_paths_is_always_rechecked(self):
+        """Test a custom checker reading undeclared paths never keeps a stale finding."""
+
+        class WaiverChecker(StabilityRuleChecker):
+            def check(self, rule, state):
+                finding = super().check(rule, state)
+                if state.get("stability.waiver"):
+                    finding.status = "review_required"
+                return finding
+
+        class DeclaredWaiverChecker(WaiverChecker):
+            def input_paths(self, rule):
+                return rule.input_paths() + ["stability.waiver"]
+
+        for checker_cls in (WaiverChecker, DeclaredWaiverChecker):
+            engine = ComplianceEngine()
+            engine.register_checker(RuleCategory.STABILITY, checker_cls())
+            state = MockStateManager(dict(self.BASE))
+            first = self._evaluate(engine, state)
+            stability = [i for i, f in enumerate(first.findings) if f.rule_id in {
+                r.rule_id for r in RULE_LIBRARY.get_by_category(RuleCategory.STABILITY)
+            }]
+            assert stability and all(first.findings[i].status != "review_required" for i in stability)
+
+            state.set("stability.waiver", True)
+            report = self._evaluate(engine, state)
+            assert all(report.findings[i].status == "review_required" for i in stability)
+
+            state.set("stability.waiver", False)
+            refreshed = engine.refresh(["stability.waiver"])
+            assert all(refreshed.findings[i].status != "review_required" for i in stability)
+
+    def test_context_change_runs_full_evaluation(self):
+        """Test a different framework list or incremental=False checks every rule."""
+        engine = ComplianceEngine()
+        state = MockStateManager(dict(self.BASE))
+        self._evaluate(engine, state)
+
+        assert self._evaluate(engine, state, incremental=False).rules_checked > 0
+        report = engine.evaluate(state, [RegulatoryFramework.ABS_HSNC], "patrol", 35.0)
+        assert report.rules_checked == report.total_rules
+
+    def test_updates_stream_with_cascade(self):
+        """Test invalidation marks rules stale and the cascade re-checks them."""
+        from magnet.dependencies.cascade import CalculatorRegistry, CascadeExecutor
+        from magnet.dependencies.graph import DependencyGraph
+        from magnet.dependencies.invalidation import InvalidationEngine
+
+        graph = DependencyGraph()
+        graph.add_dependency("stability.gm_m", "hull.beam")
+        invalidation = InvalidationEngine(graph)
+        registry = CalculatorRegistry()
+        registry.register("stability.gm_m", lambda sm, param: 0.05)
+        state = MockStateManager(dict(self.BASE))
+        cascade = CascadeExecutor(graph, invalidation, state, calculator_registry=registry)
+
+        engine = ComplianceEngine()
+        engine.attach(invalidation, cascade)
+        updates = []
+        engine.on_update(lambda report, changed: updates.append((report, changed)))
+        self._evaluate(engine, state)
+        updates.clear()
+
+        # The changed beam is re-checked at once; GM waits for the cascade
+        state.write("hull", "beam", 9.0)
+        invalidation.invalidate_parameter("hull.beam")
+        assert engine.stale_rules() == ["ABS-HSNC-3-2-1", "HSC-2000-2-7-1"]
+        assert [[f.rule_id for f in changed] for _, changed in updates] == [["ABS-HSNC-3-2-1"]]
+        assert updates[0][1][0].required_value == pytest.approx(0.36)
+
+        cascade.execute({"stability.gm_m"})
+        assert engine.stale_rules() == []
+        report, changed = updates[-1]
+        assert {f.rule_id for f in changed} == {"ABS-HSNC-3-2-1", "HSC-2000-2-7-1"}
+        assert report is engine.last_report
+        assert report.overall_status == ComplianceStatus.NON_COMPLIANT
+
+
+class TestFormulaRules:
+    """Test formula-based limits without dedicated checker code."""
+
+    def test_criterion_rule_in_structural_category(self):
+        """Test the collision bulkhead criterion is checked, not sent to review."""
+        rule = RULE_LIBRARY.get("USCG-46CFR-179-210")
+        checker = StructuralRuleChecker()
+
+        inside = MockStateManager({"arrangement.collision_bulkhead_m": 3.0, "hull.lwl": 30.0})
+        outside = MockStateManager({"arrangement.collision_bulkhead_m": 6.0, "hull.lwl": 30.0})
+
+        assert checker.check(rule, inside).status == "pass"
+        finding = checker.check(rule, outside)
+        assert finding.status == "fail"
+        assert finding.severity == FindingSeverity.NON_CONFORMANCE
+
+    def test_category_without_checker_uses_formula_checker(self):
+        """Test a formula rule in an unchecked category is evaluated by the engine."""
+        library = RuleLibrary()
+        library.register(RuleRequirement(
+            rule_id="T-FIRE-1", name="Escape width", description="",
+            category=RuleCategory.FIRE_SAFETY, framework=RegulatoryFramework.SOLAS,
+            required_inputs=["arrangement.escape_width_m"],
+            formula="max(0.7, 0.01 * passengers)",
+        ))
+        engine = ComplianceEngine(library)
+        state = MockStateManager({"arrangement.escape_width_m": 0.9, "mission.passengers": 120})
+
+        report = engine.evaluate(state, [RegulatoryFramework.SOLAS], "ferry", 40.0)
+
+        assert [f.status for f in report.findings] == ["fail"]
+        assert report.findings[0].required_value == pytest.approx(1.2)
+        assert isinstance(engine._checker_for(library.get("T-FIRE-1")), FormulaRuleChecker)
+
+    def test_screen_matches_evaluate(self):
+        """Test batch screening agrees with per-design evaluation."""
+        import numpy as np
+
+        rng = np.random.default_rng(7)
+        n = 40
+        columns = {
+            "hull.lwl": rng.uniform(20, 45, n),
+            "hull.beam": rng.uniform(5, 10, n),
+            "hull.freeboard": rng.uniform(0.2, 0.6, n),
+            "stability.gm_m": rng.uniform(0.0, 0.6, n),
+            "stability.range_deg": rng.uniform(10, 40, n),
+            "stability.damage_all_pass": rng.integers(0, 2, n).astype(bool),
+            "arrangement.collision_bulkhead_m": rng.uniform(1, 6, n),
+        }
+        frameworks = [
+            RegulatoryFramework.ABS_HSNC,
+            RegulatoryFramework.HSC_CODE_2000,
+            RegulatoryFramework.USCG_SUBCHAPTER_T,
+        ]
+        engine = ComplianceEngine()
+        masks = engine.screen(columns, frameworks, "patrol", 35.0)
+
+        assert {"ABS-HSNC-3-2-1", "ABS-HSNC-3-1-1", "HSC-2000-2-8-1", "USCG-46CFR-179-210"} <= set(masks)
+        for i in range(n):
+            state = MockStateManager({path: values[i].item() for path, values in columns.items()})
+            report = engine.evaluate(state, frameworks, "patrol", 35.0, incremental=False)
+            for finding in report.findings:
+                if finding.rule_id in masks:
+                    assert masks[finding.rule_id][i] == (finding.status == "pass"), finding.rule_id
+
+    def test_check_many_nan_inputs_fail(self):
+        """Test designs with a NaN (missing) input fail in batch checks."""
+        import numpy as np
+
+        nan = float("nan")
+        checker = StabilityRuleChecker()
+
+        criterion = RULE_LIBRARY.get("HSC-2000-2-8-1")
+        passes = checker.check_many(criterion, {"stability.damage_all_pass": np.array([nan, 0.0, 1.0])})
+        assert passes.tolist() == [False, False, True]
+
+        gm = RULE_LIBRARY.get("ABS-HSNC-3-2-1")
+        passes = checker.check_many(gm, {
+            "stability.gm_m": np.array([1.0, 1.0, nan]),
+            "hull.beam": np.array([nan, 8.0, 8.0]),
+        })
+        assert passes.tolist() == [False, True, False]
+
+    def test_screen_skips_malformed_formula(self):
+        """Test a rule whose formula does not compile is left out of screening, not raised."""
+        import numpy as np
+
+        library = RuleLibrary()
+        library.register(RuleRequirement(
+            rule_id="T-BAD-1", name="Bad formula", description="",
+            category=RuleCategory.FIRE_SAFETY, framework=RegulatoryFramework.SOLAS,
+            required_inputs=["arrangement.escape_width_m"],
+            formula="foo(1)",
+        ))
+        library.register(RuleRequirement(
+            rule_id="T-FIRE-1", name="Escape width", description="",
+            category=RuleCategory.FIRE_SAFETY, framework=RegulatoryFramework.SOLAS,
+            required_inputs=["arrangement.escape_width_m"],
+            limit_value=0.7,
+        ))
+        engine = ComplianceEngine(library)
+        state = MockStateManager({"arrangement.escape_width_m": 0.9})
+
+        report = engine.evaluate(state, [RegulatoryFramework.SOLAS], "ferry", 40.0)
+        statuses = {f.rule_id: f.status for f in report.findings}
+        assert statuses["T-BAD-1"] == "error"
+
+        masks = engine.screen(
+            {"arrangement.escape_width_m": np.array([0.5, 0.9])},
+            [RegulatoryFramework.SOLAS], "ferry", 40.0,
+        )
+        assert set(masks) == {"T-FIRE-1"}
+        assert masks["T-FIRE-1"].tolist() == [False, True]
+
+
 class TestComplianceReport:
     """Test ComplianceReport class."""
 
@@ -0,0 +1,203 @@
+"""
+Unit tests for dependencies/cascade.py
+
+Tests the CascadeExecutor streaming scheduler and timing breakdown.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from magnet.dependencies.cascade import (
+    CalculatorRegistry,
+    CascadeExecutor,
+    CascadeResult,
+    RecalculationResult,
+)
+from magnet.dependencies.graph import DependencyGraph
+
+
+class FakeState:
+    """Minimal thread-safe state store for cascade tests."""
+
+    def __init__(self):
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def get(self, path, default=None):
+        with self._lock:
+            return self.values.get(path, default)
+
+    def set(self, path, value, source=None):
+        with self._lock:
+            self.values[path] = value
+
+
+def make_executor(graph, registry, max_workers=4):
+    return CascadeExecutor(
+        dependency_graph=graph,
+        invalidation_engine=MagicMock(),
+        state_manager=FakeState(),
+        calculator_registry=registry,
+        max_workers=max_workers,
+    )
+
+
+class TestStreamingScheduler:
+    """Test the dependency-counting parallel scheduler."""
+
+    def test_dependencies_complete_before_dependents(self):
+        """Test dependents never start before their inputs finish."""
+        graph = DependencyGraph()
+        graph.add_dependency("b", "a")
+        graph.add_dependency("c", "b")
+        graph.add_dependency("d", "a")
+
+        finished = []
+        lock = threading.Lock()
+        registry = CalculatorRegistry()
+
+        def calc(sm, param):
+            for dep in graph.get_direct_dependencies(param):
+                assert dep in finished
+            with lock:
+                finished.append(param)
+            return 1.0
+
+        for p in ("a", "b", "c", "d"):
+            registry.register(p, calc)
+
+        result = make_executor(graph, registry).execute({"a", "b", "c", "d"})
+
+        assert result.success
+        assert result.success_count == 4
+        assert finished[0] == "a"
+        assert finished.index("b") < finished.index("c")
+
+    def test_slow_branch_does_not_block_unrelated_dependent(self):
+        """Test a dependent starts as soon as its own input finishes."""
+        graph = DependencyGraph()
+        graph.add_parameter("slow")
+        graph.add_dependency("fast_child", "fast")
+
+        slow_release = threading.Event()
+        child_started = threading.Event()
+        registry = CalculatorRegistry()
+
+        def slow(sm, param):
+            # Only finishes once fast_child has started (or times out)
+            slow_release.wait(timeout=5.0)
+            return 1.0
+
+        def fast_child(sm, param):
+            child_started.set()
+            slow_release.set()
+            return 2.0
+
+        registry.register("slow", slow)
+        registry.register("fast", lambda sm, p: 0.5)
+        registry.register("fast_child", fast_child)
+
+        start = time.perf_counter()
+        result = make_executor(graph, registry).execute({"slow", "fast", "fast_child"})
+        elapsed = time.perf_counter() - start
+
+        assert result.success_count == 3
+        assert child_started.is_set()
+        assert elapsed < 4.0
+
+    def test_longest_critical_path_dispatched_first(self):
+        """Test ready parameters are ordered by critical path length."""
+        graph = DependencyGraph()
+        graph.add_parameter("short")
+        graph.add_dependency("long_child", "long")
+
+        order = []
+        registry = CalculatorRegistry()
+
+        def record(sm, param):
+            order.append(param)
+            return 1.0
+
+        registry.register("short", record, estimated_time_ms=500)
+        registry.register("long", record, estimated_time_ms=100)
+        registry.register("long_child", record, estimated_time_ms=1000)
+
+        # Single worker slot: dispatch order equals priority order
+        executor = make_executor(graph, registry, max_workers=1)
+        executor._execute_parallel(
+            ["long", "short", "long_child"],
+            CascadeResult(cascade_id="t", started_at=MagicMock()),
+            stop_on_error=False,
+        )
+
+        assert order == ["long", "long_child", "short"]
+
+    def test_stop_on_error_stops_dispatch(self):
+        """Test no new work is dispatched after a failure."""
+        graph = DependencyGraph()
+        graph.add_dependency("b", "a")
+
+        registry = CalculatorRegistry()
+
+        def fail(sm, param):
+            raise ValueError("boom")
+
+        called = []
+        registry.register("a", fail)
+        registry.register("b", lambda sm, p: called.append(p))
+
+        result = make_executor(graph, registry).execute(
+            {"a", "b"}, stop_on_error=True
+        )
+
+        assert result.failed_count == 1
+        assert called == []
+
+
+class TestTimingBreakdown:
+    """Test per-parameter queue-wait vs. run time reporting."""
+
+    def test_timings_recorded(self):
+        """Test run time and queue wait populated for every parameter."""
+        graph = DependencyGraph()
+        graph.add_dependency("b", "a")
+
+        registry = CalculatorRegistry()
+
+        def sleepy(sm, param):
+            time.sleep(0.01)
+            return 1.0
+
+        registry.register("a", sleepy)
+        registry.register("b", sleepy)
+
+        result = make_executor(graph, registry).execute({"a", "b"})
+        timings = result.get_timing_breakdown()
+
+        assert set(timings) == {"a", "b"}
+        for entry in timings.values():
+            assert entry["run_time_ms"] >= 5.0
+            assert entry["queue_wait_ms"] >= 0.0
+
+        summary = result.get_summary()
+        assert summary["total_run_time_ms"] >= 10.0
+        assert "timings" in result.to_dict()
+
+    def test_sequential_records_timings(self):
+        """Test sequential execution also reports run time."""
+        graph = DependencyGraph()
+        graph.add_parameter("a")
+        registry = CalculatorRegistry()
+        registry.register("a", lambda sm, p: 1.0)
+
+        result = make_executor(graph, registry).execute({"a"}, parallel=False)
+
+        assert result.results["a"].run_time_ms >= 0.0
+        assert result.results["a"].to_dict()["queue_wait_ms"] >= 0.0
+
+    def test_result_defaults(self):
+        """Test timing fields default to zero."""
+        r = RecalculationResult(parameter="x", success=True, started_at=MagicMock())
+        assert r.queue_wait_ms == 0.0
+        assert r.run_time_ms == 0.0
@@ -431,3 +431,97 @@ class TestDefaultGraph:
         graph1 = get_default_graph()
         graph2 = get_default_graph()
         assert graph1 is graph2
+
+
+class TestClosureIndex:
+    """Test the precomputed transitive-closure index."""
+
+    def _random_graph(self, n=200, edges=600, seed=7):
+        import random
+        rng = random.Random(seed)
+        graph = DependencyGraph()
+        for i in range(n):
+            graph.add_parameter(f"p{i}", phase=f"phase{i % 5}")
+        for _ in range(edges):
+            a, b = sorted(rng.sample(range(n), 2))
+            graph.add_dependency(f"p{b}", f"p{a}")
+        graph._build_closure(graph._compute_order())
+        return graph
+
+    def test_index_built_with_graph(self):
+        """Test closure index exists after build_from_definitions."""
+        graph = DependencyGraph()
+        graph.build_from_definitions()
+        assert graph._closure is not None
+        assert len(graph._closure) == len(graph._nodes)
+
+    def test_matches_dfs_on_default_graph(self):
+        """Test index answers match graph traversal."""
+        graph = DependencyGraph()
+        graph.build_from_definitions()
+        for param in graph._nodes:
+            assert graph.get_all_downstream(param) == graph._dfs_downstream(param)
+            assert graph.get_all_dependencies(param) == graph._dfs_dependencies(param)
+
+    def test_matches_dfs_on_random_graph(self):
+        """Test index answers match traversal on a synthetic DAG."""
+        graph = self._random_graph()
+        for param in graph._nodes:
+            assert graph.get_all_downstream(param) == graph._dfs_downstream(param)
+            assert graph.get_all_dependencies(param) == graph._dfs_dependencies(param)
+
+    def test_incremental_add_dependency(self):
+        """Test edges added after build update the closure."""
+        graph = DependencyGraph()
+        graph.build_from_definitions()
+        graph.add_dependency("custom.derived", "stability.gz_max_m")
+
+        assert "custom.derived" in graph.get_all_downstream("hull.loa")
+        assert "hull.loa" in graph.get_all_dependencies("custom.derived")
+        assert graph.get_all_downstream("hull.loa") == graph._dfs_downstream("hull.loa")
+
+    def test_incremental_matches_full_rebuild(self):
+        """Test folding edges one by one equals a full build."""
+        graph = self._random_graph(n=80, edges=200, seed=3)
+        incremental = DependencyGraph()
+        incremental._build_closure([])
+        for param, node in graph._nodes.items():
+            incremental.add_parameter(param, node.phase)
+        for (source, target) in graph._edges:
+            incremental.add_dependency(target, source)
+
+        for param in graph._nodes:
+            assert incremental.get_all_downstream(param) == graph.get_all_downstream(param)
+
+    def test_recalculation_order_is_topological(self):
+        """Test recalculation list respects dependencies."""
+        graph = self._random_graph()
+        order = graph.get_recalculation_order({"p0", "p1", "p2"})
+        position = {p: i for i, p in enumerate(order)}
+
+        expected = set()
+        for p in ("p0", "p1", "p2"):
+            expected |= graph._dfs_downstream(p)
+        assert set(order) == expected
+        for p in order:
+            for dep in graph.get_direct_dependencies(p):
+                if dep in position:
+                    assert position[dep] < position[p]
+
+    def test_recalculation_order_after_incremental_edge(self):
+        """Test order is refreshed when edges are added after build."""
+        graph = DependencyGraph()
+        graph.build_from_definitions()
+        graph.add_dependency("zz.first", "hull.loa")
+        graph.add_dependency("zz.second", "zz.first")
+
+        order = graph.get_recalculation_order({"hull.loa"})
+        assert order.index("zz.first") < order.index("zz.second")
+
+    def test_downstream_phases_from_index(self):
+        """Test phases derived from closure bitsets."""
+        graph = DependencyGraph()
+        graph.build_from_definitions()
+        phases = graph.get_downstream_phases("hull.loa")
+        assert "stability" in phases
+        assert "hull_form" in phases
@@ -232,6 +232,92 @@ class TestTriggerLog:
         entries = log.get_for_phase("hull_form")
         assert len(entries) == 1
 
+    def test_capacity_eviction_keeps_indexes(self):
+        """Test evicting the oldest entries also drops them from indexes."""
+        log = TriggerLog(max_entries=3)
+        for i in range(5):
+            log.log_value_set(f"p{i % 2}", i, i + 1, transaction_id="tx")
+
+        assert len(log) == 3
+        assert [e.new_value for e in log.get_recent()] == [5, 4, 3]
+        assert [e.new_value for e in log.get_for_parameter("p0")] == [5, 3]
+        assert [e.new_value for e in log.get_for_parameter("p1")] == [4]
+        assert len(log.get_transaction("tx")) == 3
+
+    def test_retention_cleanup(self):
+        """Test entries past retention are removed from entries and indexes."""
+        from datetime import timedelta
+        from magnet.dependencies.trigger_log import TriggerEntry
+
+        log = TriggerLog(retention_days=1)
+        old = datetime.utcnow() - timedelta(days=2)
+        log.log(TriggerEntry(trigger_type=TriggerType.VALUE_SET,
+                             parameter_path="hull.loa", timestamp=old))
+        log.log_value_set("hull.loa", 20.0, 25.0)
+
+        log._cleanup_old_entries()
+
+        assert len(log) == 1
+        assert len(log.get_for_parameter("hull.loa")) == 1
+
+    def test_spill_to_segments(self, tmp_path):
+        """Test evicted entries spill to disk and stay queryable."""
+        log = TriggerLog(max_entries=10, spill_dir=tmp_path, segment_max_entries=8)
+        for i in range(40):
+            log.log_value_set("hull.loa", i, i + 1)
+
+        assert len(log) == 10
+        assert log.spilled_count == 30
+        assert len(list(tmp_path.glob("triggers-*.jsonl"))) == 4
+
+        entries = log.query(parameter="hull.loa", limit=100)
+        assert [e.new_value for e in entries] == list(range(40, 0, -1))
+
+        future = datetime.utcnow().replace(year=datetime.utcnow().year + 1)
+        assert log.query(since=future) == []
+        log.close()
+
+        reopened = TriggerLog(spill_dir=tmp_path)
+        assert len(reopened.query(limit=100)) == 30
+
+    def test_adopted_segments_expire(self, tmp_path):
+        """Test segments left by an earlier log get a time range and are removed by retention."""
+        from datetime import timedelta
+        from magnet.dependencies.trigger_log import TriggerEntry
+
+        old = datetime.utcnow() - timedelta(days=3)
+        log = TriggerLog(max_entries=2, spill_dir=tmp_path, segment_max_entries=4)
+        for i in range(6):
+            log.log(TriggerEntry(trigger_type=TriggerType.VALUE_SET, parameter_path="hull.loa",
+                                 new_value=i, timestamp=old + timedelta(minutes=i)))
+        for i in range(6, 10):
+            log.log_value_set("hull.loa", i, i + 1)
+        log.close()
+
+        reopened = TriggerLog(retention_days=1, spill_dir=tmp_path)
+        first, second = reopened.segments
+        assert (first.min_timestamp, first.max_timestamp) == (old, old + timedelta(minutes=3))
+        assert second.max_timestamp > datetime.utcnow() - timedelta(minutes=1)
+
+        reopened._cleanup_old_entries()
+
+        assert reopened.segments == [second]
+        assert not first.path.exists()
+        assert [e.new_value for e in reopened.query(limit=100)] == [8, 7, 5, 4]
+
+    def test_lines_reversed_across_blocks(self, tmp_path):
+        """Test backwards line reading with lines (and UTF-8 characters) split across blocks."""
+        from magnet.dependencies.trigger_log import _lines_reversed
+
+        lines = [f"line {i} \u00b0\u00e9 " * (i % 7) for i in range(50)]
+        path = tmp_path / "lines.jsonl"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        with open(path, "rb") as f:
+            result = [line.decode("utf-8") for line in _lines_reversed(f, block_size=5)]
+
+        assert result == [line for line in reversed(lines) if line]
+
 
 class TestCascadeExecutor:
     """Test CascadeExecutor class."""
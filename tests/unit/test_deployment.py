@@ -147,6 +147,121 @@ class TestJobQueue:
         assert queue.get_pending_count() == 0
 
 
+class TestPriorityJobQueue:
+    """Test heap ordering, wakeup, design limits and the durable store."""
+
+    def test_waiting_consumer_gets_critical_job(self):
+        import time
+        from magnet.deployment.worker import JobQueue, Job, JobPriority
+
+        async def main():
+            queue = JobQueue()
+            waiter = asyncio.ensure_future(queue.dequeue(timeout=5.0))
+            await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            await queue.enqueue(Job(job_type="urgent", priority=JobPriority.CRITICAL))
+            job = await waiter
+            return job, time.perf_counter() - start
+
+        job, latency = asyncio.run(main())
+        assert job.job_type == "urgent"
+        assert latency < 0.05
+
+    def test_strict_priority_then_fifo(self):
+        from magnet.deployment.worker import JobQueue, Job, JobPriority
+
+        async def main():
+            queue = JobQueue(aging_seconds=None)
+            for name, priority in (
+                ("low", JobPriority.LOW), ("normal-1", JobPriority.NORMAL),
+                ("critical", JobPriority.CRITICAL), ("normal-2", JobPriority.NORMAL),
+            ):
+                await queue.enqueue(Job(job_type=name, priority=priority))
+            return [(await queue.dequeue()).job_type for _ in range(4)]
+
+        assert asyncio.run(main()) == ["critical", "normal-1", "normal-2", "low"]
+
+    def test_aging_prevents_starvation(self):
+        from magnet.deployment.worker import JobQueue, Job, JobPriority
+
+        async def main():
+            queue = JobQueue(aging_seconds=0.01)
+            await queue.enqueue(Job(job_type="old-low", priority=JobPriority.LOW))
+            await asyncio.sleep(0.05)  # worth more than 3 priority levels
+            await queue.enqueue(Job(job_type="new-critical", priority=JobPriority.CRITICAL))
+            return (await queue.dequeue()).job_type
+
+        assert asyncio.run(main()) == "old-low"
+
+    def test_per_design_limit(self):
+        from magnet.deployment.worker import JobQueue, Job
+
+        async def main():
+            queue = JobQueue(max_per_design=1)
+            first = Job(job_type="a1", design_id="A")
+            await queue.enqueue(first)
+            await queue.enqueue(Job(job_type="a2", design_id="A"))
+            await queue.enqueue(Job(job_type="b1", design_id="B"))
+
+            got = [(await queue.dequeue()).job_type, (await queue.dequeue()).job_type]
+            assert await queue.dequeue() is None  # a2 waits for a1
+            assert queue.get_pending_count() == 1
+
+            waiter = asyncio.ensure_future(queue.dequeue(timeout=5.0))
+            await asyncio.sleep(0.01)
+            await queue.task_done(first)
+            got.append((await waiter).job_type)
+            return got
+
+        assert asyncio.run(main()) == ["a1", "b1", "a2"]
+
+    def test_finished_jobs_are_bounded(self):
+        from magnet.deployment.worker import JobQueue, Job, JobStatus
+
+        queue = JobQueue(max_finished=2)
+        jobs = [Job(job_type=f"j{i}", status=JobStatus.COMPLETED) for i in range(3)]
+        for job in jobs:
+            queue.update_job(job)
+
+        assert queue.get_job(jobs[0].job_id) is None
+        assert queue.get_job(jobs[2].job_id) is not None
+
+    def test_store_survives_restart(self, tmp_path):
+        from magnet.deployment.worker import (
+            JobQueue, SQLiteJobStore, Job, JobPriority, JobStatus,
+        )
+        path = tmp_path / "jobs.db"
+
+        async def first_run():
+            queue = JobQueue(store=SQLiteJobStore(path))
+            done = Job(job_type="done")
+            await queue.enqueue(done)
+            await queue.enqueue(Job(job_type="running", payload={"phase": "hull"}))
+            await queue.enqueue(Job(job_type="queued", priority=JobPriority.HIGH))
+
+            job = await queue.dequeue()
+            assert job.job_type == "queued"
+            job.status = JobStatus.COMPLETED
+            queue.update_job(job)
+
+            job = await queue.dequeue()
+            job.status = JobStatus.RUNNING
+            queue.update_job(job)
+            # Process dies here with "done" queued and "running" in flight
+
+        async def second_run():
+            queue = JobQueue(store=SQLiteJobStore(path))
+            return [await queue.dequeue(), await queue.dequeue(), await queue.dequeue()]
+
+        asyncio.run(first_run())
+        restored = asyncio.run(second_run())
+
+        assert [j.job_type for j in restored[:2]] == ["done", "running"]
+        assert restored[1].status == JobStatus.PENDING
+        assert restored[1].payload == {"phase": "hull"}
+        assert restored[2] is None
+
+
 class TestWorker:
     """Test background worker."""
 
@@ -308,6 +423,156 @@ class TestWebSocketEmitters:
         emit_error("TEST-001", "Test error", "ERR-001")
 
 
+# =============================================================================
+# KERNEL EXECUTOR TESTS
+# =============================================================================
+
+class TestKernelExecutor:
+    """Test the bounded executor for CPU-bound API work."""
+
+    def test_same_key_runs_in_order(self):
+        import threading
+        import time
+        from magnet.deployment.executor_service import KernelExecutor
+
+        executor = KernelExecutor(max_workers=4)
+        order = []
+        lock = threading.Lock()
+        running = []
+
+        def write(tag, delay):
+            with lock:
+                running.append(tag)
+                assert len(running) == 1, "same-key calls overlapped"
+            time.sleep(delay)
+            with lock:
+                running.remove(tag)
+                order.append(tag)
+            return tag
+
+        async def main():
+            # Earlier calls sleep longer; ordering must still hold
+            return await asyncio.gather(*[
+                executor.run(write, i, 0.02 * (4 - i), key="D-1")
+                for i in range(4)
+            ])
+
+        try:
+            assert asyncio.run(main()) == [0, 1, 2, 3]
+            assert order == [0, 1, 2, 3]
+        finally:
+            executor.shutdown()
+
+    def test_different_keys_run_concurrently(self):
+        import threading
+        from magnet.deployment.executor_service import KernelExecutor
+
+        executor = KernelExecutor(max_workers=2)
+        barrier = threading.Barrier(2, timeout=5)
+
+        async def main():
+            # Deadlocks (then times out) unless both calls run at once
+            await asyncio.gather(
+                executor.run(barrier.wait, key="D-1"),
+                executor.run(barrier.wait, key="D-2"),
+            )
+
+        try:
+            asyncio.run(main())
+            assert executor.stats()["completed"] == 2
+        finally:
+            executor.shutdown()
+
+    def test_saturation_rejects(self):
+        import threading
+        from magnet.deployment.executor_service import KernelExecutor, ExecutorSaturated
+
+        executor = KernelExecutor(max_workers=1, max_queue=2)
+        release = threading.Event()
+
+        async def main():
+            first = asyncio.ensure_future(executor.run(release.wait, 5))
+            second = asyncio.ensure_future(executor.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            with pytest.raises(ExecutorSaturated):
+                await executor.run(release.wait, 5)
+            release.set()
+            await asyncio.gather(first, second)
+
+        try:
+            asyncio.run(main())
+            stats = executor.stats()
+            assert stats["rejected"] == 1
+            assert stats["completed"] == 2
+            assert stats["queue_depth"] == 0
+            assert stats["in_flight"] == 0
+        finally:
+            executor.shutdown()
+
+    def test_errors_propagate_and_are_counted(self):
+        from magnet.deployment.executor_service import KernelExecutor
+
+        executor = KernelExecutor()
+
+        def fail():
+            raise ValueError("boom")
+
+        async def main():
+            with pytest.raises(ValueError):
+                await executor.run(fail, key="D-1", operation="run_phase")
+            # The key is released after a failure
+            return await executor.run(lambda: "ok", key="D-1", operation="run_phase")
+
+        try:
+            assert asyncio.run(main()) == "ok"
+            stats = executor.stats()
+            assert stats["failed"] == 1
+            assert stats["completed"] == 1
+            assert stats["keys_active"] == 0
+            assert stats["latency"]["run_phase"]["run"]["count"] == 2
+        finally:
+            executor.shutdown()
+
+    def test_event_loop_stays_responsive(self):
+        import time
+        from magnet.deployment.executor_service import KernelExecutor
+
+        executor = KernelExecutor(max_workers=1)
+
+        def busy(seconds):
+            end = time.perf_counter() + seconds
+            n = 0
+            while time.perf_counter() < end:
+                n += 1
+            return n
+
+        async def main():
+            work = asyncio.ensure_future(executor.run(busy, 0.5, key="D-1"))
+            await asyncio.sleep(0.01)
+            start = time.perf_counter()
+            await asyncio.sleep(0)  # stands in for an unrelated health check
+            latency = time.perf_counter() - start
+            await work
+            return latency
+
+        try:
+            assert asyncio.run(main()) < 0.25
+        finally:
+            executor.shutdown()
+
+    def test_latency_histogram(self):
+        from magnet.deployment.executor_service import LatencyHistogram
+
+        hist = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.5, 0.5, 5.0):
+            hist.observe(seconds)
+
+        data = hist.to_dict()
+        assert data["count"] == 4
+        assert data["buckets"] == {"0.1": 1, "1": 3, "+Inf": 4}
+        assert data["max_s"] == 5.0
+
+
 # =============================================================================
 # API TESTS
 # =============================================================================
@@ -0,0 +1,119 @@
+"""
+Unit tests for HistoryStore.
+
+Tests capped columnar mutation history and its dict-compatible access.
+"""
+
+from datetime import datetime
+
+from magnet.core.history_store import HistoryStore
+from magnet.core.design_state import DesignState
+from magnet.core.state_manager import StateManager
+
+
+class TestHistoryStore:
+    """Test HistoryStore recording and access."""
+
+    def test_roundtrip_dict_records(self):
+        """Records appended as dicts materialize back unchanged."""
+        records = [
+            {"timestamp": "2025-01-02T03:04:05.000006", "source": "user", "action": "set",
+             "path": "hull.loa", "old_value": None, "new_value": 25.0},
+            {"timestamp": "2025-01-02T03:04:06", "action": "transaction_commit",
+             "txn_id": "t1", "design_version": 1},
+            {"timestamp": "not a time", "source": None, "action": "patch",
+             "paths_modified": ["hull.beam"]},
+        ]
+        history = HistoryStore(records)
+
+        assert history.to_list() == records
+        assert history == records
+        assert history[-1] == records[-1]
+        assert history[0:2] == records[0:2]
+
+    def test_record_matches_dict_form(self):
+        """record() produces the same record as the dict form."""
+        when = datetime(2025, 5, 6, 7, 8, 9, 123456)
+        history = HistoryStore()
+        history.record("set", source="s", path="hull.beam", old_value=1.0,
+                       new_value=2.0, timestamp=when)
+
+        assert history[0] == {
+            "timestamp": when.isoformat(), "source": "s", "action": "set",
+            "path": "hull.beam", "old_value": 1.0, "new_value": 2.0,
+        }
+
+    def test_cap_keeps_newest(self):
+        """Only the newest max_entries records are kept."""
+        history = HistoryStore(max_entries=100)
+        for i in range(5000):
+            history.record("set", path="hull.loa", new_value=i)
+
+        assert len(history) == 100
+        assert history.dropped == 4900
+        assert [r["new_value"] for r in history.page(0, 3)] == [4999, 4998, 4997]
+        assert history[0]["new_value"] == 4900
+        assert [r["new_value"] for r in history.page(0, 2, newest_first=False)] == [4900, 4901]
+
+    def test_truncate_to_mark(self):
+        """truncate() drops records added after the mark, including past the cap."""
+        history = HistoryStore(max_entries=5)
+        for i in range(3):
+            history.record("set", path="hull.loa", new_value=i)
+        mark = history.recorded
+        for i in range(3, 10):
+            history.record("set", path="hull.loa", new_value=i)
+
+        history.truncate(mark)
+        assert len(history) == 0
+        assert history.dropped == 5
+
+        history.record("set", path="hull.loa", new_value=10)
+        mark = history.recorded
+        history.record("set", path="hull.loa", new_value=11)
+        history.truncate(mark)
+        assert [r["new_value"] for r in history] == [10]
+
+    def test_design_state_history(self):
+        """DesignState keeps a HistoryStore and serializes it as a list."""
+        state = DesignState()
+        state.history.append({"timestamp": "2025-01-01T00:00:00", "action": "note"})
+
+        data = state.to_dict()
+        assert data["history"] == [{"timestamp": "2025-01-01T00:00:00", "action": "note"}]
+        assert "history" not in state.to_dict(include_history=False)
+        assert isinstance(DesignState.from_dict(data).history, HistoryStore)
+
+    def test_loaded_history_uses_manager_limit(self):
+        """A loaded history is capped by the StateManager's limit, not the store default."""
+        entries = [
+            {"timestamp": "2025-01-01T00:00:00", "action": "note", "new_value": i}
+            for i in range(HistoryStore.DEFAULT_MAX_ENTRIES + 500)
+        ]
+        data = DesignState(history=entries).to_dict()
+
+        unbounded = StateManager(history_limit=None)
+        unbounded.from_dict(data)
+        assert len(unbounded.state.history) == len(entries)
+        assert StateManager(DesignState.from_dict(data), history_limit=None).state.history[0]["new_value"] == 0
+
+        capped = StateManager(history_limit=100)
+        capped.from_dict(data)
+        assert len(capped.state.history) == 100
+        assert capped.state.history[0]["new_value"] == len(entries) - 100
+
+    def test_state_manager_history(self):
+        """StateManager caps history and keeps it out of snapshots."""
+        manager = StateManager(history_limit=10)
+        for i in range(20):
+            manager.set("kernel.status", f"s{i}", source="test")
+
+        assert len(manager.state.history) == 10
+        assert manager.get_history(limit=1)[0]["new_value"] == "s19"
+
+        txn_id = manager.begin_transaction()
+        assert "history" not in manager._snapshots.materialize(
+            manager._transactions[txn_id]["snapshot"]
+        )
+        manager.rollback()
+        assert manager.get_history(limit=1)[0]["action"] == "transaction_rollback"
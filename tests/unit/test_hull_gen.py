@@ -33,6 +33,7 @@ from magnet.hull_gen.generator import (
     GeneratorConfig,
     generate_hull_from_parameters,
 )
+from magnet.hull_gen.nurbs import NURBSCurve, NURBSSurface, basis_matrices
 
 
 class TestEnums:
@@ -464,3 +465,96 @@ class TestHullGeometry:
         assert data["hull_id"] == "TEST"
         assert data["volume"] == 100.0
 
+
+
+class TestNURBSArrayEngine:
+    """Tests for vectorized NURBS evaluation."""
+
+    def _wavy_surface(self, weighted=False):
+        control_points = [
+            [Point3D(i * 2.0, j * 1.0, math.sin(i * 0.5) + 0.3 * j * j) for j in range(5)]
+            for i in range(7)
+        ]
+        weights = [[1.0 + 0.1 * ((i + j) % 3) for j in range(5)] for i in range(7)] if weighted else []
+        surface = NURBSSurface(control_points=control_points, weights=weights)
+        surface.generate_uniform_knots()
+        return surface
+
+    def _paraboloid(self):
+        """Quadratic Bezier patch representing z = x^2 + y^2 on [0, 1]^2."""
+        z = [0.0, 0.0, 1.0]
+        control_points = [
+            [Point3D(i * 0.5, j * 0.5, z[i] + z[j]) for j in range(3)]
+            for i in range(3)
+        ]
+        surface = NURBSSurface(degree_u=2, degree_v=2, control_points=control_points)
+        surface.generate_uniform_knots()
+        return surface
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_sample_grid_matches_pointwise(self, weighted):
+        """Array sampling agrees with de Boor evaluate()."""
+        surface = self._wavy_surface(weighted)
+        grid = surface.sample_grid_array(9, 6)
+        assert grid.shape == (9, 6, 3)
+        for a in range(9):
+            for b in range(6):
+                expected = surface.evaluate(a / 8, b / 5).to_tuple()
+                assert grid[a, b] == pytest.approx(expected, abs=1e-12)
+
+    def test_sample_grid_returns_points(self):
+        surface = self._wavy_surface()
+        grid = surface.sample_grid(4, 3)
+        assert len(grid) == 4 and len(grid[0]) == 3
+        assert isinstance(grid[0][0], Point3D)
+
+    def test_normal_is_analytic(self):
+        """Normal of z = x^2 + y^2 is (-2x, -2y, 1) normalized."""
+        surface = self._paraboloid()
+        n = surface.normal(0.5, 0.25)  # x = 0.5, y = 0.25
+        expected = Point3D(-1.0, -0.5, 1.0).normalize()
+        assert n.to_tuple() == pytest.approx(expected.to_tuple(), abs=1e-9)
+
+    def test_gaussian_curvature_grid(self):
+        """K = 4 / (1 + 4x^2 + 4y^2)^2 for z = x^2 + y^2."""
+        surface = self._paraboloid()
+        us, vs = [0.0, 0.3, 0.8], [0.1, 0.5]
+        k = surface.gaussian_curvature_grid(us, vs)
+        for a, x in enumerate(us):
+            for b, y in enumerate(vs):
+                assert k[a, b] == pytest.approx(4.0 / (1 + 4 * x * x + 4 * y * y) ** 2, rel=1e-9)
+        assert surface.gaussian_curvature(0.3, 0.5) == pytest.approx(k[1, 1])
+
+    def test_curve_derivatives(self):
+        """Curve array evaluation and analytic derivatives of a parabola."""
+        curve = NURBSCurve(
+            degree=2,
+            control_points=[Point3D(0, 0, 0), Point3D(0.5, 0, 0), Point3D(1, 0, 1)],
+        )
+        ders = curve.derivatives_array([0.0, 0.5, 0.9], order=2)
+        assert ders.shape == (3, 3, 3)
+        # x = u, z = u^2
+        assert ders[0, 1] == pytest.approx([0.5, 0.0, 0.25])
+        assert ders[1, 2] == pytest.approx([1.0, 0.0, 1.8])
+        assert ders[2, 0] == pytest.approx([0.0, 0.0, 2.0])
+        # Curvature of z = x^2 at x = 0 is 2
+        assert curve.curvature(0.0) == pytest.approx(2.0)
+        assert curve.sample(5)[2].to_tuple() == pytest.approx(curve.evaluate(0.5).to_tuple())
+
+    def test_degenerate_curve(self):
+        """Curves with too few control points for their degree sample point-wise."""
+        curve = NURBSCurve(degree=3, control_points=[Point3D(0, 0, 0), Point3D(1, 0, 0)])
+        assert [p.to_tuple() for p in curve.sample(3)] == [
+            curve.evaluate(u).to_tuple() for u in (0.0, 0.5, 1.0)
+        ]
+        assert curve.derivative(0.5).to_tuple() == (0.0, 0.0, 0.0)
+        assert curve.curvature(0.5) == 0.0
+
+    def test_basis_matrices_cached(self):
+        """Basis matrices are reused per knot vector and sample count."""
+        surface = self._wavy_surface()
+        basis_matrices.cache_clear()
+        surface.sample_grid_array(30, 20)
+        surface.sample_grid_array(30, 20)
+        info = basis_matrices.cache_info()
+        assert info.misses == 2 and info.hits == 2
@@ -0,0 +1,33 @@
+"""
+Unit tests for IntervalTree.
+
+Tests stabbing queries against a linear scan.
+"""
+
+import math
+import random
+
+from magnet.core.interval_tree import IntervalTree
+
+
+class TestIntervalTree:
+    """Test IntervalTree point lookups."""
+
+    def test_matches_linear_scan(self):
+        """Every range containing the point is found, endpoints included."""
+        rng = random.Random(7)
+        ranges = []
+        for i in range(200):
+            lo = rng.randint(0, 60)
+            ranges.append((lo, lo + rng.randint(0, 15), i))
+        ranges.append((-math.inf, 5, "open_low"))
+        ranges.append((50, math.inf, "open_high"))
+        tree = IntervalTree(ranges)
+
+        for x in [-1, 0, 0.5, 5, 17, 42.25, 50, 75, 100]:
+            expected = sorted(str(item) for lo, hi, item in ranges if lo <= x <= hi)
+            assert sorted(str(item) for item in tree.stab(x)) == expected
+
+    def test_empty(self):
+        """An empty tree finds nothing."""
+        assert IntervalTree([]).stab(3.0) == []
@@ -102,6 +102,17 @@ class TestConductorSession:
         assert session is not None
         assert session.design_id == "design-001"
 
+    def test_reset_sessions(self):
+        """Test resetting drops every session."""
+        state = MockStateManager()
+        conductor = Conductor(state)
+        conductor.create_session("design-001")
+
+        conductor.reset_sessions()
+
+        assert conductor.get_session() is None
+        assert conductor.get_session("design-001") is None
+
 
 class TestConductorValidators:
     """Tests for validator registration."""
@@ -0,0 +1,136 @@
+"""
+tests/unit/test_optimization_dominance.py - Tests for dominance kernels.
+
+BRAVO OWNS THIS FILE.
+
+Tests for Module 13 v1.1 - non-dominated sorting, crowding distance and
+hypervolume.
+"""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from magnet.optimization import Solution
+from magnet.optimization.dominance import (
+    crowding_distance,
+    dominance_matrix,
+    hypervolume,
+    non_dominated_ranks,
+)
+
+
+def pairwise_ranks(objectives, feasible):
+    """Reference ranks by peeling fronts with Solution.dominates()."""
+    sols = [
+        Solution(variables=[], objectives=list(obj), is_feasible=bool(ok))
+        for obj, ok in zip(objectives, feasible)
+    ]
+    ranks = [None] * len(sols)
+    remaining = set(range(len(sols)))
+    rank = 0
+    while remaining:
+        front = [
+            i for i in remaining
+            if not any(sols[j].dominates(sols[i]) for j in remaining if j != i)
+        ]
+        for i in front:
+            ranks[i] = rank
+        remaining -= set(front)
+        rank += 1
+    return ranks
+
+
+class TestNonDominatedRanks:
+    """Tests for ENS non-dominated sorting."""
+
+    def test_two_objectives(self):
+        """Test fronts of a small 2-objective set."""
+        objectives = np.array([[1.0, 5.0], [2.0, 2.0], [5.0, 1.0], [3.0, 3.0], [6.0, 6.0]])
+        assert non_dominated_ranks(objectives).tolist() == [0, 0, 0, 1, 2]
+
+    def test_duplicates_share_front(self):
+        """Test identical points do not dominate each other."""
+        objectives = np.array([[1.0, 1.0, 1.0], [1.0, 1.0, 1.0], [2.0, 2.0, 2.0]])
+        assert non_dominated_ranks(objectives).tolist() == [0, 0, 1]
+
+    def test_infeasible_after_feasible_fronts(self):
+        """Test infeasible solutions share the front after the feasible ones."""
+        objectives = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [-1.0, -1.0]])
+        feasible = np.array([True, True, False, False])
+        assert non_dominated_ranks(objectives, feasible).tolist() == [0, 1, 2, 2]
+
+    def test_all_infeasible_single_front(self):
+        """Test an all-infeasible set is one front."""
+        objectives = np.array([[0.0, 0.0], [1.0, 1.0]])
+        assert non_dominated_ranks(objectives, [False, False]).tolist() == [0, 0]
+
+    @pytest.mark.parametrize("n_obj", [1, 2, 3, 4])
+    def test_matches_pairwise_sort(self, n_obj):
+        """Test ranks match pairwise dominance on tie-heavy random sets."""
+        rng = random.Random(n_obj)
+        for _ in range(50):
+            n = rng.randint(0, 30)
+            objectives = np.array(
+                [[rng.randint(0, 4) for _ in range(n_obj)] for _ in range(n)],
+                dtype=float,
+            ).reshape(n, n_obj)
+            feasible = [rng.random() < 0.8 for _ in range(n)]
+            expected = pairwise_ranks(objectives, feasible)
+            assert non_dominated_ranks(objectives, feasible).tolist() == expected
+
+    def test_dominance_matrix(self):
+        """Test dominance matrix entries."""
+        a = np.array([[1.0, 1.0], [2.0, 2.0]])
+        b = np.array([[1.0, 1.0], [2.0, 3.0]])
+        assert dominance_matrix(a, b).tolist() == [[False, True], [False, True]]
+
+
+class TestCrowdingDistance:
+    """Tests for vectorized crowding distance."""
+
+    def test_boundaries_infinite(self):
+        """Test boundary solutions get infinite distance."""
+        objectives = np.array([[0.0, 4.0], [1.0, 2.0], [2.0, 1.0], [4.0, 0.0]])
+        distance = crowding_distance(objectives)
+        assert np.isinf(distance[0]) and np.isinf(distance[3])
+        assert distance[1] == pytest.approx(2 / 4 + 3 / 4)
+        assert distance[2] == pytest.approx(3 / 4 + 2 / 4)
+
+    def test_small_fronts_all_infinite(self):
+        """Test fronts of one or two solutions are all boundary."""
+        assert np.isinf(crowding_distance(np.array([[1.0, 2.0]]))).all()
+        assert np.isinf(crowding_distance(np.array([[1.0, 2.0], [2.0, 1.0]]))).all()
+
+
+class TestHypervolume:
+    """Tests for hypervolume."""
+
+    def test_two_objectives(self):
+        """Test 2-D hypervolume against hand calculation."""
+        assert hypervolume([[0.0, 10.0], [10.0, 0.0]], [11.0, 11.0]) == pytest.approx(21.0)
+
+    def test_points_outside_reference_ignored(self):
+        """Test points not better than the reference add nothing."""
+        assert hypervolume([[5.0, 5.0]], [4.0, 10.0]) == 0.0
+        assert hypervolume([], [1.0, 1.0]) == 0.0
+
+    def test_three_objectives_cube(self):
+        """Test 3-D hypervolume of a single point."""
+        assert hypervolume([[1.0, 2.0, 3.0]], [2.0, 4.0, 6.0]) == pytest.approx(6.0)
+
+    @pytest.mark.parametrize("n_obj", [3, 4])
+    def test_matches_inclusion_exclusion(self, n_obj):
+        """Test higher-dimensional hypervolume on small random fronts."""
+        rng = np.random.default_rng(n_obj)
+        ref = np.full(n_obj, 1.1)
+        for _ in range(20):
+            points = rng.random((rng.integers(1, 7), n_obj))
+            expected = 0.0
+            for k in range(1, len(points) + 1):
+                for subset in itertools.combinations(points, k):
+                    corner = np.max(subset, axis=0)
+                    expected += (-1) ** (k + 1) * np.prod(ref - corner)
+            assert hypervolume(points, ref) == pytest.approx(expected)
@@ -18,6 +18,8 @@ from magnet.optimization import (
     ConstraintType,
     OptimizerStatus,
     SelectionMethod,
+    EvaluationMode,
+    FitnessEvaluator,
 )
 
 
@@ -218,7 +220,8 @@ class TestDesignOptimizerEvaluation:
         optimizer._evaluate_solution(solution)
         assert optimizer._evaluations == 1
 
-        optimizer._evaluate_solution(solution)
+        other = Solution(variables=[3.0, 4.0], objectives=[0.0, 0.0])
+        optimizer._evaluate_solution(other)
         assert optimizer._evaluations == 2
 
 
@@ -567,6 +570,24 @@ class TestDesignOptimizerOptimize:
         # Same seed should produce same results
         assert len(result1.pareto_front) == len(result2.pareto_front)
 
+    def test_optimize_pareto_front_from_archive(self):
+        """Test the reported front is the archive: non-dominated and capped."""
+        problem = create_simple_problem()
+        optimizer = DesignOptimizer(
+            problem, MockStateManager(),
+            validators=[SimpleValidator()],
+            population_size=10,
+            max_generations=5,
+            seed=3,
+        )
+        result = optimizer.optimize()
+
+        front = result.pareto_front
+        assert 0 < len(front) <= 10
+        assert len(optimizer.archive) == len(front)
+        for a in front:
+            assert not any(b.dominates(a) for b in front)
+
 
 class TestDesignOptimizerWithConstraints:
     """Tests for optimization with constraints."""
@@ -612,3 +633,169 @@ class TestDesignOptimizerWithConstraints:
             x_val = result.selected_solution.variables[0]
             # Solutions near boundary or within constraint should be preferred
             assert result.selected_solution is not None
+
+
+class CountingValidator(SimpleValidator):
+    """SimpleValidator that counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def validate(self, state, config):
+        self.calls += 1
+        super().validate(state, config)
+
+
+class TestFitnessEvaluator:
+    """Tests for parallel, memoized evaluation."""
+
+    def test_memo_skips_repeat_evaluations(self):
+        """Test a repeated candidate is evaluated and counted once."""
+        problem = create_simple_problem()
+        validator = CountingValidator()
+        optimizer = DesignOptimizer(problem, MockStateManager(), validators=[validator])
+
+        first = Solution(variables=[3.0, 4.0], objectives=[0.0, 0.0])
+        second = Solution(variables=[3.0, 4.0], objectives=[0.0, 0.0])
+        optimizer._evaluate_solution(first)
+        optimizer._evaluate_solution(second)
+
+        assert validator.calls == 1
+        assert optimizer._evaluations == 1
+        assert optimizer.evaluator.cache_hits == 1
+        assert second.objectives == first.objectives == [9.0, 20.0]
+
+    def test_evaluate_many_dedupes_batch(self):
+        """Test duplicates within a batch are evaluated once, in order."""
+        problem = create_simple_problem()
+        validator = CountingValidator()
+        evaluator = FitnessEvaluator(problem, MockStateManager(), [validator])
+
+        outcomes = evaluator.evaluate_many([[1.0, 0.0], [2.0, 0.0], [1.0, 0.0]])
+
+        assert validator.calls == 2
+        assert [o.objectives for o in outcomes] == [(1.0, 16.0), (4.0, 9.0), (1.0, 16.0)]
+
+    def test_evaluate_many_streams_outcomes(self):
+        """Test on_outcome sees every batch index, memo hits first."""
+        problem = create_simple_problem()
+        evaluator = FitnessEvaluator(problem, MockStateManager(), [SimpleValidator()])
+        evaluator.evaluate([2.0, 0.0])
+
+        streamed = []
+        outcomes = evaluator.evaluate_many(
+            [[1.0, 0.0], [2.0, 0.0], [1.0, 0.0]],
+            on_outcome=lambda i, outcome: streamed.append((i, outcome.objectives)),
+        )
+
+        assert streamed == [(1, (4.0, 9.0)), (0, (1.0, 16.0)), (2, (1.0, 16.0))]
+        assert [o.objectives for o in outcomes] == [(1.0, 16.0), (4.0, 9.0), (1.0, 16.0)]
+
+    def test_memo_disabled(self):
+        """Test memo_size=0 evaluates every request."""
+        problem = create_simple_problem()
+        validator = CountingValidator()
+        evaluator = FitnessEvaluator(problem, MockStateManager(), [validator], memo_size=0)
+
+        evaluator.evaluate([1.0, 1.0])
+        evaluator.evaluate([1.0, 1.0])
+
+        assert validator.calls == 2
+
+    def test_failed_evaluation_penalized(self):
+        """Test a raising validator yields the penalty outcome."""
+        class FailingValidator:
+            def validate(self, state, config):
+                raise ValueError("boom")
+
+        problem = create_simple_problem()
+        evaluator = FitnessEvaluator(problem, MockStateManager(), [FailingValidator()])
+
+        outcome = evaluator.evaluate([1.0, 1.0])
+
+        assert outcome.failed
+        assert not outcome.is_feasible
+        assert outcome.objectives == (1e10, 1e10)
+
+    @pytest.mark.parametrize("mode", [EvaluationMode.THREAD, EvaluationMode.PROCESS])
+    def test_parallel_modes_match_serial(self, mode):
+        """Test pool backends produce the same results as serial."""
+        problem = create_simple_problem()
+        results = {}
+        for run_mode in (EvaluationMode.SERIAL, mode):
+            optimizer = DesignOptimizer(
+                problem, MockStateManager(),
+                validators=[SimpleValidator()],
+                population_size=10,
+                max_generations=3,
+                seed=7,
+                evaluation_mode=run_mode,
+                max_workers=2,
+            )
+            result = optimizer.optimize()
+            results[run_mode] = sorted(tuple(s.objectives) for s in result.pareto_front)
+            assert result.evaluations + result.cache_hits == 40
+
+        assert results[EvaluationMode.SERIAL] == results[mode]
+
+    @pytest.mark.parametrize("mode", [EvaluationMode.SERIAL, EvaluationMode.THREAD])
+    def test_optimize_streams_evaluations(self, mode):
+        """Test on_evaluated streams each evaluated solution before its generation's callback."""
+        problem = create_simple_problem()
+        events = []
+        optimizer = DesignOptimizer(
+            problem, MockStateManager(),
+            validators=[SimpleValidator()],
+            population_size=10,
+            max_generations=3,
+            seed=7,
+            evaluation_mode=mode,
+            max_workers=2,
+        )
+        result = optimizer.optimize(
+            callback=lambda gen, pareto: events.append(("generation", gen)),
+            on_evaluated=lambda gen, sol: events.append(("solution", gen, list(sol.objectives))),
+        )
+
+        solutions = [e for e in events if e[0] == "solution"]
+        assert len(solutions) == result.evaluations + result.cache_hits
+        assert all(objectives != [0.0, 0.0] for _, _, objectives in solutions)
+        generations = [e[1] for e in events]
+        assert generations == sorted(generations)
+        assert [e for e in events if e[0] == "generation"] == [("generation", g) for g in range(3)]
+
+    def test_pool_failure_falls_back_to_serial(self):
+        """Test a pool that cannot be used degrades to serial evaluation."""
+        def broken_pool():
+            raise OSError("no workers")
+
+        problem = create_simple_problem()
+        with FitnessEvaluator(
+            problem, MockStateManager(), [SimpleValidator()],
+            mode=EvaluationMode.PROCESS, max_workers=2,
+        ) as evaluator:
+            evaluator._get_pool = broken_pool
+            outcomes = evaluator.evaluate_many([[1.0, 0.0], [2.0, 0.0]])
+
+        assert evaluator.mode == EvaluationMode.SERIAL
+        assert [o.objectives for o in outcomes] == [(1.0, 16.0), (4.0, 9.0)]
+
+    def test_state_manager_clone_is_independent(self):
+        """Test evaluations on a real StateManager leave the base untouched."""
+        from magnet.core.state_manager import StateManager
+
+        problem = OptimizationProblem(name="hull", description="")
+        problem.add_variable(DesignVariable(
+            name="loa", state_path="hull.loa", lower_bound=20.0, upper_bound=40.0,
+        ))
+        problem.add_objective(Objective(
+            name="loa", state_path="hull.loa", objective_type=ObjectiveType.MINIMIZE,
+        ))
+
+        base = StateManager()
+        evaluator = FitnessEvaluator(problem, base)
+        outcome = evaluator.evaluate([30.0])
+
+        assert outcome.objectives == (30.0,)
+        assert base.get("hull.loa") is None
+        assert len(base.state.history) == 0
@@ -9,6 +9,7 @@ Tests for Module 13 v1.1 - ParetoAnalyzer and ParetoMetrics.
 import pytest
 from magnet.optimization import (
     ParetoAnalyzer,
+    ParetoArchive,
     ParetoMetrics,
     OptimizationProblem,
     DesignVariable,
@@ -522,3 +523,62 @@ class TestParetoAnalyzerVisualizationData:
         assert "spacing" in metrics
         assert "objective_mins" in metrics
         assert "objective_maxs" in metrics
+
+
+def sol(*objectives, feasible=True):
+    return Solution(variables=[0.0], objectives=list(objectives), is_feasible=feasible)
+
+
+class TestParetoArchive:
+    """Tests for the incremental Pareto archive."""
+
+    def test_keeps_non_dominated(self):
+        """Test dominated candidates are rejected and evicted."""
+        archive = ParetoArchive(n_obj=2)
+        assert archive.update([sol(5.0, 5.0), sol(6.0, 6.0), sol(1.0, 9.0)]) == 2
+        assert archive.add(sol(4.0, 4.0))
+        assert not archive.add(sol(7.0, 7.0))
+
+        assert sorted(s.objectives for s in archive) == [[1.0, 9.0], [4.0, 4.0]]
+
+    def test_rejects_infeasible_and_duplicates(self):
+        """Test infeasible solutions and repeated objectives are not archived."""
+        archive = ParetoArchive(n_obj=2)
+        archive.update([sol(1.0, 1.0), sol(1.0, 1.0), sol(0.0, 0.0, feasible=False)])
+        assert not archive.add(sol(1.0, 1.0))
+        assert len(archive) == 1
+
+    def test_truncates_most_crowded(self):
+        """Test max_size keeps the boundary solutions."""
+        archive = ParetoArchive(n_obj=2, max_size=3)
+        archive.update([sol(float(i), 10.0 - i) for i in range(11)])
+
+        assert len(archive) == 3
+        objectives = sorted(s.objectives for s in archive)
+        assert objectives[0] == [0.0, 10.0]
+        assert objectives[-1] == [10.0, 0.0]
+
+    def test_version_and_metrics_cache(self):
+        """Test compute_metrics on an archive is cached until it changes."""
+        analyzer = ParetoAnalyzer(create_two_objective_problem())
+        archive = ParetoArchive(n_obj=2)
+        archive.update([sol(0.0, 10.0), sol(10.0, 0.0)])
+
+        first = analyzer.compute_metrics(archive)
+        assert analyzer.compute_metrics(archive) is first
+        assert first.n_solutions == 2
+        assert first.hypervolume == pytest.approx(archive.hypervolume())
+
+        archive.add(sol(2.0, 2.0))
+        assert analyzer.compute_metrics(archive).n_solutions == 3
+
+    def test_three_objective_hypervolume(self):
+        """Test metrics include hypervolume beyond two objectives."""
+        problem = create_two_objective_problem()
+        problem.add_objective(Objective(
+            name="f3", state_path="result.f3", objective_type=ObjectiveType.MINIMIZE,
+        ))
+        analyzer = ParetoAnalyzer(problem)
+
+        metrics = analyzer.compute_metrics([sol(1.0, 2.0, 3.0), sol(3.0, 2.0, 1.0)])
+        assert metrics.hypervolume > 0
@@ -16,6 +16,7 @@ from magnet.optimization import (
     Objective,
     Solution,
     ObjectiveType,
+    FitnessEvaluator,
 )
 
 
@@ -498,3 +499,22 @@ class TestSensitivityAnalyzerFailure:
 
         # Should return error or empty samples
         assert "error" in result or result.get("n_samples", 0) == 0
+
+
+class TestSensitivityAnalyzerEvaluator:
+    """Tests for evaluation through a FitnessEvaluator."""
+
+    def test_shared_evaluator_reuses_cache(self):
+        """Test repeated analysis is answered from the shared memo cache."""
+        problem = create_two_variable_problem()
+        state = MockStateManager()
+        evaluator = FitnessEvaluator(problem, state, [LinearValidator()])
+        analyzer = SensitivityAnalyzer(problem, state, evaluator=evaluator)
+
+        solution = Solution(variables=[5.0, 5.0], objectives=[15.0, 20.0], is_feasible=True)
+        first = analyzer.analyze(solution)
+        second = analyzer.analyze(solution)
+
+        assert evaluator.evaluations == 4
+        assert evaluator.cache_hits == 4
+        assert first.to_dict() == second.to_dict()
@@ -0,0 +1,268 @@
+"""
+tests/unit/test_optimization_surrogate.py - Tests for surrogate screening.
+
+BRAVO OWNS THIS FILE.
+
+Tests for Module 13 v1.1 - GaussianProcessSurrogate and SurrogateScreen.
+"""
+
+import numpy as np
+import pytest
+
+from magnet.optimization import (
+    DesignOptimizer,
+    DesignVariable,
+    GaussianProcessSurrogate,
+    Objective,
+    OptimizationProblem,
+    SensitivityAnalyzer,
+    Solution,
+    SurrogateScreen,
+)
+
+
+class MockStateManager:
+    """Mock StateManager for testing."""
+
+    def __init__(self):
+        self._data = {}
+
+    def clone(self):
+        new_state = MockStateManager()
+        new_state._data = self._data.copy()
+        return new_state
+
+    def get(self, path, default=None):
+        return self._data.get(path, default)
+
+    def set(self, path, value, source=None):
+        self._data[path] = value
+
+
+def create_problem():
+    """Two variables on [0, 10], two minimized objectives."""
+    problem = OptimizationProblem(name="surrogate_test")
+    for name in ("x", "y"):
+        problem.add_variable(DesignVariable(
+            name=name, state_path=f"var.{name}", lower_bound=0.0, upper_bound=10.0,
+        ))
+    problem.add_objective(Objective(name="f1", state_path="result.f1"))
+    problem.add_objective(Objective(name="f2", state_path="result.f2"))
+    return problem
+
+
+class SmoothValidator:
+    """Smooth objectives the surrogate can learn."""
+
+    def validate(self, state, config):
+        x = state.get("var.x", 0)
+        y = state.get("var.y", 0)
+        state.set("result.f1", x ** 2 / 10.0 + y)
+        state.set("result.f2", (x - 10.0) ** 2 / 10.0 + y)
+
+
+def evaluate(problem, solutions):
+    """Evaluate solutions in place through SmoothValidator."""
+    optimizer = DesignOptimizer(problem, MockStateManager(), validators=[SmoothValidator()])
+    for s in solutions:
+        optimizer._evaluate_solution(s)
+    return solutions
+
+
+def evaluated(problem, variables):
+    """New solutions evaluated through SmoothValidator."""
+    return evaluate(problem, [Solution(variables=list(v), objectives=[]) for v in variables])
+
+
+class TestGaussianProcessSurrogate:
+    """Tests for the Gaussian-process regressor."""
+
+    def test_interpolates_training_data(self):
+        """Test predictions match training targets with low uncertainty."""
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0.0, 10.0, size=(30, 2))
+        y = np.column_stack([np.sin(x[:, 0] / 3.0), x[:, 1] ** 2])
+
+        model = GaussianProcessSurrogate([0.0, 0.0], [10.0, 10.0])
+        model.fit(x, y)
+        mean, std = model.predict(x)
+
+        assert model.is_fitted
+        assert model.n_samples == 30
+        assert mean.shape == std.shape == (30, 2)
+        assert np.allclose(mean, y, atol=1e-2 * np.ptp(y, axis=0))
+        assert np.all(std < 0.05 * model.output_scale)
+
+    def test_uncertainty_grows_away_from_data(self):
+        """Test extrapolated points are less certain than sampled ones."""
+        x = np.array([[1.0], [2.0], [3.0], [4.0]])
+        model = GaussianProcessSurrogate([0.0], [10.0])
+        model.fit(x, x ** 2)
+
+        _, std = model.predict([[2.5], [9.5]])
+        assert std[1, 0] > std[0, 0]
+
+    def test_predict_before_fit_raises(self):
+        """Test predicting with an untrained model."""
+        model = GaussianProcessSurrogate([0.0], [1.0])
+        with pytest.raises(RuntimeError):
+            model.predict([[0.5]])
+
+
+class TestSurrogateScreen:
+    """Tests for offspring screening."""
+
+    def test_passes_everything_until_trained(self):
+        """Test candidates are not screened before the model is fitted."""
+        problem = create_problem()
+        screen = SurrogateScreen(problem)
+        candidates = [
+            Solution(variables=[1.0, 1.0], objectives=[]),
+            Solution(variables=[2.0, 2.0], objectives=[]),
+        ]
+
+        assert screen.screen(candidates, []) == candidates
+
+    def test_skips_dominated_candidates(self):
+        """Test candidates predicted far behind the population are skipped."""
+        problem = create_problem()
+        grid = [[x, y] for x in np.linspace(0, 10, 6) for y in np.linspace(0, 10, 6)]
+        population = evaluated(problem, grid)
+
+        screen = SurrogateScreen(problem, min_samples=10, min_evaluate_fraction=0.0)
+        screen.observe(population)
+        screen.retrain()
+
+        # y adds to both objectives, so y = 10 is dominated by y = 0
+        good = Solution(variables=[5.0, 0.0], objectives=[])
+        bad = Solution(variables=[5.0, 10.0], objectives=[])
+        chosen = screen.screen([good, bad], population)
+
+        assert chosen == [good]
+        report = screen.report()
+        assert report.n_screened == 2
+        assert report.n_skipped == 1
+        assert report.skip_rate == 0.5
+
+    def test_limit_and_minimum(self):
+        """Test selections are capped at the limit and topped up to the minimum."""
+        problem = create_problem()
+        grid = [[x, y] for x in np.linspace(0, 10, 6) for y in np.linspace(0, 10, 6)]
+        population = evaluated(problem, grid)
+
+        screen = SurrogateScreen(problem, min_samples=10, min_evaluate_fraction=0.5)
+        screen.observe(population)
+        screen.retrain()
+
+        candidates = [Solution(variables=[x, 9.0], objectives=[]) for x in np.linspace(0.5, 9.5, 8)]
+        assert len(screen.screen(candidates, population, limit=4)) == 2
+        candidates = [Solution(variables=[x, 0.0], objectives=[]) for x in np.linspace(0.5, 9.5, 8)]
+        assert len(screen.screen(candidates, population, limit=4)) == 4
+
+    def test_report_compares_predictions(self):
+        """Test evaluated screened candidates are scored against the model."""
+        problem = create_problem()
+        rng = np.random.default_rng(1)
+        screen = SurrogateScreen(problem, min_samples=10, min_evaluate_fraction=1.0)
+        screen.observe(evaluated(problem, rng.uniform(0, 10, size=(40, 2))))
+        screen.retrain()
+
+        candidates = [
+            Solution(variables=list(v), objectives=[]) for v in rng.uniform(0, 10, size=(10, 2))
+        ]
+        chosen = screen.screen(candidates, [])
+        screen.observe(evaluate(problem, chosen))
+        report = screen.report().to_dict()
+
+        assert report["n_compared"] == 10
+        assert report["objectives"]["f1"]["r2"] > 0.95
+        assert report["n_retrains"] == 1
+
+
+class TestOptimizerWithSurrogate:
+    """Tests for DesignOptimizer with a SurrogateScreen."""
+
+    def test_optimize_reports_surrogate(self):
+        """Test optimization completes and reports screening statistics."""
+        problem = create_problem()
+        screen = SurrogateScreen(problem, min_samples=10, retrain_interval=2)
+        optimizer = DesignOptimizer(
+            problem, MockStateManager(),
+            validators=[SmoothValidator()],
+            population_size=12,
+            max_generations=6,
+            seed=42,
+            surrogate=screen,
+        )
+        result = optimizer.optimize()
+
+        assert result.surrogate_report is not None
+        assert result.surrogate_report["n_retrains"] >= 1
+        assert result.surrogate_report["n_screened"] > 0
+        assert result.to_dict()["surrogate"] == result.surrogate_report
+        assert len(result.pareto_front) > 0
+
+    def test_screened_generations_stay_within_budget(self):
+        """Test only the evaluation budget of offspring is evaluated per generation."""
+        problem = create_problem()
+        screen = SurrogateScreen(problem, min_samples=10, evaluations_per_generation=3)
+        optimizer = DesignOptimizer(
+            problem, MockStateManager(),
+            validators=[SmoothValidator()],
+            population_size=12,
+            max_generations=6,
+            seed=42,
+            surrogate=screen,
+        )
+        result = optimizer.optimize()
+
+        # Trained on the initial population, so every generation is screened
+        assert result.evaluations <= 12 + 6 * 3
+        assert result.surrogate_report["n_screened"] == 6 * 12 * screen.oversample
+        assert SurrogateScreen(problem).evaluation_budget(60) == 15
+
+
+class TestSensitivityWithSurrogate:
+    """Tests for surrogate-backed sensitivity sweeps."""
+
+    def make_analyzer(self, fitted=True):
+        problem = create_problem()
+        model = GaussianProcessSurrogate.for_problem(problem)
+        if fitted:
+            rng = np.random.default_rng(2)
+            x = rng.uniform(0, 10, size=(40, 2))
+            y = np.array([s.objectives for s in evaluated(problem, x)])
+            model.fit(x, y)
+        analyzer = SensitivityAnalyzer(
+            problem, MockStateManager(), [SmoothValidator()], surrogate=model,
+        )
+        return analyzer
+
+    def test_tradeoff_curve_matches_evaluation(self):
+        """Test the surrogate sweep tracks the evaluated one."""
+        analyzer = self.make_analyzer()
+        solution = Solution(variables=[5.0, 5.0], objectives=[])
+
+        approx = analyzer.get_tradeoff_curve(solution, 0, n_points=15, use_surrogate=True)
+        exact = analyzer.get_tradeoff_curve(solution, 0, n_points=15)
+
+        assert approx["n_points"] == exact["n_points"] == 15
+        for a, e in zip(approx["curve"], exact["curve"]):
+            assert a["variable_value"] == e["variable_value"]
+            assert a["objectives"] == pytest.approx(e["objectives"], abs=0.2)
+
+    def test_local_region_with_surrogate(self):
+        """Test local region sampling on the surrogate."""
+        analyzer = self.make_analyzer()
+        region = analyzer.analyze_local_region(
+            Solution(variables=[5.0, 5.0], objectives=[]), n_samples=50, use_surrogate=True,
+        )
+        assert region["n_samples"] == 50
+
+    def test_unfitted_surrogate_raises(self):
+        """Test surrogate sweeps need a trained model."""
+        analyzer = self.make_analyzer(fitted=False)
+        with pytest.raises(ValueError):
+            analyzer.get_tradeoff_curve(
+                Solution(variables=[5.0, 5.0], objectives=[]), 0, use_surrogate=True,
+            )
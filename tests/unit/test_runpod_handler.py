@@ -330,10 +330,10 @@ class TestResponseFormat:
         from magnet.deployment.runpod_handler import handler
 
         # Use a mock that succeeds
-        with patch('magnet.deployment.runpod_handler._create_app') as mock_create:
+        with patch('magnet.deployment.runpod_handler._acquire_app') as mock_acquire:
             with patch('magnet.deployment.runpod_handler._handle_operation') as mock_handle:
                 mock_app = Mock()
-                mock_create.return_value = mock_app
+                mock_acquire.return_value = (mock_app, True)
                 mock_handle.return_value = {"result": "test"}
 
                 event = {"input": {"operation": "query", "parameters": {}}}
@@ -343,6 +343,8 @@ class TestResponseFormat:
                 assert "result" in result
                 assert "error" in result
                 assert "duration_ms" in result
+                assert "startup_ms" in result
+                assert "work_ms" in result
                 assert result["success"] is True
 
     def test_error_response_format(self):
@@ -442,10 +444,10 @@ class TestIntegration:
         """Test complete handler flow with mocks."""
         from magnet.deployment.runpod_handler import handler
 
-        with patch('magnet.deployment.runpod_handler._create_app') as mock_create:
+        with patch('magnet.deployment.runpod_handler._acquire_app') as mock_acquire:
             with patch('magnet.deployment.runpod_handler._handle_operation') as mock_handle:
                 mock_app = Mock()
-                mock_create.return_value = mock_app
+                mock_acquire.return_value = (mock_app, True)
                 mock_handle.return_value = {"test": "result"}
 
                 event = {
@@ -460,17 +462,17 @@ class TestIntegration:
 
                 assert result["success"] is True
                 assert result["result"] == {"test": "result"}
-                mock_create.assert_called_once()
+                mock_acquire.assert_called_once()
                 mock_handle.assert_called_once()
 
     def test_handler_with_design_state(self):
         """Test handler initializes with design state."""
         from magnet.deployment.runpod_handler import handler
 
-        with patch('magnet.deployment.runpod_handler._create_app') as mock_create:
+        with patch('magnet.deployment.runpod_handler._acquire_app') as mock_acquire:
             with patch('magnet.deployment.runpod_handler._handle_operation') as mock_handle:
                 mock_app = Mock()
-                mock_create.return_value = mock_app
+                mock_acquire.return_value = (mock_app, True)
                 mock_handle.return_value = {}
 
                 design_state = {
@@ -488,8 +490,117 @@ class TestIntegration:
 
                 result = handler(event)
 
-                # Verify design_state was passed to create_app
-                mock_create.assert_called_once_with(design_state)
+                # Verify design_state was passed to the app checkout
+                mock_acquire.assert_called_once_with(design_state)
+
+
+# =============================================================================
+# WARM APP POOL TESTS
+# =============================================================================
+
+class TestWarmAppPool:
+    """Test app reuse across invocations."""
+
+    def query(self, path, design_state=None):
+        from magnet.deployment.runpod_handler import handler
+        return handler({
+            "input": {
+                "operation": "query",
+                "design_state": design_state or {},
+                "parameters": {"path": path},
+            }
+        })
+
+    def test_app_is_reused_and_reset(self):
+        from magnet.deployment.runpod_handler import get_app_pool
+
+        first = self.query("hull.loa", {"hull": {"loa": 31.0}})
+        builds = get_app_pool().stats()["builds"]
+        second = self.query("hull.loa")
+
+        assert first["success"] and second["success"]
+        assert first["result"]["value"] == 31.0
+        assert second["result"]["value"] is None  # previous design is gone
+        assert second["warm"] is True
+        assert get_app_pool().stats()["builds"] == builds
+
+    def test_response_reports_timing_split(self):
+        result = self.query("hull.beam")
+
+        assert result["startup_ms"] >= 0
+        assert result["work_ms"] >= 0
+        assert result["startup_ms"] + result["work_ms"] <= result["duration_ms"] + 1
+
+    def test_batch_handler_keeps_event_order(self):
+        import asyncio
+        from magnet.deployment.runpod_handler import batch_handler
+
+        events = [
+            {"input": {
+                "operation": "query",
+                "design_state": {"hull": {"loa": float(i)}},
+                "parameters": {"path": "hull.loa"},
+            }}
+            for i in range(6)
+        ]
+        results = asyncio.run(batch_handler(events, concurrency=3))
+
+        assert [r["result"]["value"] for r in results] == [float(i) for i in range(6)]
+
+    def test_release_ignores_foreign_apps(self):
+        from magnet.deployment.runpod_handler import WarmAppPool
+
+        pool = WarmAppPool(size=1)
+        pool.release(Mock())
+        assert pool.stats()["idle"] == 0
+
+    def test_rebuild_waits_for_checked_out_apps(self):
+        """A refill (which resets the shared ValidatorRegistry) never overlaps a checked-out app."""
+        import threading
+        from magnet.deployment.runpod_handler import WarmAppPool
+
+        events = []
+
+        def create_app():
+            events.append("build")
+            return Mock()
+
+        with patch("magnet.deployment.runpod_handler._create_app", side_effect=create_app), \
+                patch("magnet.deployment.runpod_handler._reset_app"):
+            pool = WarmAppPool(size=2)
+            pool.warm()
+            validating, _ = pool.acquire()
+            broken, _ = pool.acquire()
+            pool.discard(broken)
+            events.clear()
+
+            acquired = []
+            waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+            waiter.start()
+            waiter.join(timeout=0.1)
+            assert waiter.is_alive(), "rebuilt while another app was checked out"
+            assert events == []
+
+            events.append("validated")
+            pool.release(validating)
+            waiter.join(timeout=5)
+
+        assert not waiter.is_alive()
+        assert events == ["validated", "build"]
+        assert acquired[0][1] is False
+        assert pool.stats()["built"] == 2
+
+    def test_pool_size_env_parsed_defensively(self, monkeypatch):
+        from magnet.deployment.runpod_handler import _env_int
+
+        monkeypatch.setenv("MAGNET_RUNPOD_CONCURRENCY", "4")
+        assert _env_int("MAGNET_RUNPOD_CONCURRENCY", 1) == 4
+        monkeypatch.setenv("MAGNET_RUNPOD_CONCURRENCY", "four")
+        assert _env_int("MAGNET_RUNPOD_CONCURRENCY", 1) == 1
+        monkeypatch.setenv("MAGNET_RUNPOD_CONCURRENCY", "0")
+        assert _env_int("MAGNET_RUNPOD_CONCURRENCY", 1) == 1
+        monkeypatch.delenv("MAGNET_RUNPOD_CONCURRENCY")
+        assert _env_int("MAGNET_RUNPOD_CONCURRENCY", 1) == 1
 
 
 if __name__ == "__main__":
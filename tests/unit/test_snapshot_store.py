@@ -0,0 +1,93 @@
+"""
+Unit tests for core/snapshot_store.py
+
+Tests delta capture, keyframe replay and list-append compaction.
+"""
+
+from magnet.core.snapshot_store import (
+    SnapshotStore,
+    flatten_state,
+    unflatten_state,
+)
+
+
+class TestFlatten:
+    """Test flatten/unflatten round trip."""
+
+    def test_round_trip(self):
+        """Test nested dicts survive flatten + unflatten."""
+        data = {"a": {"b": 1, "c": {"d": [1, 2]}}, "e": {}, "f": None}
+        assert unflatten_state(flatten_state(data)) == data
+
+    def test_unflatten_copies_mutable_leaves(self):
+        """Test materialized dicts do not alias stored leaves."""
+        flat = flatten_state({"a": {"items": [1, 2]}})
+        out = unflatten_state(flat)
+        out["a"]["items"].append(3)
+        assert flat[("a", "items")] == [1, 2]
+
+
+class TestSnapshotStore:
+    """Test SnapshotStore capture and replay."""
+
+    def test_materialize_each_version(self):
+        """Test every tagged version replays exactly."""
+        store = SnapshotStore(keyframe_interval=4)
+        states = []
+        for i in range(20):
+            state = {"hull": {"loa": float(i)}, "history": list(range(i))}
+            if i % 3 == 0:
+                state["extra"] = {"k": i}
+            states.append(state)
+            store.record_version(i, state)
+
+        for i, state in enumerate(states):
+            assert store.materialize_version(i) == state
+
+    def test_delta_only_stores_changes(self):
+        """Test unchanged leaves are not stored again."""
+        store = SnapshotStore()
+        store.capture({"a": 1, "b": 2, "c": 3})
+        store.capture({"a": 1, "b": 5, "c": 3})
+        assert store.get_stats()["delta_entries"] == 1
+
+    def test_list_append_stored_as_tail(self):
+        """Test append-only lists store only the new tail."""
+        store = SnapshotStore()
+        history = [{"i": i} for i in range(100)]
+        store.capture({"history": list(history)})
+        node = store.capture({"history": history + [{"i": 100}]})
+
+        op = store._nodes[node].delta[("history",)]
+        assert op.tail == [{"i": 100}]
+        assert store.materialize(node)["history"][-1] == {"i": 100}
+
+    def test_deleted_paths(self):
+        """Test removed keys are removed on replay."""
+        store = SnapshotStore()
+        first = store.capture({"meta": {"a": 1, "b": 2}})
+        second = store.capture({"meta": {"a": 1}})
+        assert store.materialize(second) == {"meta": {"a": 1}}
+        assert store.materialize(first) == {"meta": {"a": 1, "b": 2}}
+
+    def test_type_change_detected(self):
+        """Test equal-but-different-type values are recorded."""
+        store = SnapshotStore()
+        store.capture({"flag": 1})
+        node = store.capture({"flag": True})
+        assert store.materialize(node)["flag"] is True
+
+    def test_keyframes_created(self):
+        """Test a keyframe is written every interval."""
+        store = SnapshotStore(keyframe_interval=5)
+        for i in range(16):
+            store.capture({"x": i})
+        assert store.get_stats()["keyframes"] == 4  # root + 3 intervals
+
+    def test_diff_versions(self):
+        """Test leaf diff between versions."""
+        store = SnapshotStore()
+        store.record_version(0, {"hull": {"loa": 10.0, "beam": 3.0}})
+        store.record_version(1, {"hull": {"loa": 11.0, "beam": 3.0}})
+        assert store.diff_versions(0, 1) == {"hull.loa": (10.0, 11.0)}
+        assert store.diff_versions(0, 5) is None
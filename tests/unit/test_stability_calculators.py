@@ -151,6 +151,70 @@ class TestGZCurveCalculator:
         assert len(result.curve) == len(angles)
 
 
+class TestGZCurveBatch:
+    """Test GZCurveCalculator.calculate_batch."""
+
+    def setup_method(self):
+        self.calculator = GZCurveCalculator()
+
+    def test_batch_matches_scalar(self):
+        """Each batch curve matches the single-curve calculation."""
+        # KG sweep: GM falls as KG rises, including unstable conditions
+        gms = [1.2 - 0.1 * i for i in range(16)]
+        bms = [2.0] * len(gms)
+        batch = self.calculator.calculate_batch(gms, bms)
+
+        assert len(batch) == len(gms)
+        for i, (gm, bm) in enumerate(zip(gms, bms)):
+            expected = self.calculator.calculate(gm_m=gm, bm_m=bm)
+            actual = batch.result(i)
+            assert actual.gz_max_m == pytest.approx(expected.gz_max_m)
+            assert actual.angle_gz_max_deg == expected.angle_gz_max_deg
+            assert actual.gz_30_m == pytest.approx(expected.gz_30_m)
+            assert actual.angle_of_vanishing_stability_deg == pytest.approx(
+                expected.angle_of_vanishing_stability_deg
+            )
+            assert actual.area_0_30_m_rad == pytest.approx(expected.area_0_30_m_rad)
+            assert actual.area_0_40_m_rad == pytest.approx(expected.area_0_40_m_rad)
+            assert actual.area_30_40_m_rad == pytest.approx(expected.area_30_40_m_rad)
+            assert actual.dynamic_stability_m_rad == pytest.approx(expected.dynamic_stability_m_rad)
+            assert actual.passes_all_gz_criteria == expected.passes_all_gz_criteria
+            assert actual.warnings == expected.warnings
+
+    def test_batch_custom_grid_interpolates(self):
+        """Grids without 30°/40° points interpolate like the scalar path."""
+        angles = [0.0, 12.5, 27.0, 36.0, 55.0]
+        batch = self.calculator.calculate_batch([0.7, 0.3], [2.0, 1.5], angles_deg=angles)
+        for i, gm in enumerate([0.7, 0.3]):
+            expected = self.calculator.calculate(gm_m=gm, bm_m=[2.0, 1.5][i], angles_deg=angles)
+            assert batch.gz_30_m[i] == pytest.approx(expected.gz_30_m)
+            assert batch.area_30_40_m_rad[i] == pytest.approx(expected.area_30_40_m_rad)
+
+    def test_curves_materialized_on_demand(self):
+        """Curve points are built per index from the shared grid."""
+        batch = self.calculator.calculate_batch([0.7, 0.5], 2.0, angles_deg=[0, 15, 30, 45])
+        assert batch.gz_m.shape == (2, 4)
+        curve = batch.curve(1)
+        assert [p.heel_deg for p in curve] == [0, 15, 30, 45]
+        assert curve[2].gz_m == pytest.approx(batch.gz_m[1, 2])
+        assert curve[2].heel_rad == pytest.approx(math.radians(30))
+
+    def test_downflooding_angles(self):
+        """Downflooding angle is arctan(2F/B), clamped, 90° when undefined."""
+        batch = self.calculator.calculate_batch(
+            [0.7, 0.7, 0.7], [2.0, 2.0, 2.0],
+            freeboard_m=[1.5, 0.1, 0.0], beam_m=[6.0, 6.0, 6.0],
+        )
+        assert batch.downflooding_angle_deg[0] == pytest.approx(math.degrees(math.atan(0.5)))
+        assert batch.downflooding_angle_deg[1] == pytest.approx(15.0)
+        assert batch.downflooding_angle_deg[2] == pytest.approx(90.0)
+        assert self.calculator.calculate_batch([0.7], [2.0]).downflooding_angle_deg is None
+
+    def test_empty_grid_rejected(self):
+        with pytest.raises(ValueError):
+            self.calculator.calculate_batch([0.7], [2.0], angles_deg=[])
+
+
 class TestFreeSurfaceCalculator:
     """Test FreeSurfaceCalculator class."""
 
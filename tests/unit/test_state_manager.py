@@ -126,6 +126,34 @@ class TestStateManagerTransactions:
         assert not manager.in_transaction()
         assert manager.state.mission.vessel_type == "original"
 
+    def test_rollback_drops_transaction_history(self):
+        """Test rolled-back writes leave the history, replaced by a rollback record."""
+        manager = StateManager()
+        manager.set("kernel.status", "before", source="test")
+
+        txn_id = manager.begin_transaction()
+        manager.set("kernel.status", "during", source="test")
+        manager.rollback_transaction(txn_id)
+
+        assert [r["action"] for r in manager.state.history] == ["set", "transaction_rollback"]
+        assert manager.state.history[0]["new_value"] == "before"
+
+    def test_revert_drops_later_history(self):
+        """Test reverting keeps history up to the target version's commit."""
+        manager = StateManager()
+        manager.begin_transaction()
+        manager.set("kernel.status", "v1", source="test")
+        manager.commit()
+        manager.begin_transaction()
+        manager.set("kernel.status", "v2", source="test")
+        manager.commit()
+
+        assert manager.revert_to_version(1)
+        assert [r["action"] for r in manager.state.history] == [
+            "set", "transaction_commit", "revert",
+        ]
+        assert manager.get("kernel.status") == "v1"
+
     def test_nested_transaction_not_allowed(self):
         """Test that nested transactions raise error."""
         manager = StateManager()
@@ -154,6 +182,25 @@ class TestStateManagerSerialization:
         assert manager.state.mission.vessel_type == "ferry"
 
 
+    def test_reset(self):
+        """Test reset discards state, transactions and versions."""
+        manager = StateManager()
+        manager.begin_transaction()
+        manager.set("hull.loa", 30.0, source="test")
+        manager.commit()
+        manager.begin_transaction()
+
+        manager.reset({"design_name": "Next", "hull": {"beam": 7.0}})
+
+        assert manager.state.design_name == "Next"
+        assert manager.get("hull.beam") == 7.0
+        assert manager.get("hull.loa") is None
+        assert not manager.in_transaction()
+        assert not manager.revert_to_version(1)
+
+        manager.reset()
+        assert manager.get("hull.beam") is None
+
 class TestStateManagerFileIO:
     """Test file I/O operations."""
 
@@ -221,6 +268,81 @@ class TestStateManagerPatch:
         assert manager.get("hull.loa") == 25.0
 
 
+class TestStateManagerBatchAccess:
+    """Test get_many/set_many and compiled path accessors."""
+
+    def test_get_many(self):
+        """Test batch reads resolve aliases and defaults per path."""
+        manager = StateManager()
+        manager.begin_transaction()
+        manager.set("hull.loa", 25.0, source="test")
+        manager.commit()
+
+        values = manager.get_many(["hull.loa", "hull.length", "hull.beam"], default=-1)
+        assert values == {"hull.loa": 25.0, "hull.length": 25.0, "hull.beam": -1}
+
+    def test_set_many_shares_timestamp(self):
+        """Test batch writes return canonical paths and share one timestamp."""
+        manager = StateManager()
+        manager.begin_transaction()
+        modified = manager.set_many({"hull.length": 25.0, "hull.beam": 6.0}, source="test")
+        manager.commit()
+
+        assert modified == ["hull.loa", "hull.beam"]
+        sets = [h for h in manager.state.history if h.get("action") == "set"]
+        assert {h["timestamp"] for h in sets} == {manager.state.updated_at}
+
+    def test_set_many_enforcement_is_checked_first(self):
+        """Test a refinable path outside a transaction blocks the whole batch."""
+        from magnet.core.state_manager import MutationEnforcementError
+
+        manager = StateManager()
+        with pytest.raises(MutationEnforcementError):
+            manager.set_many({"metadata.note": "x", "hull.loa": 25.0}, source="test")
+        assert manager.get("metadata.note") is None
+
+    def test_compiled_path(self):
+        """Test path compilation resolves alias, schema and refinable flag once."""
+        from magnet.core.path_accessor import PathCompiler
+        from magnet.core.state_manager import VALID_PATHS
+
+        compiler = PathCompiler(VALID_PATHS)
+        compiled = compiler.compile("hull.length")
+        assert compiled.canonical == "hull.loa"
+        assert compiled.refinable and compiled.in_schema
+        assert compiler.compile("hull.length") is compiled
+        assert compiler.compile("hull").in_schema
+        assert not compiler.compile("hull.lo").in_schema
+
+class TestStateOverlay:
+    """Test copy-on-write scratch views."""
+
+    def test_reads_fall_through_and_writes_stay_local(self):
+        """Test the view shadows written paths without touching the base."""
+        manager = StateManager()
+        manager.begin_transaction()
+        manager.set("hull.loa", 25.0, source="test")
+        manager.set("hull.beam", 6.0, source="test")
+        manager.commit()
+        history = len(manager.state.history)
+
+        view = manager.overlay()
+        assert view.set("hull.length", 30.0, "scratch")  # Alias, refinable, no transaction
+        assert view.get("hull.loa") == 30.0
+        assert view.get("hull.beam") == 6.0
+        assert view.exists("hull.loa")
+        assert view.changes == {"hull.loa": 30.0}
+
+        assert manager.get("hull.loa") == 25.0
+        assert len(manager.state.history) == history
+
+    def test_rejects_paths_the_base_cannot_store(self):
+        """Test set() fails where StateManager.set() would."""
+        view = StateManager().overlay()
+        assert not view.set("nonexistent.deep.path", 1.0, "scratch")
+        assert view.changes == {}
+
+
 class TestStateManagerDiff:
     """Test diff method."""
 
@@ -341,6 +463,81 @@ class TestDesignVersion:
         assert restored.design_version == 1
 
 
+class TestVersionSnapshots:
+    """Test revert/rollback/diff replayed from the snapshot store."""
+
+    def _commit(self, manager, **values):
+        manager.begin_transaction()
+        for path, value in values.items():
+            manager.set(path.replace("__", "."), value, source="test")
+        return manager.commit()
+
+    def test_revert_across_keyframes(self):
+        """Every committed version is restorable past several keyframes."""
+        manager = StateManager()
+        for i in range(1, 80):
+            self._commit(manager, hull__loa=float(i), hull__beam=float(i % 7))
+
+        for version in (1, 31, 32, 33, 64, 79):
+            assert manager.revert_to_version(version)
+            assert manager.get("hull.loa") == float(version)
+            assert manager.get("hull.beam") == float(version % 7)
+
+    def test_revert_then_commit_keeps_later_versions(self):
+        """Committing after a revert does not corrupt other versions."""
+        manager = StateManager()
+        for i in range(1, 6):
+            self._commit(manager, hull__loa=float(i))
+
+        manager.revert_to_version(2)
+        self._commit(manager, hull__loa=42.0)  # Overwrites version 3
+
+        assert manager.revert_to_version(5)
+        assert manager.get("hull.loa") == 5.0
+        assert manager.revert_to_version(3)
+        assert manager.get("hull.loa") == 42.0
+
+    def test_revert_unknown_version(self):
+        """Reverting to a version never committed fails."""
+        manager = StateManager()
+        assert manager.revert_to_version(7) is False
+
+    def test_rollback_restores_uncommitted_writes(self):
+        """Rollback restores non-transactional writes made before begin."""
+        manager = StateManager()
+        manager.set("kernel.status", "running", source="test")
+        txn_id = manager.begin_transaction()
+        manager.set("hull.loa", 50.0, source="test")
+        manager.set("kernel.status", "changed", source="test")
+
+        assert manager.rollback_transaction(txn_id)
+        assert manager.get("hull.loa") is None
+        assert manager.get("kernel.status") == "running"
+
+    def test_snapshots_isolated_from_live_state(self):
+        """Mutating live containers does not leak into stored versions."""
+        manager = StateManager()
+        self._commit(manager, hull__loa=10.0)
+        manager.state.phase_states["hull"] = {"state": "locked"}
+        manager.state.history.clear()
+
+        manager.revert_to_version(1)
+        assert "hull" not in manager.state.phase_states
+        assert len(manager.state.history) > 0
+
+    def test_diff_versions(self):
+        """diff_versions reports leaf changes between commits."""
+        manager = StateManager()
+        self._commit(manager, hull__loa=10.0)
+        self._commit(manager, hull__loa=12.0, hull__beam=3.0)
+
+        diff = manager.diff_versions(1, 2)
+        assert diff["hull.loa"] == (10.0, 12.0)
+        assert diff["hull.beam"] == (None, 3.0)
+        assert "mission.vessel_type" not in diff
+        assert manager.diff_versions(1, 99) is None
+
+
 class TestParameterLocks:
     """Test parameter locking functionality."""
 
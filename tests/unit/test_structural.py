@@ -721,6 +721,94 @@ class TestNestingEngine:
         assert "average_utilization_percent" in summary
         assert "weight_by_thickness_kg" in summary
 
+    def _assert_valid_layout(self, sheets):
+        margin = NestingEngine.EDGE_MARGIN_MM
+        for sheet in sheets:
+            positions = sheet.plate_positions
+            for x, y, length, width in positions:
+                assert x >= margin and y >= margin
+                assert x + length <= sheet.length_mm - margin
+                assert y + width <= sheet.width_mm - margin
+            for i, (x, y, length, width) in enumerate(positions):
+                for ox, oy, olength, owidth in positions[i + 1:]:
+                    assert x >= ox + olength or ox >= x + length or y >= oy + owidth or oy >= y + width
+
+    def _mixed_plates(self, n=60):
+        plates = []
+        for i in range(n):
+            plates.append(Plate(
+                plate_id=f"PL-{i:03d}",
+                thickness_mm=[6.0, 10.0][i % 2],
+                extent=PlateExtent(y_end=0.3 + (i * 37 % 11) * 0.2, z_end=0.2 + (i * 13 % 7) * 0.15),
+            ))
+        return plates
+
+    def test_nest_plates_valid_layout(self):
+        """Test nested plates stay on the sheet and never overlap, rotated or not."""
+        engine = NestingEngine()
+        plates = self._mixed_plates()
+        # Only fits the 1500 mm wide 10 mm stock lengthwise
+        plates.append(Plate(plate_id="PL-ROT", thickness_mm=10.0, extent=PlateExtent(y_end=1.2, z_end=2.5)))
+
+        sheets = engine.nest_plates(plates)
+
+        self._assert_valid_layout(sheets)
+        assert sum(len(s.plates) for s in sheets) == len(plates)
+        assert engine.unplaced == []
+
+    def test_nest_plates_chooses_stock_size(self):
+        """Test a small job is nested on the smaller stock sheet."""
+        engine = NestingEngine()
+        plates = [
+            Plate(plate_id=f"PL-{i}", thickness_mm=6.0, extent=PlateExtent(y_end=1.0, z_end=0.8))
+            for i in range(4)
+        ]
+
+        sheets = engine.nest_plates(plates)
+
+        assert len(sheets) == 1
+        assert (sheets[0].length_mm, sheets[0].width_mm) == (4000.0, 2000.0)
+
+    def test_nest_plates_oversized_unplaced(self):
+        """Test plates larger than every stock sheet are reported, not given empty sheets."""
+        engine = NestingEngine()
+        plates = self._create_test_plates()[:2] + [
+            Plate(plate_id="PL-BIG", thickness_mm=6.0, extent=PlateExtent(y_end=2.0, z_end=2.0)),
+        ]
+
+        sheets = engine.nest_plates(plates)
+
+        assert engine.unplaced == ["PL-BIG"]
+        assert all(s.plates for s in sheets)
+        assert engine.get_nesting_result().unplaced_plates == ["PL-BIG"]
+
+    def test_nest_plates_process_pool_matches_serial(self):
+        """Test thickness groups nested in a process pool give the serial layout."""
+        plates = self._mixed_plates()
+        serial = NestingEngine(max_workers=1).nest_plates(plates)
+
+        engine = NestingEngine(max_workers=2)
+        engine.PARALLEL_MIN_PLATES = 0
+        parallel = engine.nest_plates(plates)
+
+        assert [s.to_dict() for s in parallel] == [s.to_dict() for s in serial]
+        assert [s.plate_positions for s in parallel] == [s.plate_positions for s in serial]
+
+    def test_nest_plates_time_budget(self):
+        """Test randomized restarts never buy more stock than the deterministic pass."""
+        plates = self._mixed_plates(120)
+        baseline = NestingEngine(max_workers=1).nest_plates(plates)
+
+        engine = NestingEngine(max_workers=1, time_budget_s=0.05, seed=3)
+        improved = engine.nest_plates(plates)
+
+        self._assert_valid_layout(improved)
+        assert sum(len(s.plates) for s in improved) == len(plates)
+        assert (
+            sum(s.length_mm * s.width_mm for s in improved)
+            <= sum(s.length_mm * s.width_mm for s in baseline)
+        )
+
 
 class TestIntegrationGridToPlates:
     """Integration tests for grid to plate generation."""
@@ -41,6 +41,7 @@ from magnet.structural.scantlings import (
 )
 from magnet.structural.grid import StructuralGrid, Frame, Bulkhead
 from magnet.structural.plates import Plate, PlateExtent
+from magnet.structural.plate_index import PlateIndex
 
 
 # === MODULE 23: STIFFENERS ===
@@ -495,6 +496,136 @@ class TestWeldGenerator:
         assert summary.total_welds == len(welds)
         assert summary.total_length_m > 0
 
+    def test_seam_welds_find_all_neighbours(self):
+        """Test seams are found between plates that are not next to each other in sort order."""
+        generator = WeldGenerator(self._create_mock_state())
+        # Two strakes of two plates each: PL-A1 borders PL-A2 (longitudinal)
+        # and PL-B1 (transverse), but sorts next to PL-B1 only
+        plates = [
+            Plate(plate_id="PL-A1", zone="bottom", extent=PlateExtent(frame_start=0, frame_end=10, y_start=0, y_end=1.5)),
+            Plate(plate_id="PL-B1", zone="bottom", extent=PlateExtent(frame_start=0, frame_end=10, y_start=1.5, y_end=3.0)),
+            Plate(plate_id="PL-A2", zone="bottom", extent=PlateExtent(frame_start=10, frame_end=20, y_start=0, y_end=1.5)),
+            Plate(plate_id="PL-B2", zone="bottom", extent=PlateExtent(frame_start=10, frame_end=20, y_start=1.5, y_end=3.0)),
+        ]
+
+        welds = generator.generate_plate_seam_welds(plates)
+
+        pairs = {frozenset((w.part_a, w.part_b)) for w in welds}
+        assert pairs == {
+            frozenset(("PL-A1", "PL-B1")),
+            frozenset(("PL-A1", "PL-A2")),
+            frozenset(("PL-B1", "PL-B2")),
+            frozenset(("PL-A2", "PL-B2")),
+        }
+        assert len(welds) == 4
+        assert all(w.weld_type == WeldType.BUTT for w in welds)
+
+    def test_stiffener_weld_position_lookup(self):
+        """Test an unattached stiffener is welded to the plate under it."""
+        generator = WeldGenerator(self._create_mock_state())
+        plates = [
+            Plate(plate_id="PL-IN", zone="side", extent=PlateExtent(frame_start=0, frame_end=10, y_start=0, y_end=1.5)),
+            Plate(plate_id="PL-OUT", zone="side", extent=PlateExtent(frame_start=0, frame_end=10, y_start=1.5, y_end=3.0)),
+        ]
+        stiffeners = [
+            Stiffener(stiffener_id="FR-005-P", zone="side", frame_start=5, frame_end=5, y_position=-3.0,
+                      length_m=3.0, profile=ProfileSection.flat_bar(80, 6)),
+            Stiffener(stiffener_id="FR-030-P", zone="side", frame_start=30, frame_end=30, y_position=-3.0,
+                      length_m=3.0, profile=ProfileSection.flat_bar(80, 6)),
+        ]
+
+        welds = generator.generate_stiffener_welds(stiffeners, plates)
+
+        assert [w.part_b for w in welds] == ["PL-OUT", "PL-OUT"]
+
+    def test_bulkhead_weld_uses_shell_thickness(self):
+        """Test the bulkhead perimeter weld takes the shell plate thickness at its frame."""
+        generator = WeldGenerator(self._create_mock_state())
+        plates = [
+            Plate(plate_id="PL-BOT", zone="bottom", thickness_mm=8.0,
+                  extent=PlateExtent(frame_start=20, frame_end=30, y_start=0, y_end=1.5)),
+            Plate(plate_id="PL-BH", zone="bulkhead", thickness_mm=5.0,
+                  extent=PlateExtent(frame_start=24, frame_end=24, y_start=-3, y_end=3, z_start=0, z_end=3)),
+        ]
+
+        welds = generator.generate_bulkhead_welds(self._create_test_grid(), plates)
+
+        assert len(welds) == 1
+        assert welds[0].thickness_b_mm == 8.0
+
+
+class TestPlateIndex:
+    """Tests for PlateIndex."""
+
+    def _plates(self):
+        return [
+            Plate(plate_id="PL-1", zone="bottom", extent=PlateExtent(frame_start=0, frame_end=10, y_start=0, y_end=1.5)),
+            Plate(plate_id="PL-2", zone="bottom", extent=PlateExtent(frame_start=10, frame_end=20, y_start=0, y_end=1.5)),
+            Plate(plate_id="PL-3", zone="bottom", extent=PlateExtent(frame_start=0, frame_end=20, y_start=1.5, y_end=3.0)),
+            Plate(plate_id="PL-BH", zone="bulkhead", extent=PlateExtent(frame_start=10, frame_end=10, y_start=-3, y_end=3)),
+        ]
+
+    def test_lookup_by_id_and_zone(self):
+        """Test ID and zone lookups."""
+        index = PlateIndex(self._plates())
+        assert len(index) == 4
+        assert index.get("PL-2").extent.frame_start == 10
+        assert index.get("PL-X") is None
+        assert index.zones == ["bottom", "bulkhead"]
+        assert [p.plate_id for p in index.zone_plates("bottom")] == ["PL-1", "PL-2", "PL-3"]
+
+    def test_at_frame(self):
+        """Test plates covering a frame, boundaries inclusive."""
+        index = PlateIndex(self._plates())
+        assert [p.plate_id for p in index.at("bottom", 5)] == ["PL-1", "PL-3"]
+        assert [p.plate_id for p in index.at("bottom", 10)] == ["PL-1", "PL-2", "PL-3"]
+        assert [p.plate_id for p in index.at("bottom", 15, y=2.0)] == ["PL-3"]
+        assert index.at("bottom", 25) == []
+        assert [p.plate_id for p in index.at("bulkhead", 10)] == ["PL-BH"]
+        assert index.at("deck", 10) == []
+
+    def test_at_frame_matches_scan(self):
+        """Test indexed frame lookups agree with a full scan."""
+        plates = [
+            Plate(plate_id=f"PL-{i}", zone="side",
+                  extent=PlateExtent(frame_start=(i * 7) % 40, frame_end=(i * 7) % 40 + i % 9))
+            for i in range(60)
+        ]
+        index = PlateIndex(plates)
+        for frame in range(-1, 52):
+            expected = [p for p in plates if p.extent.frame_start <= frame <= p.extent.frame_end]
+            assert index.at("side", frame) == expected
+
+    def test_adjacent_pairs(self):
+        """Test edge-sharing pairs within a zone."""
+        index = PlateIndex(self._plates())
+        pairs = [(a.plate_id, b.plate_id) for a, b in index.adjacent_pairs("bottom")]
+        # PL-3 spans both frame ranges, so it shares no full edge
+        assert pairs == [("PL-1", "PL-2")]
+
+    def test_find_for_stiffener(self):
+        """Test stiffener attachment by ID, then by position."""
+        index = PlateIndex(self._plates())
+        attached = Stiffener(zone="bottom", attached_to_plate="PL-2")
+        assert index.find_for_stiffener(attached).plate_id == "PL-2"
+
+        by_position = Stiffener(zone="bottom", frame_start=12, frame_end=12, y_position=2.0)
+        assert index.find_for_stiffener(by_position).plate_id == "PL-3"
+
+        outside = Stiffener(zone="bottom", frame_start=40, frame_end=40)
+        assert index.find_for_stiffener(outside) is None
+
+    def test_structure_mesh_plating(self):
+        """Test the structure mesh builder draws plating from the index."""
+        from magnet.webgl.structure_mesh import StructureMeshBuilder
+
+        builder = StructureMeshBuilder(MagicMock(), plate_index=PlateIndex(self._plates()))
+        meshes = builder._build_plating(None)
+
+        assert [m.mesh_id for m in meshes] == ["plating_bottom", "plating_bulkhead"]
+        assert len(meshes[0].indices) == 3 * 2 * 3
+        assert StructureMeshBuilder(MagicMock())._build_plating(None) == []
+
 
 # === MODULE 25: SCANTLINGS ===
 
@@ -10,11 +10,13 @@ from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 import tempfile
 import json
+import time
 
 from magnet.validators.executor import (
     ExecutionState,
     CacheEntry,
     ValidationCache,
+    PersistentValidationCache,
     PipelineExecutor,
 )
 from magnet.validators.taxonomy import (
@@ -27,7 +29,7 @@ from magnet.validators.taxonomy import (
     ResourcePool,
     ResourceRequirements,
 )
-from magnet.validators.topology import ValidatorTopology
+from magnet.validators.topology import TopologyNode, ValidatorTopology
 
 
 class TestExecutionState:
@@ -269,6 +271,109 @@ class TestValidationCache:
         assert "test/a" in stats["validator_ids"]
 
 
+def _result(validator_id="test/v", state=ValidatorState.PASSED):
+    return ValidationResult(
+        validator_id=validator_id,
+        state=state,
+        started_at=datetime.utcnow(),
+        completed_at=datetime.utcnow(),
+    )
+
+
+class TestValidationCacheLRU:
+    """Test content-addressed LRU behaviour and counters."""
+
+    def test_multiple_inputs_per_validator(self):
+        """Test alternatives for one validator coexist."""
+        cache = ValidationCache()
+        cache.put("test/v", "design_a", _result(), 3600)
+        cache.put("test/v", "design_b", _result(state=ValidatorState.FAILED), 3600)
+
+        assert cache.get("test/v", "design_a").state == ValidatorState.PASSED
+        assert cache.get("test/v", "design_b").state == ValidatorState.FAILED
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted at capacity."""
+        cache = ValidationCache(max_entries=2)
+        cache.put("test/v", "h1", _result(), 3600)
+        cache.put("test/v", "h2", _result(), 3600)
+        cache.get("test/v", "h1")  # h1 now most recent
+        cache.put("test/v", "h3", _result(), 3600)
+
+        assert cache.get("test/v", "h2") is None
+        assert cache.get("test/v", "h1") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_hit_miss_counters(self):
+        """Test hit/miss counters and hit rate."""
+        cache = ValidationCache()
+        cache.put("test/v", "h", _result(), 3600)
+        cache.get("test/v", "h")
+        cache.get("test/v", "other")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_cached_result_is_copy(self):
+        """Test hits do not mutate the stored result."""
+        cache = ValidationCache()
+        original = _result()
+        cache.put("test/v", "h", original, 3600)
+
+        assert cache.get("test/v", "h").was_cached
+        assert original.was_cached is False
+
+    def test_invalidate_removes_all_inputs(self):
+        """Test invalidate drops every input hash for a validator."""
+        cache = ValidationCache()
+        cache.put("test/v", "h1", _result(), 3600)
+        cache.put("test/v", "h2", _result(), 3600)
+        cache.put("test/w", "h1", _result(), 3600)
+
+        cache.invalidate("test/v")
+        assert cache.get("test/v", "h1") is None
+        assert cache.get("test/v", "h2") is None
+        assert cache.get("test/w", "h1") is not None
+
+
+class TestPersistentValidationCache:
+    """Test the SQLite validation cache tier."""
+
+    def test_shared_across_caches_same_design(self, tmp_path):
+        """Test a second executor cache sees entries from the first."""
+        db = tmp_path / "validation.db"
+        first = ValidationCache(persistent=PersistentValidationCache(db, "design-1"))
+        first.put("test/v", "h", _result(state=ValidatorState.FAILED), 3600)
+
+        second = ValidationCache(persistent=PersistentValidationCache(db, "design-1"))
+        hit = second.get("test/v", "h")
+        assert hit is not None
+        assert hit.state == ValidatorState.FAILED
+        assert second.get_stats()["persistent_hits"] == 1
+
+    def test_scoped_by_design(self, tmp_path):
+        """Test entries do not leak between designs."""
+        db = tmp_path / "validation.db"
+        ValidationCache(persistent=PersistentValidationCache(db, "design-1")).put(
+            "test/v", "h", _result(), 3600
+        )
+        other = ValidationCache(persistent=PersistentValidationCache(db, "design-2"))
+        assert other.get("test/v", "h") is None
+
+    def test_expired_entries_ignored(self, tmp_path):
+        """Test TTL applies to the persistent tier."""
+        store = PersistentValidationCache(tmp_path / "validation.db", "d")
+        store.put("test/v", CacheEntry(
+            result=_result(),
+            input_hash="h",
+            cached_at=datetime.utcnow() - timedelta(hours=2),
+            ttl_seconds=60,
+        ))
+        assert store.get("test/v", "h") is None
+
+
 class TestPipelineExecutor:
     """Test PipelineExecutor class."""
 
@@ -283,14 +388,12 @@ class TestPipelineExecutor:
         topology.get_validators_for_phase.return_value = validators
 
         def mock_get_node(v_id):
-            node = Mock()
-            node.validator = ValidatorDefinition(
+            return TopologyNode(validator=ValidatorDefinition(
                 validator_id=v_id,
                 name=v_id,
                 description="Test",
                 category=ValidatorCategory.PHYSICS,
-            )
-            return node
+            ))
 
         topology.get_node.side_effect = mock_get_node
         topology.get_transitive_dependents.return_value = set()
@@ -395,21 +498,22 @@ class TestPipelineExecutor:
         topology = Mock(spec=ValidatorTopology)
         topology.get_execution_order.return_value = ["test/a", "test/b"]
 
-        # First call returns test/a, second returns empty (after fatal)
-        topology.get_ready_validators.side_effect = [
-            ["test/a"],
-            [],
-        ]
-
-        def mock_get_node(v_id):
-            node = Mock()
-            node.validator = ValidatorDefinition(
+        # test/b depends on test/a, so it is still pending when test/a errors
+        nodes = {
+            v_id: TopologyNode(validator=ValidatorDefinition(
                 validator_id=v_id,
                 name=v_id,
                 description="Test",
                 category=ValidatorCategory.PHYSICS,
-            )
-            return node
+            ))
+            for v_id in ["test/a", "test/b"]
+        }
+        nodes["test/a"].depended_by = {"test/b"}
+        nodes["test/b"].depends_on = {"test/a"}
+        nodes["test/b"].in_degree = 1
+
+        def mock_get_node(v_id):
+            return nodes.get(v_id)
 
         topology.get_node.side_effect = mock_get_node
 
@@ -438,6 +542,7 @@ class TestPipelineExecutor:
         result = executor.execute_all(stop_on_fatal_error=True)
         assert result.had_fatal_error == True
         assert result.fatal_error_validator == "test/a"
+        assert "test/b" in result.skipped
 
     def test_fix5_no_retry_on_failed(self):
         """Test FIX #5: No retry on FAILED state (validation failure)."""
@@ -607,7 +712,7 @@ class TestPipelineExecutor:
         topology = Mock(spec=ValidatorTopology)
         topology.get_validators_for_phase.return_value = ["hull/volume", "hull/wetted"]
         topology.get_execution_order.return_value = ["hull/volume", "hull/wetted"]
-        topology.get_ready_validators.return_value = []
+        topology.get_node.return_value = None
 
         state_manager = Mock()
 
@@ -658,6 +763,78 @@ class TestPipelineExecutor:
         stats = executor.get_cache_stats()
         assert "total_entries" in stats
         assert "valid_entries" in stats
+        assert "hits" in stats
+        assert "evictions" in stats
+
+    def test_failed_results_cached(self):
+        """Test deterministic FAILED results are served from cache."""
+        topology = self._create_mock_topology(["test/v"])
+        impl = self._create_mock_impl(state=ValidatorState.FAILED)
+
+        executor = PipelineExecutor(
+            topology=topology,
+            state_manager=Mock(),
+            validator_registry={"test/v": impl},
+        )
+
+        executor.execute_single("test/v")
+        second = executor.execute_single("test/v")
+
+        assert impl.validate.call_count == 1
+        assert second.was_cached
+        assert second.state == ValidatorState.FAILED
+
+    def test_persistent_cache_follows_loaded_design(self, tmp_path):
+        """Test the on-disk tier is keyed by the loaded design, so a restart hits it."""
+        from magnet.core.state_manager import StateManager
+
+        db = tmp_path / "validation.db"
+
+        def run():
+            state_manager = StateManager()
+            impl = self._create_mock_impl(state=ValidatorState.FAILED)
+            executor = PipelineExecutor(
+                topology=self._create_mock_topology(["test/v"]),
+                state_manager=state_manager,
+                validator_registry={"test/v": impl},
+                cache_path=db,
+            )
+            state_manager.from_dict({"design_id": "MY-DESIGN"})
+            assert executor.design_id == "MY-DESIGN"
+            return executor, impl, executor.execute_single("test/v")
+
+        run()
+        executor, impl, restarted = run()
+
+        assert impl.validate.call_count == 0
+        assert restarted.was_cached
+        assert executor.get_cache_stats()["persistent_hits"] == 1
+        assert PersistentValidationCache(db, "MY-DESIGN").count() == 1
+
+    def test_error_results_not_cached(self):
+        """Test ERROR results are always re-run."""
+        topology = self._create_mock_topology(["test/v"])
+        node = Mock()
+        node.validator = ValidatorDefinition(
+            validator_id="test/v",
+            name="test/v",
+            description="Test",
+            category=ValidatorCategory.PHYSICS,
+            max_retries=0,
+        )
+        topology.get_node.side_effect = None
+        topology.get_node.return_value = node
+        impl = self._create_mock_impl(state=ValidatorState.ERROR)
+
+        executor = PipelineExecutor(
+            topology=topology,
+            state_manager=Mock(),
+            validator_registry={"test/v": impl},
+        )
+        executor.execute_single("test/v")
+        executor.execute_single("test/v")
+
+        assert impl.validate.call_count == 2
 
 
 class TestPipelineExecutorIntegration:
@@ -717,3 +894,119 @@ class TestPipelineExecutorIntegration:
         assert "test/a" in result.completed
         assert "test/b" in result.completed
         assert len(result.failed) == 0
+
+
+class TestEventDrivenScheduling:
+    """Test completion-driven scheduling and the per-run timeline."""
+
+    def _build(self, specs):
+        """specs: {validator_id: (depends_on, sleep_s)} -> (topology, registry)."""
+        topology = ValidatorTopology()
+        registry = {}
+        for v_id, (deps, sleep_s) in specs.items():
+            topology.add_validator(ValidatorDefinition(
+                validator_id=v_id,
+                name=v_id,
+                description="Test",
+                category=ValidatorCategory.PHYSICS,
+                depends_on_validators=deps,
+            ))
+
+            def validate(state_manager, context, v_id=v_id, sleep_s=sleep_s):
+                time.sleep(sleep_s)
+                return ValidationResult(
+                    validator_id=v_id,
+                    state=ValidatorState.PASSED,
+                    started_at=datetime.utcnow(),
+                )
+
+            impl = Mock()
+            impl.validate.side_effect = validate
+            impl.get_input_hash.return_value = f"hash_{v_id}"
+            impl.should_skip_unchanged.return_value = False
+            registry[v_id] = impl
+        topology.build()
+        return topology, registry
+
+    def test_dependent_released_before_slow_sibling_finishes(self):
+        """A fast validator's dependent starts while a slow sibling still runs."""
+        topology, registry = self._build({
+            "test/slow": ([], 0.3),
+            "test/fast": ([], 0.0),
+            "test/after_fast": (["test/fast"], 0.0),
+        })
+        executor = PipelineExecutor(topology, Mock(), registry, max_workers=4)
+
+        result = executor.execute_all(skip_cached=False, skip_unchanged=False)
+
+        assert result.completed == {"test/slow", "test/fast", "test/after_fast"}
+        timeline = result.timeline
+        assert timeline["test/after_fast"].started_ms < timeline["test/slow"].finished_ms
+        assert timeline["test/after_fast"].queued_ms >= timeline["test/fast"].finished_ms
+
+    def test_timeline_recorded_and_serialized(self):
+        """Every executed validator gets queued/started/finished stamps."""
+        topology, registry = self._build({
+            "test/a": ([], 0.0),
+            "test/b": (["test/a"], 0.0),
+        })
+        executor = PipelineExecutor(topology, Mock(), registry, max_workers=2)
+
+        result = executor.execute_all(skip_cached=False, skip_unchanged=False)
+
+        for v_id in ("test/a", "test/b"):
+            entry = result.timeline[v_id]
+            assert entry.queued_ms <= entry.started_ms <= entry.finished_ms
+        breakdown = result.get_timing_breakdown()
+        assert [row["validator_id"] for row in breakdown] == ["test/a", "test/b"]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "state.json"
+            result.save(path)
+            loaded = ExecutionState.load(path)
+        assert set(loaded.timeline) == {"test/a", "test/b"}
+        assert loaded.timeline["test/b"].finished_ms == pytest.approx(
+            result.timeline["test/b"].finished_ms, abs=1e-3
+        )
+
+    def test_unsatisfied_external_dependency_stays_pending(self):
+        """A subset run leaves validators with unmet outside deps pending."""
+        topology, registry = self._build({
+            "test/a": ([], 0.0),
+            "test/b": (["test/a"], 0.0),
+        })
+        executor = PipelineExecutor(topology, Mock(), registry)
+
+        result = executor.execute_all(
+            skip_cached=False, skip_unchanged=False, validators_to_run={"test/b"}
+        )
+        assert result.pending == {"test/b"}
+        assert registry["test/b"].validate.call_count == 0
+
+        result = executor.execute_all(
+            skip_cached=False,
+            skip_unchanged=False,
+            validators_to_run={"test/b"},
+            previously_completed={"test/a"},
+        )
+        assert "test/b" in result.completed
+
+    def test_resources_limit_concurrency(self):
+        """Validators that do not fit the pool wait for a release."""
+        topology, registry = self._build({
+            f"test/v{i}": ([], 0.05) for i in range(3)
+        })
+        executor = PipelineExecutor(
+            topology, Mock(), registry, max_workers=4,
+            resource_pool=ResourcePool(cpu_cores=1),
+        )
+
+        result = executor.execute_all(skip_cached=False, skip_unchanged=False)
+
+        assert len(result.completed) == 3
+        spans = sorted(
+            (e.started_ms, e.finished_ms) for e in result.timeline.values()
+        )
+        for (_, prev_end), (next_start, _) in zip(spans, spans[1:]):
+            assert next_start >= prev_end
+        assert executor._resource_pool.cpu_cores == 1
@@ -141,6 +141,11 @@ class TestValidatorTopology:
         assert topology.get_node("test/b").depth == 1
         assert topology.get_node("test/c").depth == 2
 
+        # In-degree counters seed the executor's ready counters
+        assert topology.get_node("test/a").in_degree == 0
+        assert topology.get_node("test/b").in_degree == 1
+        assert topology.get_node("test/c").in_degree == 1
+
     def test_build_parallel_topology(self):
         """Test topology with parallel validators."""
         topology = ValidatorTopology()
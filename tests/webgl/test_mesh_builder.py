@@ -0,0 +1,173 @@
+"""
+tests/webgl/test_mesh_builder.py - Tests for mesh construction utilities v1.1
+
+Module 58: WebGL 3D Visualization
+Tests for vectorized normals/tangents and packed mesh buffers.
+"""
+
+import math
+import random
+
+import pytest
+
+
+def _random_mesh(vertex_count=60, face_count=120, seed=7):
+    rng = random.Random(seed)
+    vertices = [rng.uniform(-5.0, 5.0) for _ in range(vertex_count * 3)]
+    indices = [rng.randrange(vertex_count) for _ in range(face_count * 3)]
+    uvs = [rng.random() for _ in range(vertex_count * 2)]
+    return vertices, indices, uvs
+
+
+def _sub(a, b):
+    return [a[k] - b[k] for k in range(len(a))]
+
+
+def _cross(a, b):
+    return [a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]]
+
+
+def _dot(a, b):
+    return sum(x * y for x, y in zip(a, b))
+
+
+def _unit(v, fallback):
+    length = math.sqrt(_dot(v, v))
+    return [x / length for x in v] if length > 1e-10 else list(fallback)
+
+
+def _reference_normals(vertices, indices):
+    """Per-triangle area-weighted vertex normals."""
+    points = [vertices[i:i + 3] for i in range(0, len(vertices), 3)]
+    sums = [[0.0, 0.0, 0.0] for _ in points]
+    for f in range(0, len(indices), 3):
+        i0, i1, i2 = indices[f:f + 3]
+        n = _cross(_sub(points[i1], points[i0]), _sub(points[i2], points[i0]))
+        for i in (i0, i1, i2):
+            sums[i] = [a + b for a, b in zip(sums[i], n)]
+    return [x for n in sums for x in _unit(n, (0.0, 0.0, 1.0))]
+
+
+def _reference_tangents(vertices, normals, uvs, indices):
+    """Per-triangle tangents, Gram-Schmidt orthogonalized, with handedness."""
+    points = [vertices[i:i + 3] for i in range(0, len(vertices), 3)]
+    coords = [uvs[i:i + 2] for i in range(0, len(uvs), 2)]
+    tangents = [[0.0, 0.0, 0.0] for _ in points]
+    bitangents = [[0.0, 0.0, 0.0] for _ in points]
+    for f in range(0, len(indices), 3):
+        i0, i1, i2 = indices[f:f + 3]
+        dp1, dp2 = _sub(points[i1], points[i0]), _sub(points[i2], points[i0])
+        duv1, duv2 = _sub(coords[i1], coords[i0]), _sub(coords[i2], coords[i0])
+        denom = duv1[0] * duv2[1] - duv2[0] * duv1[1]
+        if abs(denom) < 1e-10:
+            continue
+        t = [(duv2[1] * a - duv1[1] * b) / denom for a, b in zip(dp1, dp2)]
+        b = [(duv1[0] * c - duv2[0] * a) / denom for a, c in zip(dp1, dp2)]
+        for i in (i0, i1, i2):
+            tangents[i] = [x + y for x, y in zip(tangents[i], t)]
+            bitangents[i] = [x + y for x, y in zip(bitangents[i], b)]
+
+    result = []
+    for i in range(len(points)):
+        n = normals[i * 3:i * 3 + 3]
+        t = tangents[i]
+        t = _unit([a - c * _dot(n, t) for a, c in zip(t, n)], (1.0, 0.0, 0.0))
+        result += t + [1.0 if _dot(_cross(n, t), bitangents[i]) >= 0 else -1.0]
+    return result
+
+
+class TestMeshBuilder:
+    """Tests for MeshBuilder."""
+
+    def test_build_returns_lists_by_default(self):
+        """Test build() keeps list buffers for JSON consumers."""
+        from magnet.webgl.mesh_builder import MeshBuilder
+
+        builder = MeshBuilder()
+        v0 = builder.add_vertex(0, 0, 0)
+        v1 = builder.add_vertex(1, 0, 0)
+        v2 = builder.add_vertex(0, 1, 0)
+        builder.add_triangle(v0, v1, v2)
+        mesh = builder.build()
+
+        assert mesh.vertices == [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+        assert mesh.indices == [0, 1, 2]
+        assert mesh.normals == [0.0, 0.0, 1.0] * 3
+
+    def test_build_packed(self):
+        """Test build(packed=True) returns float32/uint32 buffers."""
+        from magnet.webgl.mesh_builder import MeshBuilder
+
+        builder = MeshBuilder()
+        first = builder.add_vertex_buffer([0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0])
+        builder.add_triangle_buffer([0, 1, 2, 1, 3, 2], offset=first)
+        mesh = builder.build(packed=True)
+
+        assert mesh.is_packed
+        assert mesh.vertex_count == 4
+        assert mesh.face_count == 2
+        assert list(mesh.normals[:3]) == [0.0, 0.0, 1.0]
+
+    def test_add_buffers_with_offset(self):
+        """Test buffer appends shift indices by the vertex offset."""
+        from magnet.webgl.mesh_builder import MeshBuilder
+
+        builder = MeshBuilder()
+        builder.add_vertex_buffer([0.0] * 9)
+        offset = builder.add_vertex_buffer([1.0] * 9)
+        builder.add_triangle_buffer([0, 1, 2], offset=offset)
+
+        assert offset == 3
+        assert builder.build(compute_normals=False).indices == [3, 4, 5]
+
+
+class TestVectorizedMeshOps:
+    """Tests that vectorized paths match per-triangle reference loops."""
+
+    def test_vertex_normals_match_loop(self):
+        from magnet.webgl import mesh_builder
+
+        vertices, indices, _ = _random_mesh()
+        expected = _reference_normals(vertices, indices)
+        result = mesh_builder.compute_vertex_normals(vertices, indices)
+
+        assert isinstance(result, list)
+        assert result == pytest.approx(expected, abs=1e-9)
+
+    def test_tangents_match_loop(self):
+        from magnet.webgl import mesh_builder
+
+        vertices, indices, uvs = _random_mesh()
+        normals = _reference_normals(vertices, indices)
+        expected = _reference_tangents(vertices, normals, uvs, indices)
+        result = mesh_builder.compute_tangents(vertices, normals, uvs, indices)
+
+        assert result == pytest.approx(expected, abs=1e-9)
+
+    def test_merge_meshes_offsets_indices(self):
+        from magnet.webgl.mesh_builder import merge_meshes
+        from magnet.webgl.schema import MeshData
+
+        vertices, indices, _ = _random_mesh()
+        mesh = MeshData(vertices=vertices, indices=indices)
+
+        merged = merge_meshes([mesh, mesh])
+        assert merged.vertex_count == 2 * mesh.vertex_count
+        assert merged.indices[len(indices):] == [i + mesh.vertex_count for i in indices]
+
+        packed = merge_meshes([mesh.packed(), mesh.packed()])
+        assert packed.is_packed
+        assert list(packed.indices) == merged.indices
+
+    def test_transform_mesh_keeps_buffer_kind(self):
+        from magnet.webgl.mesh_builder import transform_mesh
+        from magnet.webgl.schema import MeshData
+
+        mesh = MeshData(vertices=[0, 0, 0, 1, 2, 3, 4, 5, 6], indices=[0, 1, 2])
+
+        moved = transform_mesh(mesh, translate=(1, 1, 1), scale=(2, 2, 2))
+        assert moved.vertices == [1.0, 1.0, 1.0, 3.0, 5.0, 7.0, 9.0, 11.0, 13.0]
+
+        moved_packed = transform_mesh(mesh.packed(), translate=(1, 1, 1), scale=(2, 2, 2))
+        assert moved_packed.is_packed
+        assert list(moved_packed.vertices) == moved.vertices
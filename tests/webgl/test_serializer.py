@@ -123,6 +123,50 @@ class TestMeshSerialization:
         assert restored.bounds.min[0] == 0
         assert restored.bounds.max[0] == 1
 
+    def test_packed_mesh_serializes_identically(self):
+        """Test packed buffers produce the same bytes and roundtrip packed."""
+        from magnet.webgl.schema import MeshData
+        from magnet.webgl.serializer import serialize_mesh, deserialize_mesh
+
+        original = MeshData(
+            mesh_id="packed",
+            vertices=[0, 0, 0, 1, 0, 0, 0.5, 1, 0],
+            indices=[0, 1, 2],
+            normals=[0, 0, 1] * 3,
+            uvs=[0, 0, 1, 0, 0.5, 1],
+        )
+
+        data = serialize_mesh(original, compress=True)
+        assert serialize_mesh(original.packed(), compress=True) == data
+
+        restored = deserialize_mesh(data, packed=True)
+        assert restored.is_packed
+        assert list(restored.indices) == original.indices
+        assert list(restored.uvs) == original.uvs
+
+    def test_missing_normals_and_uvs_match_in_both_modes(self):
+        """Test absent normals/UVs come back as MeshData leaves them, packed or not."""
+        from array import array
+        from magnet.webgl.schema import MeshData
+        from magnet.webgl.serializer import serialize_mesh, deserialize_mesh
+
+        original = MeshData(
+            mesh_id="bare",
+            vertices=[0, 0, 0, 1, 0, 0, 0.5, 1, 0],
+            indices=[0, 1, 2],
+        )
+        data = serialize_mesh(original)
+
+        restored = deserialize_mesh(data)
+        assert restored.normals == original.normals == []
+        assert restored.uvs is None and original.uvs is None
+
+        packed = deserialize_mesh(data, packed=True)
+        expected = original.packed()
+        assert isinstance(packed.normals, array) and packed.normals == expected.normals
+        assert packed.uvs is None and expected.uvs is None
+        assert packed.to_dict()["metadata"]["has_uvs"] is False
+
 
 class TestSceneSerialization:
     """Tests for scene binary serialization."""